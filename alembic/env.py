@@ -21,6 +21,12 @@ from app.models.conference import AIConference  # noqa: F401
 from app.models.ai_tool import AITool  # noqa: F401
 from app.models.job_trend import AIJobTrend  # noqa: F401
 from app.models.policy import AIPolicy  # noqa: F401
+from app.models.category_stats import CategoryDailyStat  # noqa: F401
+from app.models.keyword_occurrence import KeywordOccurrence  # noqa: F401
+from app.models.summary_job import SummaryJob  # noqa: F401
+from app.models.feed_state import FeedState  # noqa: F401
+from app.models.backfill_checkpoint import BackfillCheckpoint  # noqa: F401
+from app.models.collection_run import CollectionRun  # noqa: F401
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
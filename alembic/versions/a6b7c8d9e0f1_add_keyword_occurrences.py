@@ -0,0 +1,120 @@
+"""add keyword_occurrences index table
+
+Revision ID: a6b7c8d9e0f1
+Revises: f5a6b7c8d9e0
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+from datetime import datetime, timezone
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a6b7c8d9e0f1"
+down_revision: Union[str, None] = "f5a6b7c8d9e0"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# 테이블 → (키워드 컬럼, 카테고리, 기준 시각 컬럼)
+KEYWORD_SOURCES = {
+    "huggingface_models": ("key_features", "huggingface", "collected_at"),
+    "github_projects": ("keywords", "github", "created_at"),
+    "youtube_videos": ("keywords", "youtube", "created_at"),
+    "ai_papers": ("keywords", "papers", "created_at"),
+    "ai_news": ("keywords", "news", "created_at"),
+    "ai_conferences": ("topics", "conferences", "created_at"),
+    "ai_tools": ("key_features", "platforms", "created_at"),
+    "ai_job_trends": ("required_skills", "jobs", "created_at"),
+    "ai_policies": ("impact_areas", "policies", "created_at"),
+}
+BATCH_SIZE = 1000
+
+
+def _backfill(occurrences: sa.Table) -> None:
+    """기존 JSON 키워드 배열을 출현 행으로 펼쳐 적재."""
+    bind = op.get_bind()
+    now = datetime.now(timezone.utc)
+    for table_name, (field, category, date_field) in KEYWORD_SOURCES.items():
+        source = sa.table(
+            table_name,
+            sa.column("id", sa.Integer),
+            sa.column(field, sa.JSON),
+            sa.column(date_field, sa.DateTime(timezone=True)),
+        )
+        result = bind.execute(
+            sa.select(source.c.id, source.c[field], source.c[date_field]).where(
+                source.c[field].isnot(None)
+            )
+        )
+        rows = []
+        for item_id, keywords, observed_at in result:
+            if not isinstance(keywords, list):
+                continue
+            seen = set()
+            for keyword in keywords:
+                if not isinstance(keyword, str):
+                    continue
+                keyword = keyword.strip()[:200]
+                if not keyword or keyword in seen:
+                    continue
+                seen.add(keyword)
+                rows.append(
+                    {
+                        "keyword": keyword,
+                        "category": category,
+                        "item_id": item_id,
+                        "observed_at": observed_at or now,
+                    }
+                )
+            if len(rows) >= BATCH_SIZE:
+                bind.execute(occurrences.insert(), rows)
+                rows = []
+        if rows:
+            bind.execute(occurrences.insert(), rows)
+
+
+def upgrade() -> None:
+    occurrences = op.create_table(
+        "keyword_occurrences",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("keyword", sa.String(length=200), nullable=False),
+        sa.Column("category", sa.String(length=30), nullable=False),
+        sa.Column("item_id", sa.Integer(), nullable=False),
+        sa.Column("observed_at", sa.DateTime(timezone=True), nullable=False),
+        sa.UniqueConstraint(
+            "category",
+            "item_id",
+            "keyword",
+            name="uq_keyword_occurrences_item_keyword",
+        ),
+    )
+    op.create_index(
+        "ix_keyword_occurrences_id", "keyword_occurrences", ["id"], unique=False
+    )
+    op.create_index(
+        "ix_keyword_occurrences_keyword_category",
+        "keyword_occurrences",
+        ["keyword", "category"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_keyword_occurrences_observed_at_keyword",
+        "keyword_occurrences",
+        ["observed_at", "keyword"],
+        unique=False,
+    )
+    _backfill(occurrences)
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_keyword_occurrences_observed_at_keyword", table_name="keyword_occurrences"
+    )
+    op.drop_index(
+        "ix_keyword_occurrences_keyword_category", table_name="keyword_occurrences"
+    )
+    op.drop_index("ix_keyword_occurrences_id", table_name="keyword_occurrences")
+    op.drop_table("keyword_occurrences")
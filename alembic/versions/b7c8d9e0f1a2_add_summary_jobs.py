@@ -0,0 +1,64 @@
+"""add summary_jobs queue table
+
+Revision ID: b7c8d9e0f1a2
+Revises: a6b7c8d9e0f1
+Create Date: 2026-10-17 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b7c8d9e0f1a2"
+down_revision: Union[str, None] = "a6b7c8d9e0f1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "summary_jobs",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("category", sa.String(length=30), nullable=False),
+        sa.Column("item_id", sa.Integer(), nullable=False),
+        sa.Column("status", sa.String(length=20), nullable=False, server_default="pending"),
+        sa.Column("attempts", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column(
+            "next_run_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+        ),
+        sa.Column("locked_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("last_error", sa.Text(), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+        ),
+        sa.UniqueConstraint(
+            "category",
+            "item_id",
+            name="uq_summary_jobs_category_item",
+        ),
+    )
+    op.create_index("ix_summary_jobs_id", "summary_jobs", ["id"], unique=False)
+    op.create_index(
+        "ix_summary_jobs_status_next_run_at",
+        "summary_jobs",
+        ["status", "next_run_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_summary_jobs_status_next_run_at", table_name="summary_jobs")
+    op.drop_index("ix_summary_jobs_id", table_name="summary_jobs")
+    op.drop_table("summary_jobs")
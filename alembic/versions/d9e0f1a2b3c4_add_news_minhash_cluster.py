@@ -0,0 +1,31 @@
+"""add minhash / cluster_id to ai_news for near-duplicate clustering
+
+Revision ID: d9e0f1a2b3c4
+Revises: c8d9e0f1a2b3
+Create Date: 2026-10-17 18:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d9e0f1a2b3c4"
+down_revision: Union[str, None] = "c8d9e0f1a2b3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 기존 기사의 서명·클러스터는 첫 수집 때 최근 기사부터 채움 (news_dedup_service)
+    op.add_column("ai_news", sa.Column("minhash", sa.LargeBinary(), nullable=True))
+    op.add_column("ai_news", sa.Column("cluster_id", sa.Integer(), nullable=True))
+    op.create_index("ix_ai_news_cluster_id", "ai_news", ["cluster_id"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_ai_news_cluster_id", table_name="ai_news")
+    op.drop_column("ai_news", "cluster_id")
+    op.drop_column("ai_news", "minhash")
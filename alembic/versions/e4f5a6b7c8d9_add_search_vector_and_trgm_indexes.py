@@ -0,0 +1,84 @@
+"""add search_vector generated columns and trigram indexes
+
+Revision ID: e4f5a6b7c8d9
+Revises: d3e4f5a6b7c8
+Create Date: 2026-10-17 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e4f5a6b7c8d9"
+down_revision: Union[str, None] = "d3e4f5a6b7c8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# 테이블별 FTS 문서 구성 컬럼 (app/models/search_document.py와 동일하게 유지)
+SEARCH_DOCUMENT_COLUMNS = {
+    "huggingface_models": ("model_name", "description", "task"),
+    "youtube_videos": ("title", "description", "channel_title"),
+    "ai_papers": ("title", "abstract"),
+    "ai_news": ("title", "content", "excerpt"),
+    "github_projects": ("repo_name", "name", "description"),
+    "ai_conferences": ("conference_name", "conference_acronym"),
+    "ai_job_trends": ("job_title", "description"),
+    "ai_policies": ("title", "description"),
+}
+
+# ILIKE fallback 대상 컬럼
+SEARCH_TRIGRAM_COLUMNS = {
+    "huggingface_models": ("model_name", "description"),
+    "youtube_videos": ("title", "description", "channel_title"),
+    "ai_papers": ("title", "abstract"),
+    "ai_news": ("title", "content", "excerpt"),
+    "github_projects": ("repo_name", "name", "description"),
+    "ai_conferences": ("conference_name", "conference_acronym", "summary"),
+    "ai_job_trends": ("job_title", "description", "company_name"),
+    "ai_policies": ("title", "description", "country"),
+}
+
+
+def _document_sql(table_name: str) -> str:
+    joined = " || ' ' || ".join(
+        f"COALESCE({column}, '')" for column in SEARCH_DOCUMENT_COLUMNS[table_name]
+    )
+    return f"to_tsvector('simple', {joined})"
+
+
+def upgrade() -> None:
+    # tsvector/pg_trgm은 PostgreSQL 전용 (SQLite 로컬/테스트 환경은 건너뜀)
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    for table_name in SEARCH_DOCUMENT_COLUMNS:
+        op.execute(
+            f"ALTER TABLE {table_name} "
+            f"ADD COLUMN IF NOT EXISTS search_vector tsvector "
+            f"GENERATED ALWAYS AS ({_document_sql(table_name)}) STORED"
+        )
+        op.execute(
+            f"CREATE INDEX IF NOT EXISTS ix_{table_name}_search_vector "
+            f"ON {table_name} USING gin (search_vector)"
+        )
+        for column in SEARCH_TRIGRAM_COLUMNS[table_name]:
+            op.execute(
+                f"CREATE INDEX IF NOT EXISTS ix_{table_name}_{column}_trgm "
+                f"ON {table_name} USING gin ({column} gin_trgm_ops)"
+            )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    for table_name in SEARCH_DOCUMENT_COLUMNS:
+        for column in SEARCH_TRIGRAM_COLUMNS[table_name]:
+            op.execute(f"DROP INDEX IF EXISTS ix_{table_name}_{column}_trgm")
+        op.execute(f"DROP INDEX IF EXISTS ix_{table_name}_search_vector")
+        op.execute(f"ALTER TABLE {table_name} DROP COLUMN IF EXISTS search_vector")
@@ -0,0 +1,66 @@
+"""add collection_runs table for per-job timing and counters
+
+Revision ID: f1a2b3c4d5e6
+Revises: e0f1a2b3c4d5
+Create Date: 2026-10-17 22:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "f1a2b3c4d5e6"
+down_revision: Union[str, None] = "e0f1a2b3c4d5"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_COUNTER_COLUMNS = [
+    "duration_ms",
+    "fetch_ms",
+    "parse_ms",
+    "summarize_ms",
+    "save_ms",
+    "invalidate_ms",
+    "fetched",
+    "inserted",
+    "updated",
+    "http_calls",
+    "llm_calls",
+]
+
+
+def upgrade() -> None:
+    op.create_table(
+        "collection_runs",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("job_id", sa.String(length=100), nullable=False),
+        sa.Column("trigger", sa.String(length=20), nullable=False, server_default="scheduled"),
+        sa.Column("status", sa.String(length=20), nullable=False),
+        sa.Column("started_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("finished_at", sa.DateTime(timezone=True), nullable=True),
+        *[
+            sa.Column(name, sa.Integer(), nullable=False, server_default="0")
+            for name in _COUNTER_COLUMNS
+        ],
+        sa.Column("errors", sa.JSON(), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+        ),
+    )
+    op.create_index("ix_collection_runs_id", "collection_runs", ["id"], unique=False)
+    op.create_index("ix_collection_runs_started_at", "collection_runs", ["started_at"], unique=False)
+    op.create_index(
+        "ix_collection_runs_job_started", "collection_runs", ["job_id", "started_at"], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_collection_runs_job_started", table_name="collection_runs")
+    op.drop_index("ix_collection_runs_started_at", table_name="collection_runs")
+    op.drop_index("ix_collection_runs_id", table_name="collection_runs")
+    op.drop_table("collection_runs")
@@ -0,0 +1,61 @@
+"""add category_daily_stats rollup table
+
+Revision ID: f5a6b7c8d9e0
+Revises: e4f5a6b7c8d9
+Create Date: 2026-10-17 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "f5a6b7c8d9e0"
+down_revision: Union[str, None] = "e4f5a6b7c8d9"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "category_daily_stats",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("category", sa.String(), nullable=False),
+        sa.Column("stat_date", sa.Date(), nullable=False),
+        sa.Column("item_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("last_item_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+        ),
+        sa.UniqueConstraint(
+            "category",
+            "stat_date",
+            name="uq_category_daily_stats_category_date",
+        ),
+    )
+    op.create_index(
+        "ix_category_daily_stats_id", "category_daily_stats", ["id"], unique=False
+    )
+    op.create_index(
+        "ix_category_daily_stats_category",
+        "category_daily_stats",
+        ["category"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_category_daily_stats_stat_date",
+        "category_daily_stats",
+        ["stat_date"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_category_daily_stats_stat_date", table_name="category_daily_stats")
+    op.drop_index("ix_category_daily_stats_category", table_name="category_daily_stats")
+    op.drop_index("ix_category_daily_stats_id", table_name="category_daily_stats")
+    op.drop_table("category_daily_stats")
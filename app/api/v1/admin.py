@@ -2,9 +2,12 @@
 
 - POST /login: 비밀번호로 JWT 토큰 발급
 - GET /verify: 토큰 유효성 확인
+- GET/DELETE /summary-cache: AI 요약 캐시 적중률 조회 / 무효화
+- POST /backfill-v4, GET /backfills: 청크 단위 재개형 백필 실행 / 진행 현황
 """
 from datetime import datetime, timedelta, timezone
 import logging
+from typing import Optional
 from fastapi import APIRouter, HTTPException, Header, BackgroundTasks, Depends, Query
 from pydantic import BaseModel
 import hashlib
@@ -12,9 +15,16 @@ import hmac
 import json
 import base64
 
+from app.cache import get_summary_cache_stats, summary_cache_purge
 from app.config import get_settings
 from app.database import AsyncSessionLocal
-from app.services.backfill_service import backfill_missing_summaries, backfill_v4_metadata
+from app.services.ai_summary_service import PROMPT_TEMPLATE_VERSIONS, purge_stale_summary_cache
+from app.backfill import claim_backfill, get_backfill_progress, release_backfill
+from app.services.backfill_service import (
+    V4_BACKFILL_JOB,
+    backfill_missing_summaries,
+    backfill_v4_metadata,
+)
 
 router = APIRouter()
 settings = get_settings()
@@ -91,16 +101,35 @@ async def _run_summary_backfill(limit_per_category: int) -> None:
     logger.info("summary backfill finished: %s", result)
 
 
-async def _run_v4_backfill(limit: int, include_summary: bool, summary_limit: int) -> None:
-    async with AsyncSessionLocal() as db:
-        metadata_result = await backfill_v4_metadata(db, limit=limit)
+async def _run_v4_backfill(
+    limit: Optional[int],
+    force: bool,
+    resume: bool,
+    chunk_size: Optional[int],
+    concurrency: Optional[int],
+    include_summary: bool,
+    summary_limit: int,
+) -> None:
+    # 요청 핸들러가 선점한 자리를 요약 백필까지 끝난 뒤 해제
+    try:
+        metadata_result = await backfill_v4_metadata(
+            limit=limit,
+            force=force,
+            resume=resume,
+            chunk_size=chunk_size,
+            concurrency=concurrency,
+            claimed=True,
+        )
         logger.info("v4 metadata backfill finished: %s", metadata_result)
         if include_summary:
-            summary_result = await backfill_missing_summaries(
-                db,
-                limit_per_category=summary_limit,
-            )
+            async with AsyncSessionLocal() as db:
+                summary_result = await backfill_missing_summaries(
+                    db,
+                    limit_per_category=summary_limit,
+                )
             logger.info("v4 summary backfill finished: %s", summary_result)
+    finally:
+        release_backfill(V4_BACKFILL_JOB)
 
 
 @router.post("/site-login")
@@ -149,17 +178,73 @@ async def trigger_summary_backfill(
 @router.post("/backfill-v4", response_model=TriggerTaskResponse)
 async def trigger_v4_backfill(
     background_tasks: BackgroundTasks,
-    limit: int = Query(5000, ge=1, le=200000),
+    limit: Optional[int] = Query(
+        None, ge=1, description="작업별 최대 처리 행 수 (미지정 시 전체, 미처리 행 중 오래된 id부터)"
+    ),
+    force: bool = Query(False, description="이미 분류된 행까지 전체 재분류 (규칙 변경 후)"),
+    resume: bool = Query(True, description="중단된 체크포인트에서 이어서 처리"),
+    chunk_size: Optional[int] = Query(None, ge=10, le=5000, description="청크(커밋)당 행 수"),
+    concurrency: Optional[int] = Query(None, ge=1, le=8, description="동시에 처리하는 청크 수"),
     include_summary: bool = Query(False),
     summary_limit: int = Query(10, ge=1, le=200),
     _: bool = Depends(verify_admin_token),
 ):
-    """v4 분류/언어/task_ko 소급 반영 + 선택적 요약 백필."""
-    background_tasks.add_task(_run_v4_backfill, limit, include_summary, summary_limit)
+    """v4 분류/언어/task_ko 소급 반영 (청크 커밋·체크포인트) + 선택적 요약 백필.
+
+    진행 현황은 `GET /backfills`. 실행 자리는 응답 전에 선점하므로 연속 요청 중 1건만 시작되고 나머지는 409.
+    """
+    if not claim_backfill(V4_BACKFILL_JOB):
+        raise HTTPException(status_code=409, detail="v4 백필이 이미 실행 중입니다")
+    background_tasks.add_task(
+        _run_v4_backfill,
+        limit,
+        force,
+        resume,
+        chunk_size,
+        concurrency,
+        include_summary,
+        summary_limit,
+    )
     return TriggerTaskResponse(
         status="started",
         message=(
             "v4 backfill started "
-            f"(limit={limit}, include_summary={include_summary}, summary_limit={summary_limit})"
+            f"(limit={limit}, force={force}, resume={resume}, "
+            f"include_summary={include_summary}, summary_limit={summary_limit})"
         ),
     )
+
+
+@router.get("/backfills")
+async def get_backfill_status(
+    job: Optional[str] = Query(None, description="백필 이름 (예: v4_metadata, 미지정 시 전체)"),
+    _: bool = Depends(verify_admin_token),
+):
+    """백필 작업별 체크포인트 진행 현황 (처리/변경 수, 진행률, 마지막 오류)."""
+    return {"backfills": await get_backfill_progress(job)}
+
+
+@router.get("/summary-cache")
+async def get_summary_cache_status(_: bool = Depends(verify_admin_token)):
+    """AI 요약 캐시 카테고리별 적중/미스 수, 적중률, 현재 템플릿 버전."""
+    return {
+        "template_versions": PROMPT_TEMPLATE_VERSIONS,
+        "stats": await get_summary_cache_stats(),
+    }
+
+
+@router.delete("/summary-cache")
+async def invalidate_summary_cache(
+    kind: Optional[str] = Query(None, description="카테고리 (미지정 시 전체)"),
+    stale_only: bool = Query(True, description="현재 템플릿 버전이 아닌 항목만 삭제"),
+    _: bool = Depends(verify_admin_token),
+):
+    """AI 요약 캐시 무효화."""
+    if kind is not None and kind not in PROMPT_TEMPLATE_VERSIONS:
+        raise HTTPException(status_code=400, detail=f"알 수 없는 카테고리: {kind}")
+    if stale_only:
+        deleted = await purge_stale_summary_cache(kind)
+    else:
+        kinds = [kind] if kind else list(PROMPT_TEMPLATE_VERSIONS)
+        deleted = {name: await summary_cache_purge(name) for name in kinds}
+    return {"deleted": deleted, "total_deleted": sum(deleted.values())}
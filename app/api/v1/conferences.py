@@ -2,12 +2,14 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, desc, func
+from typing import Any, Dict, Optional
 
-from app.database import get_db
+from app.database import get_db, with_session
 from app.db_compat import has_archive_column
 from app.models.conference import AIConference
 from app.schemas.conference import AIConferenceList, AIConferenceResponse
-from app.cache import cache_get, cache_set, TTL_LIST_QUERY
+from app.cache import cached, list_cache_tag, TTL_LIST_QUERY
+from app.pagination import apply_keyset, cached_count, split_keyset_page
 
 router = APIRouter()
 
@@ -20,6 +22,7 @@ async def list_conferences(
     tier: str = Query(None, description="등급 필터 (A*, A, B)"),
     year: int = Query(None, description="연도 필터 (예: 2026)"),
     include_archived: bool = Query(False, description="아카이브 데이터 포함 여부"),
+    cursor: Optional[str] = Query(None, description="키셋 페이지네이션 cursor (빈 값이면 첫 페이지)"),
     db: AsyncSession = Depends(get_db),
 ):
     """
@@ -30,6 +33,7 @@ async def list_conferences(
     - **upcoming**: True시 다가오는 컨퍼런스만 반환
     - **tier**: 등급 필터 (A*, A, B)
     - **year**: 연도 필터 (예: 2026)
+    - **cursor**: 지정 시 OFFSET 대신 `(start_date ASC, id)` 키셋 페이지네이션 (`next_cursor` 반환)
     """
     supports_archive = await has_archive_column(db, "ai_conferences")
     effective_include_archived = include_archived or not supports_archive
@@ -55,43 +59,59 @@ async def list_conferences(
         query = query.where(AIConference.year == year)
         count_query = count_query.where(AIConference.year == year)
 
-    # 총 개수 조회
-    count_result = await db.execute(count_query)
-    total = count_result.scalar()
-
-    # 페이지네이션
-    offset = (page - 1) * page_size
-    query = (
-        query.order_by(
-            AIConference.start_date.is_(None),   # 날짜 있는 항목 우선
-            AIConference.start_date.asc(),
-            desc(AIConference.submission_deadline),
-            desc(AIConference.created_at),
-        )
-        .offset(offset)
-        .limit(page_size)
-    )
-
     cache_key = (
         "list:conferences:"
         f"page={page}:size={page_size}:upcoming={upcoming}:tier={tier}:year={year}:"
-        f"archived={int(effective_include_archived)}"
+        f"archived={int(effective_include_archived)}:cursor={cursor}"
+    )
+
+    # 백그라운드 갱신에도 쓰이므로 요청 세션이 아닌 새 세션으로 조회
+    async def _load(db: AsyncSession) -> Dict[str, Any]:
+        # 총 개수 조회 (필터 조합별 캐시)
+        total = await cached_count(
+            db,
+            count_query,
+            "list:conferences:count:"
+            f"upcoming={upcoming}:tier={tier}:year={year}:"
+            f"archived={int(effective_include_archived)}",
+        )
+
+        next_cursor = None
+        if cursor is not None:
+            # 키셋: 시작일 오름차순 (날짜 없는 항목은 마지막)
+            page_query = apply_keyset(
+                query, AIConference.start_date, AIConference.id, cursor, descending=False
+            ).limit(page_size + 1)
+            rows = (await db.execute(page_query)).scalars().all()
+            conferences, next_cursor = split_keyset_page(rows, page_size, "start_date")
+        else:
+            # 페이지네이션
+            offset = (page - 1) * page_size
+            page_query = (
+                query.order_by(
+                    AIConference.start_date.is_(None),   # 날짜 있는 항목 우선
+                    AIConference.start_date.asc(),
+                    desc(AIConference.submission_deadline),
+                    desc(AIConference.created_at),
+                )
+                .offset(offset)
+                .limit(page_size)
+            )
+            result = await db.execute(page_query)
+            conferences = result.scalars().all()
+        payload = AIConferenceList(
+            total=total or 0,
+            items=conferences,
+            page=page,
+            page_size=page_size,
+            total_pages=max(((total or 0) + page_size - 1) // page_size, 1),
+            next_cursor=next_cursor,
+        ).model_dump(mode="json")
+        return payload
+
+    return await cached(
+        cache_key, lambda: with_session(_load), ttl=TTL_LIST_QUERY, tag=list_cache_tag("conferences")
     )
-    cached = await cache_get(cache_key)
-    if cached is not None:
-        return cached
-
-    result = await db.execute(query)
-    conferences = result.scalars().all()
-    payload = AIConferenceList(
-        total=total or 0,
-        items=conferences,
-        page=page,
-        page_size=page_size,
-        total_pages=max(((total or 0) + page_size - 1) // page_size, 1),
-    ).model_dump(mode="json")
-    await cache_set(cache_key, payload, ttl=TTL_LIST_QUERY)
-    return payload
 
 
 @router.get("/{conference_id}", response_model=AIConferenceResponse)
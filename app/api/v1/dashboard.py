@@ -5,70 +5,28 @@ Phase 2: 대시보드용 집계/통계 API
 - /trending-keywords: 전체 카테고리에서 상위 키워드 집계
 - /category-stats: 카테고리별 빠른 통계 (개수, 최근 업데이트, 트렌드 방향)
 """
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func, desc
 from datetime import datetime, timedelta, timezone
 from typing import Dict, Any, List, Optional
-from collections import Counter
 
-from app.database import get_db
+from app.database import with_session
 from app.models.huggingface import HuggingFaceModel
-from app.models.youtube import YouTubeVideo
 from app.models.paper import AIPaper
 from app.models.news import AINews
 from app.models.github import GitHubProject
 from app.models.conference import AIConference
-from app.models.ai_tool import AITool
-from app.models.job_trend import AIJobTrend
-from app.models.policy import AIPolicy
-from app.cache import cache_get, cache_set, TTL_SYSTEM_STATUS, TTL_KEYWORDS, TTL_LIST_QUERY
+from app.cache import cached, TTL_SYSTEM_STATUS, TTL_KEYWORDS, TTL_LIST_QUERY
+from app.services.category_stats_service import CATEGORY_META, get_category_stats_snapshot
+from app.services.keyword_index_service import get_top_keywords
 from app.services.scheduler import get_scheduler_runtime_status, scheduler
 from app.services.trending_keyword_service import ExternalTrendingKeywordService
 
 router = APIRouter()
 
-# ── 카테고리 메타데이터 ──────────────────────────────────────
-CATEGORY_META = {
-    "huggingface": {"name": "Hugging Face 모델", "model": HuggingFaceModel, "date_field": "collected_at"},
-    "github": {"name": "GitHub 프로젝트", "model": GitHubProject, "date_field": "created_at"},
-    "youtube": {"name": "YouTube 영상", "model": YouTubeVideo, "date_field": "created_at"},
-    "papers": {"name": "AI 논문", "model": AIPaper, "date_field": "created_at"},
-    "news": {"name": "AI 뉴스", "model": AINews, "date_field": "created_at"},
-    "conferences": {"name": "AI 컨퍼런스", "model": AIConference, "date_field": "created_at"},
-    "tools": {"name": "AI 도구/플랫폼", "model": AITool, "date_field": "created_at"},
-    "jobs": {"name": "AI 채용", "model": AIJobTrend, "date_field": "created_at"},
-    "policies": {"name": "AI 정책", "model": AIPolicy, "date_field": "created_at"},
-}
-
-
-async def _get_count(db: AsyncSession, model) -> int:
-    """모델의 전체 레코드 수 반환."""
-    result = await db.execute(select(func.count()).select_from(model))
-    return result.scalar() or 0
-
-
-async def _get_latest_date(db: AsyncSession, model, date_field_name: str):
-    """모델의 가장 최근 날짜 반환."""
-    date_col = getattr(model, date_field_name)
-    result = await db.execute(
-        select(date_col).order_by(date_col.desc()).limit(1)
-    )
-    return result.scalar_one_or_none()
-
-
-async def _get_recent_count(db: AsyncSession, model, date_field_name: str, days: int = 7) -> int:
-    """최근 N일 내 추가된 레코드 수 반환."""
-    date_col = getattr(model, date_field_name)
-    cutoff = datetime.now(timezone.utc) - timedelta(days=days)
-    result = await db.execute(
-        select(func.count()).select_from(model).where(date_col >= cutoff)
-    )
-    return result.scalar() or 0
-
-
 @router.get("/summary")
-async def get_summary(db: AsyncSession = Depends(get_db)) -> Dict[str, Any]:
+async def get_summary() -> Dict[str, Any]:
     """
     대시보드 요약 정보
 
@@ -77,36 +35,28 @@ async def get_summary(db: AsyncSession = Depends(get_db)) -> Dict[str, Any]:
     - 최근 7일간 신규 데이터 수
     """
     cache_key = "dashboard:summary"
-    cached = await cache_get(cache_key)
-    if cached is not None:
-        return cached
+    return await cached(cache_key, _build_summary, ttl=TTL_SYSTEM_STATUS)
+
 
+async def _build_summary() -> Dict[str, Any]:
+    snapshot = await get_category_stats_snapshot()
     categories = {}
     total_items = 0
     total_recent = 0
 
     for key, meta in CATEGORY_META.items():
-        try:
-            count = await _get_count(db, meta["model"])
-            latest = await _get_latest_date(db, meta["model"], meta["date_field"])
-            recent = await _get_recent_count(db, meta["model"], meta["date_field"], days=7)
-
-            categories[key] = {
-                "name": meta["name"],
-                "total": count,
-                "recent_7d": recent,
-                "last_update": latest.isoformat() if latest else None,
-            }
-            total_items += count
-            total_recent += recent
-        except Exception as e:
-            categories[key] = {
-                "name": meta["name"],
-                "total": 0,
-                "recent_7d": 0,
-                "last_update": None,
-                "error": str(e),
-            }
+        stat = snapshot[key]
+        latest = stat["latest"]
+        categories[key] = {
+            "name": meta["name"],
+            "total": stat["total"],
+            "recent_7d": stat["recent_7d"],
+            "last_update": latest.isoformat() if latest else None,
+        }
+        if "error" in stat:
+            categories[key]["error"] = stat["error"]
+        total_items += stat["total"]
+        total_recent += stat["recent_7d"]
 
     response = {
         "total_items": total_items,
@@ -116,97 +66,52 @@ async def get_summary(db: AsyncSession = Depends(get_db)) -> Dict[str, Any]:
         "categories": categories,
     }
 
-    await cache_set(cache_key, response, ttl=TTL_SYSTEM_STATUS)
     return response
 
 
 @router.get("/trending-keywords")
 async def get_trending_keywords(
     limit: int = Query(30, ge=1, le=100, description="반환할 키워드 수"),
-    db: AsyncSession = Depends(get_db),
+    days: Optional[int] = Query(None, ge=1, le=365, description="최근 N일만 집계 (미지정 시 전체)"),
 ) -> Dict[str, Any]:
     """
     전체 카테고리에서 트렌딩 키워드 집계
 
-    - 각 카테고리의 keywords / key_features / topics 등에서 집계
-    - 빈도 순 정렬
+    - 각 카테고리의 keywords / key_features / topics 등에서 집계 (keyword_occurrences)
+    - 빈도 순 정렬 (동률은 키워드 순)
     """
-    cache_key = f"dashboard:trending_keywords:{limit}"
-    cached = await cache_get(cache_key)
-    if cached is not None:
-        return cached
-
-    all_keywords: List[str] = []
-    keyword_sources_map: Dict[str, set[str]] = {}
-
-    # 각 카테고리별 키워드 수집 (필드명이 모델마다 다름)
-    keyword_sources = [
-        (HuggingFaceModel, "key_features", "huggingface"),
-        (GitHubProject, "keywords", "github"),
-        (YouTubeVideo, "keywords", "youtube"),
-        (AIPaper, "keywords", "papers"),
-        (AINews, "keywords", "news"),
-        (AIConference, "topics", "conferences"),
-        (AITool, "key_features", "platforms"),
-        (AIJobTrend, "required_skills", "jobs"),
-        (AIPolicy, "impact_areas", "policies"),
-    ]
-
-    for model, field_name, source_name in keyword_sources:
-        try:
-            col = getattr(model, field_name)
-            result = await db.execute(
-                select(col).where(col.isnot(None)).limit(200)
-            )
-            for row in result.scalars():
-                if row and isinstance(row, list):
-                    all_keywords.extend(row)
-                    for keyword in row:
-                        if not isinstance(keyword, str):
-                            continue
-                        if keyword not in keyword_sources_map:
-                            keyword_sources_map[keyword] = set()
-                        keyword_sources_map[keyword].add(source_name)
-        except Exception:
-            continue
+    cache_key = f"dashboard:trending_keywords:{limit}:days={days}"
+    return await cached(cache_key, lambda: with_session(_build_trending_keywords, limit, days), ttl=TTL_KEYWORDS)
 
-    if not all_keywords:
-        response = {
-            "total_keywords": 0,
-            "unique_keywords": 0,
-            "top_keywords": [],
-        }
-        await cache_set(cache_key, response, ttl=TTL_KEYWORDS)
-        return response
 
-    keyword_counts = Counter(all_keywords)
-    max_count = max(keyword_counts.values()) if keyword_counts else 1
+async def _build_trending_keywords(db: AsyncSession, limit: int, days: Optional[int]) -> Dict[str, Any]:
+    since = datetime.now(timezone.utc) - timedelta(days=days) if days else None
+    result = await get_top_keywords(db, limit=limit, since=since)
+    ranked = result["top_keywords"]
+    max_count = ranked[0]["count"] if ranked else 1
 
     top_keywords = [
         {
-            "keyword": kw,
-            "count": cnt,
-            "weight": round(cnt / max_count, 3),
-            "sources": sorted(list(keyword_sources_map.get(kw, set()))),
-            "source": sorted(list(keyword_sources_map.get(kw, {"unknown"})))[0],
+            "keyword": item["keyword"],
+            "count": item["count"],
+            "weight": round(item["count"] / max_count, 3),
+            "sources": item["sources"],
+            "source": item["sources"][0] if item["sources"] else "unknown",
         }
-        for kw, cnt in keyword_counts.most_common(limit)
+        for item in ranked
     ]
 
     response = {
-        "total_keywords": len(all_keywords),
-        "unique_keywords": len(keyword_counts),
+        "total_keywords": result["total_keywords"],
+        "unique_keywords": result["unique_keywords"],
         "top_keywords": top_keywords,
     }
 
-    await cache_set(cache_key, response, ttl=TTL_KEYWORDS)
     return response
 
 
 @router.get("/category-stats")
-async def get_category_stats(
-    db: AsyncSession = Depends(get_db),
-) -> Dict[str, Any]:
+async def get_category_stats() -> Dict[str, Any]:
     """
     카테고리별 빠른 통계
 
@@ -215,80 +120,52 @@ async def get_category_stats(
     - 트렌드 방향 (최근 7일 vs 이전 7일 비교)
     """
     cache_key = "dashboard:category_stats"
-    cached = await cache_get(cache_key)
-    if cached is not None:
-        return cached
+    return await cached(cache_key, _build_category_stats, ttl=TTL_LIST_QUERY)
 
+
+async def _build_category_stats() -> Dict[str, Any]:
+    snapshot = await get_category_stats_snapshot()
     stats = []
 
     for key, meta in CATEGORY_META.items():
-        try:
-            model = meta["model"]
-            date_field_name = meta["date_field"]
-
-            count = await _get_count(db, model)
-            latest = await _get_latest_date(db, model, date_field_name)
-
-            # 트렌드 방향 계산: 최근 7일 vs 이전 7일
-            recent_7d = await _get_recent_count(db, model, date_field_name, days=7)
-            prev_7d_count = await _get_prev_period_count(db, model, date_field_name, days=7)
-
-            if prev_7d_count > 0:
-                if recent_7d > prev_7d_count:
-                    trend = "up"
-                elif recent_7d < prev_7d_count:
-                    trend = "down"
-                else:
-                    trend = "stable"
+        stat = snapshot[key]
+        latest = stat["latest"]
+
+        # 트렌드 방향 계산: 최근 7일 vs 이전 7일
+        recent_7d = stat["recent_7d"]
+        prev_7d_count = stat["prev_7d"]
+
+        if prev_7d_count > 0:
+            if recent_7d > prev_7d_count:
+                trend = "up"
+            elif recent_7d < prev_7d_count:
+                trend = "down"
             else:
-                trend = "up" if recent_7d > 0 else "stable"
-
-            stats.append({
-                "category": key,
-                "name": meta["name"],
-                "total": count,
-                "recent_7d": recent_7d,
-                "prev_7d": prev_7d_count,
-                "trend": trend,
-                "last_update": latest.isoformat() if latest else None,
-            })
-        except Exception as e:
-            stats.append({
-                "category": key,
-                "name": meta["name"],
-                "total": 0,
-                "recent_7d": 0,
-                "prev_7d": 0,
-                "trend": "stable",
-                "last_update": None,
-                "error": str(e),
-            })
+                trend = "stable"
+        else:
+            trend = "up" if recent_7d > 0 else "stable"
+
+        entry = {
+            "category": key,
+            "name": meta["name"],
+            "total": stat["total"],
+            "recent_7d": recent_7d,
+            "prev_7d": prev_7d_count,
+            "trend": trend,
+            "last_update": latest.isoformat() if latest else None,
+        }
+        if "error" in stat:
+            entry["error"] = stat["error"]
+        stats.append(entry)
 
     response = {
         "timestamp": datetime.now(timezone.utc).isoformat(),
         "categories": stats,
     }
 
-    await cache_set(cache_key, response, ttl=TTL_LIST_QUERY)
     return response
 
 
-async def _get_prev_period_count(
-    db: AsyncSession, model, date_field_name: str, days: int = 7
-) -> int:
-    """이전 기간(N일 전 ~ 2N일 전)에 추가된 레코드 수 반환."""
-    date_col = getattr(model, date_field_name)
-    now = datetime.now(timezone.utc)
-    period_start = now - timedelta(days=days * 2)
-    period_end = now - timedelta(days=days)
-    result = await db.execute(
-        select(func.count())
-        .select_from(model)
-        .where(date_col >= period_start, date_col < period_end)
-    )
-    return result.scalar() or 0
-
-
 def _safe_iso(dt: Any) -> Optional[str]:
     if isinstance(dt, datetime):
         return dt.isoformat()
@@ -466,37 +343,21 @@ def _build_recent_logs(limit: int = 5) -> List[Dict[str, Any]]:
 
 
 @router.get("/live-pulse")
-async def get_live_pulse(db: AsyncSession = Depends(get_db)) -> Dict[str, Any]:
+async def get_live_pulse() -> Dict[str, Any]:
     """대시보드 LIVE 섹션용 집계 데이터."""
     cache_key = "dashboard:live_pulse"
-    cached = await cache_get(cache_key)
-    if cached is not None:
-        return cached
+    return await cached(cache_key, lambda: with_session(_build_live_pulse), ttl=TTL_SYSTEM_STATUS)
 
-    now = datetime.now(timezone.utc)
-    start_of_day = datetime(now.year, now.month, now.day)
-    yesterday_start = start_of_day - timedelta(days=1)
 
-    today_counts: Dict[str, int] = {}
-    yesterday_counts: Dict[str, int] = {}
-    for key, meta in CATEGORY_META.items():
-        date_col = getattr(meta["model"], meta["date_field"])
-        today_count = (
-            await db.execute(
-                select(func.count())
-                .select_from(meta["model"])
-                .where(date_col >= start_of_day)
-            )
-        ).scalar() or 0
-        yesterday_count = (
-            await db.execute(
-                select(func.count())
-                .select_from(meta["model"])
-                .where(date_col >= yesterday_start, date_col < start_of_day)
-            )
-        ).scalar() or 0
-        today_counts[key] = int(today_count)
-        yesterday_counts[key] = int(yesterday_count)
+async def _build_live_pulse(db: AsyncSession) -> Dict[str, Any]:
+    now = datetime.now(timezone.utc)
+    snapshot = await get_category_stats_snapshot(now)
+    today_counts: Dict[str, int] = {
+        key: stat["today"] for key, stat in snapshot.items()
+    }
+    yesterday_counts: Dict[str, int] = {
+        key: stat["yesterday"] for key, stat in snapshot.items()
+    }
 
     total_today = sum(today_counts.values())
     total_yesterday = sum(yesterday_counts.values())
@@ -543,5 +404,4 @@ async def get_live_pulse(db: AsyncSession = Depends(get_db)) -> Dict[str, Any]:
         "recent_logs": _build_recent_logs(limit=5),
         "updated_at": datetime.now(timezone.utc).isoformat(),
     }
-    await cache_set(cache_key, response, ttl=TTL_SYSTEM_STATUS)
     return response
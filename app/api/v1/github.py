@@ -2,13 +2,14 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func
-from typing import Optional
-from app.database import get_db
+from typing import Any, Dict, Optional
+from app.database import get_db, with_session
 from app.db_compat import has_archive_column
 from app.services.github_service import GitHubService
 from app.schemas.github import GitHubProject, GitHubProjectList
 from app.models.github import GitHubProject as GitHubProjectModel
-from app.cache import cache_get, cache_set, TTL_LIST_QUERY
+from app.cache import cached, list_cache_tag, TTL_LIST_QUERY
+from app.pagination import cached_count, split_keyset_page
 
 router = APIRouter()
 
@@ -22,7 +23,7 @@ async def get_projects(
     trending_only: bool = False,
     language: Optional[str] = Query(None, description="프로그래밍 언어 (예: Python, JavaScript)"),
     include_archived: bool = Query(False, description="아카이브 데이터 포함 여부"),
-    db: AsyncSession = Depends(get_db),
+    cursor: Optional[str] = Query(None, description="키셋 페이지네이션 cursor (빈 값이면 첫 페이지)"),
 ):
     """
     GitHub 프로젝트 목록 조회
@@ -31,6 +32,7 @@ async def get_projects(
     - **limit**: 가져올 개수 (최대 100)
     - **trending_only**: 트렌딩 프로젝트만 조회
     - **language**: 프로그래밍 언어 필터
+    - **cursor**: 지정 시 OFFSET 대신 `(updated_at_github, id)` 키셋 페이지네이션 (`next_cursor` 반환)
     """
     # page/page_size 우선, skip/limit은 하위 호환
     if skip is not None or limit is not None:
@@ -43,47 +45,67 @@ async def get_projects(
     cache_key = (
         "list:github:"
         f"skip={effective_skip}:limit={effective_limit}:trending={int(trending_only)}:"
-        f"language={language or ''}:archived={int(include_archived)}"
+        f"language={language or ''}:archived={int(include_archived)}:cursor={cursor}"
     )
-    cached = await cache_get(cache_key)
-    if cached is not None:
-        return cached
-
-    supports_archive = await has_archive_column(db, "github_projects")
-    effective_include_archived = include_archived or not supports_archive
-
-    count_query = select(func.count()).select_from(GitHubProjectModel)
-    if not effective_include_archived:
-        count_query = count_query.where(GitHubProjectModel.is_archived == False)
-    if trending_only:
-        count_query = count_query.where(GitHubProjectModel.is_trending == True)
-    if language:
-        count_query = count_query.where(GitHubProjectModel.language == language)
-    total = (await db.execute(count_query)).scalar() or 0
-    total_pages = max((total + effective_limit - 1) // effective_limit, 1)
 
-    service = GitHubService()
-    projects = await service.get_projects(
-        db=db,
-        skip=effective_skip,
-        limit=effective_limit,
-        trending_only=trending_only,
-        language=language,
-        include_archived=effective_include_archived,
+    async def _load(db: AsyncSession) -> Dict[str, Any]:
+        supports_archive = await has_archive_column(db, "github_projects")
+        effective_include_archived = include_archived or not supports_archive
+
+        count_query = select(func.count()).select_from(GitHubProjectModel)
+        if not effective_include_archived:
+            count_query = count_query.where(GitHubProjectModel.is_archived == False)
+        if trending_only:
+            count_query = count_query.where(GitHubProjectModel.is_trending == True)
+        if language:
+            count_query = count_query.where(GitHubProjectModel.language == language)
+        total = await cached_count(
+            db,
+            count_query,
+            "list:github:count:"
+            f"trending={int(trending_only)}:language={language or ''}:"
+            f"archived={int(effective_include_archived)}",
+        )
+        total_pages = max((total + effective_limit - 1) // effective_limit, 1)
+
+        service = GitHubService()
+        next_cursor = None
+        if cursor is not None:
+            rows = await service.get_projects(
+                db=db,
+                limit=effective_limit + 1,
+                trending_only=trending_only,
+                language=language,
+                include_archived=effective_include_archived,
+                cursor=cursor,
+            )
+            projects, next_cursor = split_keyset_page(rows, effective_limit, "updated_at_github")
+        else:
+            projects = await service.get_projects(
+                db=db,
+                skip=effective_skip,
+                limit=effective_limit,
+                trending_only=trending_only,
+                language=language,
+                include_archived=effective_include_archived,
+            )
+
+        current_page = (effective_skip // effective_limit) + 1
+        payload = GitHubProjectList(
+            total=total,
+            projects=projects,
+            items=projects,  # 프론트 호환 필드
+            page=current_page,
+            page_size=effective_limit,
+            total_pages=total_pages,
+            next_cursor=next_cursor,
+        ).model_dump(mode="json")
+        return payload
+
+    return await cached(
+        cache_key, lambda: with_session(_load), ttl=TTL_LIST_QUERY, tag=list_cache_tag("github")
     )
 
-    current_page = (effective_skip // effective_limit) + 1
-    payload = GitHubProjectList(
-        total=total,
-        projects=projects,
-        items=projects,  # 프론트 호환 필드
-        page=current_page,
-        page_size=effective_limit,
-        total_pages=total_pages,
-    ).model_dump(mode="json")
-    await cache_set(cache_key, payload, ttl=TTL_LIST_QUERY)
-    return payload
-
 
 @router.get("/projects/{repo_name:path}", response_model=GitHubProject)
 async def get_project(
@@ -1,11 +1,12 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func
-from typing import List
+from typing import List, Optional
 
 from app.database import get_db
 from app.db_compat import has_archive_column
 from app.models.huggingface import HuggingFaceModel
+from app.pagination import apply_keyset, cached_count, split_keyset_page
 from app.schemas.huggingface import (
     HuggingFaceModelResponse,
     HuggingFaceModelList,
@@ -23,6 +24,7 @@ async def get_models(
     author: str = Query(None, description="작성자 필터"),
     trending: bool = Query(None, description="트렌딩 모델만 보기"),
     include_archived: bool = Query(False, description="아카이브 데이터 포함 여부"),
+    cursor: Optional[str] = Query(None, description="키셋 페이지네이션 cursor (빈 값이면 첫 페이지)"),
     db: AsyncSession = Depends(get_db),
 ):
     """
@@ -33,6 +35,7 @@ async def get_models(
     - **task**: 태스크 필터 (선택사항)
     - **author**: 작성자 필터 (선택사항)
     - **trending**: 트렌딩 모델만 보기 (선택사항)
+    - **cursor**: 지정 시 OFFSET 대신 `(collected_at, id)` 키셋 페이지네이션 (`next_cursor` 반환)
     """
     supports_archive = await has_archive_column(db, "huggingface_models")
     effective_include_archived = include_archived or not supports_archive
@@ -56,20 +59,34 @@ async def get_models(
         query = query.where(HuggingFaceModel.is_trending == trending)
         count_query = count_query.where(HuggingFaceModel.is_trending == trending)
 
-    # 정렬 (최신순)
-    query = query.order_by(HuggingFaceModel.collected_at.desc())
-
-    # 전체 개수 조회
-    total_result = await db.execute(count_query)
-    total = total_result.scalar()
-
-    # 페이지네이션 적용
-    offset = (page - 1) * page_size
-    query = query.offset(offset).limit(page_size)
+    # 전체 개수 조회 (필터 조합별 캐시)
+    total = await cached_count(
+        db,
+        count_query,
+        "list:huggingface:count:"
+        f"task={task or ''}:author={author or ''}:trending={trending}:"
+        f"archived={int(effective_include_archived)}",
+    )
 
-    # 실행
-    result = await db.execute(query)
-    models = result.scalars().all()
+    next_cursor = None
+    if cursor is not None:
+        # 키셋 페이지네이션 (최신순)
+        query = apply_keyset(
+            query, HuggingFaceModel.collected_at, HuggingFaceModel.id, cursor
+        ).limit(page_size + 1)
+        rows = (await db.execute(query)).scalars().all()
+        models, next_cursor = split_keyset_page(rows, page_size, "collected_at")
+    else:
+        # 정렬 (최신순)
+        query = query.order_by(HuggingFaceModel.collected_at.desc())
+
+        # 페이지네이션 적용
+        offset = (page - 1) * page_size
+        query = query.offset(offset).limit(page_size)
+
+        # 실행
+        result = await db.execute(query)
+        models = result.scalars().all()
 
     return HuggingFaceModelList(
         total=total,
@@ -77,6 +94,7 @@ async def get_models(
         page=page,
         page_size=page_size,
         total_pages=max((total + page_size - 1) // page_size, 1),
+        next_cursor=next_cursor,
     )
 
 
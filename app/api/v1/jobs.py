@@ -3,12 +3,13 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func
 import html
 import re
-from typing import Optional
-from app.database import get_db
+from typing import Any, Dict, Optional
+from app.database import get_db, with_session
 from app.db_compat import has_archive_column
 from app.models.job_trend import AIJobTrend
 from app.schemas.job_trend import AIJobTrendList
-from app.cache import cache_get, cache_set, TTL_LIST_QUERY
+from app.cache import cached, list_cache_tag, TTL_LIST_QUERY
+from app.pagination import apply_keyset, cached_count, split_keyset_page
 from app.services.job_trend_service import JobTrendService
 
 router = APIRouter()
@@ -28,6 +29,7 @@ async def list_jobs(
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
     include_archived: bool = Query(False, description="아카이브 데이터 포함 여부"),
+    cursor: Optional[str] = Query(None, description="키셋 페이지네이션 cursor (빈 값이면 첫 페이지)"),
     db: AsyncSession = Depends(get_db),
 ):
     service = JobTrendService()
@@ -42,48 +44,64 @@ async def list_jobs(
 
     offset = (page - 1) * page_size
     cache_key = (
-        f"list:jobs:skip={offset}:limit={page_size}:archived={int(effective_include_archived)}"
+        f"list:jobs:skip={offset}:limit={page_size}:archived={int(effective_include_archived)}:"
+        f"cursor={cursor}"
     )
-    cached = await cache_get(cache_key)
-    if cached is not None:
-        return cached
 
-    total = (await db.execute(count_query)).scalar() or 0
-    offset = (page - 1) * page_size
-    rows = (await db.execute(query.offset(offset).limit(page_size))).scalars().all()
-    serialized_items = []
-    for row in rows:
-        skills = row.required_skills or []
-        cleaned_description = _clean_text(row.description)
-        serialized_items.append(
-            {
-                "id": row.id,
-                "job_title": row.job_title,
-                "company_name": row.company_name or "미공개",
-                "location": row.location,
-                "is_remote": bool(row.is_remote),
-                "description": cleaned_description,
-                "salary_min": row.salary_min,
-                "salary_max": row.salary_max,
-                "required_skills": skills,
-                "keywords": row.keywords or [],
-                "created_at": row.created_at,
-                "role_category": service.classify_role_category(
-                    title=row.job_title or "",
-                    description=cleaned_description or "",
-                    skills=skills,
-                ),
-            }
+    # 백그라운드 갱신에도 쓰이므로 요청 세션이 아닌 새 세션으로 조회
+    async def _load(db: AsyncSession) -> Dict[str, Any]:
+        total = await cached_count(
+            db,
+            count_query,
+            f"list:jobs:count:archived={int(effective_include_archived)}",
         )
+        next_cursor = None
+        if cursor is not None:
+            keyset_query = apply_keyset(
+                query, AIJobTrend.created_at, AIJobTrend.id, cursor
+            ).limit(page_size + 1)
+            rows = (await db.execute(keyset_query)).scalars().all()
+            rows, next_cursor = split_keyset_page(rows, page_size, "created_at")
+        else:
+            page_query = query.order_by(AIJobTrend.created_at.desc(), AIJobTrend.id.desc())
+            rows = (await db.execute(page_query.offset(offset).limit(page_size))).scalars().all()
+        serialized_items = []
+        for row in rows:
+            skills = row.required_skills or []
+            cleaned_description = _clean_text(row.description)
+            serialized_items.append(
+                {
+                    "id": row.id,
+                    "job_title": row.job_title,
+                    "company_name": row.company_name or "미공개",
+                    "location": row.location,
+                    "is_remote": bool(row.is_remote),
+                    "description": cleaned_description,
+                    "salary_min": row.salary_min,
+                    "salary_max": row.salary_max,
+                    "required_skills": skills,
+                    "keywords": row.keywords or [],
+                    "created_at": row.created_at,
+                    "role_category": service.classify_role_category(
+                        title=row.job_title or "",
+                        description=cleaned_description or "",
+                        skills=skills,
+                    ),
+                }
+            )
+
+        trending_skills = await service.get_trending_skills(db, limit=10)
+        payload = AIJobTrendList(
+            total=total,
+            items=serialized_items,
+            trending_skills=trending_skills,
+            page=page,
+            page_size=page_size,
+            total_pages=max((total + page_size - 1) // page_size, 1),
+            next_cursor=next_cursor,
+        ).model_dump(mode="json")
+        return payload
 
-    trending_skills = await service.get_trending_skills(db, limit=10)
-    payload = AIJobTrendList(
-        total=total,
-        items=serialized_items,
-        trending_skills=trending_skills,
-        page=page,
-        page_size=page_size,
-        total_pages=max((total + page_size - 1) // page_size, 1),
-    ).model_dump(mode="json")
-    await cache_set(cache_key, payload, ttl=TTL_LIST_QUERY)
-    return payload
+    return await cached(
+        cache_key, lambda: with_session(_load), ttl=TTL_LIST_QUERY, tag=list_cache_tag("jobs")
+    )
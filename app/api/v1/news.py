@@ -2,13 +2,15 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func
-from typing import Optional
-from app.database import get_db
+from typing import Any, Dict, Optional
+from app.database import get_db, with_session
 from app.db_compat import has_archive_column
-from app.services.news_service import NewsService
+from app.services.news_service import NewsService, news_list_filters
+from app.services.news_dedup_service import cluster_representative_clause
 from app.schemas.news import AINews, AINewsList
 from app.models.news import AINews as AINewsModel
-from app.cache import cache_get, cache_set, TTL_LIST_QUERY
+from app.cache import cached, list_cache_tag, TTL_LIST_QUERY
+from app.pagination import cached_count, split_keyset_page
 
 router = APIRouter()
 
@@ -22,7 +24,9 @@ async def get_news(
     trending_only: bool = False,
     source: Optional[str] = Query(None, description="뉴스 소스 (예: TechCrunch AI)"),
     include_archived: bool = Query(False, description="아카이브 데이터 포함 여부"),
-    db: AsyncSession = Depends(get_db),
+    cursor: Optional[str] = Query(None, description="키셋 페이지네이션 cursor (빈 값이면 첫 페이지)"),
+    collapse_duplicates: bool = Query(True, description="같은 이야기(근사 중복 클러스터)는 대표 기사만 표시"),
+    cluster_id: Optional[int] = Query(None, description="클러스터 id — 같은 이야기를 다룬 기사 전체 조회"),
 ):
     """
     AI 뉴스 목록 조회
@@ -31,6 +35,9 @@ async def get_news(
     - **limit**: 가져올 개수 (최대 100)
     - **trending_only**: 트렌딩 뉴스만 조회
     - **source**: 소스 필터
+    - **cursor**: 지정 시 OFFSET 대신 `(published_date, id)` 키셋 페이지네이션 (`next_cursor` 반환)
+    - **collapse_duplicates**: 여러 매체의 같은 이야기는 최초 기사 1건만 (기본값)
+    - **cluster_id**: 해당 클러스터 기사 전체 (중복 접기 무시)
     """
     # page/page_size 우선, skip/limit은 하위 호환
     if skip is not None or limit is not None:
@@ -43,47 +50,79 @@ async def get_news(
     cache_key = (
         "list:news:"
         f"skip={effective_skip}:limit={effective_limit}:trending={int(trending_only)}:"
-        f"source={source or ''}:archived={int(include_archived)}"
+        f"source={source or ''}:archived={int(include_archived)}:cursor={cursor}:"
+        f"collapse={int(collapse_duplicates)}:cluster={cluster_id or ''}"
     )
-    cached = await cache_get(cache_key)
-    if cached is not None:
-        return cached
-
-    supports_archive = await has_archive_column(db, "ai_news")
-    effective_include_archived = include_archived or not supports_archive
-
-    count_query = select(func.count()).select_from(AINewsModel)
-    if not effective_include_archived:
-        count_query = count_query.where(AINewsModel.is_archived == False)
-    if trending_only:
-        count_query = count_query.where(AINewsModel.is_trending == True)
-    if source:
-        count_query = count_query.where(AINewsModel.source == source)
-    total = (await db.execute(count_query)).scalar() or 0
-    total_pages = max((total + effective_limit - 1) // effective_limit, 1)
 
-    service = NewsService()
-    news = await service.get_news(
-        db=db,
-        skip=effective_skip,
-        limit=effective_limit,
-        trending_only=trending_only,
-        source=source,
-        include_archived=effective_include_archived,
+    async def _load(db: AsyncSession) -> Dict[str, Any]:
+        supports_archive = await has_archive_column(db, "ai_news")
+        effective_include_archived = include_archived or not supports_archive
+
+        def visible(news) -> list:
+            return news_list_filters(
+                news,
+                include_archived=effective_include_archived,
+                trending_only=trending_only,
+                source=source,
+            )
+
+        count_query = select(func.count()).select_from(AINewsModel).where(*visible(AINewsModel))
+        if cluster_id is not None:
+            count_query = count_query.where(AINewsModel.cluster_id == cluster_id)
+        elif collapse_duplicates:
+            count_query = count_query.where(cluster_representative_clause(visible))
+        total = await cached_count(
+            db,
+            count_query,
+            "list:news:count:"
+            f"trending={int(trending_only)}:source={source or ''}:"
+            f"archived={int(effective_include_archived)}:"
+            f"collapse={int(collapse_duplicates)}:cluster={cluster_id or ''}",
+        )
+        total_pages = max((total + effective_limit - 1) // effective_limit, 1)
+
+        service = NewsService()
+        next_cursor = None
+        if cursor is not None:
+            rows = await service.get_news(
+                db=db,
+                limit=effective_limit + 1,
+                trending_only=trending_only,
+                source=source,
+                include_archived=effective_include_archived,
+                collapse_duplicates=collapse_duplicates,
+                cluster_id=cluster_id,
+                cursor=cursor,
+            )
+            news, next_cursor = split_keyset_page(rows, effective_limit, "published_date")
+        else:
+            news = await service.get_news(
+                db=db,
+                skip=effective_skip,
+                limit=effective_limit,
+                trending_only=trending_only,
+                source=source,
+                include_archived=effective_include_archived,
+                collapse_duplicates=collapse_duplicates,
+                cluster_id=cluster_id,
+            )
+
+        current_page = (effective_skip // effective_limit) + 1
+        payload = AINewsList(
+            total=total,
+            news=news,
+            items=news,
+            page=current_page,
+            page_size=effective_limit,
+            total_pages=total_pages,
+            next_cursor=next_cursor,
+        ).model_dump(mode="json")
+        return payload
+
+    return await cached(
+        cache_key, lambda: with_session(_load), ttl=TTL_LIST_QUERY, tag=list_cache_tag("news")
     )
 
-    current_page = (effective_skip // effective_limit) + 1
-    payload = AINewsList(
-        total=total,
-        news=news,
-        items=news,
-        page=current_page,
-        page_size=effective_limit,
-        total_pages=total_pages,
-    ).model_dump(mode="json")
-    await cache_set(cache_key, payload, ttl=TTL_LIST_QUERY)
-    return payload
-
 
 @router.get("/news/{news_id}", response_model=AINews)
 async def get_news_item(
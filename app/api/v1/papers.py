@@ -3,13 +3,14 @@ import re
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func
-from typing import Optional
-from app.database import get_db
+from typing import Any, Dict, Optional
+from app.database import get_db, with_session
 from app.db_compat import has_archive_column
 from app.services.arxiv_service import ArxivService
 from app.schemas.paper import AIPaper, AIPaperList
 from app.models.paper import AIPaper as AIPaperModel
-from app.cache import cache_get, cache_set, TTL_LIST_QUERY
+from app.cache import cached, list_cache_tag, TTL_LIST_QUERY
+from app.pagination import cached_count, split_keyset_page
 
 router = APIRouter()
 ARXIV_ID_PATTERN = re.compile(
@@ -27,7 +28,7 @@ async def get_papers(
     trending_only: bool = False,
     category: Optional[str] = Query(None, description="arXiv 카테고리 (예: cs.AI, cs.LG)"),
     include_archived: bool = Query(False, description="아카이브 데이터 포함 여부"),
-    db: AsyncSession = Depends(get_db),
+    cursor: Optional[str] = Query(None, description="키셋 페이지네이션 cursor (빈 값이면 첫 페이지)"),
 ):
     """
     AI 논문 목록 조회
@@ -36,6 +37,7 @@ async def get_papers(
     - **limit**: 가져올 개수 (최대 100)
     - **trending_only**: 트렌딩 논문만 조회
     - **category**: 카테고리 필터 (cs.AI, cs.LG, cs.CL, cs.CV 등)
+    - **cursor**: 지정 시 OFFSET 대신 `(published_date, id)` 키셋 페이지네이션 (`next_cursor` 반환)
     """
     # page/page_size 우선, skip/limit은 하위 호환
     if skip is not None or limit is not None:
@@ -48,47 +50,67 @@ async def get_papers(
     cache_key = (
         "list:papers:"
         f"skip={effective_skip}:limit={effective_limit}:trending={int(trending_only)}:"
-        f"category={category or ''}:archived={int(include_archived)}"
+        f"category={category or ''}:archived={int(include_archived)}:cursor={cursor}"
     )
-    cached = await cache_get(cache_key)
-    if cached is not None:
-        return cached
-
-    supports_archive = await has_archive_column(db, "ai_papers")
-    effective_include_archived = include_archived or not supports_archive
-
-    count_query = select(func.count()).select_from(AIPaperModel)
-    if not effective_include_archived:
-        count_query = count_query.where(AIPaperModel.is_archived == False)
-    if trending_only:
-        count_query = count_query.where(AIPaperModel.is_trending == True)
-    if category:
-        count_query = count_query.where(AIPaperModel.categories.contains([category]))
-    total = (await db.execute(count_query)).scalar() or 0
-    total_pages = max((total + effective_limit - 1) // effective_limit, 1)
 
-    service = ArxivService()
-    papers = await service.get_papers(
-        db=db,
-        skip=effective_skip,
-        limit=effective_limit,
-        trending_only=trending_only,
-        category=category,
-        include_archived=effective_include_archived,
+    async def _load(db: AsyncSession) -> Dict[str, Any]:
+        supports_archive = await has_archive_column(db, "ai_papers")
+        effective_include_archived = include_archived or not supports_archive
+
+        count_query = select(func.count()).select_from(AIPaperModel)
+        if not effective_include_archived:
+            count_query = count_query.where(AIPaperModel.is_archived == False)
+        if trending_only:
+            count_query = count_query.where(AIPaperModel.is_trending == True)
+        if category:
+            count_query = count_query.where(AIPaperModel.categories.contains([category]))
+        total = await cached_count(
+            db,
+            count_query,
+            "list:papers:count:"
+            f"trending={int(trending_only)}:category={category or ''}:"
+            f"archived={int(effective_include_archived)}",
+        )
+        total_pages = max((total + effective_limit - 1) // effective_limit, 1)
+
+        service = ArxivService()
+        next_cursor = None
+        if cursor is not None:
+            rows = await service.get_papers(
+                db=db,
+                limit=effective_limit + 1,
+                trending_only=trending_only,
+                category=category,
+                include_archived=effective_include_archived,
+                cursor=cursor,
+            )
+            papers, next_cursor = split_keyset_page(rows, effective_limit, "published_date")
+        else:
+            papers = await service.get_papers(
+                db=db,
+                skip=effective_skip,
+                limit=effective_limit,
+                trending_only=trending_only,
+                category=category,
+                include_archived=effective_include_archived,
+            )
+
+        current_page = (effective_skip // effective_limit) + 1
+        payload = AIPaperList(
+            total=total,
+            papers=papers,
+            items=papers,
+            page=current_page,
+            page_size=effective_limit,
+            total_pages=total_pages,
+            next_cursor=next_cursor,
+        ).model_dump(mode="json")
+        return payload
+
+    return await cached(
+        cache_key, lambda: with_session(_load), ttl=TTL_LIST_QUERY, tag=list_cache_tag("papers")
     )
 
-    current_page = (effective_skip // effective_limit) + 1
-    payload = AIPaperList(
-        total=total,
-        papers=papers,
-        items=papers,
-        page=current_page,
-        page_size=effective_limit,
-        total_pages=total_pages,
-    ).model_dump(mode="json")
-    await cache_set(cache_key, payload, ttl=TTL_LIST_QUERY)
-    return payload
-
 
 @router.get("/search")
 async def search_papers(
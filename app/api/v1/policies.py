@@ -3,12 +3,13 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func
 import html
 import re
-from typing import Optional
-from app.database import get_db
+from typing import Any, Dict, Optional
+from app.database import get_db, with_session
 from app.db_compat import has_archive_column
 from app.models.policy import AIPolicy
 from app.schemas.policy import AIPolicyList
-from app.cache import cache_get, cache_set, TTL_LIST_QUERY
+from app.cache import cached, list_cache_tag, TTL_LIST_QUERY
+from app.pagination import apply_keyset, cached_count, split_keyset_page
 
 router = APIRouter()
 
@@ -27,6 +28,7 @@ async def list_policies(
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
     include_archived: bool = Query(False, description="아카이브 데이터 포함 여부"),
+    cursor: Optional[str] = Query(None, description="키셋 페이지네이션 cursor (빈 값이면 첫 페이지)"),
     db: AsyncSession = Depends(get_db),
 ):
     supports_archive = await has_archive_column(db, "ai_policies")
@@ -40,23 +42,40 @@ async def list_policies(
 
     offset = (page - 1) * page_size
     cache_key = (
-        f"list:policies:skip={offset}:limit={page_size}:archived={int(effective_include_archived)}"
+        f"list:policies:skip={offset}:limit={page_size}:archived={int(effective_include_archived)}:"
+        f"cursor={cursor}"
+    )
+
+    # 백그라운드 갱신에도 쓰이므로 요청 세션이 아닌 새 세션으로 조회
+    async def _load(db: AsyncSession) -> Dict[str, Any]:
+        total = await cached_count(
+            db,
+            count_query,
+            f"list:policies:count:archived={int(effective_include_archived)}",
+        )
+        next_cursor = None
+        if cursor is not None:
+            keyset_query = apply_keyset(
+                query, AIPolicy.created_at, AIPolicy.id, cursor
+            ).limit(page_size + 1)
+            rows = (await db.execute(keyset_query)).scalars().all()
+            items, next_cursor = split_keyset_page(rows, page_size, "created_at")
+        else:
+            page_query = query.order_by(AIPolicy.created_at.desc(), AIPolicy.id.desc())
+            items = (await db.execute(page_query.offset(offset).limit(page_size))).scalars().all()
+        for item in items:
+            item.title = _clean_text(item.title) or item.title
+            item.description = _clean_text(item.description)
+        payload = AIPolicyList(
+            total=total,
+            items=items,
+            page=page,
+            page_size=page_size,
+            total_pages=max((total + page_size - 1) // page_size, 1),
+            next_cursor=next_cursor,
+        ).model_dump(mode="json")
+        return payload
+
+    return await cached(
+        cache_key, lambda: with_session(_load), ttl=TTL_LIST_QUERY, tag=list_cache_tag("policies")
     )
-    cached = await cache_get(cache_key)
-    if cached is not None:
-        return cached
-
-    total = (await db.execute(count_query)).scalar() or 0
-    items = (await db.execute(query.offset(offset).limit(page_size))).scalars().all()
-    for item in items:
-        item.title = _clean_text(item.title) or item.title
-        item.description = _clean_text(item.description)
-    payload = AIPolicyList(
-        total=total,
-        items=items,
-        page=page,
-        page_size=page_size,
-        total_pages=max((total + page_size - 1) // page_size, 1),
-    ).model_dump(mode="json")
-    await cache_set(cache_key, payload, ttl=TTL_LIST_QUERY)
-    return payload
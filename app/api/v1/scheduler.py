@@ -12,10 +12,13 @@ async def trigger_collection():
 
     스케줄 대기 없이 지금 바로 데이터 수집을 시작합니다.
     """
-    await run_collection_now()
+    summary = await run_collection_now()
     return {
         "success": True,
-        "message": "데이터 수집이 완료되었습니다"
+        "message": "데이터 수집이 완료되었습니다",
+        "status": summary["status"],
+        "duration_ms": summary["duration_ms"],
+        "collectors": summary["collectors"],
     }
 
 
@@ -1,18 +1,40 @@
 """전역 검색 API 엔드포인트"""
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
+import asyncio
 import logging
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Query
 from sqlalchemy import text
-from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.cache import TTL_LIST_QUERY, cache_get, cache_set
-from app.database import get_db
+from app.cache import TTL_LIST_QUERY, cached
+from app.config import get_settings
+from app.database import AsyncSessionLocal
+from app.db_compat import has_column
+from app.models.search_document import search_document_sql
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
+settings = get_settings()
 
 
+# 프로세스 전체에서 동시에 실행하는 카테고리 쿼리 수 (요청마다 8개씩 열면 동시 검색 2건에 풀이 고갈되고
+# 풀 대기만으로 데드라인을 넘겨 정상 DB에서도 degraded가 됨)
+_query_slots = asyncio.Semaphore(max(1, settings.search_query_concurrency))
+
+# 카테고리 → 검색 대상 테이블
+SEARCH_TABLES = {
+    "huggingface": "huggingface_models",
+    "youtube": "youtube_videos",
+    "papers": "ai_papers",
+    "news": "ai_news",
+    "github": "github_projects",
+    "conferences": "ai_conferences",
+    "jobs": "ai_job_trends",
+    "policies": "ai_policies",
+}
+
+# `{document}`는 search_vector 컬럼(GIN 인덱스) 또는 마이그레이션 미적용 시
+# 동일한 인라인 to_tsvector 표현식으로 치환됩니다. ILIKE는 pg_trgm 인덱스를 사용합니다.
 SEARCH_QUERIES = {
     "huggingface": """
         SELECT
@@ -21,17 +43,11 @@ SEARCH_QUERIES = {
             model_name AS title,
             COALESCE(summary, description, '') AS snippet,
             url,
-            COALESCE(
-              ts_rank(
-                to_tsvector('simple', COALESCE(model_name,'') || ' ' || COALESCE(description,'') || ' ' || COALESCE(task,'')),
-                plainto_tsquery('simple', :q)
-              ),
-              0
-            ) AS score,
+            COALESCE(ts_rank({document}, query), 0) AS score,
             collected_at AS published_at
-        FROM huggingface_models
+        FROM huggingface_models, plainto_tsquery('simple', :q) AS query
         WHERE
-            to_tsvector('simple', COALESCE(model_name,'') || ' ' || COALESCE(description,'') || ' ' || COALESCE(task,'')) @@ plainto_tsquery('simple', :q)
+            {document} @@ query
             OR model_name ILIKE :q_like
             OR description ILIKE :q_like
         ORDER BY score DESC, collected_at DESC NULLS LAST
@@ -44,17 +60,11 @@ SEARCH_QUERIES = {
             title,
             COALESCE(summary, description, '') AS snippet,
             ('https://www.youtube.com/watch?v=' || video_id) AS url,
-            COALESCE(
-              ts_rank(
-                to_tsvector('simple', COALESCE(title,'') || ' ' || COALESCE(description,'') || ' ' || COALESCE(channel_title,'')),
-                plainto_tsquery('simple', :q)
-              ),
-              0
-            ) AS score,
+            COALESCE(ts_rank({document}, query), 0) AS score,
             published_at
-        FROM youtube_videos
+        FROM youtube_videos, plainto_tsquery('simple', :q) AS query
         WHERE
-            to_tsvector('simple', COALESCE(title,'') || ' ' || COALESCE(description,'') || ' ' || COALESCE(channel_title,'')) @@ plainto_tsquery('simple', :q)
+            {document} @@ query
             OR title ILIKE :q_like
             OR description ILIKE :q_like
             OR channel_title ILIKE :q_like
@@ -68,17 +78,11 @@ SEARCH_QUERIES = {
             title,
             COALESCE(summary, abstract, '') AS snippet,
             COALESCE(arxiv_url, pdf_url) AS url,
-            COALESCE(
-              ts_rank(
-                to_tsvector('simple', COALESCE(title,'') || ' ' || COALESCE(abstract,'')),
-                plainto_tsquery('simple', :q)
-              ),
-              0
-            ) AS score,
+            COALESCE(ts_rank({document}, query), 0) AS score,
             published_date AS published_at
-        FROM ai_papers
+        FROM ai_papers, plainto_tsquery('simple', :q) AS query
         WHERE
-            to_tsvector('simple', COALESCE(title,'') || ' ' || COALESCE(abstract,'')) @@ plainto_tsquery('simple', :q)
+            {document} @@ query
             OR title ILIKE :q_like
             OR abstract ILIKE :q_like
         ORDER BY score DESC, published_date DESC NULLS LAST
@@ -91,17 +95,11 @@ SEARCH_QUERIES = {
             title,
             COALESCE(summary, excerpt, content, '') AS snippet,
             url,
-            COALESCE(
-              ts_rank(
-                to_tsvector('simple', COALESCE(title,'') || ' ' || COALESCE(content,'') || ' ' || COALESCE(excerpt,'')),
-                plainto_tsquery('simple', :q)
-              ),
-              0
-            ) AS score,
+            COALESCE(ts_rank({document}, query), 0) AS score,
             published_date AS published_at
-        FROM ai_news
+        FROM ai_news, plainto_tsquery('simple', :q) AS query
         WHERE
-            to_tsvector('simple', COALESCE(title,'') || ' ' || COALESCE(content,'') || ' ' || COALESCE(excerpt,'')) @@ plainto_tsquery('simple', :q)
+            {document} @@ query
             OR title ILIKE :q_like
             OR content ILIKE :q_like
             OR excerpt ILIKE :q_like
@@ -115,17 +113,11 @@ SEARCH_QUERIES = {
             COALESCE(repo_name, name) AS title,
             COALESCE(summary, description, '') AS snippet,
             url,
-            COALESCE(
-              ts_rank(
-                to_tsvector('simple', COALESCE(repo_name,'') || ' ' || COALESCE(name,'') || ' ' || COALESCE(description,'')),
-                plainto_tsquery('simple', :q)
-              ),
-              0
-            ) AS score,
+            COALESCE(ts_rank({document}, query), 0) AS score,
             created_at AS published_at
-        FROM github_projects
+        FROM github_projects, plainto_tsquery('simple', :q) AS query
         WHERE
-            to_tsvector('simple', COALESCE(repo_name,'') || ' ' || COALESCE(name,'') || ' ' || COALESCE(description,'')) @@ plainto_tsquery('simple', :q)
+            {document} @@ query
             OR repo_name ILIKE :q_like
             OR name ILIKE :q_like
             OR description ILIKE :q_like
@@ -139,17 +131,11 @@ SEARCH_QUERIES = {
             conference_name AS title,
             COALESCE(summary, conference_acronym, '') AS snippet,
             website_url AS url,
-            COALESCE(
-              ts_rank(
-                to_tsvector('simple', COALESCE(conference_name,'') || ' ' || COALESCE(conference_acronym,'')),
-                plainto_tsquery('simple', :q)
-              ),
-              0
-            ) AS score,
+            COALESCE(ts_rank({document}, query), 0) AS score,
             start_date AS published_at
-        FROM ai_conferences
+        FROM ai_conferences, plainto_tsquery('simple', :q) AS query
         WHERE
-            to_tsvector('simple', COALESCE(conference_name,'') || ' ' || COALESCE(conference_acronym,'')) @@ plainto_tsquery('simple', :q)
+            {document} @@ query
             OR conference_name ILIKE :q_like
             OR conference_acronym ILIKE :q_like
             OR summary ILIKE :q_like
@@ -163,17 +149,11 @@ SEARCH_QUERIES = {
             job_title AS title,
             COALESCE(summary, description, '') AS snippet,
             job_url AS url,
-            COALESCE(
-              ts_rank(
-                to_tsvector('simple', COALESCE(job_title,'') || ' ' || COALESCE(description,'')),
-                plainto_tsquery('simple', :q)
-              ),
-              0
-            ) AS score,
+            COALESCE(ts_rank({document}, query), 0) AS score,
             posted_date AS published_at
-        FROM ai_job_trends
+        FROM ai_job_trends, plainto_tsquery('simple', :q) AS query
         WHERE
-            to_tsvector('simple', COALESCE(job_title,'') || ' ' || COALESCE(description,'')) @@ plainto_tsquery('simple', :q)
+            {document} @@ query
             OR job_title ILIKE :q_like
             OR description ILIKE :q_like
             OR company_name ILIKE :q_like
@@ -187,17 +167,11 @@ SEARCH_QUERIES = {
             title,
             COALESCE(summary, description, '') AS snippet,
             source_url AS url,
-            COALESCE(
-              ts_rank(
-                to_tsvector('simple', COALESCE(title,'') || ' ' || COALESCE(description,'')),
-                plainto_tsquery('simple', :q)
-              ),
-              0
-            ) AS score,
+            COALESCE(ts_rank({document}, query), 0) AS score,
             effective_date AS published_at
-        FROM ai_policies
+        FROM ai_policies, plainto_tsquery('simple', :q) AS query
         WHERE
-            to_tsvector('simple', COALESCE(title,'') || ' ' || COALESCE(description,'')) @@ plainto_tsquery('simple', :q)
+            {document} @@ query
             OR title ILIKE :q_like
             OR description ILIKE :q_like
             OR country ILIKE :q_like
@@ -207,46 +181,106 @@ SEARCH_QUERIES = {
 }
 
 
+async def _run_category_query(
+    category: str,
+    sql: str,
+    params: Dict[str, Any],
+) -> List[Dict[str, Any]]:
+    """카테고리 단일 쿼리 실행 (`_query_slots` 슬롯을 잡은 동안 풀 커넥션 1개 사용)."""
+    table_name = SEARCH_TABLES[category]
+    async with AsyncSessionLocal() as session:
+        if await has_column(session, table_name, "search_vector"):
+            document = "search_vector"
+        else:
+            document = search_document_sql(table_name)
+        result = await session.execute(text(sql.format(document=document)), params)
+        return [
+            {
+                "category": row["category"],
+                "id": row["item_id"],
+                "title": row["title"],
+                "snippet": row["snippet"],
+                "url": row["url"],
+                "score": float(row["score"] or 0),
+                "published_at": (
+                    row["published_at"].isoformat()
+                    if row.get("published_at") is not None
+                    else None
+                ),
+            }
+            for row in result.mappings().all()
+        ]
+
+
+async def _search_categories(
+    params: Dict[str, Any],
+    timeout: float,
+) -> Tuple[List[Dict[str, Any]], List[str]]:
+    """전체 카테고리 쿼리를 동시에 실행하고 데드라인 초과 카테고리를 분리.
+
+    동시 실행 수는 `_query_slots`로 제한하며, 데드라인은 슬롯을 잡은 뒤(쿼리 실행)부터 적용.
+
+    Returns:
+        (검색 결과 rows, 데드라인 초과/오류로 누락된 카테고리 목록)
+    """
+
+    async def _bounded(category: str) -> List[Dict[str, Any]]:
+        async with _query_slots:
+            return await asyncio.wait_for(
+                _run_category_query(category, SEARCH_QUERIES[category], params),
+                timeout=timeout,
+            )
+
+    categories = list(SEARCH_QUERIES.keys())
+    outcomes = await asyncio.gather(
+        *(_bounded(category) for category in categories),
+        return_exceptions=True,
+    )
+
+    rows: List[Dict[str, Any]] = []
+    degraded: List[str] = []
+    for category, outcome in zip(categories, outcomes):
+        if isinstance(outcome, asyncio.TimeoutError):
+            logger.warning("search query timed out (%s, %.1fs)", category, timeout)
+            degraded.append(category)
+        elif isinstance(outcome, BaseException):
+            # 스키마 불일치나 특정 테이블 오류가 있어도 전체 검색은 계속 동작
+            logger.warning("search query skipped (%s): %s", category, outcome)
+            degraded.append(category)
+        else:
+            rows.extend(outcome)
+    return rows, degraded
+
+
 @router.get("")
 async def global_search(
     q: str = Query(..., min_length=2, description="검색어"),
     page: int = Query(1, ge=1, description="페이지 번호"),
     page_size: int = Query(20, ge=1, le=100, description="페이지당 항목 수"),
-    db: AsyncSession = Depends(get_db),
 ) -> Dict[str, Any]:
-    """카테고리 통합 전역 검색 (FTS + ILIKE fallback)."""
+    """카테고리 통합 전역 검색 (FTS + ILIKE fallback).
+
+    카테고리별 쿼리는 프로세스 전체 동시 실행 수 제한 안에서 각자의 커넥션으로 실행되며,
+    데드라인을 넘긴 카테고리는 `degraded_categories`로 보고하고 제외합니다.
+    """
     cache_key = f"search:{q}:{page}:{page_size}"
-    cached = await cache_get(cache_key)
-    if cached is not None:
-        return cached
+    # 부분 결과는 캐시하지 않음 (다음 요청에서 전체 결과 재시도)
+    return await cached(
+        cache_key,
+        lambda: _build_search_page(q, page, page_size),
+        ttl=TTL_LIST_QUERY,
+        cache_if=lambda payload: not payload["partial"],
+    )
+
 
+async def _build_search_page(q: str, page: int, page_size: int) -> Dict[str, Any]:
     per_source = min(max(page_size * 4, 20), 120)
     params = {"q": q, "q_like": f"%{q}%", "per_source": per_source}
 
-    rows: List[Dict[str, Any]] = []
-    for category, sql in SEARCH_QUERIES.items():
-        try:
-            result = await db.execute(text(sql), params)
-            for row in result.mappings().all():
-                rows.append(
-                    {
-                        "category": row["category"],
-                        "id": row["item_id"],
-                        "title": row["title"],
-                        "snippet": row["snippet"],
-                        "url": row["url"],
-                        "score": float(row["score"] or 0),
-                        "published_at": (
-                            row["published_at"].isoformat()
-                            if row.get("published_at") is not None
-                            else None
-                        ),
-                    }
-                )
-        except Exception as e:
-            # 스키마 불일치나 특정 테이블 오류가 있어도 전체 검색은 계속 동작
-            logger.warning("search query skipped (%s): %s", category, e)
-            continue
+    rows, degraded_categories = await _search_categories(
+        params,
+        timeout=settings.search_category_timeout_seconds,
+    )
 
     rows.sort(
         key=lambda x: (
@@ -267,6 +301,7 @@ async def global_search(
         "page_size": page_size,
         "total_pages": total_pages,
         "items": items,
+        "partial": bool(degraded_categories),
+        "degraded_categories": degraded_categories,
     }
-    await cache_set(cache_key, payload, ttl=TTL_LIST_QUERY)
     return payload
@@ -1,13 +1,12 @@
 """시스템 상태 API 엔드포인트"""
-from fastapi import APIRouter, Depends, Query, HTTPException, BackgroundTasks
+from fastapi import APIRouter, Query, HTTPException, BackgroundTasks
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func, text
 from datetime import datetime, timedelta, timezone
-from typing import Dict, Any, List
-from collections import Counter
+from typing import Dict, Any, List, Optional
 from pathlib import Path
 
-from app.database import get_db
+from app.database import with_session
 from app.models.huggingface import HuggingFaceModel
 from app.models.github import GitHubProject
 from app.models.youtube import YouTubeVideo
@@ -18,8 +17,15 @@ from app.models.ai_tool import AITool
 from app.models.job_trend import AIJobTrend
 from app.models.policy import AIPolicy
 from app.services.scheduler import collect_all_data, scheduler, get_scheduler_runtime_status
+from app.services.keyword_index_service import get_top_keywords
+from app.services.collection_run_service import (
+    get_collection_run_history,
+    get_collection_run_percentiles,
+)
+from app.services.keyword_extraction_service import get_keyword_extractor
 from app.config import get_settings
-from app.cache import cache_get, cache_set, TTL_SYSTEM_STATUS, TTL_KEYWORDS, get_redis, get_visitor_counts
+from app.executors import get_executor_stats
+from app.cache import cached, TTL_SYSTEM_STATUS, TTL_KEYWORDS, get_redis, get_visitor_counts
 import asyncio
 
 router = APIRouter()
@@ -27,7 +33,7 @@ settings = get_settings()
 
 
 @router.get("/status")
-async def get_system_status(db: AsyncSession = Depends(get_db)) -> Dict[str, Any]:
+async def get_system_status() -> Dict[str, Any]:
     """
     시스템 전체 상태 조회
 
@@ -36,10 +42,10 @@ async def get_system_status(db: AsyncSession = Depends(get_db)) -> Dict[str, Any
     - 각 카테고리별 데이터 개수 및 최신 업데이트 시간
     """
     cache_key = "system:status"
-    cached = await cache_get(cache_key)
-    if cached is not None:
-        return cached
+    return await cached(cache_key, lambda: with_session(_build_system_status), ttl=TTL_SYSTEM_STATUS)
 
+
+async def _build_system_status(db: AsyncSession) -> Dict[str, Any]:
     # Database connectivity test
     db_connected = False
     try:
@@ -519,184 +525,54 @@ async def get_system_status(db: AsyncSession = Depends(get_db)) -> Dict[str, Any
         "total_categories": len(categories_status),
         "categories": categories_status,
     }
-    await cache_set(cache_key, response, ttl=TTL_SYSTEM_STATUS)
     return response
 
 
 @router.get("/keywords")
 async def get_keywords(
-    db: AsyncSession = Depends(get_db),
-    limit: int = 50
+    limit: int = 50,
+    days: Optional[int] = Query(None, ge=1, le=365, description="최근 N일만 집계 (미지정 시 전체)"),
 ) -> Dict[str, Any]:
     """
     전체 카테고리에서 키워드 집계
 
-    - 모든 카테고리의 keywords 필드를 합산
-    - 빈도수 기준으로 정렬
+    - 모든 카테고리의 keywords 필드를 합산 (keyword_occurrences 인덱스)
+    - 빈도수 기준으로 정렬 (동률은 키워드 순)
     - 워드 클라우드 및 키워드 순위용 데이터 제공
     """
 
-    cache_key = f"system:keywords:{limit}"
-    cached = await cache_get(cache_key)
-    if cached is not None:
-        return cached
-
-    all_keywords = []
-
-    # Hugging Face keywords
-    try:
-        hf_result = await db.execute(
-            select(HuggingFaceModel.key_features).where(
-                HuggingFaceModel.key_features.isnot(None)
-            ).limit(100)
-        )
-        for row in hf_result.scalars():
-            if row and isinstance(row, list):
-                all_keywords.extend(row)
-    except Exception:
-        pass
-
-    # GitHub keywords
-    try:
-        gh_result = await db.execute(
-            select(GitHubProject.keywords).where(
-                GitHubProject.keywords.isnot(None)
-            ).limit(100)
-        )
-        for row in gh_result.scalars():
-            if row and isinstance(row, list):
-                all_keywords.extend(row)
-    except Exception:
-        pass
-
-    # YouTube keywords
-    try:
-        yt_result = await db.execute(
-            select(YouTubeVideo.keywords).where(
-                YouTubeVideo.keywords.isnot(None)
-            ).limit(100)
-        )
-        for row in yt_result.scalars():
-            if row and isinstance(row, list):
-                all_keywords.extend(row)
-    except Exception:
-        pass
-
-    # AI Papers keywords
-    try:
-        paper_result = await db.execute(
-            select(AIPaper.keywords).where(
-                AIPaper.keywords.isnot(None)
-            ).limit(100)
-        )
-        for row in paper_result.scalars():
-            if row and isinstance(row, list):
-                all_keywords.extend(row)
-    except Exception:
-        pass
-
-    # AI News keywords
-    try:
-        news_result = await db.execute(
-            select(AINews.keywords).where(
-                AINews.keywords.isnot(None)
-            ).limit(100)
-        )
-        for row in news_result.scalars():
-            if row and isinstance(row, list):
-                all_keywords.extend(row)
-    except Exception:
-        pass
-
-    # AI Conference keywords
-    try:
-        conf_result = await db.execute(
-            select(AIConference.topics).where(
-                AIConference.topics.isnot(None)
-            ).limit(100)
-        )
-        for row in conf_result.scalars():
-            if row and isinstance(row, list):
-                all_keywords.extend(row)
-    except Exception:
-        pass
-
-    # AI Tool keywords
-    try:
-        tool_result = await db.execute(
-            select(AITool.key_features).where(
-                AITool.key_features.isnot(None)
-            ).limit(100)
-        )
-        for row in tool_result.scalars():
-            if row and isinstance(row, list):
-                all_keywords.extend(row)
-    except Exception:
-        pass
-
-    # AI Job keywords
-    try:
-        job_result = await db.execute(
-            select(AIJobTrend.required_skills).where(
-                AIJobTrend.required_skills.isnot(None)
-            ).limit(100)
-        )
-        for row in job_result.scalars():
-            if row and isinstance(row, list):
-                all_keywords.extend(row)
-    except Exception:
-        pass
-
-    # AI Policy keywords
-    try:
-        policy_result = await db.execute(
-            select(AIPolicy.impact_areas).where(
-                AIPolicy.impact_areas.isnot(None)
-            ).limit(100)
-        )
-        for row in policy_result.scalars():
-            if row and isinstance(row, list):
-                all_keywords.extend(row)
-    except Exception:
-        pass
+    cache_key = f"system:keywords:{limit}:days={days}"
+    return await cached(cache_key, lambda: with_session(_build_keywords, limit, days), ttl=TTL_KEYWORDS)
 
-    # Count keywords
-    if not all_keywords:
-        payload = {
-            "total_keywords": 0,
-            "unique_keywords": 0,
-            "top_keywords": [],
-            "all_keywords": []
-        }
-        await cache_set(cache_key, payload, ttl=TTL_KEYWORDS)
-        return payload
 
-    keyword_counts = Counter(all_keywords)
+async def _build_keywords(db: AsyncSession, limit: int, days: Optional[int]) -> Dict[str, Any]:
+    since = datetime.now(timezone.utc) - timedelta(days=days) if days else None
+    result = await get_top_keywords(db, limit=limit, since=since)
+    ranked = result["top_keywords"]
 
     # Top keywords with counts
     top_keywords = [
-        {"keyword": keyword, "count": count}
-        for keyword, count in keyword_counts.most_common(limit)
+        {"keyword": item["keyword"], "count": item["count"]}
+        for item in ranked
     ]
 
     # All keywords for word cloud (with normalized counts)
-    max_count = max(keyword_counts.values()) if keyword_counts else 1
+    max_count = ranked[0]["count"] if ranked else 1
     all_keywords_normalized = [
         {
-            "keyword": keyword,
-            "count": count,
-            "weight": count / max_count
+            "keyword": item["keyword"],
+            "count": item["count"],
+            "weight": item["count"] / max_count
         }
-        for keyword, count in keyword_counts.items()
+        for item in ranked
     ]
 
     payload = {
-        "total_keywords": len(all_keywords),
-        "unique_keywords": len(keyword_counts),
+        "total_keywords": result["total_keywords"],
+        "unique_keywords": result["unique_keywords"],
         "top_keywords": top_keywords,
-        "all_keywords": all_keywords_normalized[:limit]
+        "all_keywords": all_keywords_normalized
     }
-    await cache_set(cache_key, payload, ttl=TTL_KEYWORDS)
     return payload
 
 
@@ -736,6 +612,54 @@ async def get_collection_logs() -> Dict[str, Any]:
     }
 
 
+@router.get("/collection-runs")
+async def get_collection_runs(
+    job_id: Optional[str] = Query(None, description="작업 ID (예: collect_news, 미지정 시 전체)"),
+    status: Optional[str] = Query(None, description="success / error"),
+    limit: int = Query(50, ge=1, le=500, description="최근 N건"),
+) -> Dict[str, Any]:
+    """수집 작업 실행 이력 (단계별 시간, 수집/신규/갱신 건수, HTTP/LLM 호출 수, 최신순)."""
+    runs = await get_collection_run_history(job_id, status=status, limit=limit)
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "total": len(runs),
+        "runs": runs,
+    }
+
+
+@router.get("/collection-runs/percentiles")
+async def get_collection_run_stats(
+    job_id: Optional[str] = Query(None, description="작업 ID (미지정 시 작업별 전체)"),
+    days: int = Query(7, ge=1, le=30, description="최근 N일 실행 기준"),
+) -> Dict[str, Any]:
+    """작업별 소요 시간·단계별 시간·호출 수 분위수 (p50/p90/p95/p99/max)와 에러율."""
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "days": days,
+        "jobs": await get_collection_run_percentiles(job_id, days=days),
+    }
+
+
+@router.get("/executors")
+async def get_executors_status() -> Dict[str, Any]:
+    """CPU 작업 실행기(parse 스레드 풀 / nlp 프로세스 풀) 대기열 현황."""
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "pools": get_executor_stats(),
+    }
+
+
+@router.get("/keyword-cache")
+async def get_keyword_cache_status() -> Dict[str, Any]:
+    """키워드 추출 메모 캐시 적중률 (이 프로세스 기준, l1=메모리 LRU, l2=Redis)."""
+    extractor = get_keyword_extractor()
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "backends": extractor.backend_signature,
+        **extractor.memo.stats(),
+    }
+
+
 @router.get("/logs")
 async def get_logs(
     log_type: str = Query("app", description="로그 타입: app, error, collection"),
@@ -837,7 +761,7 @@ async def trigger_data_collection(background_tasks: BackgroundTasks) -> Dict[str
     수동으로 전체 데이터 수집 트리거 (백그라운드)
 
     - 모든 카테고리의 데이터를 즉시 수집합니다
-    - 이 작업은 1-2분 정도 소요됩니다
+    - 수집기들을 동시에 실행하며, 가장 느린 소스만큼 소요됩니다
     - 백그라운드에서 실행되므로 즉시 응답이 반환됩니다
     """
 
@@ -856,19 +780,21 @@ async def trigger_data_collection_sync() -> Dict[str, Any]:
     """
     수동으로 전체 데이터 수집 트리거 (동기 - 완료까지 대기)
 
-    - 모든 카테고리의 데이터를 즉시 수집합니다
-    - 완료될 때까지 대기하므로 1-2분 소요됩니다
-    - 에러 발생 시 즉시 확인 가능합니다
+    - 모든 카테고리의 데이터를 동시에 수집합니다 (소요 시간 ≈ 가장 느린 소스)
+    - 수집기별 소요 시간/수집/신규/갱신 건수와 에러를 반환합니다
+    - 일부 수집기만 실패하면 status는 `partial`입니다
     """
 
     try:
         # 동기적으로 실행 (완료까지 대기)
-        await collect_all_data()
+        summary = await collect_all_data()
 
         return {
-            "status": "completed",
+            "status": summary["status"],
             "message": "데이터 수집이 완료되었습니다.",
-            "timestamp": datetime.now(timezone.utc).isoformat()
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "duration_ms": summary["duration_ms"],
+            "collectors": summary["collectors"],
         }
     except Exception as e:
         return {
@@ -10,13 +10,14 @@ from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, desc, func
 from datetime import datetime
-from typing import List, Set
+from typing import Any, Dict, List, Optional, Set
 
-from app.database import get_db
+from app.database import get_db, with_session
 from app.db_compat import has_archive_column
 from app.models.ai_tool import AITool
 from app.schemas.ai_tool import AIToolList, AIToolResponse
-from app.cache import cache_get, cache_set, TTL_LIST_QUERY
+from app.cache import cached, list_cache_tag, TTL_LIST_QUERY
+from app.pagination import apply_keyset, cached_count, split_keyset_page
 
 router = APIRouter()
 
@@ -53,6 +54,7 @@ async def list_tools(
     category: str = Query(None, description="카테고리 필터"),
     trending: bool = Query(None, description="트렌딩 도구만 조회"),
     include_archived: bool = Query(False, description="아카이브 데이터 포함 여부"),
+    cursor: Optional[str] = Query(None, description="키셋 페이지네이션 cursor (빈 값이면 첫 페이지)"),
     db: AsyncSession = Depends(get_db),
 ):
     """
@@ -62,6 +64,7 @@ async def list_tools(
     - **page_size**: 페이지당 항목 수 (최대 100)
     - **category**: 카테고리 필터
     - **trending**: True시 트렌딩 도구만 반환
+    - **cursor**: 지정 시 OFFSET 대신 `(upvotes, id)` 키셋 페이지네이션 (`next_cursor` 반환)
     """
     supports_archive = await has_archive_column(db, "ai_tools")
     effective_include_archived = include_archived or not supports_archive
@@ -82,36 +85,48 @@ async def list_tools(
         query = query.where(AITool.is_trending == trending)
         count_query = count_query.where(AITool.is_trending == trending)
 
-    # 총 개수 조회
-    count_result = await db.execute(count_query)
-    total = count_result.scalar()
-
-    # 페이지네이션
-    offset = (page - 1) * page_size
-    query = query.order_by(desc(AITool.upvotes)).offset(offset).limit(page_size)
-
     cache_key = (
         "list:tools:"
         f"page={page}:size={page_size}:category={category}:trending={trending}:"
-        f"archived={int(effective_include_archived)}"
+        f"archived={int(effective_include_archived)}:cursor={cursor}"
+    )
+
+    # 백그라운드 갱신에도 쓰이므로 요청 세션이 아닌 새 세션으로 조회
+    async def _load(db: AsyncSession) -> Dict[str, Any]:
+        # 총 개수 조회 (필터 조합별 캐시)
+        total = await cached_count(
+            db,
+            count_query,
+            "list:tools:count:"
+            f"category={category}:trending={trending}:archived={int(effective_include_archived)}",
+        )
+
+        next_cursor = None
+        if cursor is not None:
+            page_query = apply_keyset(query, AITool.upvotes, AITool.id, cursor).limit(page_size + 1)
+            rows = (await db.execute(page_query)).scalars().all()
+            tools, next_cursor = split_keyset_page(rows, page_size, "upvotes")
+        else:
+            # 페이지네이션
+            offset = (page - 1) * page_size
+            page_query = query.order_by(desc(AITool.upvotes)).offset(offset).limit(page_size)
+            result = await db.execute(page_query)
+            tools = result.scalars().all()
+        payload = AIToolList(
+            total=total or 0,
+            items=tools,
+            data_sources=_build_data_sources(tools),
+            last_updated=_max_updated_at(tools),
+            page=page,
+            page_size=page_size,
+            total_pages=max(((total or 0) + page_size - 1) // page_size, 1),
+            next_cursor=next_cursor,
+        ).model_dump(mode="json")
+        return payload
+
+    return await cached(
+        cache_key, lambda: with_session(_load), ttl=TTL_LIST_QUERY, tag=list_cache_tag("tools")
     )
-    cached = await cache_get(cache_key)
-    if cached is not None:
-        return cached
-
-    result = await db.execute(query)
-    tools = result.scalars().all()
-    payload = AIToolList(
-        total=total or 0,
-        items=tools,
-        data_sources=_build_data_sources(tools),
-        last_updated=_max_updated_at(tools),
-        page=page,
-        page_size=page_size,
-        total_pages=max(((total or 0) + page_size - 1) // page_size, 1),
-    ).model_dump(mode="json")
-    await cache_set(cache_key, payload, ttl=TTL_LIST_QUERY)
-    return payload
 
 
 @router.get("/{tool_id}", response_model=AIToolResponse)
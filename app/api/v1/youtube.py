@@ -2,14 +2,15 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func
-from typing import Optional
+from typing import Any, Dict, Optional
 
-from app.database import get_db
+from app.database import get_db, with_session
 from app.db_compat import has_archive_column
 from app.services.youtube_service import YouTubeService
 from app.schemas.youtube import YouTubeVideo, YouTubeVideoList
 from app.models.youtube import YouTubeVideo as YouTubeVideoModel
-from app.cache import cache_get, cache_set, TTL_LIST_QUERY
+from app.cache import cached, list_cache_tag, TTL_LIST_QUERY
+from app.pagination import cached_count, split_keyset_page
 
 router = APIRouter()
 
@@ -23,7 +24,7 @@ async def get_videos(
     language: Optional[str] = Query(None, description="채널 언어 필터 (ko/en)"),
     trending_only: bool = False,
     include_archived: bool = Query(False, description="아카이브 데이터 포함 여부"),
-    db: AsyncSession = Depends(get_db),
+    cursor: Optional[str] = Query(None, description="키셋 페이지네이션 cursor (빈 값이면 첫 페이지)"),
 ):
     """
     YouTube 비디오 목록 조회
@@ -31,6 +32,7 @@ async def get_videos(
     - **skip**: 건너뛸 개수
     - **limit**: 가져올 개수 (최대 100)
     - **trending_only**: 트렌딩 비디오만 조회
+    - **cursor**: 지정 시 OFFSET 대신 `(view_count, id)` 키셋 페이지네이션 (`next_cursor` 반환)
     """
     # page/page_size 우선, skip/limit은 하위 호환
     if skip is not None or limit is not None:
@@ -43,47 +45,67 @@ async def get_videos(
     cache_key = (
         "list:youtube:"
         f"skip={effective_skip}:limit={effective_limit}:trending={int(trending_only)}:"
-        f"lang={language or ''}:archived={int(include_archived)}"
+        f"lang={language or ''}:archived={int(include_archived)}:cursor={cursor}"
     )
-    cached = await cache_get(cache_key)
-    if cached is not None:
-        return cached
-
-    supports_archive = await has_archive_column(db, "youtube_videos")
-    effective_include_archived = include_archived or not supports_archive
-
-    count_query = select(func.count()).select_from(YouTubeVideoModel)
-    if not effective_include_archived:
-        count_query = count_query.where(YouTubeVideoModel.is_archived == False)
-    if trending_only:
-        count_query = count_query.where(YouTubeVideoModel.is_trending == True)
-    if language:
-        count_query = count_query.where(YouTubeVideoModel.channel_language == language.lower())
-    total = (await db.execute(count_query)).scalar() or 0
-    total_pages = max((total + effective_limit - 1) // effective_limit, 1)
 
-    service = YouTubeService()
-    videos = await service.get_videos(
-        db=db,
-        skip=effective_skip,
-        limit=effective_limit,
-        trending_only=trending_only,
-        include_archived=effective_include_archived,
-        language=language,
+    async def _load(db: AsyncSession) -> Dict[str, Any]:
+        supports_archive = await has_archive_column(db, "youtube_videos")
+        effective_include_archived = include_archived or not supports_archive
+
+        count_query = select(func.count()).select_from(YouTubeVideoModel)
+        if not effective_include_archived:
+            count_query = count_query.where(YouTubeVideoModel.is_archived == False)
+        if trending_only:
+            count_query = count_query.where(YouTubeVideoModel.is_trending == True)
+        if language:
+            count_query = count_query.where(YouTubeVideoModel.channel_language == language.lower())
+        total = await cached_count(
+            db,
+            count_query,
+            "list:youtube:count:"
+            f"trending={int(trending_only)}:lang={(language or '').lower()}:"
+            f"archived={int(effective_include_archived)}",
+        )
+        total_pages = max((total + effective_limit - 1) // effective_limit, 1)
+
+        service = YouTubeService()
+        next_cursor = None
+        if cursor is not None:
+            rows = await service.get_videos(
+                db=db,
+                limit=effective_limit + 1,
+                trending_only=trending_only,
+                include_archived=effective_include_archived,
+                language=language,
+                cursor=cursor,
+            )
+            videos, next_cursor = split_keyset_page(rows, effective_limit, "view_count")
+        else:
+            videos = await service.get_videos(
+                db=db,
+                skip=effective_skip,
+                limit=effective_limit,
+                trending_only=trending_only,
+                include_archived=effective_include_archived,
+                language=language,
+            )
+
+        current_page = (effective_skip // effective_limit) + 1
+        payload = YouTubeVideoList(
+            total=total,
+            videos=videos,
+            items=videos,
+            page=current_page,
+            page_size=effective_limit,
+            total_pages=total_pages,
+            next_cursor=next_cursor,
+        ).model_dump(mode="json")
+        return payload
+
+    return await cached(
+        cache_key, lambda: with_session(_load), ttl=TTL_LIST_QUERY, tag=list_cache_tag("youtube")
     )
 
-    current_page = (effective_skip // effective_limit) + 1
-    payload = YouTubeVideoList(
-        total=total,
-        videos=videos,
-        items=videos,
-        page=current_page,
-        page_size=effective_limit,
-        total_pages=total_pages,
-    ).model_dump(mode="json")
-    await cache_set(cache_key, payload, ttl=TTL_LIST_QUERY)
-    return payload
-
 
 @router.get("/videos/{video_id}", response_model=YouTubeVideo)
 async def get_video(
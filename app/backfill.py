@@ -0,0 +1,335 @@
+"""재개 가능한 청크 단위 백필 엔진.
+
+- 대상 id를 키셋 순서(id 오름차순)로 `stream_scalars` + `yield_per` 스트리밍해 청크로 묶음
+  (읽기 세션은 id만 조회 — 전체 행을 메모리에 올리지 않음)
+- 청크마다 별도 세션에서 행 로드 → 수정 → 커밋 (실패해도 앞 청크 결과는 유지, 행 잠금은 청크 트랜잭션 동안만)
+- `backfill_checkpoints`에 작업별 진행을 기록 → 중단·실패·`limit` 도달 후 재실행 시 `last_id` 다음부터 이어서 처리
+- 청크는 `concurrency`개까지 동시에 처리. 체크포인트는 연속으로 완료된 청크까지만 전진하므로
+  재개 시 일부 청크가 다시 처리될 수 있음 (`apply`는 멱등이어야 함)
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set, Tuple
+
+from sqlalchemy import func, select, update
+
+from app.config import get_settings
+from app.database import AsyncSessionLocal
+from app.models.backfill_checkpoint import BackfillCheckpoint
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+BACKFILL_STATUS_PENDING = "pending"
+BACKFILL_STATUS_RUNNING = "running"
+BACKFILL_STATUS_DONE = "done"
+BACKFILL_STATUS_FAILED = "failed"
+
+_running_jobs: Set[str] = set()
+
+
+@dataclass(frozen=True)
+class BackfillTask:
+    """백필 대상 1개.
+
+    `apply`는 ORM 행을 수정하고 값이 바뀌었으면 True를 반환.
+    `where`는 대상 행 조건 (id 키셋 조건과 AND).
+    """
+
+    name: str
+    model: Any
+    apply: Callable[[Any], bool]
+    where: Sequence[Any] = ()
+
+
+class _ChunkTracker:
+    """완료 순서와 무관하게 연속으로 완료된 청크까지만 진행 위치를 전진."""
+
+    def __init__(self, last_id: int, processed: int, updated: int) -> None:
+        self.last_id = last_id
+        self.processed = processed
+        self.updated = updated
+        self._next_seq = 0
+        self._completed: Dict[int, Tuple[int, int, int]] = {}
+
+    def complete(self, seq: int, last_id: int, count: int, changed: int) -> bool:
+        self._completed[seq] = (last_id, count, changed)
+        advanced = False
+        while self._next_seq in self._completed:
+            last_id, count, changed = self._completed.pop(self._next_seq)
+            self.last_id = last_id
+            self.processed += count
+            self.updated += changed
+            self._next_seq += 1
+            advanced = True
+        return advanced
+
+
+def is_backfill_running(job: str) -> bool:
+    """이 프로세스에서 해당 백필이 실행 중(또는 선점됨)인지."""
+    return job in _running_jobs
+
+
+def claim_backfill(job: str) -> bool:
+    """백필 실행 자리를 선점 (이미 실행·선점 중이면 False).
+
+    확인과 등록 사이에 await가 없어 같은 프로세스의 동시 요청 중 1곳만 성공.
+    선점한 쪽은 `run_backfill(..., claimed=True)`로 실행하고 끝나면 `release_backfill` 호출.
+    """
+    if job in _running_jobs:
+        return False
+    _running_jobs.add(job)
+    return True
+
+
+def release_backfill(job: str) -> None:
+    """`claim_backfill`로 선점한 자리 해제."""
+    _running_jobs.discard(job)
+
+
+def _checkpoint_filter(job: str, task: str):
+    return (BackfillCheckpoint.job == job, BackfillCheckpoint.task == task)
+
+
+async def _start_checkpoint(session_factory, job: str, task: str, resume: bool) -> Tuple[int, int, int]:
+    """체크포인트를 running으로 전환하고 시작 위치 반환 (완료된 작업이나 resume=False면 처음부터)."""
+    async with session_factory() as db:
+        checkpoint = (
+            await db.execute(select(BackfillCheckpoint).where(*_checkpoint_filter(job, task)))
+        ).scalar_one_or_none()
+        if checkpoint is None:
+            checkpoint = BackfillCheckpoint(job=job, task=task)
+            db.add(checkpoint)
+        if checkpoint.last_id is None or not resume or checkpoint.status == BACKFILL_STATUS_DONE:
+            checkpoint.last_id = 0
+            checkpoint.processed = 0
+            checkpoint.updated = 0
+            checkpoint.started_at = datetime.now(timezone.utc)
+        checkpoint.status = BACKFILL_STATUS_RUNNING
+        checkpoint.last_error = None
+        checkpoint.finished_at = None
+        await db.commit()
+        return checkpoint.last_id, checkpoint.processed, checkpoint.updated
+
+
+async def _save_checkpoint(session_factory, job: str, task: str, **values: Any) -> None:
+    async with session_factory() as db:
+        await db.execute(
+            update(BackfillCheckpoint)
+            .where(*_checkpoint_filter(job, task))
+            .values(updated_at=datetime.now(timezone.utc), **values)
+        )
+        await db.commit()
+
+
+async def _process_chunk(session_factory, task: BackfillTask, ids: List[int]) -> int:
+    """청크 1개를 자체 트랜잭션으로 처리 → 변경된 행 수."""
+    async with session_factory() as db:
+        rows = (
+            await db.execute(select(task.model).where(task.model.id.in_(ids)))
+        ).scalars().all()
+        changed = sum(1 for row in rows if task.apply(row))
+        await db.commit()
+    return changed
+
+
+async def _run_task(
+    job: str,
+    task: BackfillTask,
+    *,
+    chunk_size: int,
+    concurrency: int,
+    limit: Optional[int],
+    resume: bool,
+    session_factory,
+) -> Dict[str, Any]:
+    model = task.model
+    last_id, processed, updated = await _start_checkpoint(session_factory, job, task.name, resume)
+
+    async with session_factory() as db:
+        remaining = (
+            await db.execute(
+                select(func.count()).select_from(model).where(model.id > last_id, *task.where)
+            )
+        ).scalar_one()
+    # limit은 이번 실행의 처리량만 자르고, 진행률의 분모는 남은 전체 행 기준
+    truncated = limit is not None and remaining > limit
+    total = processed + remaining
+    await _save_checkpoint(session_factory, job, task.name, total=total)
+
+    tracker = _ChunkTracker(last_id, processed, updated)
+    semaphore = asyncio.Semaphore(concurrency)
+    checkpoint_lock = asyncio.Lock()
+    in_flight: Set[asyncio.Task] = set()
+    errors: List[BaseException] = []
+
+    async def _chunk(seq: int, ids: List[int]) -> None:
+        try:
+            changed = await _process_chunk(session_factory, task, ids)
+        except Exception as e:
+            logger.exception("백필 청크 실패 (%s/%s, id %d~%d)", job, task.name, ids[0], ids[-1])
+            errors.append(e)
+            return
+        finally:
+            semaphore.release()
+        async with checkpoint_lock:
+            if tracker.complete(seq, ids[-1], len(ids), changed):
+                await _save_checkpoint(
+                    session_factory,
+                    job,
+                    task.name,
+                    last_id=tracker.last_id,
+                    processed=tracker.processed,
+                    updated=tracker.updated,
+                )
+
+    streamed = 0
+    seq = 0
+    query = (
+        select(model.id)
+        .where(model.id > last_id, *task.where)
+        .order_by(model.id)
+        .execution_options(yield_per=chunk_size)
+    )
+    async with session_factory() as reader:
+        stream = await reader.stream_scalars(query)
+        async for partition in stream.partitions(chunk_size):
+            ids = list(partition)
+            if limit is not None:
+                ids = ids[: limit - streamed]
+            if not ids:
+                break
+            await semaphore.acquire()
+            if errors:
+                # 실패 이후 청크는 시작하지 않음 (재실행 때 체크포인트부터 다시 처리)
+                semaphore.release()
+                break
+            chunk_task = asyncio.create_task(_chunk(seq, ids))
+            in_flight.add(chunk_task)
+            chunk_task.add_done_callback(in_flight.discard)
+            streamed += len(ids)
+            seq += 1
+            if limit is not None and streamed >= limit:
+                break
+        await stream.close()
+    if in_flight:
+        await asyncio.gather(*in_flight)
+
+    if errors:
+        status = BACKFILL_STATUS_FAILED
+    elif truncated:
+        # limit으로 끊긴 실행은 done이 아니라 pending으로 남겨 다음 실행이 last_id 다음부터 이어감
+        status = BACKFILL_STATUS_PENDING
+    else:
+        status = BACKFILL_STATUS_DONE
+    await _save_checkpoint(
+        session_factory,
+        job,
+        task.name,
+        status=status,
+        last_error=str(errors[0])[:1000] if errors else None,
+        finished_at=datetime.now(timezone.utc),
+    )
+    logger.info(
+        "백필 %s/%s %s: 처리 %d / 변경 %d (last_id=%d)",
+        job,
+        task.name,
+        status,
+        tracker.processed,
+        tracker.updated,
+        tracker.last_id,
+    )
+    return {
+        "status": status,
+        "processed": tracker.processed,
+        "updated": tracker.updated,
+        "total": total,
+        "last_id": tracker.last_id,
+    }
+
+
+async def run_backfill(
+    job: str,
+    tasks: Sequence[BackfillTask],
+    *,
+    chunk_size: Optional[int] = None,
+    concurrency: Optional[int] = None,
+    limit: Optional[int] = None,
+    resume: bool = True,
+    claimed: bool = False,
+    session_factory=AsyncSessionLocal,
+) -> Dict[str, Dict[str, Any]]:
+    """작업들을 순서대로 청크 단위 처리 (작업 하나가 실패해도 나머지는 진행).
+
+    Args:
+        job: 체크포인트 묶음 이름 (같은 job은 프로세스당 동시에 1개만 실행)
+        chunk_size: 청크(트랜잭션)당 행 수 (기본: settings.backfill_chunk_size)
+        concurrency: 동시에 처리하는 청크 수 (기본: settings.backfill_concurrency)
+        limit: 작업별 최대 처리 행 수 (None이면 전체). 체크포인트 다음 id부터 오름차순으로 자르므로
+            최신 행이 아니라 아직 처리하지 않은 가장 오래된 행부터 처리됨. 남은 행이 있으면
+            체크포인트를 pending으로 남겨 다음 실행(resume=True)이 이어서 처리
+        resume: True면 미완료 체크포인트에서 이어서, False면 처음부터
+        claimed: 호출 측이 `claim_backfill`로 이미 선점했으면 True (해제도 호출 측이 담당)
+
+    Returns:
+        `{task: {"status", "processed", "updated", "total", "last_id"}}`
+    """
+    if not claimed and not claim_backfill(job):
+        raise RuntimeError(f"backfill already running: {job}")
+    try:
+        results: Dict[str, Dict[str, Any]] = {}
+        for task in tasks:
+            results[task.name] = await _run_task(
+                job,
+                task,
+                chunk_size=max(1, chunk_size or settings.backfill_chunk_size),
+                concurrency=max(1, concurrency or settings.backfill_concurrency),
+                limit=limit,
+                resume=resume,
+                session_factory=session_factory,
+            )
+        return results
+    finally:
+        if not claimed:
+            release_backfill(job)
+
+
+async def get_backfill_progress(
+    job: Optional[str] = None, session_factory=AsyncSessionLocal
+) -> List[Dict[str, Any]]:
+    """체크포인트 기준 진행 현황 (관리자 API용)."""
+    query = select(BackfillCheckpoint).order_by(BackfillCheckpoint.job, BackfillCheckpoint.id)
+    if job:
+        query = query.where(BackfillCheckpoint.job == job)
+    async with session_factory() as db:
+        checkpoints = (await db.execute(query)).scalars().all()
+
+    def _iso(value: Optional[datetime]) -> Optional[str]:
+        return value.isoformat() if value else None
+
+    return [
+        {
+            "job": checkpoint.job,
+            "task": checkpoint.task,
+            "status": checkpoint.status,
+            "running": checkpoint.job in _running_jobs,
+            "last_id": checkpoint.last_id,
+            "processed": checkpoint.processed,
+            "updated": checkpoint.updated,
+            "total": checkpoint.total,
+            "progress": (
+                round(min(checkpoint.processed / checkpoint.total, 1.0), 4)
+                if checkpoint.total
+                else (1.0 if checkpoint.status == BACKFILL_STATUS_DONE else 0.0)
+            ),
+            "last_error": checkpoint.last_error,
+            "started_at": _iso(checkpoint.started_at),
+            "finished_at": _iso(checkpoint.finished_at),
+            "updated_at": _iso(checkpoint.updated_at),
+        }
+        for checkpoint in checkpoints
+    ]
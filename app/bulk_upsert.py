@@ -0,0 +1,198 @@
+"""수집기 공통 벌크 업서트 헬퍼.
+
+- 기존 항목은 `WHERE key IN (...)` 1회(청크 단위)로 미리 조회
+- 저장은 `INSERT ... ON CONFLICT (key) DO UPDATE`를 배치 단위로 실행 (`updated_at` 컬럼이 있으면 함께 갱신)
+- 커밋은 호출자가 한 번만 수행 (배치 전체가 단일 트랜잭션)
+"""
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.keyword_occurrence import (
+    KEYWORD_SOURCES,
+    normalize_keywords,
+    replace_keyword_occurrences,
+)
+
+logger = logging.getLogger(__name__)
+
+BULK_UPSERT_BATCH_SIZE = 500
+PREFETCH_CHUNK_SIZE = 1000
+
+
+@dataclass
+class UpsertStats:
+    """업서트 결과 집계."""
+
+    inserted: int = 0
+    updated: int = 0
+    skipped: int = 0
+
+    def merge(self, other: "UpsertStats") -> "UpsertStats":
+        self.inserted += other.inserted
+        self.updated += other.updated
+        self.skipped += other.skipped
+        return self
+
+    def as_dict(self) -> Dict[str, int]:
+        return {
+            "inserted": self.inserted,
+            "updated": self.updated,
+            "skipped": self.skipped,
+        }
+
+
+async def prefetch_existing(
+    db: AsyncSession,
+    model,
+    key: str,
+    keys: Iterable[Any],
+) -> Dict[Any, Any]:
+    """`{key 값: ORM 인스턴스}` 맵을 IN 쿼리로 조회 (항목별 SELECT 대체)."""
+    key_col = getattr(model, key)
+    unique_keys = list(dict.fromkeys(k for k in keys if k is not None))
+    existing: Dict[Any, Any] = {}
+    for start in range(0, len(unique_keys), PREFETCH_CHUNK_SIZE):
+        chunk = unique_keys[start:start + PREFETCH_CHUNK_SIZE]
+        result = await db.execute(select(model).where(key_col.in_(chunk)))
+        for row in result.scalars():
+            existing[getattr(row, key)] = row
+    return existing
+
+
+def dialect_insert(db: AsyncSession, table):
+    if db.get_bind().dialect.name == "sqlite":
+        return sqlite_insert(table)
+    return pg_insert(table)
+
+
+async def _sync_keywords(db: AsyncSession, model, item_ids: List[int]) -> None:
+    """ON CONFLICT 경로는 ORM flush 훅을 거치지 않으므로 키워드 인덱스를 직접 갱신."""
+    field, category, date_field = KEYWORD_SOURCES[model]
+    table = model.__table__
+    rows = (
+        await db.execute(
+            select(table.c.id, table.c[field], table.c[date_field]).where(
+                table.c.id.in_(item_ids)
+            )
+        )
+    ).all()
+    now = datetime.now(timezone.utc)
+    targets = [
+        (category, item_id, normalize_keywords(keywords), observed_at or now)
+        for item_id, keywords, observed_at in rows
+    ]
+    await db.run_sync(
+        lambda session: replace_keyword_occurrences(session.connection(), targets)
+    )
+
+
+async def bulk_upsert(
+    db: AsyncSession,
+    model,
+    rows: Sequence[Dict[str, Any]],
+    key: str,
+    update_columns: Sequence[str] = (),
+    coalesce_columns: Sequence[str] = (),
+    existing: Optional[Dict[Any, Any]] = None,
+    batch_size: int = BULK_UPSERT_BATCH_SIZE,
+) -> UpsertStats:
+    """행 목록을 `INSERT ... ON CONFLICT (key) DO UPDATE`로 배치 저장 (커밋하지 않음).
+
+    Args:
+        rows: 컬럼명 → 값 딕셔너리 목록 (신규 삽입 시 그대로 사용)
+        key: 충돌 기준 unique 컬럼
+        update_columns: 충돌 시 새 값으로 덮어쓸 컬럼
+        coalesce_columns: 새 값이 None이면 기존 값을 유지할 컬럼 (나머지는 update_columns와 동일)
+        existing: `prefetch_existing` 결과 (없으면 IN 쿼리로 조회)
+
+    Returns:
+        inserted / updated / skipped 집계 (key 누락·배치 내 중복은 skipped)
+    """
+    stats = UpsertStats()
+    table = model.__table__
+
+    unique_rows: Dict[Any, Dict[str, Any]] = {}
+    for row in rows:
+        key_value = row.get(key)
+        if key_value is None or key_value in unique_rows:
+            stats.skipped += 1
+            continue
+        unique_rows[key_value] = row
+    if not unique_rows:
+        return stats
+
+    if existing is None:
+        existing = await prefetch_existing(db, model, key, unique_rows)
+
+    # JSON 컬럼의 None은 SQL NULL이 아닌 'null'로 저장되므로 COALESCE 대신 기존 값을 미리 채움
+    for key_value, row in unique_rows.items():
+        current = existing.get(key_value)
+        if current is None:
+            continue
+        for col in coalesce_columns:
+            if col in row and row[col] is None:
+                row[col] = getattr(current, col)
+    update_columns = list(dict.fromkeys([*update_columns, *coalesce_columns]))
+
+    keyword_field = KEYWORD_SOURCES[model][0] if model in KEYWORD_SOURCES else None
+    items = list(unique_rows.items())
+    for batch_no, start in enumerate(range(0, len(items), batch_size), start=1):
+        batch = items[start:start + batch_size]
+
+        # executemany는 모든 행의 컬럼 구성이 같아야 하므로 컬럼 조합별로 나눠 실행
+        groups: Dict[tuple, List[Dict[str, Any]]] = {}
+        for _, row in batch:
+            groups.setdefault(tuple(row), []).append(row)
+
+        item_ids: List[int] = []
+        has_update = False
+        for columns, values in groups.items():
+            stmt = dialect_insert(db, table)
+            set_ = {
+                col: stmt.excluded[col]
+                for col in update_columns
+                if col in columns and col != key
+            }
+            if set_:
+                has_update = True
+                # Core ON CONFLICT는 ORM의 onupdate를 적용하지 않으므로 수정 시각을 직접 갱신
+                if "updated_at" in table.c and "updated_at" not in set_:
+                    set_["updated_at"] = func.now()
+                stmt = stmt.on_conflict_do_update(index_elements=[table.c[key]], set_=set_)
+            else:
+                stmt = stmt.on_conflict_do_nothing(index_elements=[table.c[key]])
+            result = await db.execute(stmt.returning(table.c.id), values)
+            item_ids.extend(result.scalars())
+
+        batch_stats = UpsertStats()
+        for key_value, _ in batch:
+            if key_value in existing:
+                batch_stats.updated += 1
+            else:
+                batch_stats.inserted += 1
+        if not has_update:
+            batch_stats.skipped += batch_stats.updated
+            batch_stats.updated = 0
+        logger.info(
+            "bulk upsert %s batch %d: inserted=%d updated=%d skipped=%d",
+            table.name,
+            batch_no,
+            batch_stats.inserted,
+            batch_stats.updated,
+            batch_stats.skipped,
+        )
+        stats.merge(batch_stats)
+
+        if item_ids and any(keyword_field in columns for columns in groups):
+            await _sync_keywords(db, model, item_ids)
+
+    return stats
@@ -3,14 +3,36 @@
 Phase 2: Redis 기반 캐시 레이어
 - 시스템 상태, 키워드, 리스트 쿼리에 대한 캐싱 지원
 - async redis 클라이언트 사용
+- `cache_get`/`cache_set`은 프로세스 내 L1(LRU, 바이트 상한, 짧은 TTL) + Redis L2 2단 구조.
+  키 삭제·덮어쓰기는 Redis pub/sub로 모든 워커에 알려 각 워커의 L1에서도 지움
+  (구독이 끊긴 동안에는 L1을 쓰지 않음)
+- Redis 상태는 백그라운드 하트비트로 점검 (요청마다 PING하지 않음)
+- 집계 API 응답은 `cached()`로 캐시: 미스 시 키별 단일 계산(워커 내 작업 공유 + Redis 락),
+  soft TTL이 지난 값은 그대로 내주고 백그라운드에서 갱신
+- 무효화는 태그(dashboard/search/system, 카테고리별 list:{category})의 세대 번호 INCR —
+  키에 세대 번호가 들어가므로 SCAN/DELETE 없이 이전 세대 키가 모두 무효화됨
 """
+import asyncio
 import json
 import logging
-from typing import Any, Awaitable, Callable, Optional, TypeVar
+import time
+import uuid
+from collections import OrderedDict
+from datetime import date, datetime, timedelta, timezone
+from fnmatch import fnmatchcase
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple, TypeVar
 
 import redis.asyncio as aioredis
 
 from app.config import get_settings
+from app.metrics import (
+    CACHE_FILLS,
+    CACHE_L1_REQUESTS,
+    REDIS_CALL_DURATION,
+    REDIS_CALL_FAILURES,
+    cache_prefix,
+    record_cache_lookup,
+)
 
 logger = logging.getLogger(__name__)
 T = TypeVar("T")
@@ -21,10 +43,133 @@ settings = get_settings()
 TTL_SYSTEM_STATUS = 60      # 시스템 상태: 1분
 TTL_KEYWORDS = 300          # 키워드: 5분
 TTL_LIST_QUERY = 120        # 리스트 쿼리: 2분
+TTL_LIST_COUNT = 600        # 리스트 전체 개수: 10분
+TTL_SUMMARY = 60 * 60 * 24 * 30  # AI 요약: 30일 (적중 시 연장 → 쓰이지 않는 항목만 만료)
+TTL_KEYWORD_MEMO = 60 * 60 * 24 * 14  # 키워드 추출 결과: 14일 (적중 시 연장)
+
+# AI 요약 캐시 키 prefix / 적중률 통계 해시 키
+SUMMARY_CACHE_PREFIX = "ai_summary"
+SUMMARY_CACHE_STATS_KEY = "stats:ai_summary_cache"
+
+# 키워드 추출 메모 캐시 키 prefix
+KEYWORD_MEMO_PREFIX = "kw_memo"
+
+# L1 무효화 알림 채널 (메시지: {"origin": 워커 ID, "keys": [...]} 또는 {"patterns": [...]})
+CACHE_INVALIDATION_CHANNEL = "cache:invalidate"
+WORKER_ID = uuid.uuid4().hex
+
+
+# ── L1: 프로세스 내 캐시 ───────────────────────────────────────
+
+class LocalCache:
+    """바이트 상한이 있는 LRU + TTL 캐시 (단일 이벤트 루프 전용).
+
+    크기는 직렬화된 JSON 길이(UTF-8 바이트)로 계산. 반환 값은 워커 내에서 공유되는
+    객체이므로 호출 측에서 수정하지 않아야 함.
+    """
+
+    def __init__(self, max_bytes: int, max_ttl: float) -> None:
+        self.max_bytes = max_bytes
+        self.max_ttl = max_ttl
+        self.enabled = False  # 무효화 채널을 구독 중일 때만 사용
+        self.size = 0
+        # 키 → (만료 시각(monotonic), 크기, 값)
+        self._entries: "OrderedDict[str, Tuple[float, int, Any]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Tuple[bool, Any]:
+        if not self.enabled:
+            return False, None
+        entry = self._entries.get(key)
+        if entry is None:
+            return False, None
+        if entry[0] <= time.monotonic():
+            self.pop(key)
+            return False, None
+        self._entries.move_to_end(key)
+        return True, entry[2]
+
+    def set(self, key: str, value: Any, size: int, ttl: float) -> None:
+        if not self.enabled:
+            return
+        self.pop(key)
+        ttl = min(ttl, self.max_ttl)
+        if ttl <= 0 or size > self.max_bytes:
+            return
+        self._entries[key] = (time.monotonic() + ttl, size, value)
+        self.size += size
+        while self.size > self.max_bytes:
+            _, (_, evicted_size, _) = self._entries.popitem(last=False)
+            self.size -= evicted_size
+
+    def pop(self, key: str) -> bool:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return False
+        self.size -= entry[1]
+        return True
+
+    def delete_pattern(self, pattern: str) -> int:
+        matched = [key for key in self._entries if fnmatchcase(key, pattern)]
+        for key in matched:
+            self.pop(key)
+        return len(matched)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.size = 0
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "enabled": self.enabled,
+            "entries": len(self._entries),
+            "bytes": self.size,
+            "max_bytes": self.max_bytes,
+        }
+
+
+local_cache = LocalCache(
+    max_bytes=settings.cache_l1_max_bytes,
+    max_ttl=settings.cache_l1_ttl_seconds,
+)
+
+
+def apply_invalidation(message: str) -> int:
+    """다른 워커가 보낸 무효화 메시지를 L1에 반영 (자기 자신이 보낸 메시지는 무시)."""
+    try:
+        payload = json.loads(message)
+    except (TypeError, ValueError):
+        return 0
+    if payload.get("origin") == WORKER_ID:
+        return 0
+    removed = 0
+    for key in payload.get("keys", []):
+        removed += local_cache.pop(key)
+    for pattern in payload.get("patterns", []):
+        removed += local_cache.delete_pattern(pattern)
+    return removed
+
+
+def _invalidation_message(
+    keys: Optional[List[str]] = None, patterns: Optional[List[str]] = None
+) -> str:
+    payload: Dict[str, Any] = {"origin": WORKER_ID}
+    if keys:
+        payload["keys"] = keys
+    if patterns:
+        payload["patterns"] = patterns
+    return json.dumps(payload)
+
 
 # ── Redis 클라이언트 싱글톤 ────────────────────────────────────
 _redis_client: Optional[aioredis.Redis] = None
 
+# 하트비트 결과 (하트비트가 돌지 않으면 ok=None)
+_redis_health: Dict[str, Any] = {"ok": None, "checked_at": None, "latency_ms": None, "error": None}
+_background_tasks: List[asyncio.Task] = []
+
 
 async def _reset_redis_client() -> None:
     """현재 Redis 클라이언트를 안전하게 종료하고 초기화."""
@@ -42,7 +187,8 @@ async def _reset_redis_client() -> None:
 async def get_redis(force_reconnect: bool = False) -> aioredis.Redis:
     """Redis 클라이언트 싱글톤 반환.
 
-    최초 호출 시 연결을 생성하고 이후 재사용합니다.
+    최초 호출 시 연결을 생성하고 이후 재사용합니다. 연결 상태는 하트비트가 점검하고,
+    끊긴 연결은 `_redis_call`의 재연결 재시도로 복구합니다.
     """
     global _redis_client
     if force_reconnect:
@@ -54,25 +200,112 @@ async def get_redis(force_reconnect: bool = False) -> aioredis.Redis:
             encoding="utf-8",
             decode_responses=True,
         )
-    try:
-        # stale connection 방지: 매 요청 전 ping 검증
-        await _redis_client.ping()
-        return _redis_client
-    except Exception as e:
-        logger.warning("Redis 연결 점검 실패, 재연결 시도: %s", e)
-        await _reset_redis_client()
-        _redis_client = aioredis.from_url(
-            settings.redis_url,
-            encoding="utf-8",
-            decode_responses=True,
-        )
-        await _redis_client.ping()
-        logger.info("Redis 재연결 성공: %s", settings.redis_url)
     return _redis_client
 
 
+def redis_health() -> Dict[str, Any]:
+    """마지막 하트비트 결과.
+
+    `status`: ok / error / unknown (하트비트 미실행 또는 마지막 점검이 너무 오래됨)
+    """
+    health = dict(_redis_health)
+    checked_at = health.pop("checked_at")
+    stale_after = settings.redis_heartbeat_interval_seconds * 3
+    if health["ok"] is None or checked_at is None or time.monotonic() - checked_at > stale_after:
+        health["status"] = "unknown"
+    else:
+        health["status"] = "ok" if health["ok"] else "error"
+    health.pop("ok")
+    return health
+
+
+async def _redis_heartbeat() -> None:
+    """주기적으로 PING해 상태를 기록하고, 실패하면 다음 호출에서 새로 연결하도록 클라이언트 초기화."""
+    interval = settings.redis_heartbeat_interval_seconds
+    while True:
+        started = time.perf_counter()
+        try:
+            client = await get_redis()
+            await asyncio.wait_for(client.ping(), timeout=interval)
+            if _redis_health["ok"] is False:
+                logger.info("Redis 연결 복구: %s", settings.redis_url)
+            _redis_health.update(
+                ok=True,
+                latency_ms=round((time.perf_counter() - started) * 1000, 2),
+                error=None,
+            )
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            if _redis_health["ok"] is not False:
+                logger.warning("Redis 하트비트 실패: %s", e)
+            _redis_health.update(ok=False, latency_ms=None, error=str(e)[:200])
+            await _reset_redis_client()
+        _redis_health["checked_at"] = time.monotonic()
+        await asyncio.sleep(interval)
+
+
+async def _invalidation_listener() -> None:
+    """무효화 채널을 구독해 L1에 반영.
+
+    pub/sub은 끊긴 동안의 메시지를 보장하지 않으므로, 구독이 끊기면 L1을 비우고 끄며
+    다시 구독한 뒤에 켬.
+    """
+    backoff = 1.0
+    while True:
+        pubsub = None
+        try:
+            client = await get_redis()
+            pubsub = client.pubsub(ignore_subscribe_messages=True)
+            await pubsub.subscribe(CACHE_INVALIDATION_CHANNEL)
+            local_cache.clear()
+            local_cache.enabled = True
+            backoff = 1.0
+            logger.info("캐시 무효화 채널 구독 시작 (worker=%s)", WORKER_ID[:8])
+            async for message in pubsub.listen():
+                if message.get("type") == "message":
+                    apply_invalidation(message["data"])
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning("캐시 무효화 채널 구독 끊김, %.0f초 후 재시도: %s", backoff, e)
+        finally:
+            local_cache.enabled = False
+            local_cache.clear()
+            if pubsub is not None:
+                try:
+                    await pubsub.aclose()
+                except Exception:
+                    pass
+        await asyncio.sleep(backoff)
+        backoff = min(backoff * 2, 30.0)
+
+
+def start_cache_background_tasks() -> None:
+    """하트비트, 무효화 구독, 요청 집계 flush 작업 시작 (앱 lifespan에서 호출)."""
+    if _background_tasks:
+        return
+    _background_tasks.append(asyncio.create_task(_redis_heartbeat()))
+    _background_tasks.append(asyncio.create_task(_request_stats_flusher()))
+    if settings.cache_l1_max_bytes > 0:
+        _background_tasks.append(asyncio.create_task(_invalidation_listener()))
+
+
+async def stop_cache_background_tasks() -> None:
+    for task in _background_tasks:
+        task.cancel()
+    await asyncio.gather(*_background_tasks, return_exceptions=True)
+    _background_tasks.clear()
+    # 종료 전 남은 요청 집계 반영
+    await flush_request_stats()
+    _redis_health.update(ok=None, checked_at=None, latency_ms=None, error=None)
+    local_cache.enabled = False
+    local_cache.clear()
+
+
 async def close_redis() -> None:
     """Redis 연결 종료."""
+    await stop_cache_background_tasks()
     await _reset_redis_client()
     logger.info("Redis 연결 종료")
 
@@ -82,27 +315,51 @@ async def _redis_call(
     fn: Callable[[aioredis.Redis], Awaitable[T]],
     fallback: T,
 ) -> T:
-    """Redis 작업 공통 래퍼 (실패 시 1회 재연결 재시도)."""
+    """Redis 작업 공통 래퍼 (실패 시 1회 재연결 재시도, 지연·실패는 메트릭으로 집계)."""
+    metric_action = action.split("(", 1)[0]
+    if _redis_health["ok"] is False:
+        # 하트비트가 장애를 확인한 동안에는 연결 시도 없이 바로 대체값 반환
+        REDIS_CALL_FAILURES.inc(metric_action)
+        return fallback
+    started = time.perf_counter()
     last_error: Optional[Exception] = None
-    for attempt in range(2):
-        try:
-            client = await get_redis(force_reconnect=attempt == 1)
-            return await fn(client)
-        except Exception as e:
-            last_error = e
-            if attempt == 0:
-                logger.warning("%s 실패, 재연결 후 재시도: %s", action, e)
-            else:
-                logger.warning("%s 재시도 실패: %s", action, e)
+    try:
+        for attempt in range(2):
+            try:
+                client = await get_redis(force_reconnect=attempt == 1)
+                return await fn(client)
+            except Exception as e:
+                last_error = e
+                if attempt == 0:
+                    logger.warning("%s 실패, 재연결 후 재시도: %s", action, e)
+                else:
+                    logger.warning("%s 재시도 실패: %s", action, e)
+    finally:
+        REDIS_CALL_DURATION.observe(time.perf_counter() - started, metric_action)
+    REDIS_CALL_FAILURES.inc(metric_action)
     if last_error:
         logger.debug("%s 최종 실패 원인: %s", action, last_error)
     return fallback
 
 
+_scripts: Dict[str, Any] = {}
+
+
+async def run_script(action: str, script: str, keys: List[str], args: List[Any]) -> Optional[Any]:
+    """Lua 스크립트 실행 (EVALSHA, 서버에 없으면 적재 후 재시도). Redis 장애 시 None."""
+    async def _op(client: aioredis.Redis) -> Any:
+        registered = _scripts.get(script)
+        if registered is None:
+            registered = _scripts[script] = client.register_script(script)
+        return await registered(keys=keys, args=args, client=client)
+
+    return await _redis_call(action, _op, None)
+
+
 # ── 캐시 헬퍼 함수 ─────────────────────────────────────────────
 
 async def cache_get(key: str) -> Optional[Any]:
-    """캐시에서 값 조회.
+    """캐시에서 값 조회 (L1 → Redis 순, Redis 적중 값은 남은 TTL만큼 L1에 보관).
 
     Args:
         key: 캐시 키
@@ -110,13 +367,27 @@ async def cache_get(key: str) -> Optional[Any]:
     Returns:
         캐시된 값 (JSON 디코딩됨) 또는 None
     """
+    if local_cache.enabled:
+        hit, value = local_cache.get(key)
+        CACHE_L1_REQUESTS.inc(cache_prefix(key), "hit" if hit else "miss")
+        if hit:
+            record_cache_lookup(key, True)
+            return value
+
     async def _op(client: aioredis.Redis) -> Optional[Any]:
-        value = await client.get(key)
-        if value is not None:
-            logger.debug("Cache HIT: %s", key)
-            return json.loads(value)
-        logger.debug("Cache MISS: %s", key)
-        return None
+        async with client.pipeline(transaction=False) as pipe:
+            pipe.get(key)
+            pipe.pttl(key)
+            raw, ttl_ms = await pipe.execute()
+        record_cache_lookup(key, raw is not None)
+        if raw is None:
+            logger.debug("Cache MISS: %s", key)
+            return None
+        logger.debug("Cache HIT: %s", key)
+        value = json.loads(raw)
+        if ttl_ms and ttl_ms > 0:
+            local_cache.set(key, value, len(raw.encode("utf-8")), ttl_ms / 1000)
+        return value
 
     return await _redis_call(f"cache_get(key={key})", _op, None)
 
@@ -132,13 +403,56 @@ async def cache_set(key: str, value: Any, ttl: int = TTL_LIST_QUERY) -> bool:
     Returns:
         저장 성공 여부
     """
+    serialized = json.dumps(value, default=str, ensure_ascii=False)
+
     async def _op(client: aioredis.Redis) -> bool:
-        serialized = json.dumps(value, default=str, ensure_ascii=False)
-        await client.set(key, serialized, ex=ttl)
+        async with client.pipeline(transaction=False) as pipe:
+            pipe.set(key, serialized, ex=ttl)
+            pipe.publish(CACHE_INVALIDATION_CHANNEL, _invalidation_message(keys=[key]))
+            await pipe.execute()
         logger.debug("Cache SET: %s (ttl=%ds)", key, ttl)
         return True
 
-    return await _redis_call(f"cache_set(key={key})", _op, False)
+    stored = await _redis_call(f"cache_set(key={key})", _op, False)
+    if stored:
+        # 직렬화 결과와 같은 형태(datetime → 문자열 등)로 보관
+        local_cache.set(key, json.loads(serialized), len(serialized.encode("utf-8")), ttl)
+    return stored
+
+
+async def cache_get_many(keys: List[str], touch_ttl: Optional[int] = None) -> List[Optional[Any]]:
+    """여러 키를 MGET 1회로 조회 (키 순서대로, 없으면 None). `touch_ttl`이 있으면 적중 키 TTL 연장."""
+    if not keys:
+        return []
+
+    async def _op(client: aioredis.Redis) -> List[Optional[Any]]:
+        values = await client.mget(keys)
+        for key, value in zip(keys, values):
+            record_cache_lookup(key, value is not None)
+        hits = [key for key, value in zip(keys, values) if value is not None]
+        if touch_ttl and hits:
+            async with client.pipeline(transaction=False) as pipe:
+                for key in hits:
+                    pipe.expire(key, touch_ttl)
+                await pipe.execute()
+        return [json.loads(value) if value is not None else None for value in values]
+
+    return await _redis_call("cache_get_many", _op, [None] * len(keys))
+
+
+async def cache_set_many(items: Dict[str, Any], ttl: int = TTL_LIST_QUERY) -> bool:
+    """여러 키를 파이프라인 1회로 저장."""
+    if not items:
+        return True
+
+    async def _op(client: aioredis.Redis) -> bool:
+        async with client.pipeline(transaction=False) as pipe:
+            for key, value in items.items():
+                pipe.set(key, json.dumps(value, default=str, ensure_ascii=False), ex=ttl)
+            await pipe.execute()
+        return True
+
+    return await _redis_call("cache_set_many", _op, False)
 
 
 async def cache_delete(key: str) -> bool:
@@ -150,36 +464,117 @@ async def cache_delete(key: str) -> bool:
     Returns:
         삭제 성공 여부
     """
+    local_cache.pop(key)
+
     async def _op(client: aioredis.Redis) -> bool:
-        await client.delete(key)
+        async with client.pipeline(transaction=False) as pipe:
+            pipe.delete(key)
+            pipe.publish(CACHE_INVALIDATION_CHANNEL, _invalidation_message(keys=[key]))
+            await pipe.execute()
         logger.debug("Cache DELETE: %s", key)
         return True
 
     return await _redis_call(f"cache_delete(key={key})", _op, False)
 
 
-async def track_visitor(visitor_id: str) -> None:
-    """HyperLogLog로 고유 방문자 기록 (일별/월별).
+# ── 요청 집계 (메모리 버퍼 → 주기적 파이프라인 flush) ──────────
 
-    12KB 메모리로 수백만 고유 방문자를 0.81% 오차로 카운트.
+TTL_API_REQUESTS = 60 * 60 * 24 * 8  # 일별 API 요청 수: 8일 보관
+REQUEST_STATS_MAX_PENDING = 50_000   # flush 전 보관하는 방문자 수 상한 (넘으면 즉시 flush, 장애 시 초과분 버림)
+
+
+class RequestStatsBuffer:
+    """일별 API 요청 수(INCRBY)와 HyperLogLog 방문자(PFADD)를 모아 두는 버퍼.
+
+    요청 경로에서는 메모리만 갱신하고(await 없음), `flush_request_stats`가 파이프라인 1회로 반영.
+    HLL은 12KB 메모리로 수백만 고유 방문자를 0.81% 오차로 카운트.
     """
-    from datetime import date
 
-    async def _op(client: aioredis.Redis) -> None:
+    def __init__(self, max_pending: int = REQUEST_STATS_MAX_PENDING) -> None:
+        self.max_pending = max_pending
+        self.requests: Dict[str, int] = {}
+        self.visitors: Dict[str, set] = {}
+        self.pending_visitors = 0
+        self.dropped_visitors = 0
+        self.wakeup = asyncio.Event()
+
+    def record(self, visitor_id: str) -> None:
+        request_key = f"api_requests:{datetime.now(timezone.utc).strftime('%Y-%m-%d')}"
+        self.requests[request_key] = self.requests.get(request_key, 0) + 1
         today = date.today().isoformat()
-        month = today[:7]  # YYYY-MM
-        await client.pfadd(f"visitors:daily:{today}", visitor_id)
-        await client.pfadd(f"visitors:monthly:{month}", visitor_id)
-        await client.pfadd("visitors:total", visitor_id)
-        return None
+        for key in (f"visitors:daily:{today}", f"visitors:monthly:{today[:7]}", "visitors:total"):
+            self._add_visitor(key, visitor_id)
+        if self.pending_visitors >= self.max_pending:
+            self.wakeup.set()
+
+    def _add_visitor(self, key: str, visitor_id: str) -> None:
+        members = self.visitors.setdefault(key, set())
+        if visitor_id in members:
+            return
+        if self.pending_visitors >= self.max_pending * 2:
+            self.dropped_visitors += 1
+            return
+        members.add(visitor_id)
+        self.pending_visitors += 1
+
+    def drain(self) -> Tuple[Dict[str, int], Dict[str, set]]:
+        requests, visitors = self.requests, self.visitors
+        self.requests, self.visitors = {}, {}
+        self.pending_visitors = 0
+        return requests, visitors
+
+    def restore(self, requests: Dict[str, int], visitors: Dict[str, set]) -> None:
+        """flush 실패분을 다음 flush로 되돌림 (방문자는 상한까지만)."""
+        for key, count in requests.items():
+            self.requests[key] = self.requests.get(key, 0) + count
+        for key, members in visitors.items():
+            for visitor_id in members:
+                self._add_visitor(key, visitor_id)
+
+
+request_stats = RequestStatsBuffer()
+
+
+def record_api_request(visitor_id: str) -> None:
+    """API 요청 1건 집계 (메모리 버퍼, 즉시 반환)."""
+    request_stats.record(visitor_id)
+
+
+async def flush_request_stats() -> bool:
+    """버퍼를 Redis 파이프라인 1회로 반영 (실패 시 버퍼로 되돌림)."""
+    requests, visitors = request_stats.drain()
+    if not requests and not visitors:
+        return True
+
+    async def _op(client: aioredis.Redis) -> bool:
+        async with client.pipeline(transaction=False) as pipe:
+            for key, count in requests.items():
+                pipe.incrby(key, count)
+                pipe.expire(key, TTL_API_REQUESTS)
+            for key, members in visitors.items():
+                pipe.pfadd(key, *members)
+            await pipe.execute()
+        return True
+
+    flushed = await _redis_call("flush_request_stats", _op, False)
+    if not flushed:
+        request_stats.restore(requests, visitors)
+    return flushed
 
-    await _redis_call("track_visitor", _op, None)
+
+async def _request_stats_flusher() -> None:
+    interval = settings.request_stats_flush_ms / 1000
+    while True:
+        try:
+            await asyncio.wait_for(request_stats.wakeup.wait(), timeout=interval)
+        except asyncio.TimeoutError:
+            pass
+        request_stats.wakeup.clear()
+        await flush_request_stats()
 
 
 async def get_visitor_counts() -> dict:
     """HyperLogLog 기반 방문자 수 조회."""
-    from datetime import date, timedelta
-
     async def _op(client: aioredis.Redis) -> dict:
         today = date.today()
         yesterday = (today - timedelta(days=1)).isoformat()
@@ -206,20 +601,315 @@ async def get_visitor_counts() -> dict:
 
 
 async def cache_delete_pattern(pattern: str) -> int:
-    """패턴에 매칭되는 모든 캐시 키 삭제.
+    """패턴에 매칭되는 모든 캐시 키 삭제 (모든 워커의 L1 포함).
 
     Args:
         pattern: 글로브 패턴 (예: "dashboard:*", "keywords:*")
 
     Returns:
-        삭제된 키 개수
+        삭제된 키 개수 (Redis 기준)
     """
+    local_cache.delete_pattern(pattern)
+
     async def _op(client: aioredis.Redis) -> int:
         deleted_count = 0
         async for key in client.scan_iter(match=pattern, count=100):
             await client.delete(key)
             deleted_count += 1
+        await client.publish(CACHE_INVALIDATION_CHANNEL, _invalidation_message(patterns=[pattern]))
         logger.debug("Cache DELETE PATTERN: %s (%d keys)", pattern, deleted_count)
         return deleted_count
 
     return await _redis_call(f"cache_delete_pattern(pattern={pattern})", _op, 0)
+
+
+# ── 세대 번호(namespace) 무효화 ────────────────────────────────
+
+CACHE_GENERATION_PREFIX = "cache:gen"
+TTL_CACHE_GENERATION = 60 * 60 * 24 * 30  # 무효화할 때마다 연장 (만료 후 0부터 다시 세도 이전 키는 이미 만료)
+
+# 모든 카테고리를 모아 보여주는 응답 (어느 카테고리가 바뀌어도 무효화)
+AGGREGATE_CACHE_TAGS = ("dashboard", "search", "system")
+
+
+def list_cache_tag(category: str) -> str:
+    """카테고리 목록 캐시 태그 (`list:news` → 키 `list:news:v{n}:...`)."""
+    return f"list:{category}"
+
+
+def _generation_key(tag: str) -> str:
+    return f"{CACHE_GENERATION_PREFIX}:{tag}"
+
+
+async def cache_generation(tag: str) -> int:
+    """태그의 현재 세대 번호 (L1에 보관, 무효화 시 pub/sub로 모든 워커에서 삭제)."""
+    value = await cache_get(_generation_key(tag))
+    if value is not None:
+        return int(value)
+
+    async def _op(client: aioredis.Redis) -> int:
+        # 없으면 0으로 만들어 두어 이후 조회가 L1에 적중하도록 함
+        await client.set(_generation_key(tag), 0, nx=True, ex=TTL_CACHE_GENERATION)
+        return int(await client.get(_generation_key(tag)) or 0)
+
+    return await _redis_call(f"cache_generation(tag={tag})", _op, 0)
+
+
+async def namespaced_key(key: str, tag: str) -> str:
+    """`tag`로 시작하는 키에 세대 번호를 넣은 실제 저장 키 (`list:news:x` → `list:news:v3:x`)."""
+    if key != tag and not key.startswith(f"{tag}:"):
+        raise ValueError(f"cache key {key!r} is not under tag {tag!r}")
+    generation = await cache_generation(tag)
+    return f"{tag}:v{generation}{key[len(tag):]}"
+
+
+async def invalidate_cache_tags(tags: Iterable[str]) -> None:
+    """태그별 세대 번호를 올려 이전 세대 키를 한 번에 무효화 (이전 키는 TTL로 자연 만료).
+
+    키 수와 무관하게 태그당 INCR 1회이며, 모든 워커의 L1에 보관된 세대 번호도 pub/sub로 삭제.
+    """
+    keys = [_generation_key(tag) for tag in sorted(set(tags))]
+    if not keys:
+        return
+    for key in keys:
+        local_cache.pop(key)
+
+    async def _op(client: aioredis.Redis) -> None:
+        async with client.pipeline(transaction=False) as pipe:
+            for key in keys:
+                pipe.incr(key)
+                pipe.expire(key, TTL_CACHE_GENERATION)
+            pipe.publish(CACHE_INVALIDATION_CHANNEL, _invalidation_message(keys=keys))
+            await pipe.execute()
+        logger.debug("Cache INVALIDATE TAGS: %s", ", ".join(keys))
+        return None
+
+    await _redis_call("invalidate_cache_tags", _op, None)
+
+
+# ── 단일 계산(single-flight) + stale-while-revalidate ─────────
+
+CACHE_LOCK_PREFIX = "lock"
+CACHE_LOCK_TTL = 30          # 계산 락 최대 보유 시간 (초, 계산이 멈춰도 자동 해제)
+CACHE_LOCK_WAIT = 5.0        # 다른 워커의 계산 결과를 기다리는 최대 시간 (초)
+CACHE_LOCK_POLL = 0.05       # 대기 중 캐시 재확인 간격 (초)
+
+_RELEASE_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+_ENVELOPE_MARK = "__cached__"
+_SKIPPED = object()
+
+# 워커 내 진행 중인 계산 (키 → 작업) / 백그라운드 갱신 작업 참조 유지
+_inflight: Dict[str, "asyncio.Task[Any]"] = {}
+_refresh_tasks: "set[asyncio.Task[Any]]" = set()
+
+
+def _envelope(value: Any, ttl: int) -> Dict[str, Any]:
+    return {_ENVELOPE_MARK: 1, "fresh_until": time.time() + ttl, "value": value}
+
+
+def _is_envelope(cached_value: Any) -> bool:
+    return isinstance(cached_value, dict) and cached_value.get(_ENVELOPE_MARK) == 1
+
+
+async def _acquire_lock(key: str, token: str) -> bool:
+    """키별 계산 락 획득 (Redis 장애 시 True — 각자 계산)."""
+    async def _op(client: aioredis.Redis) -> bool:
+        return bool(await client.set(f"{CACHE_LOCK_PREFIX}:{key}", token, nx=True, ex=CACHE_LOCK_TTL))
+
+    return await _redis_call(f"cache_lock(key={key})", _op, True)
+
+
+async def _release_lock(key: str, token: str) -> None:
+    async def _op(client: aioredis.Redis) -> None:
+        await client.eval(_RELEASE_LOCK_SCRIPT, 1, f"{CACHE_LOCK_PREFIX}:{key}", token)
+        return None
+
+    await _redis_call(f"cache_unlock(key={key})", _op, None)
+
+
+async def _wait_for_fill(key: str) -> Any:
+    """다른 워커가 채울 값을 잠시 기다림 (시간 초과 시 `_SKIPPED`)."""
+    deadline = time.monotonic() + CACHE_LOCK_WAIT
+    while time.monotonic() < deadline:
+        await asyncio.sleep(CACHE_LOCK_POLL)
+        cached_value = await cache_get(key)
+        if _is_envelope(cached_value):
+            CACHE_FILLS.inc(cache_prefix(key), "waited")
+            return cached_value["value"]
+    return _SKIPPED
+
+
+async def _fill(
+    key: str,
+    compute: Callable[[], Awaitable[T]],
+    ttl: int,
+    stale_ttl: int,
+    cache_if: Optional[Callable[[T], bool]],
+    background: bool,
+) -> Any:
+    """락을 잡고 계산해 저장. 다른 워커가 계산 중이면 기다리거나(요청) 건너뜀(백그라운드)."""
+    try:
+        token = uuid.uuid4().hex
+        acquired = await _acquire_lock(key, token)
+        if not acquired:
+            if background:
+                return _SKIPPED
+            value = await _wait_for_fill(key)
+            if value is not _SKIPPED:
+                return value
+            logger.warning("캐시 계산 대기 시간 초과, 직접 계산: %s", key)
+        try:
+            if acquired:
+                # 조회 후 락을 잡기 전에 다른 워커가 채우고 락을 풀었을 수 있음
+                cached_value = await cache_get(key)
+                if _is_envelope(cached_value) and cached_value["fresh_until"] > time.time():
+                    return cached_value["value"]
+            value = await compute()
+            CACHE_FILLS.inc(cache_prefix(key), "refresh" if background else "miss")
+            if cache_if is None or cache_if(value):
+                await cache_set(key, _envelope(value, ttl), ttl=ttl + stale_ttl)
+            return value
+        finally:
+            if acquired:
+                await _release_lock(key, token)
+    finally:
+        if _inflight.get(key) is asyncio.current_task():
+            del _inflight[key]
+
+
+def _start_fill(key: str, *args: Any) -> "asyncio.Task[Any]":
+    task = asyncio.create_task(_fill(key, *args))
+    _inflight[key] = task
+    # 기다리던 요청이 모두 취소돼도 예외가 "never retrieved"로 남지 않도록
+    task.add_done_callback(lambda t: t.cancelled() or t.exception())
+    return task
+
+
+def _refresh_done(task: "asyncio.Task[Any]") -> None:
+    _refresh_tasks.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        logger.warning("캐시 백그라운드 갱신 실패: %s", task.exception())
+
+
+async def cached(
+    key: str,
+    compute: Callable[[], Awaitable[T]],
+    *,
+    ttl: int,
+    stale_ttl: Optional[int] = None,
+    cache_if: Optional[Callable[[T], bool]] = None,
+    tag: Optional[str] = None,
+) -> T:
+    """캐시 조회 + 미스 시 단일 계산(single-flight) + stale-while-revalidate.
+
+    - `ttl`(soft)이 지난 값은 그대로 반환하고 백그라운드에서 1회만 갱신
+      (`ttl + stale_ttl`(hard)이 지나면 Redis에서 만료되어 미스)
+    - 미스가 동시에 몰리면 워커 안에서는 진행 중인 계산 1건을 함께 기다리고,
+      워커 간에는 Redis 키별 락을 잡은 1곳만 계산하고 나머지는 저장된 값을 기다림
+    - `compute`는 요청이 끝난 뒤 백그라운드에서도 실행되므로 요청 스코프 자원(`get_db` 세션 등)을
+      쓰지 말 것 (`app.database.with_session` 사용). `stale_ttl=0`이면 백그라운드 갱신 없음
+    - `cache_if`가 False를 반환한 값(부분 결과 등)은 저장하지 않음
+    - 키는 `tag`(기본값: 키의 첫 구간) 세대 번호 아래에 저장되어 `invalidate_cache_tags`로 무효화
+
+    Args:
+        key: 캐시 키
+        compute: 값을 계산하는 인자 없는 코루틴 함수 (JSON 직렬화 가능한 값 반환)
+        ttl: 신선 기간 (초)
+        stale_ttl: soft TTL 이후 오래된 값을 내줄 수 있는 기간 (초, 기본값: ttl)
+    """
+    stale_ttl = ttl if stale_ttl is None else stale_ttl
+    args = (compute, ttl, stale_ttl, cache_if)
+    key = await namespaced_key(key, tag or cache_prefix(key))
+
+    cached_value = await cache_get(key)
+    if _is_envelope(cached_value):
+        if cached_value["fresh_until"] > time.time():
+            return cached_value["value"]
+        if stale_ttl > 0:
+            if key not in _inflight:
+                task = _start_fill(key, *args, True)
+                _refresh_tasks.add(task)
+                task.add_done_callback(_refresh_done)
+            CACHE_FILLS.inc(cache_prefix(key), "stale")
+            return cached_value["value"]
+
+    task = _inflight.get(key)
+    if task is not None:
+        CACHE_FILLS.inc(cache_prefix(key), "coalesced")
+        value = await asyncio.shield(task)
+        if value is not _SKIPPED:
+            return value
+    # 취소되어도 계산은 계속되어 같은 키를 기다리는 다른 요청이 결과를 받음
+    return await asyncio.shield(_start_fill(key, *args, False))
+
+
+# ── AI 요약 캐시 ───────────────────────────────────────────────
+
+async def summary_cache_lookup(keys: List[str]) -> Optional[Any]:
+    """후보 키 중 처음 적중한 요약 반환 (적중 키는 TTL 연장)."""
+    if not keys:
+        return None
+
+    async def _op(client: aioredis.Redis) -> Optional[Any]:
+        values = await client.mget(keys)
+        for key, value in zip(keys, values):
+            if value is not None:
+                record_cache_lookup(key, True)
+                await client.expire(key, TTL_SUMMARY)
+                return json.loads(value)
+        record_cache_lookup(keys[0], False)
+        return None
+
+    return await _redis_call("summary_cache_lookup", _op, None)
+
+
+async def summary_cache_record(kind: str, hit: bool) -> None:
+    """카테고리별 요약 캐시 적중/미스 카운터 증가."""
+    field = f"{kind}:{'hits' if hit else 'misses'}"
+
+    async def _op(client: aioredis.Redis) -> None:
+        await client.hincrby(SUMMARY_CACHE_STATS_KEY, field, 1)
+        return None
+
+    await _redis_call("summary_cache_record", _op, None)
+
+
+async def get_summary_cache_stats() -> Dict[str, Dict[str, Any]]:
+    """카테고리별 요약 캐시 적중/미스 수와 적중률."""
+    async def _op(client: aioredis.Redis) -> Dict[str, Dict[str, Any]]:
+        raw = await client.hgetall(SUMMARY_CACHE_STATS_KEY)
+        stats: Dict[str, Dict[str, Any]] = {}
+        for field, value in raw.items():
+            kind, _, metric = field.rpartition(":")
+            entry = stats.setdefault(kind, {"hits": 0, "misses": 0})
+            entry[metric] = int(value)
+        for entry in stats.values():
+            total = entry["hits"] + entry["misses"]
+            entry["hit_rate"] = round(entry["hits"] / total, 4) if total else 0.0
+        return stats
+
+    return await _redis_call("get_summary_cache_stats", _op, {})
+
+
+async def summary_cache_purge(kind: str, keep_version: Optional[str] = None) -> int:
+    """카테고리 요약 캐시 삭제 (`keep_version`이 있으면 해당 템플릿 버전 항목은 유지)."""
+    keep_prefix = (
+        f"{SUMMARY_CACHE_PREFIX}:{kind}:{keep_version}:" if keep_version is not None else None
+    )
+
+    async def _op(client: aioredis.Redis) -> int:
+        deleted_count = 0
+        async for key in client.scan_iter(match=f"{SUMMARY_CACHE_PREFIX}:{kind}:*", count=500):
+            if keep_prefix and key.startswith(keep_prefix):
+                continue
+            await client.delete(key)
+            deleted_count += 1
+        return deleted_count
+
+    return await _redis_call(f"summary_cache_purge(kind={kind})", _op, 0)
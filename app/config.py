@@ -30,6 +30,46 @@ class Settings(BaseSettings):
     # 스케줄링 설정
     scheduler_interval_hours: int = 12
     api_rate_limit_per_minute: int = 240
+    # 라우트 종류별 분당 한도 (검색 API / POST·PUT·DELETE — 수집 트리거·로그인 포함)
+    api_rate_limit_search_per_minute: int = 60
+    api_rate_limit_write_per_minute: int = 10
+
+    # 전역 검색 설정 (카테고리별 쿼리 데드라인 초,
+    # 프로세스 전체에서 동시에 실행하는 카테고리 쿼리 수 — DB 풀 크기 5보다 작게)
+    search_category_timeout_seconds: float = 3.0
+    search_query_concurrency: int = 4
+
+    # AI 요약 큐 워커 설정 (동시 LLM 호출 수, Gemini 분당 요청 한도, 최대 시도 횟수)
+    summary_worker_concurrency: int = 4
+    summary_rate_per_minute: float = 30.0
+    summary_max_attempts: int = 5
+    summary_batch_size: int = 20
+    summary_items_per_prompt: int = 5  # 배치 프롬프트 1회에 묶는 항목 수
+
+    # RSS 피드 동시 요청 수 (뉴스/정책/컨퍼런스 공통)
+    feed_fetch_concurrency: int = 8
+
+    # CPU 바운드 작업 실행기 (파싱 스레드 수, NLP 프로세스 수 — 0이면 스레드 풀에서 실행)
+    parse_thread_workers: int = 4
+    nlp_process_workers: int = 1
+
+    # 전체 수집(collect_all_data) 시 동시에 실행하는 수집기 수
+    collection_concurrency: int = 4
+
+    # 청크 단위 백필 (청크당 행 수, 동시에 처리하는 청크 수)
+    backfill_chunk_size: int = 500
+    backfill_concurrency: int = 2
+
+    # 프로세스 내 L1 캐시 (바이트 상한, TTL 상한 — 0이면 L1 미사용) / Redis 하트비트 주기
+    cache_l1_max_bytes: int = 32 * 1024 * 1024
+    cache_l1_ttl_seconds: int = 30
+    redis_heartbeat_interval_seconds: float = 5.0
+
+    # API 요청 수·방문자 집계를 Redis에 반영하는 주기 (밀리초)
+    request_stats_flush_ms: int = 1000
+
+    # /metrics 접근 토큰 (비어 있으면 인증 없이 노출 — 운영에서는 설정 권장)
+    metrics_token: str = ""
 
     # 보안 설정 (환경변수 필수 — 미설정 시 기동 실패)
     app_password: str
@@ -1,6 +1,9 @@
+from typing import Any, Awaitable, Callable, TypeVar
+
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from sqlalchemy.orm import declarative_base
 from app.config import get_settings
+from app.metrics import instrument_engine
 
 settings = get_settings()
 
@@ -35,6 +38,9 @@ engine = create_async_engine(
     future=True,
 )
 
+# 쿼리 실행 시간 메트릭 (/metrics)
+instrument_engine(engine.sync_engine)
+
 # 비동기 세션 팩토리
 AsyncSessionLocal = async_sessionmaker(
     engine,
@@ -59,6 +65,19 @@ async def get_db():
             await session.close()
 
 
+T = TypeVar("T")
+
+
+async def with_session(fn: Callable[..., Awaitable[T]], *args: Any, **kwargs: Any) -> T:
+    """새 세션으로 `fn(session, *args, **kwargs)` 실행 (읽기 전용).
+
+    요청이 끝난 뒤에도 실행될 수 있는 계산(`cached()`의 백그라운드 갱신 등)은
+    요청 세션 대신 이 함수를 사용합니다.
+    """
+    async with AsyncSessionLocal() as session:
+        return await fn(session, *args, **kwargs)
+
+
 async def init_db():
     """데이터베이스 초기화.
 
@@ -68,3 +87,6 @@ async def init_db():
     # 모든 모델 import (Alembic이 감지할 수 있도록)
     from app.models import huggingface, youtube, youtube_channel, paper, news, github  # noqa
     from app.models import conference, ai_tool, job_trend, policy  # noqa
+    from app.models import category_stats, keyword_occurrence, summary_job, feed_state  # noqa
+    from app.models import backfill_checkpoint  # noqa
+    from app.models import collection_run  # noqa
@@ -0,0 +1,152 @@
+"""CPU 바운드 작업 실행기 (이벤트 루프 블로킹 방지)
+
+- parse: 스레드 풀 — XML/RSS/JSON 파싱, HTML 정리 등 짧은 동기 작업
+- nlp: 프로세스 풀 — KeyBERT/spaCy/Mecab 키워드 추출 (GIL 경합 없이 별도 코어 사용)
+  `NLP_PROCESS_WORKERS=0`이면 프로세스를 띄우지 않고 parse 스레드 풀에서 실행
+- 풀별 진행 중/대기 작업 수를 집계해 `/api/v1/system/executors`로 노출
+"""
+from __future__ import annotations
+
+import asyncio
+import functools
+import logging
+import multiprocessing
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, Optional, TypeVar
+
+from app.config import get_settings
+from app.run_metrics import track_phase
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+PARSE_POOL = "parse"
+NLP_POOL = "nlp"
+
+
+class _PoolStats:
+    """풀별 작업 카운터 (이벤트 루프 스레드에서만 갱신)."""
+
+    def __init__(self) -> None:
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def as_dict(self, workers: int) -> Dict[str, int]:
+        return {
+            "workers": workers,
+            "in_flight": self.in_flight,
+            # 워커 수를 넘는 진행 중 작업은 풀 내부 큐에서 대기 중
+            "queue_depth": max(0, self.in_flight - workers),
+            "max_in_flight": self.max_in_flight,
+            "submitted": self.submitted,
+            "completed": self.completed,
+            "failed": self.failed,
+        }
+
+
+_executors: Dict[str, Executor] = {}
+_stats: Dict[str, _PoolStats] = {PARSE_POOL: _PoolStats(), NLP_POOL: _PoolStats()}
+_lock = threading.Lock()
+
+
+def _create_executor(name: str) -> Executor:
+    if name == NLP_POOL and settings.nlp_process_workers > 0:
+        workers = settings.nlp_process_workers
+        # fork는 이벤트 루프·스레드 상태를 복제하므로 spawn 사용 (모델은 워커별 1회 로드)
+        executor: Executor = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    else:
+        workers = max(1, settings.parse_thread_workers)
+        executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix=f"{name}-worker")
+    logger.info("실행기 생성: %s (%s, workers=%d)", name, type(executor).__name__, workers)
+    return executor
+
+
+def get_executor(name: str) -> Executor:
+    """이름별 실행기 반환 (최초 호출 시 생성). nlp가 스레드 모드면 parse 풀을 공유."""
+    if name == NLP_POOL and settings.nlp_process_workers <= 0:
+        name = PARSE_POOL
+    with _lock:
+        executor = _executors.get(name)
+        if executor is None:
+            executor = _create_executor(name)
+            _executors[name] = executor
+        return executor
+
+
+async def _run(name: str, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    stats = _stats[name]
+    stats.submitted += 1
+    stats.in_flight += 1
+    stats.max_in_flight = max(stats.max_in_flight, stats.in_flight)
+    loop = asyncio.get_running_loop()
+    call = functools.partial(fn, *args, **kwargs)
+    try:
+        try:
+            result = await loop.run_in_executor(get_executor(name), call)
+        except BrokenProcessPool:
+            # 워커 프로세스가 죽으면(OOM 등) 풀을 새로 만들어 1회 재시도
+            logger.warning("%s 프로세스 풀 손상 — 재생성 후 재시도", name)
+            with _lock:
+                broken = _executors.pop(name, None)
+            if broken is not None:
+                broken.shutdown(wait=False, cancel_futures=True)
+            result = await loop.run_in_executor(get_executor(name), call)
+    except BaseException:
+        stats.failed += 1
+        raise
+    finally:
+        stats.in_flight -= 1
+    stats.completed += 1
+    return result
+
+
+async def run_parse(fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """파싱 등 짧은 동기 함수를 스레드 풀에서 실행 (수집 실행 중이면 parse 단계 시간에 집계)."""
+    with track_phase("parse"):
+        return await _run(PARSE_POOL, fn, *args, **kwargs)
+
+
+async def run_nlp(fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """무거운 NLP 함수를 프로세스 풀에서 실행 (fn/인자는 pickle 가능해야 함)."""
+    return await _run(NLP_POOL, fn, *args, **kwargs)
+
+
+def get_executor_stats() -> Dict[str, Dict[str, Any]]:
+    """풀별 워커 수·진행 중·대기(queue_depth)·누적 처리 수."""
+    nlp_mode = "process" if settings.nlp_process_workers > 0 else "thread"
+    parse_workers = max(1, settings.parse_thread_workers)
+    nlp_workers = settings.nlp_process_workers if nlp_mode == "process" else parse_workers
+    result: Dict[str, Dict[str, Any]] = {
+        PARSE_POOL: {"mode": "thread", **_stats[PARSE_POOL].as_dict(parse_workers)},
+        NLP_POOL: {"mode": nlp_mode, **_stats[NLP_POOL].as_dict(nlp_workers)},
+    }
+    for name, info in result.items():
+        info["started"] = name in _executors or (
+            name == NLP_POOL and nlp_mode == "thread" and PARSE_POOL in _executors
+        )
+    return result
+
+
+def shutdown_executors(wait: bool = True) -> None:
+    """모든 실행기 종료 (lifespan 종료 시)."""
+    with _lock:
+        executors = list(_executors.values())
+        _executors.clear()
+    for executor in executors:
+        executor.shutdown(wait=wait, cancel_futures=True)
+
+
+def reset_executor_stats(name: Optional[str] = None) -> None:
+    """집계 초기화 (테스트·운영 점검용)."""
+    for key in [name] if name else list(_stats):
+        _stats[key] = _PoolStats()
@@ -0,0 +1,191 @@
+"""수집기 공용 HTTP 클라이언트 레지스트리
+
+- 소스별 `httpx.AsyncClient`를 프로세스에서 재사용 (DNS/TCP/TLS 핸드셰이크 재사용)
+- keep-alive 풀 + 호스트별 동시 요청 상한 + 소스별 타임아웃
+- `h2` 패키지가 설치되어 있으면 HTTP/2 사용
+- 수집 작업 실행 중이면 요청 수를 현재 실행에 집계 (app/run_metrics.py)
+- 호스트별 응답 지연·상태 코드는 `/metrics`로 노출 (app/metrics.py)
+- FastAPI lifespan에서 생성/종료, 스크립트·스케줄러에서는 최초 사용 시 생성
+"""
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import logging
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import AsyncIterator, Callable, Dict, Optional
+
+import httpx
+
+from app.metrics import UPSTREAM_REQUEST_DURATION, UPSTREAM_REQUESTS
+from app.run_metrics import count_http_call
+
+logger = logging.getLogger(__name__)
+
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+@dataclass(frozen=True)
+class HttpSourceConfig:
+    """소스별 클라이언트 설정."""
+
+    timeout: float = 20.0
+    max_connections: int = 20
+    max_keepalive_connections: int = 10
+    keepalive_expiry: float = 30.0
+    per_host_limit: int = 4  # 같은 호스트로 동시에 진행 가능한 요청 수
+
+
+# 수집 실행 계측에서 HTTP 호출이 아니라 LLM 호출로 따로 세는 소스
+LLM_SOURCES = frozenset({"ollama"})
+
+HTTP_SOURCE_CONFIGS: Dict[str, HttpSourceConfig] = {
+    # RSS 피드는 호스트가 많고 응답이 느린 곳이 있어 전체 풀을 넉넉히
+    "news": HttpSourceConfig(timeout=30.0, max_connections=40, max_keepalive_connections=20),
+    # arXiv API 이용 가이드: 연속 요청 자제 → 호스트당 1개
+    "arxiv": HttpSourceConfig(timeout=30.0, max_connections=2, per_host_limit=1),
+    "youtube": HttpSourceConfig(timeout=15.0, per_host_limit=8),
+    "github": HttpSourceConfig(timeout=30.0, per_host_limit=4),
+    "huggingface": HttpSourceConfig(timeout=30.0, per_host_limit=4),
+    "jobs": HttpSourceConfig(timeout=30.0, max_connections=4, per_host_limit=2),
+    "trending": HttpSourceConfig(timeout=25.0, per_host_limit=4),
+    "policies": HttpSourceConfig(timeout=20.0, per_host_limit=2),
+    # WikiCFP는 카테고리 피드 4개가 같은 호스트
+    "conferences": HttpSourceConfig(timeout=30.0, max_connections=4, per_host_limit=2),
+    # 로컬 LLM: 요약 워커 동시 실행 수만큼만 (응답이 길어 타임아웃 여유)
+    "ollama": HttpSourceConfig(timeout=60.0, max_connections=8, per_host_limit=4),
+    "default": HttpSourceConfig(),
+}
+
+_clients: Dict[str, httpx.AsyncClient] = {}
+_clients_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+class _HostLimitedStream(httpx.AsyncByteStream):
+    """응답 본문을 다 읽거나 닫을 때 호스트 슬롯을 반납하는 스트림 래퍼."""
+
+    def __init__(self, stream: httpx.AsyncByteStream, release: Callable[[], None]):
+        self._stream = stream
+        self._release = release
+        self._released = False
+
+    async def __aiter__(self):
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            if not self._released:
+                self._released = True
+                self._release()
+
+
+class _HostLimitedTransport(httpx.AsyncBaseTransport):
+    """호스트별 세마포어로 동시 요청 수를 제한하는 전송 계층."""
+
+    def __init__(
+        self,
+        transport: httpx.AsyncBaseTransport,
+        per_host_limit: int,
+        source: str = "default",
+    ):
+        self._transport = transport
+        self._per_host_limit = max(per_host_limit, 1)
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._source = source
+        self._count_calls = source not in LLM_SOURCES
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if self._count_calls:
+            count_http_call()
+        host = request.url.host
+        semaphore = self._semaphores.setdefault(
+            host, asyncio.Semaphore(self._per_host_limit)
+        )
+        await semaphore.acquire()
+        # 호스트 슬롯 대기 시간은 빼고 응답 헤더까지의 지연만 측정
+        started = time.perf_counter()
+        try:
+            response = await self._transport.handle_async_request(request)
+        except BaseException:
+            semaphore.release()
+            UPSTREAM_REQUESTS.inc(self._source, host, "error")
+            raise
+        UPSTREAM_REQUEST_DURATION.observe(time.perf_counter() - started, self._source, host)
+        UPSTREAM_REQUESTS.inc(self._source, host, str(response.status_code))
+        return httpx.Response(
+            status_code=response.status_code,
+            headers=response.headers,
+            stream=_HostLimitedStream(response.stream, semaphore.release),
+            extensions=response.extensions,
+        )
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+def _build_client(source: str) -> httpx.AsyncClient:
+    config = HTTP_SOURCE_CONFIGS.get(source, HTTP_SOURCE_CONFIGS["default"])
+    limits = httpx.Limits(
+        max_connections=config.max_connections,
+        max_keepalive_connections=config.max_keepalive_connections,
+        keepalive_expiry=config.keepalive_expiry,
+    )
+    transport = httpx.AsyncHTTPTransport(http2=HTTP2_AVAILABLE, limits=limits)
+    return httpx.AsyncClient(
+        timeout=config.timeout,
+        transport=_HostLimitedTransport(transport, config.per_host_limit, source=source),
+    )
+
+
+def get_http_client(source: str = "default") -> httpx.AsyncClient:
+    """소스별 공유 클라이언트 반환 (없으면 생성).
+
+    클라이언트는 이벤트 루프에 묶이므로 루프가 바뀌면(스크립트의 연속 `asyncio.run`)
+    기존 클라이언트를 버리고 새로 만듦.
+    """
+    global _clients_loop
+    loop = asyncio.get_running_loop()
+    if _clients_loop is not loop:
+        _clients.clear()
+        _clients_loop = loop
+
+    client = _clients.get(source)
+    if client is None or client.is_closed:
+        client = _build_client(source)
+        _clients[source] = client
+    return client
+
+
+@asynccontextmanager
+async def http_client(source: str = "default") -> AsyncIterator[httpx.AsyncClient]:
+    """`async with httpx.AsyncClient()` 대체 — 공유 클라이언트를 빌려 쓰고 닫지 않음."""
+    yield get_http_client(source)
+
+
+async def init_http_clients() -> None:
+    """설정된 모든 소스의 클라이언트를 미리 생성 (lifespan 시작 시)."""
+    for source in HTTP_SOURCE_CONFIGS:
+        get_http_client(source)
+    logger.info(
+        "HTTP 클라이언트 풀 준비 완료 (sources=%d, http2=%s)",
+        len(_clients),
+        HTTP2_AVAILABLE,
+    )
+
+
+async def close_http_clients() -> None:
+    """모든 공유 클라이언트 종료 (lifespan 종료 시)."""
+    global _clients_loop
+    clients = list(_clients.values())
+    _clients.clear()
+    _clients_loop = None
+    for client in clients:
+        try:
+            await client.aclose()
+        except Exception as e:
+            logger.warning("HTTP 클라이언트 종료 실패: %s", e)
@@ -0,0 +1,172 @@
+"""규칙 테이블용 다중 키워드 매처 (Aho–Corasick).
+
+- 규칙 테이블(라벨 → 키워드 목록)마다 1회 오토마톤을 만들어 두고,
+  텍스트를 한 번만 훑으며 모든 키워드 출현을 찾음 (키워드 수와 무관한 O(텍스트 길이))
+- 대소문자 무시 (키워드·텍스트 모두 소문자로 비교)
+- 단어 경계: 영문자로 시작/끝나는 키워드에만 적용 (한국어 키워드는 조사가 붙으므로 부분 일치)
+  - `BOUNDARY_NONE`: 부분 문자열 일치
+  - `BOUNDARY_START`: 단어 시작에서만 일치 ("lg"가 "algorithm"에 걸리지 않음, "transformer" → "transformers"는 허용).
+    `whole_word_max_len` 이하의 짧은 키워드는 양쪽 경계 모두 요구
+  - `BOUNDARY_WORD`: 항상 양쪽 경계 요구
+  - 양쪽 경계를 요구할 때도 복수형 `s`는 허용 ("llm" → "llms")
+"""
+from __future__ import annotations
+
+from collections import deque
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional, Tuple, Union
+
+BOUNDARY_NONE = "none"
+BOUNDARY_START = "start"
+BOUNDARY_WORD = "word"
+
+WHOLE_WORD_MAX_LEN = 3
+
+
+def _is_word_char(char: str) -> bool:
+    return "a" <= char <= "z" or "0" <= char <= "9"
+
+
+def _is_letter(char: str) -> bool:
+    return "a" <= char <= "z"
+
+
+class KeywordMatcher:
+    """라벨별 키워드 규칙을 미리 컴파일한 매처.
+
+    `rules`가 매핑이면 라벨 → 키워드 목록, 키워드 목록이면 각 키워드가 곧 라벨.
+    같은 키워드가 여러 라벨에 있으면 모두에 집계됨.
+    """
+
+    def __init__(
+        self,
+        rules: Union[Mapping[str, Iterable[str]], Iterable[str]],
+        *,
+        boundary: str = BOUNDARY_START,
+        whole_word_max_len: int = WHOLE_WORD_MAX_LEN,
+    ) -> None:
+        if boundary not in (BOUNDARY_NONE, BOUNDARY_START, BOUNDARY_WORD):
+            raise ValueError(f"unknown boundary mode: {boundary}")
+        if not isinstance(rules, Mapping):
+            rules = {keyword: (keyword,) for keyword in rules}
+
+        self.label_order: List[str] = list(rules)
+        self.patterns: List[str] = []
+        self._pattern_labels: List[List[str]] = []
+        pattern_index: Dict[str, int] = {}
+        for label, keywords in rules.items():
+            for keyword in keywords:
+                pattern = (keyword or "").strip().lower()
+                if not pattern:
+                    continue
+                index = pattern_index.get(pattern)
+                if index is None:
+                    index = pattern_index[pattern] = len(self.patterns)
+                    self.patterns.append(pattern)
+                    self._pattern_labels.append([])
+                if label not in self._pattern_labels[index]:
+                    self._pattern_labels[index].append(label)
+        self._pattern_index = pattern_index
+
+        # 패턴별 경계 검사 여부 (왼쪽, 오른쪽)
+        self._edges: List[Tuple[bool, bool]] = []
+        for pattern in self.patterns:
+            if boundary == BOUNDARY_NONE:
+                self._edges.append((False, False))
+                continue
+            whole_word = boundary == BOUNDARY_WORD or len(pattern) <= whole_word_max_len
+            self._edges.append(
+                (_is_word_char(pattern[0]), whole_word and _is_word_char(pattern[-1]))
+            )
+        self._build()
+
+    def _build(self) -> None:
+        goto: List[Dict[str, int]] = [{}]
+        output: List[Tuple[int, ...]] = [()]
+        for index, pattern in enumerate(self.patterns):
+            state = 0
+            for char in pattern:
+                next_state = goto[state].get(char)
+                if next_state is None:
+                    next_state = len(goto)
+                    goto[state][char] = next_state
+                    goto.append({})
+                    output.append(())
+                state = next_state
+            output[state] += (index,)
+
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in goto[state].items():
+                queue.append(next_state)
+                fallback = fail[state]
+                while fallback and char not in goto[fallback]:
+                    fallback = fail[fallback]
+                fail[next_state] = goto[fallback].get(char, 0)
+                output[next_state] += output[fail[next_state]]
+
+        self._goto = goto
+        self._fail = fail
+        self._output = output
+
+    def _accept(self, text: str, start: int, end: int, index: int) -> bool:
+        check_start, check_end = self._edges[index]
+        if check_start and start > 0 and _is_letter(text[start - 1]):
+            return False
+        if check_end and end < len(text) and _is_letter(text[end]):
+            # 복수형 s만 허용 ("llm" → "llms")
+            if text[end] != "s" or (end + 1 < len(text) and _is_letter(text[end + 1])):
+                return False
+        return True
+
+    def iter_matches(self, text: Optional[str]) -> Iterator[Tuple[int, str]]:
+        """`(시작 위치, 키워드)`를 끝 위치 순으로 (겹치는 매치 포함)."""
+        if not text or not self.patterns:
+            return
+        lowered = text.lower()
+        goto, fail, output, patterns = self._goto, self._fail, self._output, self.patterns
+        state = 0
+        for position, char in enumerate(lowered):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for index in output[state]:
+                start = position - len(patterns[index]) + 1
+                if self._accept(lowered, start, position + 1, index):
+                    yield start, patterns[index]
+
+    def contains_any(self, text: Optional[str]) -> bool:
+        for _ in self.iter_matches(text):
+            return True
+        return False
+
+    def find_all(self, text: Optional[str]) -> List[str]:
+        """일치한 키워드 (중복 제거, 처음 나온 순서)."""
+        return list(dict.fromkeys(pattern for _, pattern in self.iter_matches(text)))
+
+    def label_counts(self, text: Optional[str]) -> Dict[str, int]:
+        """라벨별로 일치한 서로 다른 키워드 수 (일치 없는 라벨은 0)."""
+        counts = {label: 0 for label in self.label_order}
+        for pattern in self.find_all(text):
+            for label in self._labels_of(pattern):
+                counts[label] += 1
+        return counts
+
+    def labels(self, text: Optional[str]) -> List[str]:
+        """일치한 라벨 (규칙 테이블 순서)."""
+        matched = {
+            label for pattern in self.find_all(text) for label in self._labels_of(pattern)
+        }
+        return [label for label in self.label_order if label in matched]
+
+    def first_label(self, text: Optional[str], order: Optional[Iterable[str]] = None) -> Optional[str]:
+        """`order`(기본: 규칙 테이블 순서)에서 처음으로 일치한 라벨."""
+        matched = set(self.labels(text))
+        for label in order if order is not None else self.label_order:
+            if label in matched:
+                return label
+        return None
+
+    def _labels_of(self, pattern: str) -> List[str]:
+        return self._pattern_labels[self._pattern_index[pattern]]
@@ -9,6 +9,8 @@ from starlette.responses import Response
 from sqlalchemy import text
 from datetime import datetime, timezone
 import asyncio
+import hmac
+import time
 
 from app.config import get_settings
 from app.database import init_db, AsyncSessionLocal
@@ -30,15 +32,34 @@ from app.api.v1 import (
     search,
 )
 from app.services.scheduler import start_scheduler, stop_scheduler, scheduler as app_scheduler
+from app.services.ai_summary_service import purge_stale_summary_cache
 from app.auth import verify_api_key
 from app.logging_config import setup_logging
-from app.cache import get_redis, track_visitor
+from app.cache import (
+    close_redis,
+    get_redis,
+    record_api_request,
+    redis_health,
+    start_cache_background_tasks,
+)
+from app.http_client import close_http_clients, init_http_clients
+from app.executors import shutdown_executors
+from app.rate_limit import DistributedRateLimiter, RateLimitRule, route_class
+from app.metrics import (
+    CONTENT_TYPE as METRICS_CONTENT_TYPE,
+    HTTP_REQUEST_DURATION,
+    HTTP_REQUESTS,
+    render_metrics,
+)
 import logging
 
 settings = get_settings()
 API_RATE_LIMIT_PER_MINUTE = max(1, int(getattr(settings, "api_rate_limit_per_minute", 240)))
-_rate_limit_lock = asyncio.Lock()
-_rate_limit_buckets: dict[tuple[str, int], int] = {}
+api_rate_limiter = DistributedRateLimiter([
+    RateLimitRule("default", API_RATE_LIMIT_PER_MINUTE),
+    RateLimitRule("search", max(1, int(getattr(settings, "api_rate_limit_search_per_minute", 60)))),
+    RateLimitRule("write", max(1, int(getattr(settings, "api_rate_limit_write_per_minute", 10)))),
+])
 
 
 # 보안 헤더 미들웨어
@@ -66,13 +87,25 @@ async def lifespan(app: FastAPI):
     await init_db()
     logger.info("✅ 데이터베이스 초기화 완료")
 
+    # 수집기 공용 HTTP 클라이언트 풀 (스케줄러보다 먼저 준비)
+    await init_http_clients()
+
+    # Redis 하트비트 + L1 캐시 무효화 구독
+    start_cache_background_tasks()
+
     start_scheduler()
     logger.info("✅ 스케줄러 시작 완료")
 
+    # 프롬프트 템플릿 버전이 바뀐 AI 요약 캐시 정리 (기동을 막지 않도록 백그라운드)
+    asyncio.create_task(purge_stale_summary_cache())
+
     yield
 
     # 종료 시: 스케줄러 정리
     stop_scheduler()
+    await close_http_clients()
+    await close_redis()
+    shutdown_executors(wait=False)
     logger.info("👋 애플리케이션 종료")
 
 
@@ -85,50 +118,58 @@ app = FastAPI(
 )
 
 
+def _client_ip(request: Request) -> str:
+    forwarded = request.headers.get("x-forwarded-for", request.client.host if request.client else "unknown")
+    return forwarded.split(",")[0].strip()
+
+
 @app.middleware("http")
 async def count_api_requests(request: Request, call_next):
-    """API 요청 횟수 집계 + IP 단위 rate limiting + 방문자 추적."""
-    if request.url.path.startswith("/api/"):
-        visitor_ip = request.headers.get("x-forwarded-for", request.client.host if request.client else "unknown")
-        client_ip = visitor_ip.split(",")[0].strip()
-        minute_bucket = int(datetime.now(timezone.utc).timestamp() // 60)
-        bucket_key = (client_ip, minute_bucket)
-
-        async with _rate_limit_lock:
-            # 메모리 누수 방지를 위해 2분 이상 지난 버킷 제거
-            stale_keys = [key for key in _rate_limit_buckets if key[1] < minute_bucket - 2]
-            for key in stale_keys:
-                _rate_limit_buckets.pop(key, None)
-
-            current_count = _rate_limit_buckets.get(bucket_key, 0)
-            if current_count >= API_RATE_LIMIT_PER_MINUTE:
-                return JSONResponse(
-                    status_code=429,
-                    content={
-                        "detail": "요청 한도를 초과했습니다. 잠시 후 다시 시도해주세요.",
-                        "limit_per_minute": API_RATE_LIMIT_PER_MINUTE,
-                    },
-                )
-            _rate_limit_buckets[bucket_key] = current_count + 1
+    """API 요청 횟수 집계 + IP·라우트 종류 단위 rate limiting + 방문자 추적.
+
+    한도는 Redis에서 워커·레플리카 공통으로 판정 (장애 시 워커별 판정으로 대체),
+    집계는 메모리에 모았다가 백그라운드에서 Redis에 일괄 반영.
+    """
+    if not request.url.path.startswith("/api/"):
+        return await call_next(request)
+
+    client_ip = _client_ip(request)
+    rule = api_rate_limiter.rules[route_class(request.method, request.url.path)]
+    decision = await api_rate_limiter.hit(rule, client_ip)
+    headers = rule.headers(decision)
+    if not decision.allowed:
+        return JSONResponse(
+            status_code=429,
+            content={
+                "detail": "요청 한도를 초과했습니다. 잠시 후 다시 시도해주세요.",
+                "limit_per_minute": rule.limit,
+                "rule": rule.name,
+            },
+            headers={**headers, "Retry-After": str(decision.retry_after)},
+        )
 
     response = await call_next(request)
-    if request.url.path.startswith("/api/"):
-        try:
-            today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-            key = f"api_requests:{today}"
-            redis = await get_redis()
-            await redis.incr(key)
-            ttl = await redis.ttl(key)
-            if ttl is None or ttl < 0:
-                await redis.expire(key, 60 * 60 * 24 * 8)  # 8일 보관
-        except Exception:
-            pass
-        # HyperLogLog 방문자 추적 (IP 기반)
-        visitor_ip = request.headers.get("x-forwarded-for", request.client.host if request.client else "unknown")
-        await track_visitor(visitor_ip.split(",")[0].strip())
+    record_api_request(client_ip)
+    response.headers.update(headers)
     return response
 
 
+@app.middleware("http")
+async def record_request_metrics(request: Request, call_next):
+    """경로 템플릿별 응답 시간·상태 코드 집계 (/metrics, rate limit 429 포함)."""
+    started = time.perf_counter()
+    status_code = 500
+    try:
+        response = await call_next(request)
+        status_code = response.status_code
+        return response
+    finally:
+        # 라벨은 실제 경로가 아닌 템플릿 (/api/v1/news/{news_id}) — 매칭 실패는 하나로 묶음
+        route = getattr(request.scope.get("route"), "path", None) or "unmatched"
+        HTTP_REQUEST_DURATION.observe(time.perf_counter() - started, request.method, route)
+        HTTP_REQUESTS.inc(request.method, route, str(status_code))
+
+
 # 보안 미들웨어 추가
 app.add_middleware(SecurityHeadersMiddleware)
 app.add_middleware(GZipMiddleware, minimum_size=1000)  # 압축
@@ -141,6 +182,9 @@ allowed_origins = [
     "https://ai-trend-tracker-production.up.railway.app",  # Railway 백엔드
 ]
 
+# 프론트엔드가 읽을 수 있도록 노출하는 rate limit 응답 헤더
+RATE_LIMIT_HEADERS = ["RateLimit-Limit", "RateLimit-Remaining", "RateLimit-Reset", "RateLimit-Policy", "Retry-After"]
+
 # DEBUG 모드가 아닐 때는 특정 origin만 허용
 if not settings.debug:
     app.add_middleware(
@@ -149,6 +193,7 @@ if not settings.debug:
         allow_credentials=True,
         allow_methods=["GET", "POST", "PUT", "DELETE"],
         allow_headers=["*"],
+        expose_headers=RATE_LIMIT_HEADERS,
     )
 else:
     # 개발 환경에서는 모든 origin 허용
@@ -158,6 +203,7 @@ else:
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        expose_headers=RATE_LIMIT_HEADERS,
     )
 
 
@@ -173,11 +219,20 @@ async def root():
     }
 
 
+@app.get("/metrics", include_in_schema=False)
+async def metrics(request: Request):
+    """Prometheus 스크레이프 엔드포인트 (METRICS_TOKEN 설정 시 Bearer 토큰 필요)."""
+    if settings.metrics_token:
+        authorization = request.headers.get("authorization", "")
+        if not hmac.compare_digest(authorization, f"Bearer {settings.metrics_token}"):
+            return JSONResponse(status_code=401, content={"detail": "Unauthorized"})
+    return Response(render_metrics(), media_type=METRICS_CONTENT_TYPE)
+
+
 @app.get("/health")
 async def health_check():
     """헬스 체크 엔드포인트 (DB/Redis/Scheduler 진단 포함)."""
     db_status = "error"
-    redis_status = "error"
     scheduler_status = "running" if app_scheduler.running else "stopped"
 
     try:
@@ -187,12 +242,15 @@ async def health_check():
     except Exception:
         db_status = "error"
 
-    try:
-        redis = await get_redis()
-        redis_ok = await redis.ping()
-        redis_status = "ok" if redis_ok else "error"
-    except Exception:
-        redis_status = "error"
+    # 하트비트 결과 사용 (하트비트가 아직 돌지 않았으면 직접 PING)
+    redis_status = redis_health()["status"]
+    if redis_status == "unknown":
+        try:
+            redis = await get_redis()
+            redis_ok = await redis.ping()
+            redis_status = "ok" if redis_ok else "error"
+        except Exception:
+            redis_status = "error"
 
     if db_status == "ok" and redis_status == "ok":
         status = "healthy"
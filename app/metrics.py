@@ -0,0 +1,340 @@
+"""프로세스 내 메트릭 레지스트리 (Prometheus 텍스트 포맷 노출)
+
+- 외부 의존성 없이 Counter / Histogram / Gauge(렌더링 시 계산)만 지원
+- 값은 프로세스(워커)별 — 여러 워커를 띄우면 Prometheus에서 인스턴스별로 합산
+- 라벨 값은 경로 템플릿·호스트·작업 ID처럼 종류가 한정된 값만 사용 (키·IP 등 금지)
+- `/metrics`(app/main.py)에서 `render_metrics()` 결과를 그대로 반환
+"""
+from __future__ import annotations
+
+import math
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+DB_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+REDIS_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1.0)
+JOB_BUCKETS = (1.0, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0, 600.0, 1800.0, 3600.0)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Metric:
+    type_name = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Sequence[str]) -> Tuple[str, ...]:
+        if len(labels) != len(self.labelnames):
+            raise ValueError(f"{self.name}: expected labels {self.labelnames}, got {labels}")
+        return tuple(str(label) for label in labels)
+
+    def header(self) -> List[str]:
+        return [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.type_name}",
+        ]
+
+    def samples(self) -> List[str]:
+        raise NotImplementedError
+
+    def reset(self) -> None:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    type_name = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, *labels: str) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+    def items(self) -> List[Tuple[Tuple[str, ...], float]]:
+        with self._lock:
+            return list(self._values.items())
+
+    def samples(self) -> List[str]:
+        return [
+            f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+            for key, value in sorted(self.items())
+        ]
+
+    def reset(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+
+class Histogram(_Metric):
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # 라벨 → [버킷별 개수..., 합계, 전체 개수]
+        self._values: Dict[Tuple[str, ...], List[float]] = {}
+
+    def observe(self, value: float, *labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = [0.0] * (len(self.buckets) + 2)
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    state[index] += 1
+                    break
+            state[-2] += value
+            state[-1] += 1
+
+    @contextmanager
+    def time(self, *labels: str) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, *labels)
+
+    def count(self, *labels: str) -> int:
+        state = self._values.get(self._key(labels))
+        return int(state[-1]) if state else 0
+
+    def samples(self) -> List[str]:
+        with self._lock:
+            snapshot = {key: list(state) for key, state in self._values.items()}
+        lines = []
+        for key, state in sorted(snapshot.items()):
+            cumulative = 0.0
+            for bound, count in zip(self.buckets, state):
+                cumulative += count
+                le = f'le="{_format_value(bound)}"'
+                lines.append(
+                    f"{self.name}_bucket{_format_labels(self.labelnames, key, le)} {_format_value(cumulative)}"
+                )
+            inf = 'le="+Inf"'
+            lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, key, inf)} {_format_value(state[-1])}")
+            lines.append(f"{self.name}_sum{_format_labels(self.labelnames, key)} {_format_value(state[-2])}")
+            lines.append(f"{self.name}_count{_format_labels(self.labelnames, key)} {_format_value(state[-1])}")
+        return lines
+
+    def reset(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+
+class Gauge(_Metric):
+    """렌더링 시점에 `collect()`로 값을 계산하는 게이지."""
+
+    type_name = "gauge"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str],
+        collect: Callable[[], Dict[Tuple[str, ...], float]],
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self._collect = collect
+
+    def samples(self) -> List[str]:
+        return [
+            f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+            for key, value in sorted(self._collect().items())
+        ]
+
+    def reset(self) -> None:
+        pass
+
+
+_registry: List[_Metric] = []
+
+
+def _register(metric: _Metric) -> _Metric:
+    _registry.append(metric)
+    return metric
+
+
+# ── API 요청 ──────────────────────────────────────────────────
+HTTP_REQUESTS = _register(
+    Counter("http_requests_total", "HTTP requests by route template and status code.", ("method", "route", "status"))
+)
+HTTP_REQUEST_DURATION = _register(
+    Histogram("http_request_duration_seconds", "HTTP request latency by route template.", ("method", "route"))
+)
+RATE_LIMIT_DECISIONS = _register(
+    Counter(
+        "rate_limit_decisions_total",
+        "API rate limit decisions by rule, deciding backend (redis/local) and result (allowed/limited).",
+        ("rule", "backend", "result"),
+    )
+)
+
+# ── DB ────────────────────────────────────────────────────────
+DB_QUERY_DURATION = _register(
+    Histogram("db_query_duration_seconds", "SQLAlchemy statement execution time by operation.", ("operation",), DB_BUCKETS)
+)
+DB_QUERY_ERRORS = _register(
+    Counter("db_query_errors_total", "SQLAlchemy statements that raised, by operation.", ("operation",))
+)
+
+# ── Redis / 캐시 ──────────────────────────────────────────────
+REDIS_CALL_DURATION = _register(
+    Histogram("redis_call_duration_seconds", "Redis helper call latency (including one reconnect retry).", ("action",), REDIS_BUCKETS)
+)
+REDIS_CALL_FAILURES = _register(
+    Counter("redis_call_failures_total", "Redis helper calls that fell back after retry.", ("action",))
+)
+CACHE_REQUESTS = _register(
+    Counter("cache_requests_total", "Cache lookups by key prefix and result (hit/miss).", ("prefix", "result"))
+)
+
+
+def _cache_hit_ratios() -> Dict[Tuple[str, ...], float]:
+    totals: Dict[str, List[float]] = {}
+    for (prefix, result), value in CACHE_REQUESTS.items():
+        entry = totals.setdefault(prefix, [0.0, 0.0])
+        entry[0 if result == "hit" else 1] += value
+    return {
+        (prefix,): round(hits / (hits + misses), 4)
+        for prefix, (hits, misses) in totals.items()
+        if hits + misses
+    }
+
+
+CACHE_HIT_RATIO = _register(
+    Gauge("cache_hit_ratio", "Cache hit ratio by key prefix since process start.", ("prefix",), _cache_hit_ratios)
+)
+CACHE_FILLS = _register(
+    Counter(
+        "cache_fills_total",
+        "cached() outcomes by key prefix: miss/refresh (computed here), coalesced/waited (shared), stale (served stale).",
+        ("prefix", "outcome"),
+    )
+)
+CACHE_L1_REQUESTS = _register(
+    Counter("cache_l1_requests_total", "In-process L1 cache lookups by key prefix and result.", ("prefix", "result"))
+)
+
+
+def _cache_l1_bytes() -> Dict[Tuple[str, ...], float]:
+    from app.cache import local_cache
+
+    return {(): float(local_cache.size)}
+
+
+CACHE_L1_BYTES = _register(
+    Gauge("cache_l1_bytes", "Serialized size of entries held in the in-process L1 cache.", (), _cache_l1_bytes)
+)
+
+# ── 수집기 HTTP 클라이언트 ─────────────────────────────────────
+UPSTREAM_REQUEST_DURATION = _register(
+    Histogram(
+        "upstream_request_duration_seconds",
+        "Shared HTTP client latency to response headers by upstream host.",
+        ("source", "host"),
+    )
+)
+UPSTREAM_REQUESTS = _register(
+    Counter("upstream_requests_total", "Shared HTTP client requests by upstream host and status.", ("source", "host", "status"))
+)
+
+# ── 스케줄러 ──────────────────────────────────────────────────
+SCHEDULER_JOB_DURATION = _register(
+    Histogram("scheduler_job_duration_seconds", "Scheduler job run time.", ("job",), JOB_BUCKETS)
+)
+SCHEDULER_JOB_RUNS = _register(
+    Counter("scheduler_job_runs_total", "Scheduler job runs by final status.", ("job", "status"))
+)
+
+
+def cache_prefix(key: str) -> str:
+    """캐시 키의 첫 구간 (`list:news:...` → `list`)."""
+    return key.split(":", 1)[0] or "unknown"
+
+
+def record_cache_lookup(key: str, hit: bool) -> None:
+    CACHE_REQUESTS.inc(cache_prefix(key), "hit" if hit else "miss")
+
+
+def statement_operation(statement: Optional[str]) -> str:
+    """SQL 문의 첫 키워드 (SELECT/INSERT/...; WITH 등은 OTHER)."""
+    word = (statement or "").lstrip().split(None, 1)
+    operation = word[0].upper() if word else ""
+    if operation in ("SELECT", "INSERT", "UPDATE", "DELETE"):
+        return operation
+    return "OTHER"
+
+
+def instrument_engine(sync_engine) -> None:
+    """SQLAlchemy 엔진에 쿼리 시간 측정 이벤트 등록 (`engine.sync_engine`)."""
+    from sqlalchemy import event
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("_metrics_started", []).append(time.perf_counter())
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        stack = conn.info.get("_metrics_started")
+        if stack:
+            DB_QUERY_DURATION.observe(time.perf_counter() - stack.pop(), statement_operation(statement))
+
+    @event.listens_for(sync_engine, "handle_error")
+    def _error(context):
+        stack = context.connection.info.get("_metrics_started") if context.connection else None
+        if stack:
+            stack.pop()
+        DB_QUERY_ERRORS.inc(statement_operation(context.statement))
+
+
+def render_metrics() -> str:
+    lines: List[str] = []
+    for metric in _registry:
+        lines.extend(metric.header())
+        lines.extend(metric.samples())
+    return "\n".join(lines) + "\n"
+
+
+def reset_metrics() -> None:
+    """모든 메트릭 초기화 (테스트용)."""
+    for metric in _registry:
+        metric.reset()
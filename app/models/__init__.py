@@ -8,6 +8,12 @@ from app.models.conference import AIConference
 from app.models.ai_tool import AITool
 from app.models.job_trend import AIJobTrend
 from app.models.policy import AIPolicy
+from app.models.category_stats import CategoryDailyStat
+from app.models.keyword_occurrence import KeywordOccurrence
+from app.models.summary_job import SummaryJob
+from app.models.feed_state import FeedState
+from app.models.backfill_checkpoint import BackfillCheckpoint
+from app.models.collection_run import CollectionRun
 
 __all__ = [
     "HuggingFaceModel",
@@ -20,4 +26,10 @@ __all__ = [
     "AITool",
     "AIJobTrend",
     "AIPolicy",
+    "CategoryDailyStat",
+    "KeywordOccurrence",
+    "SummaryJob",
+    "FeedState",
+    "BackfillCheckpoint",
+    "CollectionRun",
 ]
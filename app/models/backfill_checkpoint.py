@@ -0,0 +1,30 @@
+"""백필 작업 체크포인트 모델"""
+from sqlalchemy import Column, Integer, String, Text, DateTime, UniqueConstraint
+from sqlalchemy.sql import func
+from app.database import Base
+
+
+class BackfillCheckpoint(Base):
+    """백필 작업(job) × 대상(task)별 진행 상태 — 중단 후 재실행 시 `last_id` 다음부터 이어서 처리"""
+
+    __tablename__ = "backfill_checkpoints"
+    __table_args__ = (
+        UniqueConstraint("job", "task", name="uq_backfill_checkpoints_job_task"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    job = Column(String(50), nullable=False)  # v4_metadata, ...
+    task = Column(String(50), nullable=False)  # news_category, paper_topic, ...
+    status = Column(String(20), nullable=False, default="pending")  # pending/running/done/failed
+    last_id = Column(Integer, nullable=False, default=0)  # 연속 완료된 마지막 대상 id (키셋 cursor)
+    processed = Column(Integer, nullable=False, default=0)  # 처리한 행 수
+    updated = Column(Integer, nullable=False, default=0)  # 값이 바뀐 행 수
+    total = Column(Integer)  # 시작 시 추정한 전체 대상 수
+    last_error = Column(Text)
+    started_at = Column(DateTime(timezone=True))
+    finished_at = Column(DateTime(timezone=True))
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+    def __repr__(self):
+        return f"<BackfillCheckpoint({self.job}:{self.task} {self.status} last_id={self.last_id})>"
@@ -0,0 +1,23 @@
+"""카테고리별 일간 통계 롤업 모델"""
+from sqlalchemy import Column, Integer, String, Date, DateTime, UniqueConstraint
+from sqlalchemy.sql import func
+from app.database import Base
+
+
+class CategoryDailyStat(Base):
+    """카테고리별 일자 단위 신규 항목 수 (스케줄러가 수집 후 증분 갱신)"""
+
+    __tablename__ = "category_daily_stats"
+    __table_args__ = (
+        UniqueConstraint("category", "stat_date", name="uq_category_daily_stats_category_date"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    category = Column(String, nullable=False, index=True)  # huggingface, news, ...
+    stat_date = Column(Date, nullable=False, index=True)  # 기준 날짜 (date_field 기준)
+    item_count = Column(Integer, nullable=False, default=0)  # 해당 일자 신규 항목 수
+    last_item_at = Column(DateTime(timezone=True))  # 해당 일자 최신 항목 시각
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+    def __repr__(self):
+        return f"<CategoryDailyStat({self.category} {self.stat_date}={self.item_count})>"
@@ -0,0 +1,39 @@
+"""수집 작업 실행 이력 모델"""
+from sqlalchemy import Column, Integer, String, DateTime, JSON, Index
+from sqlalchemy.sql import func
+from app.database import Base
+
+
+class CollectionRun(Base):
+    """`collect_*` 작업 1회 실행의 소요 시간·단계별 시간·건수·외부 호출 수 (느린 실행의 원인 분석용)"""
+
+    __tablename__ = "collection_runs"
+    __table_args__ = (
+        Index("ix_collection_runs_job_started", "job_id", "started_at"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    job_id = Column(String(100), nullable=False)  # collect_news, collect_all_data, ...
+    trigger = Column(String(20), nullable=False, default="scheduled")  # scheduled/manual/collect_all
+    status = Column(String(20), nullable=False)  # success/error
+    started_at = Column(DateTime(timezone=True), nullable=False, index=True)
+    finished_at = Column(DateTime(timezone=True))
+    duration_ms = Column(Integer, nullable=False, default=0)
+
+    # 단계별 누적 시간 (ms) — parse/summarize는 fetch/save 구간 안에서 측정됨
+    fetch_ms = Column(Integer, nullable=False, default=0)
+    parse_ms = Column(Integer, nullable=False, default=0)
+    summarize_ms = Column(Integer, nullable=False, default=0)
+    save_ms = Column(Integer, nullable=False, default=0)
+    invalidate_ms = Column(Integer, nullable=False, default=0)
+
+    fetched = Column(Integer, nullable=False, default=0)
+    inserted = Column(Integer, nullable=False, default=0)
+    updated = Column(Integer, nullable=False, default=0)
+    http_calls = Column(Integer, nullable=False, default=0)
+    llm_calls = Column(Integer, nullable=False, default=0)
+    errors = Column(JSON, default=[])
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    def __repr__(self):
+        return f"<CollectionRun({self.job_id} {self.status} {self.duration_ms}ms)>"
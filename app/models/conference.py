@@ -2,12 +2,19 @@
 from sqlalchemy import Column, String, Text, Integer, DateTime, Boolean, JSON, Float
 from sqlalchemy.sql import func
 from app.database import Base
+from app.models.search_document import (
+    SEARCH_VECTOR_MAPPER_ARGS,
+    search_indexes,
+    search_vector_column,
+)
 
 
 class AIConference(Base):
     """AI 컨퍼런스 및 학회"""
 
     __tablename__ = "ai_conferences"
+    __table_args__ = search_indexes("ai_conferences")
+    __mapper_args__ = SEARCH_VECTOR_MAPPER_ARGS
 
     id = Column(Integer, primary_key=True, index=True)
     conference_name = Column(String, nullable=False, index=True)
@@ -48,6 +55,7 @@ class AIConference(Base):
     is_upcoming = Column(Boolean, default=False)
     is_archived = Column(Boolean, default=False, index=True)
     archived_at = Column(DateTime(timezone=True))
+    search_vector = search_vector_column("ai_conferences")  # 전역 검색 FTS 문서 (generated)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
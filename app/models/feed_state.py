@@ -0,0 +1,22 @@
+"""RSS 피드 조건부 요청 상태 모델"""
+from sqlalchemy import Column, Integer, String, DateTime
+from sqlalchemy.sql import func
+from app.database import Base
+
+
+class FeedState(Base):
+    """피드별 마지막 검증자(ETag/Last-Modified) — 다음 수집 때 304로 본문 다운로드·파싱 생략"""
+
+    __tablename__ = "feed_states"
+
+    id = Column(Integer, primary_key=True, index=True)
+    feed_url = Column(String(1000), unique=True, nullable=False)
+    etag = Column(String(500))  # 응답 ETag → If-None-Match
+    last_modified = Column(String(100))  # 응답 Last-Modified → If-Modified-Since
+    last_status = Column(Integer)  # 마지막 HTTP 상태 코드 (200/304/...)
+    last_fetched_at = Column(DateTime(timezone=True))
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+    def __repr__(self):
+        return f"<FeedState({self.feed_url} {self.last_status})>"
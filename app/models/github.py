@@ -2,12 +2,19 @@
 from sqlalchemy import Column, String, Text, Integer, DateTime, Boolean, JSON
 from sqlalchemy.sql import func
 from app.database import Base
+from app.models.search_document import (
+    SEARCH_VECTOR_MAPPER_ARGS,
+    search_indexes,
+    search_vector_column,
+)
 
 
 class GitHubProject(Base):
     """GitHub 트렌딩 AI 프로젝트"""
 
     __tablename__ = "github_projects"
+    __table_args__ = search_indexes("github_projects")
+    __mapper_args__ = SEARCH_VECTOR_MAPPER_ARGS
 
     id = Column(Integer, primary_key=True, index=True)
     repo_name = Column(String, unique=True, index=True, nullable=False)  # owner/repo 형식
@@ -38,6 +45,7 @@ class GitHubProject(Base):
     is_featured = Column(Boolean, default=False)  # 주요 프로젝트
     is_archived = Column(Boolean, default=False, index=True)  # 아카이브 여부
     archived_at = Column(DateTime(timezone=True))  # 아카이브 처리 시각
+    search_vector = search_vector_column("github_projects")  # 전역 검색 FTS 문서 (generated)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
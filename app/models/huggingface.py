@@ -1,12 +1,19 @@
 from sqlalchemy import Column, Integer, String, Text, DateTime, JSON, Boolean
 from sqlalchemy.sql import func
 from app.database import Base
+from app.models.search_document import (
+    SEARCH_VECTOR_MAPPER_ARGS,
+    search_indexes,
+    search_vector_column,
+)
 
 
 class HuggingFaceModel(Base):
     """Hugging Face 모델 정보"""
 
     __tablename__ = "huggingface_models"
+    __table_args__ = search_indexes("huggingface_models")
+    __mapper_args__ = SEARCH_VECTOR_MAPPER_ARGS
 
     id = Column(Integer, primary_key=True, index=True)
     model_id = Column(String, unique=True, index=True, nullable=False)  # 예: "meta-llama/Llama-2-7b"
@@ -41,6 +48,7 @@ class HuggingFaceModel(Base):
     is_trending = Column(Boolean, default=False)  # 트렌딩 모델
     is_archived = Column(Boolean, default=False, index=True)  # 아카이브 여부
     archived_at = Column(DateTime(timezone=True))  # 아카이브 처리 시각
+    search_vector = search_vector_column("huggingface_models")  # 전역 검색 FTS 문서 (generated)
 
     def __repr__(self):
         return f"<HuggingFaceModel {self.model_id}>"
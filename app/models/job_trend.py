@@ -2,9 +2,16 @@
 from sqlalchemy import Column, String, Text, Integer, DateTime, Boolean, JSON
 from sqlalchemy.sql import func
 from app.database import Base
+from app.models.search_document import (
+    SEARCH_VECTOR_MAPPER_ARGS,
+    search_indexes,
+    search_vector_column,
+)
 
 class AIJobTrend(Base):
     __tablename__ = "ai_job_trends"
+    __table_args__ = search_indexes("ai_job_trends")
+    __mapper_args__ = SEARCH_VECTOR_MAPPER_ARGS
     id = Column(Integer, primary_key=True, index=True)
     job_title = Column(String, index=True, nullable=False)
     company_name = Column(String)
@@ -21,6 +28,7 @@ class AIJobTrend(Base):
     is_trending = Column(Boolean, default=False)
     is_archived = Column(Boolean, default=False, index=True)
     archived_at = Column(DateTime(timezone=True))
+    search_vector = search_vector_column("ai_job_trends")  # 전역 검색 FTS 문서 (generated)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     def __repr__(self):
         return f"<AIJobTrend(job_title={self.job_title})>"
@@ -0,0 +1,160 @@
+"""키워드 출현 인덱스 모델
+
+카테고리 모델의 키워드 JSON 배열을 (keyword, category, item_id) 행으로 펼쳐 저장합니다.
+ORM flush 직후 자동 동기화되므로 save_*_to_db / 요약 보강 / 백필 경로 모두 별도 호출이 필요 없습니다.
+"""
+from datetime import datetime, timezone
+from typing import Any, Dict, List
+
+from sqlalchemy import (
+    Column,
+    DateTime,
+    Index,
+    Integer,
+    String,
+    UniqueConstraint,
+    delete,
+    event,
+    inspect,
+)
+from sqlalchemy.orm import Session
+
+from app.database import Base
+from app.models.ai_tool import AITool
+from app.models.conference import AIConference
+from app.models.github import GitHubProject
+from app.models.huggingface import HuggingFaceModel
+from app.models.job_trend import AIJobTrend
+from app.models.news import AINews
+from app.models.paper import AIPaper
+from app.models.policy import AIPolicy
+from app.models.youtube import YouTubeVideo
+
+KEYWORD_MAX_LENGTH = 200
+
+
+class KeywordOccurrence(Base):
+    """항목별 키워드 출현 (트렌딩 키워드 GROUP BY 집계용)"""
+
+    __tablename__ = "keyword_occurrences"
+    __table_args__ = (
+        UniqueConstraint(
+            "category", "item_id", "keyword", name="uq_keyword_occurrences_item_keyword"
+        ),
+        Index("ix_keyword_occurrences_keyword_category", "keyword", "category"),
+        Index("ix_keyword_occurrences_observed_at_keyword", "observed_at", "keyword"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    keyword = Column(String(KEYWORD_MAX_LENGTH), nullable=False)
+    category = Column(String(30), nullable=False)  # huggingface, github, ..., platforms
+    item_id = Column(Integer, nullable=False)  # 원본 테이블 PK
+    observed_at = Column(DateTime(timezone=True), nullable=False)  # 항목 수집 시각
+
+    def __repr__(self):
+        return f"<KeywordOccurrence({self.category}#{self.item_id} {self.keyword})>"
+
+
+# 모델 → (키워드 필드, 카테고리, 기준 시각 필드)
+KEYWORD_SOURCES: Dict[type, tuple] = {
+    HuggingFaceModel: ("key_features", "huggingface", "collected_at"),
+    GitHubProject: ("keywords", "github", "created_at"),
+    YouTubeVideo: ("keywords", "youtube", "created_at"),
+    AIPaper: ("keywords", "papers", "created_at"),
+    AINews: ("keywords", "news", "created_at"),
+    AIConference: ("topics", "conferences", "created_at"),
+    AITool: ("key_features", "platforms", "created_at"),
+    AIJobTrend: ("required_skills", "jobs", "created_at"),
+    AIPolicy: ("impact_areas", "policies", "created_at"),
+}
+
+# 마이그레이션 미적용 DB에서는 동기화를 건너뜀 (프로세스 단위 메모이제이션)
+_TABLE_EXISTS: Dict[str, bool] = {}
+
+
+def normalize_keywords(value: Any) -> List[str]:
+    """JSON 키워드 배열 정규화 (문자열만, 공백 제거, 항목 내 중복 제거)."""
+    if not isinstance(value, list):
+        return []
+    keywords: List[str] = []
+    for keyword in value:
+        if not isinstance(keyword, str):
+            continue
+        keyword = keyword.strip()[:KEYWORD_MAX_LENGTH]
+        if keyword and keyword not in keywords:
+            keywords.append(keyword)
+    return keywords
+
+
+def _keyword_table_exists(connection) -> bool:
+    url = str(connection.engine.url)
+    if url not in _TABLE_EXISTS:
+        _TABLE_EXISTS[url] = inspect(connection).has_table(KeywordOccurrence.__tablename__)
+    return _TABLE_EXISTS[url]
+
+
+@event.listens_for(Session, "after_flush")
+def _sync_keyword_occurrences(session: Session, flush_context) -> None:
+    """flush된 신규/수정/삭제 항목의 키워드 출현 행을 같은 트랜잭션에서 갱신."""
+    targets = []  # (category, item_id, keywords | None, observed_at)
+    now = datetime.now(timezone.utc)
+
+    for obj in session.new:
+        source = KEYWORD_SOURCES.get(type(obj))
+        if source is None or obj.id is None:
+            continue
+        field, category, date_field = source
+        observed_at = obj.__dict__.get(date_field) or now
+        targets.append((category, obj.id, normalize_keywords(obj.__dict__.get(field)), observed_at))
+
+    for obj in session.dirty:
+        source = KEYWORD_SOURCES.get(type(obj))
+        if source is None or obj.id is None:
+            continue
+        field, category, date_field = source
+        if not inspect(obj).attrs[field].history.has_changes():
+            continue
+        observed_at = obj.__dict__.get(date_field) or now
+        targets.append((category, obj.id, normalize_keywords(obj.__dict__.get(field)), observed_at))
+
+    for obj in session.deleted:
+        source = KEYWORD_SOURCES.get(type(obj))
+        if source is None or obj.id is None:
+            continue
+        targets.append((source[1], obj.id, None, None))
+
+    if targets:
+        replace_keyword_occurrences(session.connection(), targets)
+
+
+def replace_keyword_occurrences(connection, targets) -> None:
+    """항목별 키워드 출현 행 교체.
+
+    Args:
+        connection: 동기 Connection (flush 훅 / `AsyncSession.run_sync` 내부)
+        targets: `(category, item_id, keywords | None, observed_at)` 목록 (None은 삭제만)
+    """
+    if not _keyword_table_exists(connection):
+        return
+
+    table = KeywordOccurrence.__table__
+    stale: Dict[str, List[int]] = {}
+    rows = []
+    for category, item_id, keywords, observed_at in targets:
+        stale.setdefault(category, []).append(item_id)
+        for keyword in keywords or []:
+            rows.append(
+                {
+                    "keyword": keyword,
+                    "category": category,
+                    "item_id": item_id,
+                    "observed_at": observed_at,
+                }
+            )
+
+    for category, item_ids in stale.items():
+        connection.execute(
+            delete(table).where(table.c.category == category, table.c.item_id.in_(item_ids))
+        )
+    if rows:
+        connection.execute(table.insert(), rows)
@@ -1,13 +1,20 @@
 """AI 뉴스/블로그 모델"""
-from sqlalchemy import Column, String, Text, Integer, DateTime, Boolean, JSON
+from sqlalchemy import Column, String, Text, Integer, DateTime, Boolean, JSON, LargeBinary
 from sqlalchemy.sql import func
 from app.database import Base
+from app.models.search_document import (
+    SEARCH_VECTOR_MAPPER_ARGS,
+    search_indexes,
+    search_vector_column,
+)
 
 
 class AINews(Base):
     """AI 뉴스 및 블로그 포스트"""
 
     __tablename__ = "ai_news"
+    __table_args__ = search_indexes("ai_news")
+    __mapper_args__ = SEARCH_VECTOR_MAPPER_ARGS
 
     id = Column(Integer, primary_key=True, index=True)
     url = Column(String, unique=True, index=True, nullable=False)  # 원본 URL
@@ -30,8 +37,11 @@ class AINews(Base):
     category = Column(String, default="AI News")  # 카테고리
     is_featured = Column(Boolean, default=False)  # 주요 뉴스
     is_trending = Column(Boolean, default=False)  # 트렌딩 뉴스
+    minhash = Column(LargeBinary)  # 제목 MinHash 서명 (근사 중복 판정)
+    cluster_id = Column(Integer, index=True)  # 같은 이야기 묶음의 최초 기사 id
     is_archived = Column(Boolean, default=False, index=True)  # 아카이브 여부
     archived_at = Column(DateTime(timezone=True))  # 아카이브 처리 시각
+    search_vector = search_vector_column("ai_news")  # 전역 검색 FTS 문서 (generated)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
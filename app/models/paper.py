@@ -2,12 +2,19 @@
 from sqlalchemy import Column, String, Text, Integer, DateTime, Boolean, JSON
 from sqlalchemy.sql import func
 from app.database import Base
+from app.models.search_document import (
+    SEARCH_VECTOR_MAPPER_ARGS,
+    search_indexes,
+    search_vector_column,
+)
 
 
 class AIPaper(Base):
     """arXiv AI 논문"""
 
     __tablename__ = "ai_papers"
+    __table_args__ = search_indexes("ai_papers")
+    __mapper_args__ = SEARCH_VECTOR_MAPPER_ARGS
 
     id = Column(Integer, primary_key=True, index=True)
     arxiv_id = Column(String, unique=True, index=True, nullable=False)  # arXiv ID (예: 2301.12345)
@@ -35,6 +42,7 @@ class AIPaper(Base):
     is_trending = Column(Boolean, default=False)  # 트렌딩 논문
     is_archived = Column(Boolean, default=False, index=True)  # 아카이브 여부
     archived_at = Column(DateTime(timezone=True))  # 아카이브 처리 시각
+    search_vector = search_vector_column("ai_papers")  # 전역 검색 FTS 문서 (generated)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
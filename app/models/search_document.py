@@ -0,0 +1,80 @@
+"""전역 검색용 FTS 문서 컬럼 정의.
+
+각 검색 대상 테이블은 `search_vector` (PostgreSQL STORED generated tsvector)
+컬럼과 GIN 인덱스를 가지며, ILIKE fallback 컬럼에는 pg_trgm GIN 인덱스를 둡니다.
+마이그레이션 미적용 환경을 위해 동일한 표현식을 검색 API에서 인라인으로도 사용합니다.
+"""
+from typing import Dict, Tuple
+
+from sqlalchemy import Column, Computed, Index
+from sqlalchemy.dialects.postgresql import TSVECTOR
+
+# 테이블별 FTS 문서 구성 컬럼 (순서 유지)
+SEARCH_DOCUMENT_COLUMNS: Dict[str, Tuple[str, ...]] = {
+    "huggingface_models": ("model_name", "description", "task"),
+    "youtube_videos": ("title", "description", "channel_title"),
+    "ai_papers": ("title", "abstract"),
+    "ai_news": ("title", "content", "excerpt"),
+    "github_projects": ("repo_name", "name", "description"),
+    "ai_conferences": ("conference_name", "conference_acronym"),
+    "ai_job_trends": ("job_title", "description"),
+    "ai_policies": ("title", "description"),
+}
+
+# 테이블별 ILIKE fallback 대상 컬럼 (pg_trgm 인덱스)
+SEARCH_TRIGRAM_COLUMNS: Dict[str, Tuple[str, ...]] = {
+    "huggingface_models": ("model_name", "description"),
+    "youtube_videos": ("title", "description", "channel_title"),
+    "ai_papers": ("title", "abstract"),
+    "ai_news": ("title", "content", "excerpt"),
+    "github_projects": ("repo_name", "name", "description"),
+    "ai_conferences": ("conference_name", "conference_acronym", "summary"),
+    "ai_job_trends": ("job_title", "description", "company_name"),
+    "ai_policies": ("title", "description", "country"),
+}
+
+
+def search_document_sql(table_name: str) -> str:
+    """`to_tsvector('simple', ...)` 문서 표현식 SQL 반환."""
+    joined = " || ' ' || ".join(
+        f"COALESCE({column}, '')" for column in SEARCH_DOCUMENT_COLUMNS[table_name]
+    )
+    return f"to_tsvector('simple', {joined})"
+
+
+def search_vector_column(table_name: str) -> Column:
+    """모델용 `search_vector` generated 컬럼.
+
+    스키마(인덱스/마이그레이션) 정의용이며 ORM 매핑에서는 제외합니다
+    (`SEARCH_VECTOR_MAPPER_ARGS`). INSERT RETURNING/SELECT에 포함되지 않도록 하기 위함.
+    """
+    return Column(
+        "search_vector",
+        TSVECTOR,
+        Computed(search_document_sql(table_name), persisted=True),
+    )
+
+
+# 모델 `__mapper_args__`: search_vector는 DB 전용 컬럼으로 ORM 속성에서 제외
+SEARCH_VECTOR_MAPPER_ARGS = {"exclude_properties": ["search_vector"]}
+
+
+def search_indexes(table_name: str) -> Tuple[Index, ...]:
+    """`search_vector` GIN 인덱스 + ILIKE 컬럼 trigram 인덱스."""
+    indexes = [
+        Index(
+            f"ix_{table_name}_search_vector",
+            "search_vector",
+            postgresql_using="gin",
+        )
+    ]
+    for column in SEARCH_TRIGRAM_COLUMNS[table_name]:
+        indexes.append(
+            Index(
+                f"ix_{table_name}_{column}_trgm",
+                column,
+                postgresql_using="gin",
+                postgresql_ops={column: "gin_trgm_ops"},
+            )
+        )
+    return tuple(indexes)
@@ -0,0 +1,28 @@
+"""AI 요약 작업 큐 모델"""
+from sqlalchemy import Column, Integer, String, Text, DateTime, Index, UniqueConstraint
+from sqlalchemy.sql import func
+from app.database import Base
+
+
+class SummaryJob(Base):
+    """요약 대기 항목 (수집기는 등록만 하고 워커 풀이 SKIP LOCKED로 가져가 처리)"""
+
+    __tablename__ = "summary_jobs"
+    __table_args__ = (
+        UniqueConstraint("category", "item_id", name="uq_summary_jobs_category_item"),
+        Index("ix_summary_jobs_status_next_run_at", "status", "next_run_at"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    category = Column(String(30), nullable=False)  # huggingface, news, ...
+    item_id = Column(Integer, nullable=False)  # 대상 테이블 PK
+    status = Column(String(20), nullable=False, default="pending")  # pending/running/done/failed
+    attempts = Column(Integer, nullable=False, default=0)  # 시도 횟수
+    next_run_at = Column(DateTime(timezone=True), server_default=func.now())  # 재시도 백오프 시각
+    locked_at = Column(DateTime(timezone=True))  # 워커가 가져간 시각 (임대 만료 판단)
+    last_error = Column(Text)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+    def __repr__(self):
+        return f"<SummaryJob({self.category}:{self.item_id} {self.status})>"
@@ -2,12 +2,19 @@
 from sqlalchemy import Column, String, Text, Integer, DateTime, Boolean, JSON
 from sqlalchemy.sql import func
 from app.database import Base
+from app.models.search_document import (
+    SEARCH_VECTOR_MAPPER_ARGS,
+    search_indexes,
+    search_vector_column,
+)
 
 
 class YouTubeVideo(Base):
     """YouTube AI 관련 비디오"""
 
     __tablename__ = "youtube_videos"
+    __table_args__ = search_indexes("youtube_videos")
+    __mapper_args__ = SEARCH_VECTOR_MAPPER_ARGS
 
     id = Column(Integer, primary_key=True, index=True)
     video_id = Column(String, unique=True, index=True, nullable=False)
@@ -34,6 +41,7 @@ class YouTubeVideo(Base):
     is_trending = Column(Boolean, default=False)
     is_archived = Column(Boolean, default=False, index=True)
     archived_at = Column(DateTime(timezone=True))
+    search_vector = search_vector_column("youtube_videos")  # 전역 검색 FTS 문서 (generated)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
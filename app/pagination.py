@@ -0,0 +1,103 @@
+"""리스트 API 공통 페이지네이션 헬퍼.
+
+- 키셋(cursor) 페이지네이션: `(sort_key, id)` 기준으로 다음 페이지를 조회
+- 전체 개수: COUNT(*) 결과를 필터 조합별로 캐시하여 페이지마다 재계산하지 않음
+"""
+import base64
+import json
+from datetime import datetime
+from typing import Any, List, Optional, Sequence, Tuple
+
+from fastapi import HTTPException, status
+from sqlalchemy import and_, or_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.cache import TTL_LIST_COUNT, cached
+
+
+def encode_cursor(sort_value: Any, row_id: int) -> str:
+    """`(sort_value, id)`를 불투명한 cursor 문자열로 인코딩."""
+    if isinstance(sort_value, datetime):
+        payload = {"k": "dt", "v": sort_value.isoformat(), "id": row_id}
+    else:
+        payload = {"k": "raw", "v": sort_value, "id": row_id}
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[Any, int]:
+    """cursor 문자열을 `(sort_value, id)`로 디코딩 (형식 오류 시 400)."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        row_id = int(payload["id"])
+        value = payload.get("v")
+        if payload.get("k") == "dt" and value is not None:
+            value = datetime.fromisoformat(value)
+        return value, row_id
+    except Exception:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="유효하지 않은 cursor입니다",
+        )
+
+
+def apply_keyset(query, sort_column, id_column, cursor: str, descending: bool = True):
+    """쿼리에 키셋 조건과 `(sort_key, id)` 정렬을 적용.
+
+    빈 cursor(`""`)는 첫 페이지를 의미합니다. NULL 정렬 값은 항상 마지막에 위치합니다.
+    """
+    if descending:
+        query = query.order_by(None).order_by(
+            sort_column.desc().nulls_last(),
+            id_column.desc(),
+        )
+    else:
+        query = query.order_by(None).order_by(
+            sort_column.asc().nulls_last(),
+            id_column.asc(),
+        )
+
+    if not cursor:
+        return query
+
+    sort_value, row_id = decode_cursor(cursor)
+    id_after = id_column < row_id if descending else id_column > row_id
+    if sort_value is None:
+        return query.where(and_(sort_column.is_(None), id_after))
+
+    sort_after = sort_column < sort_value if descending else sort_column > sort_value
+    return query.where(
+        or_(
+            sort_after,
+            and_(sort_column == sort_value, id_after),
+            sort_column.is_(None),
+        )
+    )
+
+
+def split_keyset_page(
+    rows: Sequence[Any],
+    limit: int,
+    sort_attr: str,
+) -> Tuple[List[Any], Optional[str]]:
+    """`limit + 1`개 조회 결과를 현재 페이지와 `next_cursor`로 분리."""
+    items = list(rows[:limit])
+    if len(rows) <= limit or not items:
+        return items, None
+    last = items[-1]
+    return items, encode_cursor(getattr(last, sort_attr), last.id)
+
+
+async def cached_count(db: AsyncSession, count_query, cache_key: str) -> int:
+    """필터 조합별 COUNT(*) 결과를 캐시에서 조회 (미스 시 계산 후 저장).
+
+    키는 `list:{category}:count:...` 형식으로, 해당 카테고리 목록 태그(`list:{category}`) 아래에
+    저장되어 수집 후 목록 캐시와 함께 무효화됩니다.
+    요청 세션(`db`)으로 계산하므로 백그라운드 갱신 없이 단일 계산만 사용합니다.
+    """
+    async def _count() -> int:
+        return (await db.execute(count_query)).scalar() or 0
+
+    tag = ":".join(cache_key.split(":", 2)[:2])
+    return int(await cached(cache_key, _count, ttl=TTL_LIST_COUNT, stale_ttl=0, tag=tag))
@@ -0,0 +1,166 @@
+"""API rate limiter.
+
+- `DistributedRateLimiter`: 라우트 종류(검색·쓰기·기본)별 규칙을 Redis Lua 스크립트(GCRA)로 판정 —
+  uvicorn 워커·레플리카가 같은 한도를 공유하고, 스크립트 1회로 읽기·갱신이 원자적으로 끝남
+- 프로세스 내 `SlidingWindowLimiter`로 먼저 판정해 이미 초과한 요청은 Redis를 거치지 않고,
+  Redis 장애 시에는 이 판정을 그대로 사용 (워커별 한도로 완화)
+
+슬라이딩 윈도 카운터:
+- 키(클라이언트 IP)별로 현재·직전 윈도 요청 수만 보관하고, 직전 윈도 수를 남은 비율만큼
+  가중해 최근 `window`초 요청 수를 근사 (경계 직후 몰아치기 방지)
+- 판정은 await 없이 끝나므로 이벤트 루프 안에서 락 없이 원자적으로 실행됨
+- 최근 사용 순서로 보관해 만료 키는 앞에서부터 제거 (요청당 분할 상환 O(1))
+"""
+from __future__ import annotations
+
+import math
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List
+
+from app.cache import run_script
+from app.metrics import RATE_LIMIT_DECISIONS
+
+RATE_LIMIT_KEY_PREFIX = "ratelimit"
+WRITE_METHODS = frozenset({"POST", "PUT", "PATCH", "DELETE"})
+
+# GCRA: 키에 다음 요청의 이론적 도착 시각(TAT, ms)을 두고 요청마다 interval만큼 민다.
+# TAT가 현재보다 tolerance(=윈도) 이상 앞서면 거부 — 윈도당 limit회, 버스트도 limit회까지.
+# 시각은 Redis TIME을 써서 레플리카 간 시계 차이의 영향을 받지 않음.
+_GCRA_SCRIPT = """
+if redis.replicate_commands then redis.replicate_commands() end
+local t = redis.call('TIME')
+local now = tonumber(t[1]) * 1000 + math.floor(tonumber(t[2]) / 1000)
+local interval = tonumber(ARGV[1])
+local tolerance = tonumber(ARGV[2])
+local tat = tonumber(redis.call('GET', KEYS[1]) or now)
+if tat < now then tat = now end
+local new_tat = tat + interval
+local wait = new_tat - tolerance - now
+if wait > 0 then
+    return {0, 0, math.ceil(wait)}
+end
+redis.call('SET', KEYS[1], tostring(new_tat), 'PX', math.ceil(new_tat - now))
+return {1, math.floor((tolerance - (new_tat - now)) / interval + 1e-9), math.ceil(new_tat - now)}
+"""
+
+
+@dataclass(frozen=True)
+class RateLimitDecision:
+    allowed: bool
+    limit: int
+    remaining: int
+    reset_after: float  # 한도가 다시 차기까지(거부 시 다음 요청이 허용되기까지) 남은 초
+
+    @property
+    def retry_after(self) -> int:
+        return max(1, math.ceil(self.reset_after))
+
+
+@dataclass(frozen=True)
+class RateLimitRule:
+    """라우트 종류별 한도 (`limit`회 / `window`초)."""
+
+    name: str
+    limit: int
+    window: float = 60.0
+
+    def headers(self, decision: RateLimitDecision) -> Dict[str, str]:
+        """`RateLimit-*` 응답 헤더 (IETF RateLimit header fields 초안 형식)."""
+        return {
+            "RateLimit-Limit": str(decision.limit),
+            "RateLimit-Remaining": str(decision.remaining),
+            "RateLimit-Reset": str(math.ceil(decision.reset_after)),
+            "RateLimit-Policy": f"{self.limit};w={int(self.window)}",
+        }
+
+
+def route_class(method: str, path: str) -> str:
+    """요청의 한도 규칙 이름 — write(상태 변경·수집 트리거·로그인) / search / default."""
+    if method.upper() in WRITE_METHODS:
+        return "write"
+    if path.startswith("/api/v1/search") or path.rstrip("/").endswith("/search"):
+        return "search"
+    return "default"
+
+
+class SlidingWindowLimiter:
+    """키별 `limit`회 / `window`초 제한."""
+
+    def __init__(
+        self,
+        limit: int,
+        window: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.limit = max(1, int(limit))
+        self.window = window
+        self._clock = clock
+        # 키 → [윈도 번호, 현재 윈도 요청 수, 직전 윈도 요청 수] (오래 안 쓴 키가 앞)
+        self._entries: "OrderedDict[str, List[int]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def hit(self, key: str) -> RateLimitDecision:
+        """요청 1건 판정 (허용되면 카운트)."""
+        now = self._clock()
+        index = int(now // self.window)
+        elapsed = now - index * self.window
+        self._evict(index)
+
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = self._entries[key] = [index, 0, 0]
+        else:
+            self._entries.move_to_end(key)
+            if entry[0] != index:
+                entry[2] = entry[1] if entry[0] == index - 1 else 0
+                entry[1] = 0
+                entry[0] = index
+
+        estimated = entry[2] * (1 - elapsed / self.window) + entry[1]
+        reset_after = self.window - elapsed
+        if estimated + 1 > self.limit:
+            return RateLimitDecision(False, self.limit, 0, reset_after)
+        entry[1] += 1
+        return RateLimitDecision(True, self.limit, int(self.limit - estimated - 1), reset_after)
+
+    def _evict(self, index: int) -> None:
+        # 직전 윈도보다 오래된 키는 판정에 영향이 없음
+        entries = self._entries
+        while entries:
+            key = next(iter(entries))
+            if entries[key][0] >= index - 1:
+                break
+            del entries[key]
+
+
+class DistributedRateLimiter:
+    """규칙별 Redis GCRA 판정 (워커·레플리카 공유) + 프로세스 내 선판정·장애 대체."""
+
+    def __init__(self, rules: Iterable[RateLimitRule], clock: Callable[[], float] = time.monotonic) -> None:
+        self.rules: Dict[str, RateLimitRule] = {rule.name: rule for rule in rules}
+        self._local = {
+            name: SlidingWindowLimiter(rule.limit, rule.window, clock) for name, rule in self.rules.items()
+        }
+
+    async def hit(self, rule: RateLimitRule, key: str) -> RateLimitDecision:
+        """요청 1건 판정 (허용되면 카운트)."""
+        decision = self._local[rule.name].hit(key)
+        backend = "local"
+        if decision.allowed:
+            # 워커 안에서 이미 초과한 요청은 Redis까지 가지 않음
+            result = await run_script(
+                f"rate_limit(rule={rule.name})",
+                _GCRA_SCRIPT,
+                [f"{RATE_LIMIT_KEY_PREFIX}:{rule.name}:{key}"],
+                [repr(rule.window * 1000 / rule.limit), repr(rule.window * 1000)],
+            )
+            if result is not None:
+                allowed, remaining, reset_ms = (int(value) for value in result)
+                decision = RateLimitDecision(bool(allowed), rule.limit, max(0, remaining), reset_ms / 1000)
+                backend = "redis"
+        RATE_LIMIT_DECISIONS.inc(rule.name, backend, "allowed" if decision.allowed else "limited")
+        return decision
@@ -0,0 +1,117 @@
+"""수집 실행 계측 (건수, 단계별 소요 시간, HTTP/LLM 호출 수).
+
+- 실행 중인 수집 작업의 `CollectorResult`를 컨텍스트 변수에 묶어 두고,
+  공용 HTTP 클라이언트·LLM 호출·파싱 실행기가 현재 실행에 호출 수와 시간을 더함
+- asyncio 작업은 생성 시점의 컨텍스트를 이어받으므로 수집기 안에서 띄운 동시 요청도 같은 실행에 집계
+- 수집 작업 밖(API 요청, 요약 큐 워커 등)에서는 아무것도 기록하지 않음
+- 단계 시간은 누적 값: `parse`/`summarize`는 `fetch`/`save` 구간 안에서 측정되며,
+  동시에 실행된 호출은 각각 더해지므로 벽시계 시간보다 클 수 있음
+"""
+from __future__ import annotations
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional
+
+if TYPE_CHECKING:
+    from app.bulk_upsert import UpsertStats
+
+PHASES = ("fetch", "parse", "summarize", "save", "invalidate")
+
+COLLECTOR_STATUS_SUCCESS = "success"
+COLLECTOR_STATUS_ERROR = "error"
+COLLECTOR_STATUS_SKIPPED = "skipped"
+
+
+@dataclass
+class CollectorResult:
+    """수집기 1회 실행 결과."""
+
+    name: str
+    status: str = COLLECTOR_STATUS_SUCCESS
+    fetched: int = 0
+    inserted: int = 0
+    updated: int = 0
+    errors: List[str] = field(default_factory=list)
+    duration_ms: int = 0
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    phases: Dict[str, float] = field(default_factory=dict)  # 단계 → 누적 ms
+    http_calls: int = 0
+    llm_calls: int = 0
+
+    def add_upsert(self, stats: Optional[UpsertStats]) -> None:
+        if stats is None:
+            return
+        self.inserted += stats.inserted
+        self.updated += stats.updated
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = (time.perf_counter() - started) * 1000
+            self.phases[name] = self.phases.get(name, 0.0) + elapsed
+
+    def phase_ms(self) -> Dict[str, int]:
+        return {name: int(round(self.phases.get(name, 0.0))) for name in PHASES}
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "status": self.status,
+            "duration_ms": self.duration_ms,
+            "fetched": self.fetched,
+            "inserted": self.inserted,
+            "updated": self.updated,
+            "errors": list(self.errors),
+            "phases_ms": self.phase_ms(),
+            "http_calls": self.http_calls,
+            "llm_calls": self.llm_calls,
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "finished_at": self.finished_at.isoformat() if self.finished_at else None,
+        }
+
+
+_current_run: ContextVar[Optional[CollectorResult]] = ContextVar("collection_run", default=None)
+
+
+def current_run() -> Optional[CollectorResult]:
+    return _current_run.get()
+
+
+@contextmanager
+def bind_run(result: CollectorResult) -> Iterator[CollectorResult]:
+    """이 컨텍스트(와 여기서 생성되는 작업)의 호출을 `result`에 집계."""
+    token = _current_run.set(result)
+    try:
+        yield result
+    finally:
+        _current_run.reset(token)
+
+
+@contextmanager
+def track_phase(name: str) -> Iterator[None]:
+    """현재 실행의 `name` 단계 시간에 더함 (실행 밖이면 아무것도 안 함)."""
+    run = _current_run.get()
+    if run is None:
+        yield
+        return
+    with run.phase(name):
+        yield
+
+
+def count_http_call() -> None:
+    run = _current_run.get()
+    if run is not None:
+        run.http_calls += 1
+
+
+def count_llm_call() -> None:
+    run = _current_run.get()
+    if run is not None:
+        run.llm_calls += 1
@@ -56,3 +56,4 @@ class AIConferenceList(BaseModel):
     page: int = 1
     page_size: int = 20
     total_pages: int = 1
+    next_cursor: Optional[str] = None  # 키셋 페이지네이션 다음 cursor
@@ -47,6 +47,7 @@ class AINews(AINewsBase):
     summary: Optional[str] = None
     keywords: List[str] = Field(default_factory=list)
     key_points: List[str] = Field(default_factory=list)
+    cluster_id: Optional[int] = None  # 같은 이야기 묶음 (최초 기사 id)
     created_at: datetime
     updated_at: Optional[datetime] = None
 
@@ -63,3 +64,4 @@ class AINewsList(BaseModel):
     page: int = 1
     page_size: int = 20
     total_pages: int = 1
+    next_cursor: Optional[str] = None  # 키셋 페이지네이션 다음 cursor
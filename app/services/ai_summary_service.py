@@ -1,14 +1,25 @@
 """AI 요약 서비스 (Gemini + Ollama 하이브리드)"""
+import hashlib
 import json
 import os
 import re
-from typing import Dict, Any, Optional
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
 import logging
 
 import google.generativeai as genai
-import httpx
 
+from app.cache import (
+    SUMMARY_CACHE_PREFIX,
+    TTL_SUMMARY,
+    cache_set,
+    summary_cache_lookup,
+    summary_cache_purge,
+    summary_cache_record,
+)
 from app.config import get_settings
+from app.http_client import http_client
+from app.run_metrics import count_llm_call, track_phase
 
 settings = get_settings()
 logger = logging.getLogger(__name__)
@@ -26,6 +37,51 @@ print = _log_print  # type: ignore[assignment]
 OLLAMA_BASE_URL = os.getenv("OLLAMA_BASE_URL", "http://localhost:11434")
 OLLAMA_MODEL = os.getenv("OLLAMA_MODEL", "solar:10.7b")
 
+# 카테고리별 프롬프트 템플릿 버전 (템플릿을 고치면 올릴 것 → 이전 버전 요약 캐시는 무시/정리됨)
+PROMPT_TEMPLATE_VERSIONS = {
+    "huggingface": "v1",
+    "youtube": "v1",
+    "papers": "v1",
+    "news": "v1",
+    "github": "v1",
+    "policies": "v1",
+    "conferences": "v1",
+    "tools": "v1",
+    "jobs": "v1",
+}
+
+
+async def purge_stale_summary_cache(kind: Optional[str] = None) -> Dict[str, int]:
+    """현재 템플릿 버전이 아닌 요약 캐시 항목 삭제 (카테고리별 삭제 수 반환)."""
+    kinds = [kind] if kind else list(PROMPT_TEMPLATE_VERSIONS)
+    return {
+        name: await summary_cache_purge(name, keep_version=PROMPT_TEMPLATE_VERSIONS[name])
+        for name in kinds
+    }
+
+
+@dataclass(frozen=True)
+class SummaryRequest:
+    """단건 요약 요청.
+
+    프롬프트 템플릿은 "소개 문단 / **필드** 항목 정보 / `아래 ...` 응답 형식·주의사항"
+    3단 구성이며, 배치 요약은 소개·응답 형식을 한 번만 쓰고 항목 정보만 이어 붙임.
+    """
+
+    kind: str
+    prompt: str
+    default: Dict[str, Any]
+    list_fields: List[str]
+
+    def sections(self) -> Tuple[str, str, str]:
+        """(소개, 항목 정보, 응답 형식) 분리 — 본문에 빈 줄이 있어도 양 끝 템플릿 기준으로 자름."""
+        text = self.prompt.strip()
+        intro, _, rest = text.partition("\n\n")
+        body, marker, outro = rest.rpartition("\n\n아래 ")
+        if not marker:
+            return intro, rest, ""
+        return intro, body, "아래 " + outro
+
 
 class AISummaryService:
     """AI 요약 서비스 (Google Gemini + Ollama 하이브리드)
@@ -63,8 +119,8 @@ class AISummaryService:
 
         self._ollama_checked = True
         try:
-            async with httpx.AsyncClient(timeout=3.0) as client:
-                response = await client.get(f"{self.ollama_url}/api/tags")
+            async with http_client("ollama") as client:
+                response = await client.get(f"{self.ollama_url}/api/tags", timeout=3.0)
                 response.raise_for_status()
             self._ollama_available = True
         except Exception as e:
@@ -80,7 +136,7 @@ class AISummaryService:
         return await self._check_ollama_available()
 
     @staticmethod
-    def _clean_json_text(text: str) -> str:
+    def _clean_json_text(text: str, pattern: str = r"\{.*\}") -> str:
         """Gemini 응답에서 JSON 파싱 가능한 문자열만 추출."""
         if not text:
             return ""
@@ -94,14 +150,14 @@ class AISummaryService:
             stripped = stripped[:-3]
         stripped = stripped.strip()
 
-        # 코드블록 외 텍스트가 섞일 수 있어 JSON object 구간만 추출
-        match = re.search(r"\{.*\}", stripped, flags=re.DOTALL)
+        # 코드블록 외 텍스트가 섞일 수 있어 JSON object(배치는 array) 구간만 추출
+        match = re.search(pattern, stripped, flags=re.DOTALL)
         return match.group(0) if match else stripped
 
     async def _call_ollama(self, prompt: str) -> Optional[str]:
         """Ollama API를 호출하여 텍스트 생성."""
         try:
-            async with httpx.AsyncClient(timeout=60.0) as client:
+            async with http_client("ollama") as client:
                 response = await client.post(
                     f"{self.ollama_url}/api/generate",
                     json={
@@ -117,80 +173,266 @@ class AISummaryService:
             print(f"⚠️  Ollama 호출 실패: {e}")
             return None
 
+    async def _generate_text(self, prompt: str) -> Tuple[Optional[str], Optional[str]]:
+        """Gemini → 실패 시 Ollama 폴백으로 응답 생성.
+
+        Returns:
+            (응답 텍스트, 응답을 생성한 모델명) — 모두 실패하면 (None, None)
+        """
+        with track_phase("summarize"):
+            # 1) Gemini 시도
+            if self.model:
+                try:
+                    count_llm_call()
+                    response = await self.model.generate_content_async(prompt)
+                    text = getattr(response, "text", "") or ""
+                    if text.strip():
+                        return text, self.model_name
+                except Exception as e:
+                    print(f"⚠️  Gemini 요약 실패, Ollama 폴백 시도: {e}")
+
+            # 2) Ollama 폴백
+            if await self._check_ollama_available():
+                count_llm_call()
+                raw = await self._call_ollama(prompt)
+                if raw:
+                    return raw, self.ollama_model
+
+        return None, None
+
+    @staticmethod
+    def _normalize_payload(
+        parsed: Dict[str, Any],
+        default: Dict[str, Any],
+        list_fields: list,
+    ) -> Dict[str, Any]:
+        """응답 JSON을 default 키 구성으로 정규화 (목록 필드가 목록이 아니면 기본값)."""
+        normalized = {}
+        for key, value in default.items():
+            raw_value = parsed.get(key, value)
+            if key in list_fields:
+                normalized[key] = raw_value if isinstance(raw_value, list) else value
+            else:
+                normalized[key] = raw_value
+        return normalized
+
+    def _parse_summary(
+        self,
+        raw: Optional[str],
+        default: Dict[str, Any],
+        list_fields: list,
+    ) -> Optional[Dict[str, Any]]:
+        """단건 응답 JSON 파싱 + 정규화 (응답 없음·파싱 실패 시 None)."""
+        result_text = self._clean_json_text(raw or "")
+        if not result_text:
+            return None
+        try:
+            return self._normalize_payload(json.loads(result_text), default, list_fields)
+        except Exception as e:
+            print(f"❌ AI 요약 JSON 파싱 실패: {e}")
+            return None
+
+    def _cache_candidates(self, kind: str, prompt: str) -> List[str]:
+        """현재 provider 구성에서 적중 가능한 요약 캐시 키 (Gemini → Ollama 순)."""
+        candidate_models = [self.model_name] if self.model else []
+        candidate_models.append(self.ollama_model)
+        return [self.summary_cache_key(kind, name, prompt) for name in candidate_models]
+
+    @staticmethod
+    def summary_cache_key(kind: str, model_name: str, prompt: str) -> str:
+        """요약 캐시 키: (템플릿 버전, 모델명, 정규화된 프롬프트 SHA-256)."""
+        normalized = " ".join(prompt.split())
+        digest = hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+        version = PROMPT_TEMPLATE_VERSIONS[kind]
+        return f"{SUMMARY_CACHE_PREFIX}:{kind}:{version}:{model_name}:{digest}"
+
     async def _generate_json_summary(
         self,
         prompt: str,
         default: Dict[str, Any],
         list_fields: Optional[list] = None,
+        cache_kind: Optional[str] = None,
     ) -> Dict[str, Any]:
         """프롬프트 기반 공통 요약 호출 + JSON 파싱.
 
-        Gemini → 실패 시 Ollama 폴백.
+        요약 캐시 조회 → Gemini → 실패 시 Ollama 폴백.
+        `cache_kind`가 있으면 성공한 결과를 생성한 모델 기준으로 캐시에 저장.
         """
         list_fields = list_fields or []
 
         if self.model is None and not await self._check_ollama_available():
             return default
 
-        result_text = None
+        if cache_kind:
+            cached = await summary_cache_lookup(self._cache_candidates(cache_kind, prompt))
+            await summary_cache_record(cache_kind, hit=cached is not None)
+            if cached is not None:
+                return cached
+
+        raw, produced_by = await self._generate_text(prompt)
+        normalized = self._parse_summary(raw, default, list_fields)
+        if normalized is None:
+            return default
+
+        if cache_kind and normalized.get("summary"):
+            await cache_set(
+                self.summary_cache_key(cache_kind, produced_by, prompt),
+                normalized,
+                ttl=TTL_SUMMARY,
+            )
+        return normalized
+
+    async def _summarize(self, request: SummaryRequest) -> Dict[str, Any]:
+        """단건 요약 요청 실행 (요약 캐시 사용)."""
+        return await self._generate_json_summary(
+            prompt=request.prompt,
+            default=request.default,
+            list_fields=request.list_fields,
+            cache_kind=request.kind,
+        )
+
+    def _batch_prompt(self, requests: Sequence[Tuple[str, SummaryRequest]]) -> str:
+        """같은 카테고리 요청 여러 개를 id별 JSON 배열을 요구하는 프롬프트 1개로 결합."""
+        intro, _, outro = requests[0][1].sections()
+        blocks = "\n\n".join(
+            f"### 항목 id={item_key}\n{request.sections()[1]}"
+            for item_key, request in requests
+        )
+        return f"""
+{intro}
+아래 {len(requests)}개 항목을 각각 독립적으로 요약해주세요.
+
+{blocks}
 
-        # 1) Gemini 시도
-        if self.model:
-            try:
-                response = await self.model.generate_content_async(prompt)
-                result_text = self._clean_json_text(getattr(response, "text", "") or "")
-            except Exception as e:
-                print(f"⚠️  Gemini 요약 실패, Ollama 폴백 시도: {e}")
+{outro}
 
-        # 2) Ollama 폴백
-        if not result_text and await self._check_ollama_available():
-            raw = await self._call_ollama(prompt)
-            if raw:
-                result_text = self._clean_json_text(raw)
+배치 응답 규칙:
+- 항목마다 위 형식의 JSON 객체를 만들고, "id" 필드에 항목 id를 그대로 넣을 것
+- 전체 응답은 JSON 배열만 출력 (예: [{{"id": "항목 id", ...}}, ...])
+- 항목을 빠뜨리거나 합치지 말 것
+"""
 
+    async def _generate_batch(
+        self,
+        requests: Sequence[Tuple[str, SummaryRequest]],
+    ) -> Tuple[Dict[str, Dict[str, Any]], Optional[str]]:
+        """배치 프롬프트 1회 호출 → 검증을 통과한 항목만 `{항목 키: 정규화 결과}`로 반환."""
+        raw, produced_by = await self._generate_text(self._batch_prompt(requests))
+        result_text = self._clean_json_text(raw or "", pattern=r"\[.*\]")
         if not result_text:
-            return default
+            return {}, produced_by
 
         try:
             parsed = json.loads(result_text)
-            normalized = {}
-            for key, value in default.items():
-                raw_value = parsed.get(key, value)
-                if key in list_fields:
-                    normalized[key] = raw_value if isinstance(raw_value, list) else value
-                else:
-                    normalized[key] = raw_value
-            return normalized
         except Exception as e:
-            print(f"❌ AI 요약 JSON 파싱 실패: {e}")
-            return default
-
-    async def summarize_huggingface_model(
+            print(f"❌ AI 배치 요약 JSON 파싱 실패: {e}")
+            return {}, produced_by
+        if isinstance(parsed, dict):
+            parsed = parsed.get("items") or [parsed]
+        if not isinstance(parsed, list):
+            return {}, produced_by
+
+        by_key = dict(requests)
+        results: Dict[str, Dict[str, Any]] = {}
+        for element in parsed:
+            if not isinstance(element, dict):
+                continue
+            item_key = str(element.get("id", ""))
+            request = by_key.get(item_key)
+            if request is None or item_key in results:
+                continue
+            normalized = self._normalize_payload(element, request.default, request.list_fields)
+            if normalized.get("summary"):
+                results[item_key] = normalized
+        return results, produced_by
+
+    async def summarize_many(
         self,
-        model_name: str,
-        description: Optional[str],
-        task: Optional[str],
-        tags: list,
-    ) -> Dict[str, Any]:
-        """
-        Hugging Face 모델 정보를 한글로 요약
+        kind: str,
+        items: Sequence[Tuple[Any, Dict[str, Any]]],
+        batch_size: Optional[int] = None,
+        max_retries: int = 1,
+        acquire: Optional[Callable[[], Awaitable[None]]] = None,
+    ) -> Dict[Any, Dict[str, Any]]:
+        """같은 카테고리 항목 여러 개를 배치 프롬프트로 요약.
 
         Args:
-            model_name: 모델 이름
-            description: 모델 설명
-            task: 태스크 유형
-            tags: 태그 리스트
+            kind: 카테고리 (`PROMPT_TEMPLATE_VERSIONS` 키)
+            items: (항목 ID, 해당 summarize_* 메서드 인자) 목록
+            batch_size: 프롬프트 1회에 묶을 항목 수 (기본값: settings.summary_items_per_prompt)
+            max_retries: 누락·검증 실패 항목만 다시 묶어 재요청할 횟수
+            acquire: LLM 호출 직전에 기다릴 콜백 (레이트 리밋용)
 
         Returns:
-            {
-                "summary": "한글 요약",
-                "key_features": ["특징1", "특징2", ...],
-                "use_cases": "사용 사례"
-            }
+            {항목 ID: 정규화된 요약} — 끝내 실패한 항목은 default (summary=None)
         """
+        if kind not in PROMPT_TEMPLATE_VERSIONS:
+            raise ValueError(f"Unknown summary kind: {kind}")
+        batch_size = max(batch_size or settings.summary_items_per_prompt, 1)
+        build_request = getattr(self, f"_{kind}_request")
+
+        requests = {item_id: build_request(**kwargs) for item_id, kwargs in items}
+        results = {item_id: dict(request.default) for item_id, request in requests.items()}
+        if not requests:
+            return results
+        if self.model is None and not await self._check_ollama_available():
+            return results
+
+        # 1) 항목별 요약 캐시 (단건 요약과 같은 키)
+        pending = []
+        for item_id, request in requests.items():
+            cached = await summary_cache_lookup(self._cache_candidates(kind, request.prompt))
+            await summary_cache_record(kind, hit=cached is not None)
+            if cached is not None:
+                results[item_id] = cached
+            else:
+                pending.append(item_id)
+
+        # 2) 배치 호출, 실패 항목만 재시도
+        keys = {str(item_id): item_id for item_id in pending}
+        for _ in range(max_retries + 1):
+            if not pending:
+                break
+            failed = []
+            for start in range(0, len(pending), batch_size):
+                chunk = pending[start:start + batch_size]
+                if acquire is not None:
+                    await acquire()
+                if len(chunk) == 1:
+                    # 1건이면 단건 프롬프트 그대로 사용
+                    request = requests[chunk[0]]
+                    raw, produced_by = await self._generate_text(request.prompt)
+                    payload = self._parse_summary(raw, request.default, request.list_fields)
+                    generated = {str(chunk[0]): payload} if payload and payload.get("summary") else {}
+                else:
+                    generated, produced_by = await self._generate_batch(
+                        [(str(item_id), requests[item_id]) for item_id in chunk]
+                    )
+
+                for item_key, payload in generated.items():
+                    item_id = keys[item_key]
+                    results[item_id] = payload
+                    await cache_set(
+                        self.summary_cache_key(kind, produced_by, requests[item_id].prompt),
+                        payload,
+                        ttl=TTL_SUMMARY,
+                    )
+                failed.extend(item_id for item_id in chunk if str(item_id) not in generated)
+            pending = failed
+
+        if pending:
+            print(f"⚠️  배치 요약 실패 {len(pending)}개 ({kind})")
+        return results
+
+    def _huggingface_request(
+        self,
+        model_name: str,
+        description: Optional[str],
+        task: Optional[str],
+        tags: list,
+    ) -> SummaryRequest:
         default = {"summary": None, "key_features": [], "use_cases": None}
 
-        # 프롬프트 구성
         prompt = f"""
 다음은 Hugging Face에서 가져온 AI 모델 정보입니다.
 이 정보를 바탕으로 한국어 사용자를 위한 요약을 작성해주세요.
@@ -214,34 +456,51 @@ class AISummaryService:
 - 모든 내용은 한글로 작성
 - JSON 형식만 출력 (다른 텍스트 없이)
 """
-
-        return await self._generate_json_summary(
+        return SummaryRequest(
+            kind="huggingface",
             prompt=prompt,
             default=default,
             list_fields=["key_features"],
         )
 
-    async def summarize_youtube_video(
+    async def summarize_huggingface_model(
         self,
-        title: str,
+        model_name: str,
         description: Optional[str],
+        task: Optional[str],
         tags: list,
     ) -> Dict[str, Any]:
         """
-        YouTube 영상 정보를 한글로 요약
+        Hugging Face 모델 정보를 한글로 요약
 
         Args:
-            title: 영상 제목
-            description: 영상 설명
+            model_name: 모델 이름
+            description: 모델 설명
+            task: 태스크 유형
             tags: 태그 리스트
 
         Returns:
             {
                 "summary": "한글 요약",
-                "keywords": ["키워드1", "키워드2", ...],
-                "key_points": ["핵심 포인트1", "핵심 포인트2", ...]
+                "key_features": ["특징1", "특징2", ...],
+                "use_cases": "사용 사례"
             }
         """
+        return await self._summarize(
+            self._huggingface_request(
+                model_name=model_name,
+                description=description,
+                task=task,
+                tags=tags,
+            )
+        )
+
+    def _youtube_request(
+        self,
+        title: str,
+        description: Optional[str],
+        tags: list,
+    ) -> SummaryRequest:
         default = {"summary": None, "keywords": [], "key_points": []}
 
         prompt = f"""
@@ -266,36 +525,45 @@ class AISummaryService:
 - 모든 내용은 한글로 작성
 - JSON 형식만 출력
 """
-
-        return await self._generate_json_summary(
+        return SummaryRequest(
+            kind="youtube",
             prompt=prompt,
             default=default,
             list_fields=["keywords", "key_points"],
         )
 
-    async def summarize_paper(
+    async def summarize_youtube_video(
         self,
         title: str,
-        abstract: Optional[str],
-        authors: list,
-        categories: list,
+        description: Optional[str],
+        tags: list,
     ) -> Dict[str, Any]:
         """
-        AI 논문 정보를 한글로 요약
+        YouTube 영상 정보를 한글로 요약
 
         Args:
-            title: 논문 제목
-            abstract: 논문 초록
-            authors: 저자 리스트
-            categories: 카테고리 리스트
+            title: 영상 제목
+            description: 영상 설명
+            tags: 태그 리스트
 
         Returns:
             {
                 "summary": "한글 요약",
-                "keywords": [\"키워드1\", \"키워드2\", ...],
-                "key_contributions": [\"주요 기여1\", \"주요 기여2\", ...]
+                "keywords": ["키워드1", "키워드2", ...],
+                "key_points": ["핵심 포인트1", "핵심 포인트2", ...]
             }
         """
+        return await self._summarize(
+            self._youtube_request(title=title, description=description, tags=tags)
+        )
+
+    def _papers_request(
+        self,
+        title: str,
+        abstract: Optional[str],
+        authors: list,
+        categories: list,
+    ) -> SummaryRequest:
         default = {"summary": None, "keywords": [], "key_contributions": []}
 
         prompt = f"""
@@ -321,34 +589,51 @@ class AISummaryService:
 - 모든 내용은 한글로 작성
 - JSON 형식만 출력
 """
-
-        return await self._generate_json_summary(
+        return SummaryRequest(
+            kind="papers",
             prompt=prompt,
             default=default,
             list_fields=["keywords", "key_contributions"],
         )
 
-    async def summarize_news(
+    async def summarize_paper(
         self,
         title: str,
-        content: Optional[str],
-        source: Optional[str],
+        abstract: Optional[str],
+        authors: list,
+        categories: list,
     ) -> Dict[str, Any]:
         """
-        AI 뉴스/블로그 포스트를 한글로 요약
+        AI 논문 정보를 한글로 요약
 
         Args:
-            title: 뉴스 제목
-            content: 뉴스 본문 또는 발췌문
-            source: 출처
+            title: 논문 제목
+            abstract: 논문 초록
+            authors: 저자 리스트
+            categories: 카테고리 리스트
 
         Returns:
             {
                 "summary": "한글 요약",
                 "keywords": [\"키워드1\", \"키워드2\", ...],
-                "key_points": [\"핵심 내용1\", \"핵심 내용2\", ...]
+                "key_contributions": [\"주요 기여1\", \"주요 기여2\", ...]
             }
         """
+        return await self._summarize(
+            self._papers_request(
+                title=title,
+                abstract=abstract,
+                authors=authors,
+                categories=categories,
+            )
+        )
+
+    def _news_request(
+        self,
+        title: str,
+        content: Optional[str],
+        source: Optional[str],
+    ) -> SummaryRequest:
         default = {"summary": None, "keywords": [], "key_points": []}
 
         prompt = f"""
@@ -373,36 +658,45 @@ class AISummaryService:
 - 모든 내용은 한글로 작성
 - JSON 형식만 출력
 """
-
-        return await self._generate_json_summary(
+        return SummaryRequest(
+            kind="news",
             prompt=prompt,
             default=default,
             list_fields=["keywords", "key_points"],
         )
 
-    async def summarize_github_project(
+    async def summarize_news(
         self,
-        repo_name: str,
-        description: Optional[str],
-        language: Optional[str],
-        topics: list,
+        title: str,
+        content: Optional[str],
+        source: Optional[str],
     ) -> Dict[str, Any]:
         """
-        GitHub 프로젝트를 한글로 요약
+        AI 뉴스/블로그 포스트를 한글로 요약
 
         Args:
-            repo_name: 레포지토리 이름
-            description: 프로젝트 설명
-            language: 주 프로그래밍 언어
-            topics: 토픽 태그
+            title: 뉴스 제목
+            content: 뉴스 본문 또는 발췌문
+            source: 출처
 
         Returns:
             {
                 "summary": "한글 요약",
-                "keywords": ["키워드1", "키워드2", ...],
-                "use_cases": ["사용 사례1", "사용 사례2", ...]
+                "keywords": [\"키워드1\", \"키워드2\", ...],
+                "key_points": [\"핵심 내용1\", \"핵심 내용2\", ...]
             }
         """
+        return await self._summarize(
+            self._news_request(title=title, content=content, source=source)
+        )
+
+    def _github_request(
+        self,
+        repo_name: str,
+        description: Optional[str],
+        language: Optional[str],
+        topics: list,
+    ) -> SummaryRequest:
         default = {"summary": None, "keywords": [], "use_cases": []}
 
         prompt = f"""
@@ -428,21 +722,52 @@ class AISummaryService:
 - 모든 내용은 한글로 작성
 - JSON 형식만 출력
 """
-
-        return await self._generate_json_summary(
+        return SummaryRequest(
+            kind="github",
             prompt=prompt,
             default=default,
             list_fields=["keywords", "use_cases"],
         )
 
-    async def summarize_policy(
+    async def summarize_github_project(
+        self,
+        repo_name: str,
+        description: Optional[str],
+        language: Optional[str],
+        topics: list,
+    ) -> Dict[str, Any]:
+        """
+        GitHub 프로젝트를 한글로 요약
+
+        Args:
+            repo_name: 레포지토리 이름
+            description: 프로젝트 설명
+            language: 주 프로그래밍 언어
+            topics: 토픽 태그
+
+        Returns:
+            {
+                "summary": "한글 요약",
+                "keywords": ["키워드1", "키워드2", ...],
+                "use_cases": ["사용 사례1", "사용 사례2", ...]
+            }
+        """
+        return await self._summarize(
+            self._github_request(
+                repo_name=repo_name,
+                description=description,
+                language=language,
+                topics=topics,
+            )
+        )
+
+    def _policies_request(
         self,
         title: str,
         description: Optional[str],
         policy_type: Optional[str],
         impact_areas: list,
-    ) -> Dict[str, Any]:
-        """AI 정책 정보를 한글로 요약."""
+    ) -> SummaryRequest:
         default = {"summary": None, "keywords": [], "key_points": []}
 
         prompt = f"""
@@ -461,19 +786,36 @@ class AISummaryService:
   "key_points": ["핵심 포인트1", "핵심 포인트2", "핵심 포인트3"]
 }}
 """
-        return await self._generate_json_summary(
+        return SummaryRequest(
+            kind="policies",
             prompt=prompt,
             default=default,
             list_fields=["keywords", "key_points"],
         )
 
-    async def summarize_conference(
+    async def summarize_policy(
+        self,
+        title: str,
+        description: Optional[str],
+        policy_type: Optional[str],
+        impact_areas: list,
+    ) -> Dict[str, Any]:
+        """AI 정책 정보를 한글로 요약."""
+        return await self._summarize(
+            self._policies_request(
+                title=title,
+                description=description,
+                policy_type=policy_type,
+                impact_areas=impact_areas,
+            )
+        )
+
+    def _conferences_request(
         self,
         name: str,
         description: Optional[str],
         topics: list,
-    ) -> Dict[str, Any]:
-        """AI 컨퍼런스 정보를 한글로 요약."""
+    ) -> SummaryRequest:
         default = {"summary": None, "keywords": [], "highlights": []}
 
         prompt = f"""
@@ -491,20 +833,31 @@ class AISummaryService:
   "highlights": ["하이라이트1", "하이라이트2", "하이라이트3"]
 }}
 """
-        return await self._generate_json_summary(
+        return SummaryRequest(
+            kind="conferences",
             prompt=prompt,
             default=default,
             list_fields=["keywords", "highlights"],
         )
 
-    async def summarize_ai_tool(
+    async def summarize_conference(
+        self,
+        name: str,
+        description: Optional[str],
+        topics: list,
+    ) -> Dict[str, Any]:
+        """AI 컨퍼런스 정보를 한글로 요약."""
+        return await self._summarize(
+            self._conferences_request(name=name, description=description, topics=topics)
+        )
+
+    def _tools_request(
         self,
         name: str,
         description: Optional[str],
         category: Optional[str],
         use_cases: list,
-    ) -> Dict[str, Any]:
-        """AI 도구/플랫폼 정보를 한글로 요약."""
+    ) -> SummaryRequest:
         default = {"summary": None, "keywords": [], "best_for": []}
 
         prompt = f"""
@@ -523,20 +876,37 @@ class AISummaryService:
   "best_for": ["추천 사용처1", "추천 사용처2", "추천 사용처3"]
 }}
 """
-        return await self._generate_json_summary(
+        return SummaryRequest(
+            kind="tools",
             prompt=prompt,
             default=default,
             list_fields=["keywords", "best_for"],
         )
 
-    async def summarize_job(
+    async def summarize_ai_tool(
+        self,
+        name: str,
+        description: Optional[str],
+        category: Optional[str],
+        use_cases: list,
+    ) -> Dict[str, Any]:
+        """AI 도구/플랫폼 정보를 한글로 요약."""
+        return await self._summarize(
+            self._tools_request(
+                name=name,
+                description=description,
+                category=category,
+                use_cases=use_cases,
+            )
+        )
+
+    def _jobs_request(
         self,
         title: str,
         company: Optional[str],
         description: Optional[str],
         skills: list,
-    ) -> Dict[str, Any]:
-        """AI 채용 공고를 한글로 요약."""
+    ) -> SummaryRequest:
         default = {"summary": None, "keywords": [], "key_points": []}
 
         prompt = f"""
@@ -555,8 +925,26 @@ class AISummaryService:
   "key_points": ["핵심 요구사항1", "핵심 요구사항2", "핵심 요구사항3"]
 }}
 """
-        return await self._generate_json_summary(
+        return SummaryRequest(
+            kind="jobs",
             prompt=prompt,
             default=default,
             list_fields=["keywords", "key_points"],
         )
+
+    async def summarize_job(
+        self,
+        title: str,
+        company: Optional[str],
+        description: Optional[str],
+        skills: list,
+    ) -> Dict[str, Any]:
+        """AI 채용 공고를 한글로 요약."""
+        return await self._summarize(
+            self._jobs_request(
+                title=title,
+                company=company,
+                description=description,
+                skills=skills,
+            )
+        )
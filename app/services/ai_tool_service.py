@@ -14,9 +14,10 @@ import logging
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, desc
 
+from app.bulk_upsert import bulk_upsert, prefetch_existing
 from app.models.ai_tool import AITool
 from app.config import get_settings
-from app.services.ai_summary_service import AISummaryService
+from app.services.summary_queue_service import enqueue_missing_summaries
 
 logger = logging.getLogger(__name__)
 
@@ -424,79 +425,78 @@ class AIToolService:
         Returns:
             저장된 항목 수
         """
-        from sqlalchemy import or_
-
-        saved_count = 0
-        ai_service = AISummaryService()
-        can_summarize = await ai_service.can_summarize()
-
+        prepared = []
+        skipped = 0
         for tool_data in tools:
+            website = tool_data.get("website")
+            tool_name = tool_data.get("tool_name")
+            if not website or not tool_name:
+                skipped += 1
+                continue
+            # URL 정규화
+            tool_data["website"] = self._normalize_url(website)
+            prepared.append(tool_data)
+
+        # 중복 확인: tool_name 또는 website 기준 (각 1회 IN 조회)
+        by_website = await prefetch_existing(
+            db, AITool, "website", (tool_data["website"] for tool_data in prepared)
+        )
+        by_name = await prefetch_existing(
+            db, AITool, "tool_name", (tool_data["tool_name"] for tool_data in prepared)
+        )
+
+        rows = []
+        new_names = set()
+        updated = 0
+        for tool_data in prepared:
+            tool_name = tool_data["tool_name"]
             try:
-                website = tool_data.get("website")
-                tool_name = tool_data.get("tool_name")
-                if not website or not tool_name:
-                    continue
-
-                # URL 정규화
-                website = self._normalize_url(website)
-                tool_data["website"] = website
-
-                # 해외 설명문 기반 한글 요약 생성
-                if can_summarize and not tool_data.get("summary"):
-                    summary_payload = await ai_service.summarize_ai_tool(
-                        name=tool_data.get("tool_name", ""),
-                        description=tool_data.get("description"),
-                        category=tool_data.get("category"),
-                        use_cases=tool_data.get("use_cases", []) or [],
-                    )
-                    if summary_payload.get("summary"):
-                        tool_data["summary"] = summary_payload["summary"]
-                    if summary_payload.get("keywords"):
-                        tool_data["keywords"] = summary_payload["keywords"]
-                    if summary_payload.get("best_for"):
-                        tool_data["best_for"] = summary_payload["best_for"]
-
-                # 중복 확인: tool_name 또는 website로 검색
-                result = await db.execute(
-                    select(AITool).where(
-                        or_(AITool.website == website, AITool.tool_name == tool_name)
-                    )
-                )
-                existing = result.scalar_one_or_none()
+                existing = by_website.get(tool_data["website"]) or by_name.get(tool_name)
 
                 if existing:
                     for key, value in tool_data.items():
                         if hasattr(existing, key) and value is not None:
                             setattr(existing, key, value)
-
-                    if can_summarize and not existing.summary:
-                        summary_payload = await ai_service.summarize_ai_tool(
-                            name=existing.tool_name,
-                            description=existing.description,
-                            category=existing.category,
-                            use_cases=existing.use_cases or [],
-                        )
-                        if summary_payload.get("summary"):
-                            existing.summary = summary_payload["summary"]
-                        if summary_payload.get("keywords"):
-                            existing.keywords = summary_payload["keywords"]
-                        if summary_payload.get("best_for"):
-                            existing.best_for = summary_payload["best_for"]
+                    updated += 1
                     print(f"📝 Updated: {tool_name}")
+                elif tool_name in new_names:
+                    skipped += 1
                 else:
-                    new_tool = AITool(**tool_data)
-                    db.add(new_tool)
-                    saved_count += 1
+                    new_names.add(tool_name)
+                    rows.append(
+                        {key: value for key, value in tool_data.items() if hasattr(AITool, key)}
+                    )
                     print(f"✨ Created: {tool_name}")
 
-                await db.commit()
-
             except Exception as e:
-                await db.rollback()
+                skipped += 1
                 print(f"❌ Error saving AI tool '{tool_data.get('tool_name', '?')}': {e}")
                 continue
 
-        return saved_count
+        # 동시 수집으로 이미 저장된 website는 값이 있는 필드만 갱신
+        try:
+            stats = await bulk_upsert(
+                db,
+                AITool,
+                rows,
+                key="website",
+                coalesce_columns=[column for row in rows for column in row if column != "website"],
+            )
+            # 해외 설명문 기반 한글 요약은 요약 큐에 등록 (summary_jobs 워커가 처리)
+            await enqueue_missing_summaries(db, "tools")
+            await db.commit()
+        except Exception as e:
+            await db.rollback()
+            print(f"❌ Error saving AI tools: {e}")
+            return 0
+
+        stats.updated += updated
+        stats.skipped += skipped
+        self.last_upsert_stats = stats
+        print(
+            f"💾 AI 도구 저장 결과: 신규 {stats.inserted} / 갱신 {stats.updated} / 건너뜀 {stats.skipped}"
+        )
+        return stats.inserted
 
     async def get_tools(
         self,
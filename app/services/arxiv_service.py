@@ -9,7 +9,12 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, desc
 from app.models.paper import AIPaper
 from app.schemas.paper import AIPaperCreate
+from app.bulk_upsert import bulk_upsert, prefetch_existing
+from app.executors import run_parse
+from app.http_client import http_client
+from app.keyword_matcher import KeywordMatcher
 from app.db_compat import has_archive_column, has_columns
+from app.pagination import apply_keyset
 from app.services.ai_summary_service import AISummaryService
 from app.services.keyword_extraction_service import get_keyword_extractor
 
@@ -177,15 +182,19 @@ class ArxivService:
         "AI 안전/정렬", "효율화", "의료AI", "자율주행",
     ]
 
+    # 토픽별 제목 키워드 매처 (대소문자 무시, 짧은 약어는 단어 단위: "GAN"이 "organ"에 걸리지 않음)
+    _TOPIC_MATCHER = KeywordMatcher(
+        {topic: rules.get("title_keywords", []) for topic, rules in TOPIC_RULES.items()}
+    )
+
     @classmethod
     def classify_topic(cls, title: str, categories: List[str]) -> str:
         """논문 제목과 카테고리로 주제 분류 (18 topics)"""
-        title_lower = title.lower()
+        matched_topics = set(cls._TOPIC_MATCHER.labels(title))
 
         # 1. 키워드 우선 토픽 (특화된 토픽을 먼저 매칭)
         for topic in cls._KEYWORD_PRIORITY_TOPICS:
-            rules = cls.TOPIC_RULES.get(topic, {})
-            if any(kw in title_lower for kw in rules.get("title_keywords", [])):
+            if topic in matched_topics:
                 return topic
 
         # 2. 카테고리 기반 분류
@@ -197,8 +206,8 @@ class ArxivService:
                     return topic
 
         # 3. 키워드 기반 분류 (카테고리 매칭 실패 시)
-        for topic, rules in cls.TOPIC_RULES.items():
-            if any(kw in title_lower for kw in rules.get("title_keywords", [])):
+        for topic in cls.TOPIC_RULES:
+            if topic in matched_topics:
                 return topic
 
         return "ML"  # default
@@ -223,7 +232,7 @@ class ArxivService:
             논문 정보 리스트
         """
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
+            async with http_client("arxiv") as client:
                 params = {
                     "search_query": query,
                     "start": 0,
@@ -236,7 +245,7 @@ class ArxivService:
                 response.raise_for_status()
 
                 # XML 파싱
-                papers = self._parse_arxiv_response(response.text)
+                papers = await run_parse(self._parse_arxiv_response, response.text)
                 return papers
 
         except httpx.HTTPStatusError as e:
@@ -408,7 +417,6 @@ class ArxivService:
         Returns:
             저장된 논문 수
         """
-        saved_count = 0
         ai_service = AISummaryService()
         keyword_extractor = get_keyword_extractor()
         can_summarize = await ai_service.can_summarize()
@@ -432,13 +440,15 @@ class ArxivService:
             column_flags["is_archived"] and column_flags["archived_at"]
         )
 
+        existing_papers = await prefetch_existing(
+            db, AIPaper, "arxiv_id", (paper_data.get("arxiv_id") for paper_data in papers)
+        )
+
+        rows = []
+        skipped = 0
         for paper_data in papers:
             try:
-                # 이미 존재하는지 확인
-                result = await db.execute(
-                    select(AIPaper).where(AIPaper.arxiv_id == paper_data["arxiv_id"])
-                )
-                existing_paper = result.scalar_one_or_none()
+                existing_paper = existing_papers.get(paper_data.get("arxiv_id"))
 
                 if existing_paper:
                     # 업데이트 (업데이트 날짜 등)
@@ -464,7 +474,7 @@ class ArxivService:
                         if summary_data.get("keywords"):
                             existing_paper.keywords = summary_data["keywords"]
                     if not (existing_paper.keywords or []):
-                        existing_paper.keywords = keyword_extractor.extract_keywords(
+                        existing_paper.keywords = await keyword_extractor.extract_keywords_async(
                             f"{existing_paper.title or ''} {existing_paper.abstract or ''}",
                             top_k=8,
                         )
@@ -472,70 +482,89 @@ class ArxivService:
                     if has_archive_columns:
                         existing_paper.is_archived = False
                         existing_paper.archived_at = None
-                else:
-                    # Gemini 한글 요약 생성
-                    summary_data = None
-                    if can_summarize:
-                        summary_data = await ai_service.summarize_paper(
-                            title=paper_data.get("title", ""),
-                            abstract=paper_data.get("abstract"),
-                            authors=paper_data.get("authors", []),
-                            categories=paper_data.get("categories", []),
-                        )
-
-                    extracted_keywords = keyword_extractor.extract_keywords(
-                        f"{paper_data.get('title', '')} {paper_data.get('abstract') or ''}",
-                        top_k=8,
+                    continue
+
+                # Gemini 한글 요약 생성
+                summary_data = None
+                if can_summarize:
+                    summary_data = await ai_service.summarize_paper(
+                        title=paper_data.get("title", ""),
+                        abstract=paper_data.get("abstract"),
+                        authors=paper_data.get("authors", []),
+                        categories=paper_data.get("categories", []),
                     )
-                    merged_keywords = list(
-                        dict.fromkeys(
-                            ((summary_data or {}).get("keywords") or []) + extracted_keywords
-                        )
-                    )[:12]
-
-                    # 새로 추가
-                    paper_payload = {
-                        "arxiv_id": paper_data["arxiv_id"],
-                        "title": paper_data.get("title", ""),
-                        "authors": paper_data.get("authors", []),
-                        "abstract": paper_data.get("abstract"),
-                        "categories": paper_data.get("categories", []),
-                        "published_date": paper_data.get("published_date"),
-                        "updated_date": paper_data.get("updated_date"),
-                        "pdf_url": paper_data.get("pdf_url"),
-                        "arxiv_url": paper_data.get("arxiv_url"),
-                        "comment": paper_data.get("comment"),
-                        "journal_ref": paper_data.get("journal_ref"),
-                        "summary": (summary_data or {}).get("summary"),
-                        "keywords": merged_keywords,
-                        "is_trending": True,
-                    }
-                    if has_archive_columns:
-                        paper_payload.update(
-                            {
-                                "is_archived": False,
-                                "archived_at": None,
-                            }
-                        )
-                    if has_extra_columns:
-                        paper_payload.update(
-                            {
-                                "topic": paper_data.get("topic"),
-                                "conference_name": paper_data.get("conference_name"),
-                                "conference_year": paper_data.get("conference_year"),
-                            }
-                        )
-                    new_paper = AIPaper(**paper_payload)
-                    db.add(new_paper)
-                    saved_count += 1
 
-                await db.commit()
+                extracted_keywords = await keyword_extractor.extract_keywords_async(
+                    f"{paper_data.get('title', '')} {paper_data.get('abstract') or ''}",
+                    top_k=8,
+                )
+                merged_keywords = list(
+                    dict.fromkeys(
+                        ((summary_data or {}).get("keywords") or []) + extracted_keywords
+                    )
+                )[:12]
+
+                # 새로 추가
+                paper_payload = {
+                    "arxiv_id": paper_data["arxiv_id"],
+                    "title": paper_data.get("title", ""),
+                    "authors": paper_data.get("authors", []),
+                    "abstract": paper_data.get("abstract"),
+                    "categories": paper_data.get("categories", []),
+                    "published_date": paper_data.get("published_date"),
+                    "updated_date": paper_data.get("updated_date"),
+                    "pdf_url": paper_data.get("pdf_url"),
+                    "arxiv_url": paper_data.get("arxiv_url"),
+                    "comment": paper_data.get("comment"),
+                    "journal_ref": paper_data.get("journal_ref"),
+                    "summary": (summary_data or {}).get("summary"),
+                    "keywords": merged_keywords,
+                    "is_trending": True,
+                }
+                if has_archive_columns:
+                    paper_payload.update(
+                        {
+                            "is_archived": False,
+                            "archived_at": None,
+                        }
+                    )
+                if has_extra_columns:
+                    paper_payload.update(
+                        {
+                            "topic": paper_data.get("topic"),
+                            "conference_name": paper_data.get("conference_name"),
+                            "conference_year": paper_data.get("conference_year"),
+                        }
+                    )
+                rows.append(paper_payload)
 
             except Exception as e:
-                await db.rollback()
+                skipped += 1
                 print(f"❌ 논문 저장 실패 ({paper_data.get('arxiv_id')}): {e}")
 
-        return saved_count
+        # 동시 수집으로 이미 저장된 논문은 트렌딩/아카이브 상태만 갱신
+        try:
+            stats = await bulk_upsert(
+                db,
+                AIPaper,
+                rows,
+                key="arxiv_id",
+                update_columns=["is_trending", "is_archived", "archived_at"],
+                existing=existing_papers,
+            )
+            await db.commit()
+        except Exception as e:
+            await db.rollback()
+            print(f"❌ 논문 저장 실패: {e}")
+            return 0
+
+        stats.updated += len(existing_papers)
+        stats.skipped += skipped
+        self.last_upsert_stats = stats
+        print(
+            f"💾 논문 저장 결과: 신규 {stats.inserted} / 갱신 {stats.updated} / 건너뜀 {stats.skipped}"
+        )
+        return stats.inserted
 
     async def get_papers(
         self,
@@ -545,6 +574,7 @@ class ArxivService:
         trending_only: bool = False,
         category: Optional[str] = None,
         include_archived: bool = False,
+        cursor: Optional[str] = None,
     ) -> List[AIPaper]:
         """
         데이터베이스에서 논문 목록 가져오기
@@ -555,6 +585,7 @@ class ArxivService:
             limit: 가져올 개수
             trending_only: 트렌딩 논문만 가져올지 여부
             category: 카테고리 필터 (cs.AI, cs.LG 등)
+            cursor: 키셋 cursor (지정 시 skip 대신 `(정렬키, id)` 기준 조회)
 
         Returns:
             논문 목록
@@ -572,9 +603,14 @@ class ArxivService:
             # JSON 배열에 카테고리 포함 여부 확인 (PostgreSQL JSON 쿼리)
             query = query.where(AIPaper.categories.contains([category]))
 
-        query = (
-            query.order_by(desc(AIPaper.published_date)).offset(skip).limit(limit)
-        )
+        if cursor is not None:
+            query = apply_keyset(
+                query, AIPaper.published_date, AIPaper.id, cursor
+            ).limit(limit)
+        else:
+            query = (
+                query.order_by(desc(AIPaper.published_date)).offset(skip).limit(limit)
+            )
 
         result = await db.execute(query)
         return result.scalars().all()
@@ -1,40 +1,41 @@
 """v4 데이터 품질 보정/요약 백필 서비스."""
 from __future__ import annotations
 
-import asyncio
 import logging
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional
 
-from sqlalchemy import or_, select
+from sqlalchemy import or_
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models.ai_tool import AITool
-from app.models.github import GitHubProject
+from app.backfill import BackfillTask, run_backfill
 from app.models.huggingface import HuggingFaceModel
-from app.models.job_trend import AIJobTrend
 from app.models.news import AINews
 from app.models.paper import AIPaper
-from app.models.policy import AIPolicy
 from app.models.youtube import YouTubeVideo
 from app.services.ai_summary_service import AISummaryService
 from app.services.arxiv_service import ArxivService
 from app.services.huggingface_service import HuggingFaceService
 from app.services.news_service import NewsService
+from app.services.summary_queue_service import (
+    SUMMARY_HANDLERS,
+    enqueue_missing_summaries,
+    process_summary_jobs,
+)
 from app.services.youtube_service import YouTubeService
 
 logger = logging.getLogger(__name__)
 
 _V4_NEWS_CATEGORIES = {"정책", "기업동향", "기술발전", "제품출시", "AI 일반"}
+V4_BACKFILL_JOB = "v4_metadata"
 
 
 async def backfill_missing_summaries(
     db: AsyncSession,
     limit_per_category: int = 20,
 ) -> Dict[str, Any]:
-    """summary가 비어있는 레코드를 대상으로 한글 요약 백필."""
+    """summary가 비어있는 레코드를 요약 큐에 등록하고 워커 풀로 한글 요약 백필."""
     ai_service = AISummaryService()
     can_summarize = await ai_service.can_summarize()
-    provider = "gemini" if ai_service.model is not None else "ollama"
 
     if not can_summarize:
         return {
@@ -44,315 +45,64 @@ async def backfill_missing_summaries(
             "message": "No available summarization provider (Gemini/Ollama).",
         }
 
-    delay_seconds = 2.0 if ai_service.model is not None else 0.0
-    updated: Dict[str, int] = {}
-
-    async def maybe_sleep() -> None:
-        if delay_seconds > 0:
-            await asyncio.sleep(delay_seconds)
-
-    # HuggingFace
-    count = 0
-    hf_rows = (
-        await db.execute(
-            select(HuggingFaceModel)
-            .where(or_(HuggingFaceModel.summary.is_(None), HuggingFaceModel.summary == ""))
-            .limit(limit_per_category)
+    # 재시도 한도를 넘긴 failed 작업도 수동 백필에서는 다시 시도
+    queued: Dict[str, int] = {}
+    for category in SUMMARY_HANDLERS:
+        queued[category] = await enqueue_missing_summaries(
+            db,
+            category,
+            limit=limit_per_category,
+            retry_failed=True,
         )
-    ).scalars().all()
-    for row in hf_rows:
-        try:
-            payload = await ai_service.summarize_huggingface_model(
-                model_name=row.model_name,
-                description=row.description,
-                task=row.task,
-                tags=row.tags or [],
-            )
-            if payload.get("summary"):
-                row.summary = payload["summary"]
-                if payload.get("key_features"):
-                    row.key_features = payload["key_features"]
-                if payload.get("use_cases"):
-                    row.use_cases = payload["use_cases"]
-                count += 1
-            await maybe_sleep()
-        except Exception as e:
-            logger.warning("huggingface summary backfill failed (%s): %s", row.model_id, e)
-    updated["huggingface"] = count
-
-    # Papers
-    count = 0
-    paper_rows = (
-        await db.execute(
-            select(AIPaper)
-            .where(or_(AIPaper.summary.is_(None), AIPaper.summary == ""))
-            .limit(limit_per_category)
-        )
-    ).scalars().all()
-    for row in paper_rows:
-        try:
-            payload = await ai_service.summarize_paper(
-                title=row.title,
-                abstract=row.abstract,
-                authors=row.authors or [],
-                categories=row.categories or [],
-            )
-            if payload.get("summary"):
-                row.summary = payload["summary"]
-                if payload.get("keywords"):
-                    row.keywords = payload["keywords"]
-                if payload.get("key_contributions"):
-                    row.key_contributions = payload["key_contributions"]
-                count += 1
-            await maybe_sleep()
-        except Exception as e:
-            logger.warning("paper summary backfill failed (%s): %s", row.arxiv_id, e)
-    updated["papers"] = count
-
-    # News
-    count = 0
-    news_rows = (
-        await db.execute(
-            select(AINews)
-            .where(or_(AINews.summary.is_(None), AINews.summary == ""))
-            .limit(limit_per_category)
-        )
-    ).scalars().all()
-    for row in news_rows:
-        try:
-            payload = await ai_service.summarize_news(
-                title=row.title,
-                content=row.content or row.excerpt,
-                source=row.source,
-            )
-            if payload.get("summary"):
-                row.summary = payload["summary"]
-                if payload.get("keywords"):
-                    row.keywords = payload["keywords"]
-                if payload.get("key_points"):
-                    row.key_points = payload["key_points"]
-                count += 1
-            await maybe_sleep()
-        except Exception as e:
-            logger.warning("news summary backfill failed (%s): %s", row.url, e)
-    updated["news"] = count
-
-    # GitHub
-    count = 0
-    github_rows = (
-        await db.execute(
-            select(GitHubProject)
-            .where(or_(GitHubProject.summary.is_(None), GitHubProject.summary == ""))
-            .limit(limit_per_category)
-        )
-    ).scalars().all()
-    for row in github_rows:
-        try:
-            payload = await ai_service.summarize_github_project(
-                repo_name=row.repo_name,
-                description=row.description,
-                language=row.language,
-                topics=row.topics or [],
-            )
-            if payload.get("summary"):
-                row.summary = payload["summary"]
-                if payload.get("keywords"):
-                    row.keywords = payload["keywords"]
-                if payload.get("use_cases"):
-                    row.use_cases = payload["use_cases"]
-                count += 1
-            await maybe_sleep()
-        except Exception as e:
-            logger.warning("github summary backfill failed (%s): %s", row.repo_name, e)
-    updated["github"] = count
-
-    # YouTube
-    count = 0
-    youtube_rows = (
-        await db.execute(
-            select(YouTubeVideo)
-            .where(or_(YouTubeVideo.summary.is_(None), YouTubeVideo.summary == ""))
-            .limit(limit_per_category)
-        )
-    ).scalars().all()
-    for row in youtube_rows:
-        try:
-            payload = await ai_service.summarize_youtube_video(
-                title=row.title,
-                description=row.description,
-                tags=row.tags or [],
-            )
-            if payload.get("summary"):
-                row.summary = payload["summary"]
-                if payload.get("keywords"):
-                    row.keywords = payload["keywords"]
-                if payload.get("key_points"):
-                    row.key_points = payload["key_points"]
-                count += 1
-            await maybe_sleep()
-        except Exception as e:
-            logger.warning("youtube summary backfill failed (%s): %s", row.video_id, e)
-    updated["youtube"] = count
-
-    # Tools
-    count = 0
-    tool_rows = (
-        await db.execute(
-            select(AITool)
-            .where(or_(AITool.summary.is_(None), AITool.summary == ""))
-            .limit(limit_per_category)
-        )
-    ).scalars().all()
-    for row in tool_rows:
-        try:
-            payload = await ai_service.summarize_ai_tool(
-                name=row.tool_name,
-                description=row.description,
-                category=row.category,
-                use_cases=row.use_cases or [],
-            )
-            if payload.get("summary"):
-                row.summary = payload["summary"]
-                if payload.get("keywords"):
-                    row.keywords = payload["keywords"]
-                if payload.get("best_for"):
-                    row.best_for = payload["best_for"]
-                count += 1
-            await maybe_sleep()
-        except Exception as e:
-            logger.warning("tool summary backfill failed (%s): %s", row.tool_name, e)
-    updated["tools"] = count
-
-    # Jobs
-    count = 0
-    job_rows = (
-        await db.execute(
-            select(AIJobTrend)
-            .where(or_(AIJobTrend.summary.is_(None), AIJobTrend.summary == ""))
-            .limit(limit_per_category)
-        )
-    ).scalars().all()
-    for row in job_rows:
-        try:
-            payload = await ai_service.summarize_job(
-                title=row.job_title,
-                company=row.company_name,
-                description=row.description,
-                skills=row.required_skills or [],
-            )
-            if payload.get("summary"):
-                row.summary = payload["summary"]
-                if payload.get("keywords"):
-                    row.keywords = payload["keywords"]
-                count += 1
-            await maybe_sleep()
-        except Exception as e:
-            logger.warning("job summary backfill failed (%s): %s", row.job_url, e)
-    updated["jobs"] = count
-
-    # Policies
-    count = 0
-    policy_rows = (
-        await db.execute(
-            select(AIPolicy)
-            .where(or_(AIPolicy.summary.is_(None), AIPolicy.summary == ""))
-            .limit(limit_per_category)
-        )
-    ).scalars().all()
-    for row in policy_rows:
-        try:
-            payload = await ai_service.summarize_policy(
-                title=row.title,
-                description=row.description,
-                policy_type=row.policy_type,
-                impact_areas=row.impact_areas or [],
-            )
-            if payload.get("summary"):
-                row.summary = payload["summary"]
-                if payload.get("keywords"):
-                    row.keywords = payload["keywords"]
-                count += 1
-            await maybe_sleep()
-        except Exception as e:
-            logger.warning("policy summary backfill failed (%s): %s", row.source_url, e)
-    updated["policies"] = count
-
     await db.commit()
+
+    result = await process_summary_jobs(
+        max_jobs=sum(queued.values()),
+        ai_service=ai_service,
+    )
     return {
-        "provider": provider,
-        "updated": updated,
-        "total_updated": sum(updated.values()),
+        "provider": result["provider"],
+        "queued": queued,
+        "updated": result["updated"],
+        "total_updated": sum(result["updated"].values()),
+        "retried": result["retried"],
+        "failed": result["failed"],
     }
 
 
-async def backfill_v4_metadata(
-    db: AsyncSession,
-    limit: int = 5000,
-) -> Dict[str, int]:
-    """v4 규칙(뉴스/논문/유튜브/HF)을 기존 데이터에 소급 적용."""
-    result: Dict[str, int] = {
-        "news_category": 0,
-        "paper_topic": 0,
-        "youtube_channel_language": 0,
-        "huggingface_task_ko": 0,
-    }
+def v4_metadata_tasks(force: bool = False) -> List[BackfillTask]:
+    """v4 규칙(뉴스/논문/유튜브/HF) 백필 작업 목록.
 
-    # 1) News category backfill
-    news_rows = (
-        await db.execute(select(AINews).order_by(AINews.id.desc()).limit(limit))
-    ).scalars().all()
-    for row in news_rows:
-        if row.category in _V4_NEWS_CATEGORIES:
-            continue
-        row.category = NewsService.classify_news_topic(
+    force=False면 값이 비어 있거나 v4 이전 값인 행만, True면 전체 행을 다시 분류 (규칙 변경 후 재처리).
+    """
+    hf_service = HuggingFaceService()
+    yt_service = YouTubeService()
+
+    def _news_category(row: AINews) -> bool:
+        category = NewsService.classify_news_topic(
             row.title or "",
             row.content or row.excerpt or "",
         )
-        result["news_category"] += 1
-
-    # 2) Paper topic backfill
-    paper_rows = (
-        await db.execute(
-            select(AIPaper)
-            .where(or_(AIPaper.topic.is_(None), AIPaper.topic == ""))
-            .order_by(AIPaper.id.desc())
-            .limit(limit)
-        )
-    ).scalars().all()
-    for row in paper_rows:
-        row.topic = ArxivService.classify_topic(row.title or "", row.categories or [])
-        result["paper_topic"] += 1
-
-    # 3) HuggingFace task_ko backfill
-    hf_service = HuggingFaceService()
-    hf_rows = (
-        await db.execute(
-            select(HuggingFaceModel)
-            .where(
-                HuggingFaceModel.task.is_not(None),
-                or_(HuggingFaceModel.task_ko.is_(None), HuggingFaceModel.task_ko == ""),
-            )
-            .order_by(HuggingFaceModel.id.desc())
-            .limit(limit)
-        )
-    ).scalars().all()
-    for row in hf_rows:
+        if row.category == category:
+            return False
+        row.category = category
+        return True
+
+    def _paper_topic(row: AIPaper) -> bool:
+        topic = ArxivService.classify_topic(row.title or "", row.categories or [])
+        if row.topic == topic:
+            return False
+        row.topic = topic
+        return True
+
+    def _huggingface_task_ko(row: HuggingFaceModel) -> bool:
         mapped = hf_service.PIPELINE_TAG_KO.get(row.task or "", row.task)
-        if mapped:
-            row.task_ko = mapped
-            result["huggingface_task_ko"] += 1
+        if not mapped or row.task_ko == mapped:
+            return False
+        row.task_ko = mapped
+        return True
 
-    # 4) YouTube channel_language backfill
-    yt_service = YouTubeService()
-    yt_rows = (
-        await db.execute(
-            select(YouTubeVideo)
-            .where(or_(YouTubeVideo.channel_language.is_(None), YouTubeVideo.channel_language == ""))
-            .order_by(YouTubeVideo.id.desc())
-            .limit(limit)
-        )
-    ).scalars().all()
-    for row in yt_rows:
+    def _youtube_channel_language(row: YouTubeVideo) -> bool:
         curated = yt_service._get_curated_channel_meta(row.channel_id)
         fallback = curated.get("language") or yt_service._fallback_language_from_video(
             {
@@ -360,11 +110,74 @@ async def backfill_v4_metadata(
                 "title": row.title or "",
             }
         )
-        row.channel_language = yt_service._normalize_channel_language(
+        language = yt_service._normalize_channel_language(
             row.channel_language,
             fallback=fallback,
         )
-        result["youtube_channel_language"] += 1
+        if row.channel_language == language:
+            return False
+        row.channel_language = language
+        return True
+
+    def _only_missing(*conditions):
+        return () if force else conditions
+
+    return [
+        BackfillTask(
+            "news_category",
+            AINews,
+            _news_category,
+            _only_missing(
+                or_(AINews.category.is_(None), AINews.category.notin_(_V4_NEWS_CATEGORIES))
+            ),
+        ),
+        BackfillTask(
+            "paper_topic",
+            AIPaper,
+            _paper_topic,
+            _only_missing(or_(AIPaper.topic.is_(None), AIPaper.topic == "")),
+        ),
+        BackfillTask(
+            "huggingface_task_ko",
+            HuggingFaceModel,
+            _huggingface_task_ko,
+            (HuggingFaceModel.task.is_not(None),)
+            + _only_missing(
+                or_(HuggingFaceModel.task_ko.is_(None), HuggingFaceModel.task_ko == "")
+            ),
+        ),
+        BackfillTask(
+            "youtube_channel_language",
+            YouTubeVideo,
+            _youtube_channel_language,
+            _only_missing(
+                or_(YouTubeVideo.channel_language.is_(None), YouTubeVideo.channel_language == "")
+            ),
+        ),
+    ]
 
-    await db.commit()
-    return result
+
+async def backfill_v4_metadata(
+    limit: Optional[int] = None,
+    force: bool = False,
+    resume: bool = True,
+    chunk_size: Optional[int] = None,
+    concurrency: Optional[int] = None,
+    claimed: bool = False,
+) -> Dict[str, Dict[str, Any]]:
+    """v4 규칙을 기존 데이터에 청크 단위로 소급 적용 (체크포인트로 중단 후 재개).
+
+    `limit`은 id 오름차순(체크포인트 다음 행부터)으로 적용되며, `claimed`는 `run_backfill`과 같음.
+
+    Returns:
+        작업별 `{"status", "processed", "updated", "total", "last_id"}`
+    """
+    return await run_backfill(
+        V4_BACKFILL_JOB,
+        v4_metadata_tasks(force=force),
+        chunk_size=chunk_size,
+        concurrency=concurrency,
+        limit=limit,
+        resume=resume,
+        claimed=claimed,
+    )
@@ -0,0 +1,243 @@
+"""카테고리별 대시보드 통계 엔진
+
+- 롤업 테이블(`category_daily_stats`)이 있으면 전체 카테고리의 일자 구간 수(최근 7일·이전 7일·
+  오늘·어제)를 GROUP BY 1회로 집계하고, total/latest는 원본 테이블에서 UNION ALL 1회로 조회
+  (삭제·날짜 변경·날짜 NULL 행이 롤업에 남긴 오차가 전체 수에 누적되지 않도록)
+- 롤업이 없는 카테고리는 `COUNT(*) FILTER (WHERE ...)` 단일 쿼리로 집계하며,
+  카테고리별로 별도 세션을 사용해 동시에 실행
+- 스케줄러는 수집 직후 `refresh_category_daily_stats`로 비교 구간(최근 15일)만 재계산
+- 날짜 기준은 변하지 않는 `created_at` (HF `collected_at`은 재수집마다 갱신되므로 사용하지 않음)
+"""
+import asyncio
+import logging
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Dict, Optional
+
+from sqlalchemy import and_, delete, func, literal, select, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import AsyncSessionLocal
+from app.models.ai_tool import AITool
+from app.models.category_stats import CategoryDailyStat
+from app.models.conference import AIConference
+from app.models.github import GitHubProject
+from app.models.huggingface import HuggingFaceModel
+from app.models.job_trend import AIJobTrend
+from app.models.news import AINews
+from app.models.paper import AIPaper
+from app.models.policy import AIPolicy
+from app.models.youtube import YouTubeVideo
+
+logger = logging.getLogger(__name__)
+
+# ── 카테고리 메타데이터 ──────────────────────────────────────
+CATEGORY_META = {
+    "huggingface": {"name": "Hugging Face 모델", "model": HuggingFaceModel, "date_field": "created_at"},
+    "github": {"name": "GitHub 프로젝트", "model": GitHubProject, "date_field": "created_at"},
+    "youtube": {"name": "YouTube 영상", "model": YouTubeVideo, "date_field": "created_at"},
+    "papers": {"name": "AI 논문", "model": AIPaper, "date_field": "created_at"},
+    "news": {"name": "AI 뉴스", "model": AINews, "date_field": "created_at"},
+    "conferences": {"name": "AI 컨퍼런스", "model": AIConference, "date_field": "created_at"},
+    "tools": {"name": "AI 도구/플랫폼", "model": AITool, "date_field": "created_at"},
+    "jobs": {"name": "AI 채용", "model": AIJobTrend, "date_field": "created_at"},
+    "policies": {"name": "AI 정책", "model": AIPolicy, "date_field": "created_at"},
+}
+
+# 롤업 보관·재계산 구간 (최근 7일 vs 이전 7일 비교에 필요한 14일 + 여유 1일)
+ROLLUP_REFRESH_DAYS = 15
+
+
+def _empty_stats() -> Dict[str, Any]:
+    return {
+        "total": 0,
+        "latest": None,
+        "recent_7d": 0,
+        "prev_7d": 0,
+        "today": 0,
+        "yesterday": 0,
+    }
+
+
+def _as_date(value: Any) -> Optional[date]:
+    """`func.date()` 결과 정규화 (SQLite는 문자열 반환)."""
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return date.fromisoformat(str(value)[:10])
+
+
+async def _live_category_stats(
+    key: str, now: datetime, session_factory=AsyncSessionLocal
+) -> Dict[str, Any]:
+    """원본 테이블에서 카테고리 통계를 단일 FILTER 집계 쿼리로 조회."""
+    meta = CATEGORY_META[key]
+    model = meta["model"]
+    date_col = getattr(model, meta["date_field"])
+
+    recent_cutoff = now - timedelta(days=7)
+    prev_cutoff = now - timedelta(days=14)
+    start_of_day = datetime(now.year, now.month, now.day)
+    yesterday_start = start_of_day - timedelta(days=1)
+
+    query = select(
+        func.count().label("total"),
+        func.max(date_col).label("latest"),
+        func.count().filter(date_col >= recent_cutoff).label("recent_7d"),
+        func.count()
+        .filter(and_(date_col >= prev_cutoff, date_col < recent_cutoff))
+        .label("prev_7d"),
+        func.count().filter(date_col >= start_of_day).label("today"),
+        func.count()
+        .filter(and_(date_col >= yesterday_start, date_col < start_of_day))
+        .label("yesterday"),
+    ).select_from(model)
+
+    async with session_factory() as db:
+        row = (await db.execute(query)).one()
+
+    return {
+        "total": int(row.total or 0),
+        "latest": row.latest,
+        "recent_7d": int(row.recent_7d or 0),
+        "prev_7d": int(row.prev_7d or 0),
+        "today": int(row.today or 0),
+        "yesterday": int(row.yesterday or 0),
+    }
+
+
+def _live_totals_query():
+    """전체 카테고리의 원본 total/latest (카테고리별 SELECT를 UNION ALL로 묶어 1회 조회)."""
+    return union_all(
+        *(
+            select(
+                literal(key).label("category"),
+                func.count().label("total"),
+                func.max(getattr(meta["model"], meta["date_field"])).label("latest"),
+            ).select_from(meta["model"])
+            for key, meta in CATEGORY_META.items()
+        )
+    )
+
+
+async def _rollup_category_stats(
+    now: datetime, session_factory=AsyncSessionLocal
+) -> Dict[str, Dict[str, Any]]:
+    """롤업 테이블의 일자 구간 수(GROUP BY 1회) + 원본 total/latest(UNION ALL 1회)."""
+    today = now.date()
+    recent_start = today - timedelta(days=6)
+    prev_start = today - timedelta(days=13)
+    stat_date = CategoryDailyStat.stat_date
+    item_count = CategoryDailyStat.item_count
+
+    query = select(
+        CategoryDailyStat.category,
+        func.sum(item_count).filter(stat_date >= recent_start).label("recent_7d"),
+        func.sum(item_count)
+        .filter(and_(stat_date >= prev_start, stat_date < recent_start))
+        .label("prev_7d"),
+        func.sum(item_count).filter(stat_date == today).label("today"),
+        func.sum(item_count)
+        .filter(stat_date == today - timedelta(days=1))
+        .label("yesterday"),
+    ).group_by(CategoryDailyStat.category)
+
+    async with session_factory() as db:
+        rows = (await db.execute(query)).all()
+        if not rows:
+            return {}
+        totals = {row.category: row for row in (await db.execute(_live_totals_query())).all()}
+
+    return {
+        row.category: {
+            "total": int(totals[row.category].total or 0),
+            "latest": totals[row.category].latest,
+            "recent_7d": int(row.recent_7d or 0),
+            "prev_7d": int(row.prev_7d or 0),
+            "today": int(row.today or 0),
+            "yesterday": int(row.yesterday or 0),
+        }
+        for row in rows
+        if row.category in totals
+    }
+
+
+async def get_category_stats_snapshot(
+    now: Optional[datetime] = None,
+    session_factory=AsyncSessionLocal,
+) -> Dict[str, Dict[str, Any]]:
+    """카테고리별 total/latest/recent_7d/prev_7d/today/yesterday 통계.
+
+    실패한 카테고리는 0 값과 `error` 필드를 포함합니다.
+    """
+    now = now or datetime.now(timezone.utc)
+
+    snapshot: Dict[str, Dict[str, Any]] = {}
+    try:
+        snapshot = await _rollup_category_stats(now, session_factory)
+    except Exception as e:
+        # 롤업 테이블 미생성(마이그레이션 미적용) 등 → 원본 집계로 대체
+        logger.debug("category_daily_stats 조회 실패, 원본 집계 사용: %s", e)
+
+    missing = [key for key in CATEGORY_META if key not in snapshot]
+    if missing:
+        results = await asyncio.gather(
+            *(_live_category_stats(key, now, session_factory) for key in missing),
+            return_exceptions=True,
+        )
+        for key, result in zip(missing, results):
+            if isinstance(result, BaseException):
+                snapshot[key] = {**_empty_stats(), "error": str(result)}
+            else:
+                snapshot[key] = result
+
+    return {key: snapshot[key] for key in CATEGORY_META}
+
+
+async def refresh_category_daily_stats(
+    db: AsyncSession,
+    category: str,
+    days: int = ROLLUP_REFRESH_DAYS,
+) -> int:
+    """카테고리 롤업을 최근 `days`일 구간으로 다시 만듦 (그 이전 일자 행은 삭제).
+
+    롤업은 구간 수에만 쓰이므로(total/latest는 원본 조회) 오래된 일자는 보관하지 않음 —
+    구간 안의 삭제·날짜 변경은 매 갱신마다 바로잡힘.
+
+    Returns:
+        갱신된 일자 행 수
+    """
+    meta = CATEGORY_META[category]
+    date_col = getattr(meta["model"], meta["date_field"])
+
+    cutoff_date = datetime.now(timezone.utc).date() - timedelta(days=days - 1)
+    cutoff = datetime(cutoff_date.year, cutoff_date.month, cutoff_date.day)
+    day_col = func.date(date_col)
+    query = (
+        select(
+            day_col.label("stat_date"),
+            func.count().label("item_count"),
+            func.max(date_col).label("last_item_at"),
+        )
+        .where(date_col >= cutoff)
+        .group_by(day_col)
+    )
+    rows = (await db.execute(query)).all()
+
+    await db.execute(delete(CategoryDailyStat).where(CategoryDailyStat.category == category))
+    db.add_all(
+        [
+            CategoryDailyStat(
+                category=category,
+                stat_date=_as_date(row.stat_date),
+                item_count=int(row.item_count or 0),
+                last_item_at=row.last_item_at,
+            )
+            for row in rows
+            if row.stat_date is not None
+        ]
+    )
+    await db.commit()
+    return len(rows)
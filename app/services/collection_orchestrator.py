@@ -0,0 +1,186 @@
+"""수집기 동시 실행 오케스트레이터.
+
+- 수집기들을 전역 동시 실행 상한(`concurrency`) 안에서 동시에 실행
+- 소스별 제한: 같은 소스(외부 API·LLM 등)를 쓰는 수집기는 `max_concurrent`개까지만,
+  시작 간격은 `min_interval`초 이상 (고정 `sleep` 대신 실제로 겹치는 소스만 간격을 둠)
+- `depends_on`에 적은 수집기가 끝난 뒤에 시작 (선행 수집기가 실패하면 건너뜀)
+- 수집기는 `CollectorResult`(app/run_metrics.py)에 수집/저장 건수와 에러를 기록하고, 소요 시간·상태는 여기서 채움
+- 캐시 무효화·롤업 갱신은 호출 측에서 전체 실행 후 1회 수행
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, List, Mapping, Optional, Sequence, Tuple
+
+from app.run_metrics import (
+    COLLECTOR_STATUS_ERROR,
+    COLLECTOR_STATUS_SKIPPED,
+    COLLECTOR_STATUS_SUCCESS,
+    CollectorResult,
+    bind_run,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class SourceLimit:
+    """소스별 제한 (동시 실행 수, 시작 간 최소 간격 초)."""
+
+    max_concurrent: int = 1
+    min_interval: float = 0.0
+
+
+DEFAULT_SOURCE_LIMIT = SourceLimit()
+
+
+@dataclass(frozen=True)
+class Collector:
+    """오케스트레이터에 넘기는 수집기 정의.
+
+    `run`은 결과 객체를 받아 건수·에러를 기록 (예외를 던지면 에러로 집계).
+    """
+
+    name: str
+    run: Callable[[CollectorResult], Awaitable[None]]
+    sources: Tuple[str, ...] = ()
+    depends_on: Tuple[str, ...] = ()
+
+
+def record_upsert(result: CollectorResult, service: Any) -> None:
+    """서비스의 마지막 업서트 통계를 결과에 합산 (같은 통계를 두 번 세지 않도록 비움)."""
+    result.add_upsert(getattr(service, "last_upsert_stats", None))
+    service.last_upsert_stats = None
+
+
+def _check_dependencies(collectors: Sequence[Collector]) -> None:
+    names = [collector.name for collector in collectors]
+    if len(set(names)) != len(names):
+        raise ValueError("duplicate collector names")
+    graph = {collector.name: collector.depends_on for collector in collectors}
+    for name, deps in graph.items():
+        missing = [dep for dep in deps if dep not in graph]
+        if missing:
+            raise ValueError(f"unknown dependency for {name}: {', '.join(missing)}")
+
+    visiting, visited = set(), set()
+
+    def _visit(name: str) -> None:
+        if name in visited:
+            return
+        if name in visiting:
+            raise ValueError(f"dependency cycle at {name}")
+        visiting.add(name)
+        for dep in graph[name]:
+            _visit(dep)
+        visiting.discard(name)
+        visited.add(name)
+
+    for name in graph:
+        _visit(name)
+
+
+class _SourceGate:
+    """소스 1개의 동시 실행 수와 시작 간격 제한."""
+
+    def __init__(self, limit: SourceLimit) -> None:
+        self._semaphore = asyncio.Semaphore(max(1, limit.max_concurrent))
+        self._min_interval = max(0.0, limit.min_interval)
+        self._lock = asyncio.Lock()
+        self._last_start: Optional[float] = None
+
+    async def acquire(self) -> None:
+        await self._semaphore.acquire()
+        if not self._min_interval:
+            return
+        async with self._lock:
+            now = time.monotonic()
+            if self._last_start is not None:
+                wait = self._last_start + self._min_interval - now
+                if wait > 0:
+                    await asyncio.sleep(wait)
+            self._last_start = time.monotonic()
+
+    def release(self) -> None:
+        self._semaphore.release()
+
+
+async def run_collectors(
+    collectors: Sequence[Collector],
+    *,
+    concurrency: int,
+    source_limits: Optional[Mapping[str, SourceLimit]] = None,
+) -> Dict[str, CollectorResult]:
+    """수집기들을 제한 안에서 동시에 실행하고 수집기별 결과 반환 (입력 순서 유지).
+
+    Args:
+        concurrency: 동시에 실행하는 수집기 수 상한
+        source_limits: 소스 이름 → 제한 (없는 소스는 `DEFAULT_SOURCE_LIMIT`)
+    """
+    _check_dependencies(collectors)
+    source_limits = source_limits or {}
+    global_slots = asyncio.Semaphore(max(1, concurrency))
+    gates: Dict[str, _SourceGate] = {}
+    for collector in collectors:
+        for source in collector.sources:
+            if source not in gates:
+                gates[source] = _SourceGate(source_limits.get(source, DEFAULT_SOURCE_LIMIT))
+    finished = {collector.name: asyncio.Event() for collector in collectors}
+    results = {collector.name: CollectorResult(collector.name) for collector in collectors}
+
+    async def _run(collector: Collector) -> None:
+        result = results[collector.name]
+        try:
+            for dep in collector.depends_on:
+                await finished[dep].wait()
+            failed = [
+                dep for dep in collector.depends_on
+                if results[dep].status != COLLECTOR_STATUS_SUCCESS
+            ]
+            if failed:
+                result.status = COLLECTOR_STATUS_SKIPPED
+                result.errors.append(f"dependency not completed: {', '.join(failed)}")
+                return
+
+            # 소스 게이트는 이름 순으로 잡아 수집기 간 교착을 피하고, 전역 슬롯은 마지막에 점유
+            acquired: List[_SourceGate] = []
+            try:
+                for source in sorted(set(collector.sources)):
+                    await gates[source].acquire()
+                    acquired.append(gates[source])
+                async with global_slots:
+                    result.started_at = datetime.now(timezone.utc)
+                    started = time.perf_counter()
+                    try:
+                        with bind_run(result):
+                            await collector.run(result)
+                    except Exception as e:
+                        logger.exception("수집기 실패 (%s)", collector.name)
+                        result.errors.append(str(e))
+                    finally:
+                        result.duration_ms = int((time.perf_counter() - started) * 1000)
+                        result.finished_at = datetime.now(timezone.utc)
+            finally:
+                for gate in acquired:
+                    gate.release()
+            if result.errors:
+                result.status = COLLECTOR_STATUS_ERROR
+            logger.info(
+                "수집기 %s %s: %dms, 수집 %d / 신규 %d / 갱신 %d, 에러 %d",
+                collector.name,
+                result.status,
+                result.duration_ms,
+                result.fetched,
+                result.inserted,
+                result.updated,
+                len(result.errors),
+            )
+        finally:
+            finished[collector.name].set()
+
+    await asyncio.gather(*(_run(collector) for collector in collectors))
+    return results
@@ -0,0 +1,230 @@
+"""수집 작업 실행 이력 (collection_runs) 기록·조회.
+
+- `instrumented_run`: 수집 작업 1회를 감싸 소요 시간·단계별 시간·건수·HTTP/LLM 호출 수를 모아 저장
+  (기록 실패는 로그만 남기고 수집 작업에는 영향 없음)
+- 이력 조회와 작업별 분위수(p50/p90/p95/p99) 집계 — 느린 실행이 피드(fetch)·LLM(summarize)·
+  DB(save) 중 어디서 생겼는지 비교하는 용도
+"""
+from __future__ import annotations
+
+import logging
+import time
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence
+
+from sqlalchemy import delete, func, select
+
+from app.database import AsyncSessionLocal
+from app.metrics import SCHEDULER_JOB_DURATION
+from app.models.collection_run import CollectionRun
+from app.run_metrics import (
+    COLLECTOR_STATUS_ERROR,
+    COLLECTOR_STATUS_SUCCESS,
+    PHASES,
+    CollectorResult,
+    bind_run,
+)
+
+logger = logging.getLogger(__name__)
+
+COLLECTION_RUN_RETENTION_DAYS = 30
+PERCENTILE_MAX_RUNS = 500  # 작업별 분위수 계산에 쓰는 최근 실행 수 상한
+PERCENTILES = (50, 90, 95, 99)
+PERCENTILE_METRICS = (
+    "duration_ms",
+    *(f"{phase}_ms" for phase in PHASES),
+    "fetched",
+    "inserted",
+    "updated",
+    "http_calls",
+    "llm_calls",
+)
+
+
+async def save_collection_run(
+    job_id: str,
+    result: CollectorResult,
+    *,
+    trigger: str = "scheduled",
+    session_factory=AsyncSessionLocal,
+) -> None:
+    """실행 결과 1건 저장 (실패해도 예외를 올리지 않음)."""
+    phases = result.phase_ms()
+    try:
+        async with session_factory() as db:
+            db.add(
+                CollectionRun(
+                    job_id=job_id,
+                    trigger=trigger,
+                    status=result.status,
+                    started_at=result.started_at or datetime.now(timezone.utc),
+                    finished_at=result.finished_at,
+                    duration_ms=result.duration_ms,
+                    **{f"{phase}_ms": phases[phase] for phase in PHASES},
+                    fetched=result.fetched,
+                    inserted=result.inserted,
+                    updated=result.updated,
+                    http_calls=result.http_calls,
+                    llm_calls=result.llm_calls,
+                    errors=[error[:500] for error in result.errors[:20]],
+                )
+            )
+            await db.commit()
+    except Exception as e:
+        logger.warning("collection_runs 기록 실패 (%s): %s", job_id, e)
+
+
+@asynccontextmanager
+async def instrumented_run(
+    job_id: str,
+    result: Optional[CollectorResult] = None,
+    *,
+    trigger: str = "scheduled",
+    session_factory=AsyncSessionLocal,
+) -> AsyncIterator[CollectorResult]:
+    """수집 작업 1회를 계측하고 끝나면 collection_runs에 기록.
+
+    블록 안의 HTTP/LLM 호출과 `track_phase` 구간은 yield한 결과 객체에 집계됨.
+    블록에서 예외가 나면 에러로 기록한 뒤 다시 올림.
+    """
+    result = result or CollectorResult(job_id)
+    result.started_at = datetime.now(timezone.utc)
+    started = time.perf_counter()
+    try:
+        with bind_run(result):
+            yield result
+    except Exception as e:
+        result.errors.append(str(e))
+        raise
+    finally:
+        # 단계 시간(phases_ms)과 같은 반올림이어야 duration_ms가 단계 합보다 작게 찍히지 않음
+        result.duration_ms = int(round((time.perf_counter() - started) * 1000))
+        result.finished_at = datetime.now(timezone.utc)
+        result.status = COLLECTOR_STATUS_ERROR if result.errors else COLLECTOR_STATUS_SUCCESS
+        SCHEDULER_JOB_DURATION.observe(result.duration_ms / 1000, job_id)
+        await save_collection_run(
+            job_id, result, trigger=trigger, session_factory=session_factory
+        )
+
+
+def _run_to_dict(run: CollectionRun) -> Dict[str, Any]:
+    return {
+        "id": run.id,
+        "job_id": run.job_id,
+        "trigger": run.trigger,
+        "status": run.status,
+        "started_at": run.started_at.isoformat() if run.started_at else None,
+        "finished_at": run.finished_at.isoformat() if run.finished_at else None,
+        "duration_ms": run.duration_ms,
+        "phases_ms": {phase: getattr(run, f"{phase}_ms") for phase in PHASES},
+        "fetched": run.fetched,
+        "inserted": run.inserted,
+        "updated": run.updated,
+        "http_calls": run.http_calls,
+        "llm_calls": run.llm_calls,
+        "errors": run.errors or [],
+    }
+
+
+async def get_collection_run_history(
+    job_id: Optional[str] = None,
+    *,
+    status: Optional[str] = None,
+    limit: int = 50,
+    session_factory=AsyncSessionLocal,
+) -> List[Dict[str, Any]]:
+    """최근 실행 이력 (최신순)."""
+    query = select(CollectionRun).order_by(
+        CollectionRun.started_at.desc(), CollectionRun.id.desc()
+    )
+    if job_id:
+        query = query.where(CollectionRun.job_id == job_id)
+    if status:
+        query = query.where(CollectionRun.status == status)
+    async with session_factory() as db:
+        runs = (await db.execute(query.limit(limit))).scalars().all()
+    return [_run_to_dict(run) for run in runs]
+
+
+def percentile(values: Sequence[float], pct: float) -> float:
+    """선형 보간 분위수 (`values`는 정렬된 상태)."""
+    if not values:
+        return 0.0
+    if len(values) == 1:
+        return float(values[0])
+    rank = (len(values) - 1) * pct / 100
+    lower = int(rank)
+    upper = min(lower + 1, len(values) - 1)
+    return float(values[lower] + (values[upper] - values[lower]) * (rank - lower))
+
+
+async def get_collection_run_percentiles(
+    job_id: Optional[str] = None,
+    *,
+    days: int = 7,
+    session_factory=AsyncSessionLocal,
+) -> Dict[str, Dict[str, Any]]:
+    """최근 `days`일 실행의 작업별 분위수.
+
+    Returns:
+        `{job_id: {"runs", "errors", "error_rate", "metrics": {지표: {"p50", ..., "max"}}}}`
+    """
+    cutoff = datetime.now(timezone.utc) - timedelta(days=days)
+    # 작업별 최근 PERCENTILE_MAX_RUNS건만 DB에서 잘라 가져옴 (윈도 전체를 메모리에 올리지 않음)
+    ranked = select(
+        CollectionRun.job_id,
+        CollectionRun.status,
+        *(getattr(CollectionRun, metric) for metric in PERCENTILE_METRICS),
+        func.row_number()
+        .over(
+            partition_by=CollectionRun.job_id,
+            order_by=(CollectionRun.started_at.desc(), CollectionRun.id.desc()),
+        )
+        .label("recent_rank"),
+    ).where(CollectionRun.started_at >= cutoff)
+    if job_id:
+        ranked = ranked.where(CollectionRun.job_id == job_id)
+    ranked = ranked.subquery()
+    query = select(
+        ranked.c.job_id,
+        ranked.c.status,
+        *(ranked.c[metric] for metric in PERCENTILE_METRICS),
+    ).where(ranked.c.recent_rank <= PERCENTILE_MAX_RUNS)
+    async with session_factory() as db:
+        runs = (await db.execute(query)).all()
+
+    by_job: Dict[str, List[Any]] = defaultdict(list)
+    for run in runs:
+        by_job[run.job_id].append(run)
+
+    summary: Dict[str, Dict[str, Any]] = {}
+    for name in sorted(by_job):
+        job_runs = by_job[name]
+        errors = sum(1 for run in job_runs if run.status == COLLECTOR_STATUS_ERROR)
+        metrics = {}
+        for metric in PERCENTILE_METRICS:
+            values = sorted(getattr(run, metric) or 0 for run in job_runs)
+            metrics[metric] = {
+                **{f"p{pct}": round(percentile(values, pct), 1) for pct in PERCENTILES},
+                "max": values[-1],
+            }
+        summary[name] = {
+            "runs": len(job_runs),
+            "errors": errors,
+            "error_rate": round(errors / len(job_runs), 4),
+            "metrics": metrics,
+        }
+    return summary
+
+
+async def prune_collection_runs(
+    days: int = COLLECTION_RUN_RETENTION_DAYS, session_factory=AsyncSessionLocal
+) -> int:
+    """보존 기간이 지난 실행 이력 삭제."""
+    cutoff = datetime.now(timezone.utc) - timedelta(days=days)
+    async with session_factory() as db:
+        result = await db.execute(delete(CollectionRun).where(CollectionRun.started_at < cutoff))
+        await db.commit()
+    return result.rowcount or 0
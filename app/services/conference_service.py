@@ -1,6 +1,5 @@
 """AI Conference 데이터 수집 서비스"""
 import httpx
-import feedparser
 from typing import List, Dict, Any, Optional
 from datetime import datetime, timedelta
 import re
@@ -8,8 +7,10 @@ import logging
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, desc
 
+from app.bulk_upsert import bulk_upsert, prefetch_existing
 from app.models.conference import AIConference
 from app.config import get_settings
+from app.services.feed_fetch_service import fetch_feeds, stage_feed_validators
 
 logger = logging.getLogger(__name__)
 
@@ -298,11 +299,18 @@ class ConferenceService:
         confirmed_acronyms = {c["conference_acronym"] for c in all_conferences}
 
         try:
+            print(f"📡 Fetching {year} conferences from WikiCFP ({', '.join(self.RSS_FEEDS)})...")
+            # 카테고리 피드를 동시에 조건부 요청, 파싱은 스레드 풀에서
+            results = await fetch_feeds(self.RSS_FEEDS.values(), source="conferences")
+            # 피드 검증자는 save_to_db가 컨퍼런스와 같은 트랜잭션에서 저장
+            self.pending_feed_results = list(results.values())
             for category, feed_url in self.RSS_FEEDS.items():
-                print(f"📡 Fetching {year} conferences from WikiCFP ({category})...")
-
-                # feedparser는 동기 라이브러리이므로 직접 사용
-                feed = feedparser.parse(feed_url)
+                result = results[feed_url]
+                if result.feed is None:
+                    if result.error:
+                        print(f"⚠️ WikiCFP ({category}) 수집 실패: {result.error}")
+                    continue
+                feed = result.feed
 
                 for entry in feed.entries[:max_results]:
                     conference_data = self._parse_wikicfp_entry(entry, category, year_filter=year)
@@ -543,8 +551,6 @@ class ConferenceService:
         Returns:
             저장된 항목 수
         """
-        saved_count = 0
-
         # 확정 학회는 force-delete 없이 항상 최신값으로 업서트
         try:
             await self._upsert_confirmed_conferences(db)
@@ -552,6 +558,8 @@ class ConferenceService:
             await db.rollback()
             print(f"⚠️ Error upserting confirmed conferences: {e}")
 
+        rows = []
+        skipped = 0
         for conf_data in conferences:
             try:
                 # 날짜 필드 파싱 보정
@@ -582,39 +590,50 @@ class ConferenceService:
                         f"⚠️ Skip invalid conference year ({normalized_year}): "
                         f"{conf_data.get('conference_name', 'Unknown')}"
                     )
+                    skipped += 1
                     continue
 
                 # 중복 확인 (URL 기준)
-                website_url = conf_data.get("website_url")
-                if not website_url:
+                if not conf_data.get("website_url"):
+                    skipped += 1
                     continue
 
-                result = await db.execute(
-                    select(AIConference).where(AIConference.website_url == website_url)
-                )
-                existing = result.scalar_one_or_none()
-
-                if existing:
-                    # 기존 항목 업데이트
-                    for key, value in conf_data.items():
-                        if hasattr(existing, key) and value is not None:
-                            setattr(existing, key, value)
-                    print(f"📝 Updated: {conf_data.get('conference_name', 'Unknown')}")
-                else:
-                    # 새 항목 생성
-                    new_conference = AIConference(**conf_data)
-                    db.add(new_conference)
-                    saved_count += 1
-                    print(f"✨ Created: {conf_data.get('conference_name', 'Unknown')}")
-
-                await db.commit()
+                rows.append(conf_data)
 
             except Exception as e:
-                await db.rollback()
+                skipped += 1
                 print(f"❌ Error saving conference: {e}")
                 continue
 
-        return saved_count
+        # 기존 항목은 값이 있는 필드만 갱신
+        try:
+            existing_conferences = await prefetch_existing(
+                db, AIConference, "website_url", (row["website_url"] for row in rows)
+            )
+            for row in rows:
+                if row["website_url"] in existing_conferences:
+                    print(f"📝 Updated: {row.get('conference_name', 'Unknown')}")
+                else:
+                    print(f"✨ Created: {row.get('conference_name', 'Unknown')}")
+            stats = await bulk_upsert(
+                db,
+                AIConference,
+                rows,
+                key="website_url",
+                coalesce_columns=[column for row in rows for column in row if column != "website_url"],
+                existing=existing_conferences,
+            )
+            await stage_feed_validators(db, getattr(self, "pending_feed_results", ()))
+            await db.commit()
+            self.pending_feed_results = []
+        except Exception as e:
+            await db.rollback()
+            print(f"❌ Error saving conference: {e}")
+            return 0
+
+        stats.skipped += skipped
+        self.last_upsert_stats = stats
+        return stats.inserted
 
     async def get_conferences(
         self, db: AsyncSession, skip: int = 0, limit: int = 20,
@@ -0,0 +1,209 @@
+"""RSS 피드 동시 수집 + 조건부 요청 (ETag / Last-Modified)
+
+- 피드들을 세마포어로 제한한 동시 요청으로 가져옴 (전체 소요 ≈ 가장 느린 피드)
+- 피드별 검증자를 `feed_states`에 저장하고 `If-None-Match`/`If-Modified-Since` 전송
+  → 304면 본문 다운로드·파싱 생략
+- 검증자는 수집 시점이 아니라 호출자가 항목을 저장하는 트랜잭션에서 `stage_feed_validators`로 반영
+  (파싱·저장이 실패하면 검증자도 남지 않아 다음 수집이 304로 항목을 놓치지 않음)
+- `feedparser`는 동기 라이브러리이므로 parse 실행기(스레드 풀)에서 파싱 (이벤트 루프 블로킹 방지)
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+import feedparser
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.bulk_upsert import bulk_upsert
+from app.config import get_settings
+from app.database import AsyncSessionLocal
+from app.executors import run_parse
+from app.http_client import http_client
+from app.models.feed_state import FeedState
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+FEED_STATUS_OK = "ok"
+FEED_STATUS_NOT_MODIFIED = "not_modified"
+FEED_STATUS_ERROR = "error"
+
+
+@dataclass
+class FeedFetchResult:
+    """피드 1개 수집 결과 (`feed`는 status가 ok일 때만 채워짐)."""
+
+    url: str
+    status: str
+    feed: Any = None
+    http_status: Optional[int] = None
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    error: Optional[str] = None
+
+
+async def parse_feed(content: bytes, content_type: Optional[str] = None) -> Any:
+    """feedparser 파싱을 parse 실행기에서 실행 (Content-Type의 charset을 인코딩 판단에 사용)."""
+    response_headers = {"content-type": content_type} if content_type else None
+    return await run_parse(feedparser.parse, content, response_headers=response_headers)
+
+
+async def _load_validators(
+    session_factory, urls: Iterable[str]
+) -> Dict[str, Tuple[Optional[str], Optional[str]]]:
+    try:
+        async with session_factory() as db:
+            rows = (
+                await db.execute(
+                    select(FeedState.feed_url, FeedState.etag, FeedState.last_modified).where(
+                        FeedState.feed_url.in_(list(urls))
+                    )
+                )
+            ).all()
+    except Exception as e:
+        # 마이그레이션 전이거나 DB 장애면 조건부 요청 없이 전체 수집
+        logger.warning("피드 상태 조회 실패 — 조건부 요청 생략: %s", e)
+        return {}
+    return {url: (etag, last_modified) for url, etag, last_modified in rows}
+
+
+async def stage_feed_validators(db: AsyncSession, results: Iterable[FeedFetchResult]) -> None:
+    """피드 검증자를 호출자 세션에 반영 (커밋은 호출자 — 수집 항목과 같은 트랜잭션).
+
+    feed_states 반영 실패(마이그레이션 전 등)는 SAVEPOINT만 되돌리고 항목 저장은 그대로 진행.
+    """
+    now = datetime.now(timezone.utc)
+    rows = [
+        {
+            "feed_url": result.url,
+            "etag": result.etag,
+            "last_modified": result.last_modified,
+            "last_status": result.http_status,
+            "last_fetched_at": now,
+        }
+        for result in results
+    ]
+    if not rows:
+        return
+    try:
+        async with db.begin_nested():
+            await bulk_upsert(
+                db,
+                FeedState,
+                rows,
+                key="feed_url",
+                update_columns=["etag", "last_modified", "last_status", "last_fetched_at"],
+            )
+    except Exception as e:
+        logger.warning("피드 상태 저장 실패: %s", e)
+
+
+async def _fetch_one(
+    url: str,
+    source: str,
+    validators: Tuple[Optional[str], Optional[str]],
+    semaphore: asyncio.Semaphore,
+    headers: Optional[Dict[str, str]],
+) -> FeedFetchResult:
+    etag, last_modified = validators
+    request_headers = dict(headers or {})
+    if etag:
+        request_headers["If-None-Match"] = etag
+    if last_modified:
+        request_headers["If-Modified-Since"] = last_modified
+
+    async with semaphore:
+        try:
+            async with http_client(source) as client:
+                response = await client.get(
+                    url, headers=request_headers, follow_redirects=True
+                )
+            if response.status_code == 304:
+                return FeedFetchResult(
+                    url=url,
+                    status=FEED_STATUS_NOT_MODIFIED,
+                    http_status=304,
+                    etag=response.headers.get("etag") or etag,
+                    last_modified=response.headers.get("last-modified") or last_modified,
+                )
+            response.raise_for_status()
+        except Exception as e:
+            status_code = getattr(getattr(e, "response", None), "status_code", None)
+            return FeedFetchResult(
+                url=url,
+                status=FEED_STATUS_ERROR,
+                http_status=status_code,
+                etag=etag,
+                last_modified=last_modified,
+                error=f"HTTP {status_code}" if status_code else str(e),
+            )
+
+    # 파싱은 네트워크 슬롯을 반납한 뒤 스레드 풀에서
+    feed = await parse_feed(response.content, response.headers.get("content-type"))
+    if feed.get("bozo") and not feed.get("entries"):
+        # 파싱 불가 본문의 검증자는 저장하지 않음 (다음 수집 때 다시 전체 요청)
+        return FeedFetchResult(
+            url=url,
+            status=FEED_STATUS_ERROR,
+            http_status=response.status_code,
+            error=f"feed parse error: {feed.get('bozo_exception')}",
+        )
+    return FeedFetchResult(
+        url=url,
+        status=FEED_STATUS_OK,
+        feed=feed,
+        http_status=response.status_code,
+        etag=response.headers.get("etag"),
+        last_modified=response.headers.get("last-modified"),
+    )
+
+
+async def fetch_feeds(
+    urls: Iterable[str],
+    source: str = "default",
+    concurrency: Optional[int] = None,
+    headers: Optional[Dict[str, str]] = None,
+    conditional: bool = True,
+    session_factory=AsyncSessionLocal,
+) -> Dict[str, FeedFetchResult]:
+    """여러 피드를 동시에 조건부 요청으로 수집.
+
+    Args:
+        urls: 피드 URL 목록 (중복은 1번만 요청)
+        source: 사용할 공용 HTTP 클라이언트 이름 (`app.http_client`)
+        concurrency: 동시 요청 수 (기본: settings.feed_fetch_concurrency)
+        conditional: False면 저장된 검증자를 무시하고 전체 본문 요청
+
+    Returns:
+        `{url: FeedFetchResult}` — 실패한 피드도 error 상태로 포함 (예외를 던지지 않음).
+        검증자는 저장하지 않으므로 항목 저장 시 `stage_feed_validators`로 함께 커밋해야 함
+    """
+    unique_urls = list(dict.fromkeys(url for url in urls if url))
+    if not unique_urls:
+        return {}
+
+    validators = await _load_validators(session_factory, unique_urls) if conditional else {}
+    semaphore = asyncio.Semaphore(max(1, concurrency or settings.feed_fetch_concurrency))
+    results = await asyncio.gather(
+        *(
+            _fetch_one(url, source, validators.get(url, (None, None)), semaphore, headers)
+            for url in unique_urls
+        )
+    )
+
+    counts: Dict[str, int] = {}
+    for result in results:
+        counts[result.status] = counts.get(result.status, 0) + 1
+    logger.info(
+        "피드 수집 완료 (%s): ok=%d not_modified=%d error=%d",
+        source,
+        counts.get(FEED_STATUS_OK, 0),
+        counts.get(FEED_STATUS_NOT_MODIFIED, 0),
+        counts.get(FEED_STATUS_ERROR, 0),
+    )
+    return {result.url: result for result in results}
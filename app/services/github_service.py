@@ -8,7 +8,10 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, desc
 from app.models.github import GitHubProject
 from app.config import get_settings
+from app.bulk_upsert import bulk_upsert, prefetch_existing
+from app.http_client import http_client
 from app.db_compat import has_archive_column, has_columns
+from app.pagination import apply_keyset
 
 settings = get_settings()
 logger = logging.getLogger(__name__)
@@ -184,7 +187,7 @@ class GitHubService:
             레포지토리 정보 리스트
         """
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
+            async with http_client("github") as client:
                 queries = self._build_search_queries(language=language, since=since)
                 per_query = max(10, min(50, max_results))
 
@@ -289,7 +292,6 @@ class GitHubService:
         Returns:
             저장된 프로젝트 수
         """
-        saved_count = 0
         column_flags = await has_columns(
             db,
             "github_projects",
@@ -299,67 +301,76 @@ class GitHubService:
             column_flags["is_archived"] and column_flags["archived_at"]
         )
 
-        for project_data in projects:
-            try:
-                inserted_new = False
-                # 이미 존재하는지 확인
-                result = await db.execute(
-                    select(GitHubProject).where(
-                        GitHubProject.repo_name == project_data["repo_name"]
-                    )
-                )
-                existing_project = result.scalar_one_or_none()
-
-                if existing_project:
-                    # Phase 2: star_velocity 계산 (이전 데이터와 비교)
-                    prev_stars = existing_project.stars or 0
-                    new_stars = project_data.get("stars", 0)
-                    star_velocity = new_stars - prev_stars
-                    if star_velocity > 0:
-                        print(f"📈 Star velocity for {project_data['repo_name']}: +{star_velocity}")
-
-                    # 업데이트 (스타, 포크 등)
-                    existing_project.stars = new_stars
-                    existing_project.forks = project_data.get("forks", 0)
-                    existing_project.watchers = project_data.get("watchers", 0)
-                    existing_project.open_issues = project_data.get("open_issues", 0)
-                    existing_project.is_trending = True
-                    if has_archive_columns:
-                        existing_project.is_archived = False
-                        existing_project.archived_at = None
-                else:
-                    # 새로 추가
-                    new_project = GitHubProject(
-                        repo_name=project_data["repo_name"],
-                        owner=project_data.get("owner"),
-                        name=project_data.get("name"),
-                        description=project_data.get("description"),
-                        url=project_data.get("url"),
-                        homepage=project_data.get("homepage"),
-                        language=project_data.get("language"),
-                        stars=project_data.get("stars", 0),
-                        forks=project_data.get("forks", 0),
-                        watchers=project_data.get("watchers", 0),
-                        open_issues=project_data.get("open_issues", 0),
-                        topics=project_data.get("topics", []),
-                        license=project_data.get("license"),
-                        created_at_github=project_data.get("created_at_github"),
-                        updated_at_github=project_data.get("updated_at_github"),
-                        pushed_at=project_data.get("pushed_at"),
-                        is_trending=True,
-                    )
-                    db.add(new_project)
-                    inserted_new = True
-
-                await db.commit()
-                if inserted_new:
-                    saved_count += 1
+        existing_projects = await prefetch_existing(
+            db,
+            GitHubProject,
+            "repo_name",
+            (project_data.get("repo_name") for project_data in projects),
+        )
 
-            except Exception as e:
-                await db.rollback()
-                print(f"❌ 프로젝트 저장 실패 ({project_data.get('repo_name')}): {e}")
+        rows = []
+        for project_data in projects:
+            existing_project = existing_projects.get(project_data.get("repo_name"))
+            if existing_project:
+                # Phase 2: star_velocity 계산 (이전 데이터와 비교)
+                prev_stars = existing_project.stars or 0
+                star_velocity = project_data.get("stars", 0) - prev_stars
+                if star_velocity > 0:
+                    print(f"📈 Star velocity for {project_data['repo_name']}: +{star_velocity}")
+
+            row = {
+                "repo_name": project_data.get("repo_name"),
+                "owner": project_data.get("owner"),
+                "name": project_data.get("name"),
+                "description": project_data.get("description"),
+                "url": project_data.get("url"),
+                "homepage": project_data.get("homepage"),
+                "language": project_data.get("language"),
+                "stars": project_data.get("stars", 0),
+                "forks": project_data.get("forks", 0),
+                "watchers": project_data.get("watchers", 0),
+                "open_issues": project_data.get("open_issues", 0),
+                "topics": project_data.get("topics", []),
+                "license": project_data.get("license"),
+                "created_at_github": project_data.get("created_at_github"),
+                "updated_at_github": project_data.get("updated_at_github"),
+                "pushed_at": project_data.get("pushed_at"),
+                "is_trending": True,
+            }
+            if has_archive_columns:
+                row["is_archived"] = False
+                row["archived_at"] = None
+            rows.append(row)
+
+        # 기존 항목은 스타/포크 등 지표와 트렌딩/아카이브 상태만 갱신
+        try:
+            stats = await bulk_upsert(
+                db,
+                GitHubProject,
+                rows,
+                key="repo_name",
+                update_columns=[
+                    "stars",
+                    "forks",
+                    "watchers",
+                    "open_issues",
+                    "is_trending",
+                    "is_archived",
+                    "archived_at",
+                ],
+                existing=existing_projects,
+            )
+            await db.commit()
+        except Exception as e:
+            await db.rollback()
+            print(f"❌ 프로젝트 저장 실패: {e}")
+            return 0
 
-        return saved_count
+        self.last_upsert_stats = stats
+        print(
+            f"💾 GitHub 저장 결과: 신규 {stats.inserted} / 갱신 {stats.updated} / 건너뜀 {stats.skipped}"
+        )
+        return stats.inserted
 
     async def get_projects(
         self,
@@ -369,6 +380,7 @@ class GitHubService:
         trending_only: bool = False,
         language: Optional[str] = None,
         include_archived: bool = False,
+        cursor: Optional[str] = None,
     ) -> List[GitHubProject]:
         """
         데이터베이스에서 프로젝트 목록 가져오기
@@ -379,6 +391,7 @@ class GitHubService:
             limit: 가져올 개수
             trending_only: 트렌딩 프로젝트만 가져올지 여부
             language: 프로그래밍 언어 필터
+            cursor: 키셋 cursor (지정 시 skip 대신 `(정렬키, id)` 기준 조회)
 
         Returns:
             프로젝트 목록
@@ -395,14 +408,19 @@ class GitHubService:
         if language:
             query = query.where(GitHubProject.language == language)
 
-        query = (
-            query.order_by(
-                desc(GitHubProject.updated_at_github),
-                desc(GitHubProject.stars),
+        if cursor is not None:
+            query = apply_keyset(
+                query, GitHubProject.updated_at_github, GitHubProject.id, cursor
+            ).limit(limit)
+        else:
+            query = (
+                query.order_by(
+                    desc(GitHubProject.updated_at_github),
+                    desc(GitHubProject.stars),
+                )
+                .offset(skip)
+                .limit(limit)
             )
-            .offset(skip)
-            .limit(limit)
-        )
 
         result = await db.execute(query)
         return result.scalars().all()
@@ -1,15 +1,15 @@
 """Hugging Face 데이터 수집 서비스"""
-import httpx
 from typing import List, Dict, Any, Optional
 from datetime import datetime, timezone
 import logging
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
 
 from app.config import get_settings
+from app.http_client import http_client
+from app.bulk_upsert import bulk_upsert, prefetch_existing
 from app.db_compat import has_column, has_columns
 from app.models.huggingface import HuggingFaceModel
-from app.services.ai_summary_service import AISummaryService
+from app.services.summary_queue_service import enqueue_missing_summaries
 
 settings = get_settings()
 logger = logging.getLogger(__name__)
@@ -110,7 +110,7 @@ class HuggingFaceService:
         if task:
             params["pipeline_tag"] = task
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
+        async with http_client("huggingface") as client:
             try:
                 response = await client.get(
                     HF_MODELS_ENDPOINT,
@@ -146,7 +146,7 @@ class HuggingFaceService:
         if task:
             params["pipeline_tag"] = task
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
+        async with http_client("huggingface") as client:
             try:
                 response = await client.get(
                     HF_MODELS_ENDPOINT,
@@ -244,9 +244,6 @@ class HuggingFaceService:
         Returns:
             저장된 모델 개수
         """
-        saved_count = 0
-        ai_service = AISummaryService()
-        can_summarize = await ai_service.can_summarize()
         column_flags = await has_columns(
             db,
             "huggingface_models",
@@ -257,60 +254,58 @@ class HuggingFaceService:
             column_flags["is_archived"] and column_flags["archived_at"]
         )
 
+        parsed_models = []
         for model_data in models_data:
             parsed_data = self.parse_model_data(model_data)
             if not has_task_ko_column:
                 parsed_data.pop("task_ko", None)
+            parsed_models.append(parsed_data)
 
-            # 기존 모델 확인
-            query = select(HuggingFaceModel).where(
-                HuggingFaceModel.model_id == parsed_data["model_id"]
-            )
-            result = await db.execute(query)
-            existing_model = result.scalar_one_or_none()
-
-            if existing_model:
-                # 업데이트
-                for key, value in parsed_data.items():
-                    if hasattr(existing_model, key):
-                        setattr(existing_model, key, value)
-                existing_model.is_trending = is_trending
-                if has_archive_columns:
-                    existing_model.is_archived = False
-                    existing_model.archived_at = None
-                existing_model.collected_at = datetime.now(timezone.utc)
-                # 기존 모델에 한글 요약이 없으면 생성
-                if can_summarize and not getattr(existing_model, "summary", None):
-                    summary_data = await ai_service.summarize_huggingface_model(
-                        model_name=existing_model.model_id,
-                        description=existing_model.description,
-                        task=existing_model.task,
-                        tags=existing_model.tags or [],
-                    )
-                    if summary_data.get("summary"):
-                        existing_model.summary = summary_data["summary"]
-            else:
-                # Gemini 한글 요약 생성
-                if can_summarize:
-                    summary_data = await ai_service.summarize_huggingface_model(
-                        model_name=parsed_data.get("model_id", ""),
-                        description=parsed_data.get("description"),
-                        task=parsed_data.get("task"),
-                        tags=parsed_data.get("tags", []),
-                    )
-                    if summary_data.get("summary"):
-                        parsed_data["summary"] = summary_data["summary"]
-
-                # 새로 생성
-                new_model = HuggingFaceModel(
-                    **parsed_data,
-                    is_trending=is_trending,
-                )
-                db.add(new_model)
-                saved_count += 1
+        existing_models = await prefetch_existing(
+            db,
+            HuggingFaceModel,
+            "model_id",
+            (parsed_data["model_id"] for parsed_data in parsed_models),
+        )
 
+        rows = []
+        collected_at = datetime.now(timezone.utc)
+        for parsed_data in parsed_models:
+            row = {
+                **parsed_data,
+                "is_trending": is_trending,
+                "collected_at": collected_at,
+                "summary": None,
+            }
+            if has_archive_columns:
+                row["is_archived"] = False
+                row["archived_at"] = None
+            rows.append(row)
+
+        stats = await bulk_upsert(
+            db,
+            HuggingFaceModel,
+            rows,
+            key="model_id",
+            update_columns=[
+                *(parsed_models[0].keys() if parsed_models else ()),
+                "is_trending",
+                "collected_at",
+                "is_archived",
+                "archived_at",
+            ],
+            coalesce_columns=["summary"],
+            existing=existing_models,
+        )
+        # 한글 요약이 없는 모델은 요약 큐에 등록 (summary_jobs 워커가 처리)
+        await enqueue_missing_summaries(db, "huggingface")
         await db.commit()
-        return saved_count
+
+        self.last_upsert_stats = stats
+        print(
+            f"💾 HuggingFace 저장 결과: 신규 {stats.inserted} / 갱신 {stats.updated} / 건너뜀 {stats.skipped}"
+        )
+        return stats.inserted
 
     async def collect_trending_models(
         self,
@@ -3,13 +3,17 @@ from collections import Counter
 from datetime import datetime, timezone
 from typing import List, Dict, Any
 import html
+import json
 import re
 import logging
 
-import httpx
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.bulk_upsert import bulk_upsert, prefetch_existing
+from app.executors import run_parse
+from app.http_client import http_client
+from app.keyword_matcher import KeywordMatcher
 from app.models.job_trend import AIJobTrend
 from app.services.keyword_extraction_service import get_keyword_extractor
 
@@ -135,6 +139,11 @@ class JobTrendService:
         "anthropic",
     }
 
+    # 규칙 테이블별 1회 컴파일 (짧은 키워드는 단어 단위: "rag"가 "storage"에 걸리지 않음)
+    _AI_KEYWORD_MATCHER = KeywordMatcher(AI_KEYWORDS)
+    _CATEGORY_MATCHER = KeywordMatcher(CATEGORY_KEYWORDS)
+    _SKILL_MATCHER = KeywordMatcher(sorted(COMMON_SKILLS))
+
     def __init__(self):
         self.remoteok_api_url = "https://remoteok.com/api"
         self.keyword_extractor = get_keyword_extractor()
@@ -165,11 +174,8 @@ class JobTrendService:
         description: str,
         skills: List[str],
     ) -> str:
-        text = " ".join([title or "", description or "", " ".join(skills or [])]).lower()
-        for category, keywords in self.CATEGORY_KEYWORDS.items():
-            if any(keyword in text for keyword in keywords):
-                return category
-        return "ai_sw"
+        text = " ".join([title or "", description or "", " ".join(skills or [])])
+        return self._CATEGORY_MATCHER.first_label(text) or "ai_sw"
 
     def _extract_skills(self, description: str, tags: List[str]) -> List[str]:
         """설명과 태그에서 기술 스택 추출."""
@@ -179,10 +185,8 @@ class JobTrendService:
             if tag_lower in self.COMMON_SKILLS:
                 found.add(self._normalize_skill(tag_lower))
 
-        lowered = (description or "").lower()
-        for skill in self.COMMON_SKILLS:
-            if skill in lowered:
-                found.add(self._normalize_skill(skill))
+        for skill in self._SKILL_MATCHER.find_all(description):
+            found.add(self._normalize_skill(skill))
         return sorted(list(found))[:15]
 
     @staticmethod
@@ -196,63 +200,67 @@ class JobTrendService:
         cleaned = re.sub(r"\s+", " ", cleaned).strip()
         return cleaned
 
+    def _parse_remoteok_listings(self, content: bytes, max_results: int) -> List[Dict[str, Any]]:
+        """RemoteOK 응답 본문에서 AI/ML 공고만 골라 저장용 딕셔너리로 변환."""
+        data = json.loads(content)
+        job_listings = data[1:] if isinstance(data, list) and len(data) > 1 else []
+
+        jobs: List[Dict[str, Any]] = []
+        for job in job_listings:
+            position = (job.get("position", "") or "").lower()
+            raw_description = self.strip_html(job.get("description", "") or "")
+            description = raw_description.lower()
+            tags = [str(tag).lower() for tag in (job.get("tags") or [])]
+
+            combined_text = f"{position} {description} {' '.join(tags)}"
+            if not self._AI_KEYWORD_MATCHER.contains_any(combined_text):
+                continue
+
+            salary_min = int(job.get("salary_min")) if job.get("salary_min") else None
+            salary_max = int(job.get("salary_max")) if job.get("salary_max") else None
+            skills = self._extract_skills(description, job.get("tags", []))
+            role_category = self.classify_role_category(
+                title=job.get("position", ""),
+                description=raw_description,
+                skills=skills,
+            )
+
+            jobs.append(
+                {
+                    "job_title": job.get("position", "Unknown"),
+                    "company_name": job.get("company", "미공개"),
+                    "description": raw_description[:1200],
+                    "location": job.get("location", "Remote"),
+                    "is_remote": True,
+                    "salary_min": salary_min,
+                    "salary_max": salary_max,
+                    "required_skills": skills,
+                    "job_url": job.get(
+                        "url",
+                        f"https://remoteok.com/remote-jobs/{job.get('id', '')}",
+                    ),
+                    "is_trending": True,
+                    "role_category": role_category,
+                    "posted_date": datetime.now(timezone.utc),
+                }
+            )
+
+            if len(jobs) >= max_results:
+                break
+
+        return jobs
+
     async def fetch_remoteok_jobs(self, max_results: int = 100) -> List[Dict[str, Any]]:
         """RemoteOK API에서 AI/ML 채용 공고 수집."""
         jobs: List[Dict[str, Any]] = []
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
+            async with http_client("jobs") as client:
                 headers = {"User-Agent": "Mozilla/5.0 (compatible; AITrendTracker/1.0)"}
                 response = await client.get(self.remoteok_api_url, headers=headers)
                 response.raise_for_status()
 
-                data = response.json()
-                job_listings = data[1:] if isinstance(data, list) and len(data) > 1 else []
-
-                for job in job_listings:
-                    position = (job.get("position", "") or "").lower()
-                    raw_description = self.strip_html(job.get("description", "") or "")
-                    description = raw_description.lower()
-                    tags = [str(tag).lower() for tag in (job.get("tags") or [])]
-
-                    combined_text = f"{position} {description} {' '.join(tags)}"
-                    is_ai_related = any(
-                        keyword in combined_text
-                        for keyword in self.AI_KEYWORDS
-                    )
-                    if not is_ai_related:
-                        continue
-
-                    salary_min = int(job.get("salary_min")) if job.get("salary_min") else None
-                    salary_max = int(job.get("salary_max")) if job.get("salary_max") else None
-                    skills = self._extract_skills(description, job.get("tags", []))
-                    role_category = self.classify_role_category(
-                        title=job.get("position", ""),
-                        description=raw_description,
-                        skills=skills,
-                    )
-
-                    jobs.append(
-                        {
-                            "job_title": job.get("position", "Unknown"),
-                            "company_name": job.get("company", "미공개"),
-                            "description": raw_description[:1200],
-                            "location": job.get("location", "Remote"),
-                            "is_remote": True,
-                            "salary_min": salary_min,
-                            "salary_max": salary_max,
-                            "required_skills": skills,
-                            "job_url": job.get(
-                                "url",
-                                f"https://remoteok.com/remote-jobs/{job.get('id', '')}",
-                            ),
-                            "is_trending": True,
-                            "role_category": role_category,
-                            "posted_date": datetime.now(timezone.utc),
-                        }
-                    )
-
-                    if len(jobs) >= max_results:
-                        break
+                # JSON 디코딩·HTML 정리·분류는 CPU 작업이므로 parse 실행기에서
+                jobs = await run_parse(self._parse_remoteok_listings, response.content, max_results)
 
             print(f"  ✅ RemoteOK에서 {len(jobs)}개 AI/ML 채용 공고 수집")
         except Exception as e:
@@ -313,7 +321,7 @@ class JobTrendService:
                 if normalized:
                     counter[normalized] += 1
 
-        for keyword, count in self.keyword_extractor.extract_trending_keywords(
+        for keyword, count in await self.keyword_extractor.extract_trending_keywords_async(
             descriptions,
             top_k=max(10, limit * 2),
             per_text_limit=6,
@@ -328,27 +336,36 @@ class JobTrendService:
         ]
 
     async def save_to_db(self, items: List[Dict], db: AsyncSession) -> int:
-        """데이터베이스에 저장."""
-        saved = 0
+        """데이터베이스에 저장 (job_url 기준 벌크 업서트)."""
+        existing_jobs = await prefetch_existing(
+            db, AIJobTrend, "job_url", (item.get("job_url") for item in items)
+        )
+
+        targets = []
         for item in items:
             if item.get("description"):
                 item["description"] = self.strip_html(item["description"])
+            if item.get("job_url"):
+                targets.append(item)
 
-            url = item.get("job_url")
-            if not url:
-                continue
-
-            extracted_keywords = self.keyword_extractor.extract_keywords(
+        # 공고 전체를 한 번에 배치 추출 (입력 순서 유지)
+        extracted_batch = await self.keyword_extractor.extract_keywords_batch_async(
+            [
                 " ".join(
                     [
                         item.get("job_title", "") or "",
                         item.get("description", "") or "",
                         " ".join(item.get("required_skills", []) or []),
                     ]
-                ),
-                top_k=8,
-            )
+                )
+                for item in targets
+            ],
+            top_k=8,
+        )
 
+        rows = []
+        for item, extracted_keywords in zip(targets, extracted_batch):
+            url = item["job_url"]
             role_category = item.get("role_category") or self.classify_role_category(
                 title=item.get("job_title", ""),
                 description=item.get("description", ""),
@@ -358,31 +375,30 @@ class JobTrendService:
             payload.pop("role_category", None)  # DB 컬럼 미존재 환경 호환
             payload["company_name"] = payload.get("company_name") or "미공개"
 
-            result = await db.execute(
-                select(AIJobTrend).where(AIJobTrend.job_url == url)
-            )
-            existing = result.scalar_one_or_none()
-            if existing:
-                for key, value in payload.items():
-                    if hasattr(existing, key) and value is not None:
-                        setattr(existing, key, value)
-
-                if existing.description:
-                    existing.description = self.strip_html(existing.description)
-
-                keywords = set(existing.keywords or [])
-                keywords.add(self.JOB_CATEGORIES.get(role_category, role_category))
-                keywords.update(extracted_keywords)
-                existing.keywords = list(keywords)[:20]
-                continue
-
-            payload_keywords = payload.get("keywords") or []
-            payload_keywords.append(self.JOB_CATEGORIES.get(role_category, role_category))
-            payload_keywords.extend(extracted_keywords)
-            payload["keywords"] = list(dict.fromkeys(payload_keywords))[:20]
-
-            db.add(AIJobTrend(**payload))
-            saved += 1
-
+            # 기존 공고는 저장된 키워드를 먼저 유지하고 새 키워드를 덧붙임
+            stored_keywords = existing_jobs[url].keywords if url in existing_jobs else None
+            payload["keywords"] = list(
+                dict.fromkeys(
+                    [
+                        *(stored_keywords or []),
+                        *(payload.get("keywords") or []),
+                        self.JOB_CATEGORIES.get(role_category, role_category),
+                        *extracted_keywords,
+                    ]
+                )
+            )[:20]
+            rows.append(payload)
+
+        # 기존 항목은 값이 있는 필드만 갱신
+        stats = await bulk_upsert(
+            db,
+            AIJobTrend,
+            rows,
+            key="job_url",
+            coalesce_columns=[column for row in rows for column in row if column != "job_url"],
+            existing=existing_jobs,
+        )
         await db.commit()
-        return saved
+        stats.skipped += len(items) - len(rows)
+        self.last_upsert_stats = stats
+        return stats.inserted
@@ -1,15 +1,76 @@
 """키워드 추출 서비스 (KeyBERT + spaCy + KoNLPy + 폴백)."""
 from __future__ import annotations
 
-from collections import Counter
+from collections import Counter, OrderedDict
 from functools import lru_cache
+import hashlib
+import importlib.util
 import logging
 import os
 import re
-from typing import Iterable, List, Optional, Tuple
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from app.cache import (
+    KEYWORD_MEMO_PREFIX,
+    TTL_KEYWORD_MEMO,
+    cache_get_many,
+    cache_set_many,
+)
+from app.executors import run_nlp
 
 logger = logging.getLogger(__name__)
 
+_WHITESPACE_RE = re.compile(r"\s+")
+_KO_TOKEN_RE = re.compile(r"[가-힣]{2,}")
+_EN_TOKEN_RE = re.compile(r"[A-Za-z][A-Za-z0-9+#._-]{1,}")
+
+# 추출 규칙(불용어·정규식·랭킹)이 바뀌면 올려서 기존 메모를 무효화
+KEYWORD_MEMO_VERSION = "v1"
+
+
+class KeywordMemo:
+    """키워드 추출 결과 LRU (프로세스 메모리) + 계층별 적중 집계."""
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = max(1, maxsize)
+        self._entries: "OrderedDict[str, List[str]]" = OrderedDict()
+        self._lock = threading.Lock()  # 동기 경로는 실행기 스레드에서도 호출됨
+        self.l1_hits = 0
+        self.l2_hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Optional[List[str]]:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def put(self, key: str, value: List[str]) -> None:
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.l1_hits = self.l2_hits = self.misses = 0
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.l1_hits + self.l2_hits + self.misses
+        hits = self.l1_hits + self.l2_hits
+        return {
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "l1_hits": self.l1_hits,
+            "l2_hits": self.l2_hits,
+            "misses": self.misses,
+            "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+        }
+
 
 class KeywordExtractionService:
     """텍스트에서 핵심 키워드를 추출한다.
@@ -43,6 +104,10 @@ class KeywordExtractionService:
     }
 
     def __init__(self) -> None:
+        # KeyBERT 임베딩 / spaCy `nlp.pipe` 1회에 넣는 문서 수
+        self.batch_size = max(1, int(os.getenv("KEYWORD_BATCH_SIZE", "64")))
+        self.memo = KeywordMemo(int(os.getenv("KEYWORD_MEMO_SIZE", "4096")))
+        self.backend_signature = self._backend_signature()
         self._initialized = False
         self._keybert = None
         self._spacy_nlp = None
@@ -80,9 +145,34 @@ class KeywordExtractionService:
         except Exception as e:
             logger.info("KeywordExtractor: KoNLPy Mecab unavailable (%s)", e)
 
+    @staticmethod
+    def _backend_signature() -> str:
+        """설치된 백엔드·모델 구성 지문 (메모 키 구성요소).
+
+        모델을 로드하지 않고 판단하므로 NLP를 워커 프로세스에서 돌려도 부모와 같은 값.
+        """
+        parts = []
+        if importlib.util.find_spec("keybert") is not None:
+            parts.append(f"keybert={os.getenv('KEYBERT_MODEL', 'all-MiniLM-L6-v2')}")
+        if importlib.util.find_spec("spacy") is not None:
+            parts.append(f"spacy={os.getenv('SPACY_MODEL', 'ko_core_news_sm')}")
+        if importlib.util.find_spec("konlpy") is not None:
+            parts.append("mecab")
+        parts.append("regex")
+        return "+".join(parts)
+
+    def memo_key(self, text: str, top_k: int) -> str:
+        """(정규화 텍스트 SHA-256, top_k, 백엔드 구성) 메모 키."""
+        normalized = _WHITESPACE_RE.sub(" ", text).strip()
+        digest = hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+        return (
+            f"{KEYWORD_MEMO_PREFIX}:{KEYWORD_MEMO_VERSION}:"
+            f"{self.backend_signature}:{top_k}:{digest}"
+        )
+
     @staticmethod
     def _normalize_keyword(keyword: str) -> str:
-        cleaned = re.sub(r"\s+", " ", (keyword or "").strip())
+        cleaned = _WHITESPACE_RE.sub(" ", (keyword or "").strip())
         cleaned = cleaned.strip(".,:;!?'\"()[]{}")
         return cleaned
 
@@ -100,8 +190,8 @@ class KeywordExtractionService:
         if not text:
             return []
 
-        ko_tokens = re.findall(r"[가-힣]{2,}", text)
-        en_tokens = re.findall(r"[A-Za-z][A-Za-z0-9+#._-]{1,}", text)
+        ko_tokens = _KO_TOKEN_RE.findall(text)
+        en_tokens = _EN_TOKEN_RE.findall(text)
 
         return [*ko_tokens, *en_tokens]
 
@@ -122,38 +212,101 @@ class KeywordExtractionService:
         """단일 텍스트에서 핵심 키워드 추출."""
         if not text:
             return []
+        return self.extract_keywords_batch([text], top_k=top_k)[0]
 
-        self._lazy_init()
-        candidates: List[str] = []
-
-        if self._keybert is not None:
+    def _keybert_candidates(self, docs: List[str], top_k: int) -> List[List[str]]:
+        """KeyBERT 배치 API — 문서·후보 구문 임베딩을 청크당 1회 행렬 연산으로 계산."""
+        results: List[List[str]] = []
+        for start in range(0, len(docs), self.batch_size):
+            chunk = docs[start:start + self.batch_size]
             try:
                 keyphrases = self._keybert.extract_keywords(
-                    text,
+                    chunk,
                     keyphrase_ngram_range=(1, 2),
                     use_mmr=True,
                     diversity=0.5,
                     top_n=max(8, top_k * 2),
                 )
-                candidates.extend([phrase for phrase, _score in keyphrases])
+                # 문서가 1개면 KeyBERT는 중첩되지 않은 리스트를 반환
+                if len(chunk) == 1:
+                    keyphrases = [keyphrases]
+                results.extend([phrase for phrase, _score in doc] for doc in keyphrases)
             except Exception as e:
                 logger.debug("KeyBERT extraction failed: %s", e)
+                results.extend([] for _ in chunk)
+        return results
 
-        if self._spacy_nlp is not None:
-            try:
-                doc = self._spacy_nlp(text)
-                candidates.extend([ent.text for ent in doc.ents])
-            except Exception as e:
-                logger.debug("spaCy extraction failed: %s", e)
+    def _spacy_candidates(self, docs: List[str]) -> List[List[str]]:
+        try:
+            return [
+                [ent.text for ent in doc.ents]
+                for doc in self._spacy_nlp.pipe(docs, batch_size=self.batch_size)
+            ]
+        except Exception as e:
+            logger.debug("spaCy extraction failed: %s", e)
+            return [[] for _ in docs]
 
-        if self._mecab is not None:
+    def _mecab_candidates(self, docs: List[str]) -> List[List[str]]:
+        results: List[List[str]] = []
+        for doc in docs:
             try:
-                candidates.extend(self._mecab.nouns(text))
+                results.append(self._mecab.nouns(doc))
             except Exception as e:
                 logger.debug("Mecab extraction failed: %s", e)
+                results.append([])
+        return results
+
+    def extract_keywords_batch(
+        self, texts: Sequence[Optional[str]], top_k: int = 10
+    ) -> List[List[str]]:
+        """여러 텍스트의 키워드를 한 번에 추출 (입력 순서대로, 빈 텍스트는 빈 리스트).
+
+        메모(LRU)에 없는 문서만 KeyBERT 배치 임베딩·spaCy `nlp.pipe`로 묶어 처리.
+        """
+        results: List[List[str]] = [[] for _ in texts]
+        pending: Dict[str, List[int]] = {}
+        for index, text in enumerate(texts):
+            if not text:
+                continue
+            key = self.memo_key(text, top_k)
+            cached = self.memo.get(key)
+            if cached is not None:
+                self.memo.l1_hits += 1
+                results[index] = list(cached)
+            else:
+                pending.setdefault(key, []).append(index)
+
+        if pending:
+            self.memo.misses += len(pending)
+            keys = list(pending)
+            extracted = self._extract_uncached([texts[pending[key][0]] for key in keys], top_k)
+            for key, keywords in zip(keys, extracted):
+                self.memo.put(key, keywords)
+                for index in pending[key]:
+                    results[index] = list(keywords)
+        return results
+
+    def _extract_uncached(self, docs: List[str], top_k: int) -> List[List[str]]:
+        """메모를 거치지 않고 문서 목록(빈 문자열 없음)의 키워드를 추출."""
+        self._lazy_init()
+        candidates: List[List[str]] = [[] for _ in docs]
 
-        candidates.extend(self._regex_keywords(text))
-        return self._rank_keywords(candidates, top_k=top_k)
+        backends = []
+        if self._keybert is not None:
+            backends.append(self._keybert_candidates(docs, top_k))
+        if self._spacy_nlp is not None:
+            backends.append(self._spacy_candidates(docs))
+        if self._mecab is not None:
+            backends.append(self._mecab_candidates(docs))
+        for backend_candidates in backends:
+            for doc_candidates, extracted in zip(candidates, backend_candidates):
+                doc_candidates.extend(extracted)
+
+        results: List[List[str]] = []
+        for doc, doc_candidates in zip(docs, candidates):
+            doc_candidates.extend(self._regex_keywords(doc))
+            results.append(self._rank_keywords(doc_candidates, top_k=top_k))
+        return results
 
     def extract_trending_keywords(
         self,
@@ -161,10 +314,77 @@ class KeywordExtractionService:
         top_k: int = 10,
         per_text_limit: int = 6,
     ) -> List[Tuple[str, int]]:
-        """복수 텍스트에서 트렌딩 키워드 집계."""
+        """복수 텍스트에서 트렌딩 키워드 집계 (배치 추출)."""
+        counter: Counter[str] = Counter()
+        for keywords in self.extract_keywords_batch(list(texts), top_k=per_text_limit):
+            for keyword in keywords:
+                counter[keyword] += 1
+        return counter.most_common(max(1, top_k))
+
+    async def extract_keywords_async(self, text: Optional[str], top_k: int = 10) -> List[str]:
+        """`extract_keywords`의 비동기 버전 (메모 → Redis → NLP 실행기 순)."""
+        if not text:
+            return []
+        return (await self.extract_keywords_batch_async([text], top_k=top_k))[0]
+
+    async def extract_keywords_batch_async(
+        self, texts: Sequence[Optional[str]], top_k: int = 10
+    ) -> List[List[str]]:
+        """`extract_keywords_batch`의 비동기 버전.
+
+        프로세스 메모리 LRU → Redis(MGET 1회) 순으로 조회하고, 남은 문서만 묶어
+        NLP 실행기로 보냄 (IPC 1회). 새 결과는 LRU와 Redis에 함께 저장.
+        """
+        results: List[List[str]] = [[] for _ in texts]
+        pending: Dict[str, List[int]] = {}
+        for index, text in enumerate(texts):
+            if not text:
+                continue
+            key = self.memo_key(text, top_k)
+            cached = self.memo.get(key)
+            if cached is not None:
+                self.memo.l1_hits += 1
+                results[index] = list(cached)
+            else:
+                pending.setdefault(key, []).append(index)
+        if not pending:
+            return results
+
+        keys = list(pending)
+        stored = await cache_get_many(keys, touch_ttl=TTL_KEYWORD_MEMO)
+        misses = []
+        for key, value in zip(keys, stored):
+            if isinstance(value, list):
+                self.memo.l2_hits += 1
+                self.memo.put(key, value)
+                for index in pending[key]:
+                    results[index] = list(value)
+            else:
+                misses.append(key)
+        if not misses:
+            return results
+
+        self.memo.misses += len(misses)
+        extracted = await run_nlp(
+            _extract_uncached_worker, [texts[pending[key][0]] for key in misses], top_k
+        )
+        fresh = dict(zip(misses, extracted))
+        for key, keywords in fresh.items():
+            self.memo.put(key, keywords)
+            for index in pending[key]:
+                results[index] = list(keywords)
+        await cache_set_many(fresh, ttl=TTL_KEYWORD_MEMO)
+        return results
+
+    async def extract_trending_keywords_async(
+        self,
+        texts: Iterable[str],
+        top_k: int = 10,
+        per_text_limit: int = 6,
+    ) -> List[Tuple[str, int]]:
+        """`extract_trending_keywords`의 비동기 버전 (문서별 메모 재사용)."""
         counter: Counter[str] = Counter()
-        for text in texts:
-            keywords = self.extract_keywords(text, top_k=per_text_limit)
+        for keywords in await self.extract_keywords_batch_async(list(texts), top_k=per_text_limit):
             for keyword in keywords:
                 counter[keyword] += 1
         return counter.most_common(max(1, top_k))
@@ -174,3 +394,7 @@ class KeywordExtractionService:
 def get_keyword_extractor() -> KeywordExtractionService:
     return KeywordExtractionService()
 
+
+# 프로세스 풀 워커 진입점 (pickle 가능한 모듈 함수, 워커 프로세스별 싱글톤 사용)
+def _extract_uncached_worker(docs: List[str], top_k: int) -> List[List[str]]:
+    return get_keyword_extractor()._extract_uncached(docs, top_k)
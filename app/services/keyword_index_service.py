@@ -0,0 +1,68 @@
+"""트렌딩 키워드 집계 (keyword_occurrences 인덱스 기반)
+
+- 전체 데이터셋 기준 GROUP BY 1회로 상위 키워드 집계 (JSON 역직렬화 없음)
+- 정렬: 빈도 내림차순, 동률은 키워드 오름차순 (결정적)
+- `since`로 최근 기간만 집계 가능
+"""
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import distinct, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.keyword_occurrence import KeywordOccurrence
+
+
+async def get_top_keywords(
+    db: AsyncSession,
+    limit: int,
+    since: Optional[datetime] = None,
+) -> Dict[str, Any]:
+    """상위 키워드와 출처 카테고리 목록 반환.
+
+    Returns:
+        {"total_keywords", "unique_keywords", "top_keywords": [{keyword, count, sources}]}
+    """
+    conditions = []
+    if since is not None:
+        conditions.append(KeywordOccurrence.observed_at >= since)
+
+    totals = (
+        await db.execute(
+            select(
+                func.count().label("total"),
+                func.count(distinct(KeywordOccurrence.keyword)).label("unique"),
+            ).where(*conditions)
+        )
+    ).one()
+
+    count_col = func.count().label("count")
+    top_rows = (
+        await db.execute(
+            select(KeywordOccurrence.keyword, count_col)
+            .where(*conditions)
+            .group_by(KeywordOccurrence.keyword)
+            .order_by(count_col.desc(), KeywordOccurrence.keyword.asc())
+            .limit(limit)
+        )
+    ).all()
+
+    sources: Dict[str, List[str]] = {row.keyword: [] for row in top_rows}
+    if sources:
+        source_rows = await db.execute(
+            select(KeywordOccurrence.keyword, KeywordOccurrence.category)
+            .where(KeywordOccurrence.keyword.in_(list(sources)), *conditions)
+            .group_by(KeywordOccurrence.keyword, KeywordOccurrence.category)
+            .order_by(KeywordOccurrence.category.asc())
+        )
+        for keyword, category in source_rows:
+            sources[keyword].append(category)
+
+    return {
+        "total_keywords": int(totals.total or 0),
+        "unique_keywords": int(totals.unique or 0),
+        "top_keywords": [
+            {"keyword": row.keyword, "count": int(row.count), "sources": sources[row.keyword]}
+            for row in top_rows
+        ],
+    }
@@ -0,0 +1,299 @@
+"""뉴스 근사 중복 인덱스 (제목 MinHash + LSH 밴딩)
+
+- 지문: 정규화 제목의 단어 + 단어별 문자 3-gram 집합으로 만든 128개 MinHash 서명
+  (짧은 제목은 SimHash 비트 거리로는 재게시·제목 수정과 다른 기사가 잘 갈리지 않아 Jaccard 기반 사용)
+- 인덱스: 서명을 4행짜리 밴드 32개로 나눠 밴드별 버킷에 등록
+  → Jaccard 0.6인 두 제목이 후보가 될 확률 ≈ 99% (1 - (1 - 0.6⁴)³²), 후보만 서명으로 유사도 추정
+- 영속화: `ai_news.minhash`(서명 바이트)/`cluster_id` 컬럼, 프로세스 메모리에는 최근 기사 인덱스를 유지하고
+  이후 다른 프로세스가 저장한 기사는 id 증분 조회로 반영
+- 클러스터 id: 같은 이야기 묶음의 최초 기사 id (첫 기사는 자기 자신).
+  목록에서 중복을 접을 때의 대표는 목록 필터(아카이브·소스·트렌딩)를 통과한 기사 중 가장 이른 기사
+- 서명은 제목만 사용 (본문 앞부분은 넣지 않음): RSS 본문/발췌는 매체마다 길이·머리말·광고 문구가
+  제각각이고 비어 있는 피드도 많아, 섞으면 같은 이야기의 제목 유사도가 희석되어 묶이지 않음
+"""
+from __future__ import annotations
+
+import hashlib
+import html
+import logging
+import random
+import re
+import struct
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from sqlalchemy import bindparam, exists, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+
+from app.models.news import AINews
+
+logger = logging.getLogger(__name__)
+
+MINHASH_PERMUTATIONS = 128
+LSH_BANDS = 32
+LSH_ROWS = MINHASH_PERMUTATIONS // LSH_BANDS
+JACCARD_THRESHOLD = 0.6  # 서명 일치 비율(추정 Jaccard)이 이 값 이상이면 같은 이야기
+
+NEWS_DEDUP_WINDOW_DAYS = 14  # 메모리 인덱스에 유지하는 기간
+NEWS_DEDUP_MAX_ENTRIES = 20_000
+
+Signature = Tuple[int, ...]
+
+_TAG_RE = re.compile(r"<[^>]+>")
+_BRACKET_RE = re.compile(r"\[[^\]]+\]|\([^)]+\)")
+_NON_WORD_RE = re.compile(r"[^a-z0-9가-힣\s]")
+_WHITESPACE_RE = re.compile(r"\s+")
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+_SIGNATURE_FORMAT = f"<{MINHASH_PERMUTATIONS}I"
+
+# 서명이 DB에 저장되므로 순열 계수는 고정 시드로 생성 (프로세스·배포 간 동일)
+_rng = random.Random(20261017)
+_PERMUTATIONS = [
+    (_rng.randrange(1, _MERSENNE_PRIME), _rng.randrange(0, _MERSENNE_PRIME))
+    for _ in range(MINHASH_PERMUTATIONS)
+]
+del _rng
+
+
+def normalize_text(text: Optional[str]) -> str:
+    """HTML·괄호 머리말·기호를 제거하고 소문자/공백 정규화."""
+    if not text:
+        return ""
+    normalized = html.unescape(_TAG_RE.sub(" ", text)).lower()
+    normalized = _BRACKET_RE.sub(" ", normalized)
+    normalized = _NON_WORD_RE.sub(" ", normalized)
+    return _WHITESPACE_RE.sub(" ", normalized).strip()
+
+
+def shingles(text: str) -> Set[str]:
+    """단어 + 단어별 문자 3-gram (한국어 조사·영문 어형 변화에 덜 민감)."""
+    features: Set[str] = set()
+    for word in text.split():
+        features.add(f"w:{word}")
+        padded = f" {word} "
+        features.update(f"c:{padded[i:i + 3]}" for i in range(len(padded) - 2))
+    return features
+
+
+def minhash_signature(features: Iterable[str]) -> Optional[Signature]:
+    hashes = [
+        int.from_bytes(hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest(), "big")
+        for feature in features
+    ]
+    if not hashes:
+        return None
+    return tuple(
+        min((a * value + b) % _MERSENNE_PRIME for value in hashes) & _MAX_HASH
+        for a, b in _PERMUTATIONS
+    )
+
+
+def news_signature(title: Optional[str]) -> Optional[Signature]:
+    """기사 제목 서명 (정규화 후 제목이 비어 있으면 None)."""
+    normalized_title = normalize_text(title)
+    if not normalized_title:
+        return None
+    return minhash_signature(shingles(normalized_title))
+
+
+def pack_signature(signature: Signature) -> bytes:
+    """`ai_news.minhash` 컬럼 저장용 바이트 (512B)."""
+    return struct.pack(_SIGNATURE_FORMAT, *signature)
+
+
+def unpack_signature(data: Optional[bytes]) -> Optional[Signature]:
+    if not data or len(data) != struct.calcsize(_SIGNATURE_FORMAT):
+        return None  # 순열 수가 바뀐 이전 서명은 버리고 다시 계산
+    return struct.unpack(_SIGNATURE_FORMAT, data)
+
+
+def estimated_jaccard(a: Signature, b: Signature) -> float:
+    return sum(1 for left, right in zip(a, b) if left == right) / MINHASH_PERMUTATIONS
+
+
+def _bands(signature: Signature) -> List[Tuple[int, ...]]:
+    return [signature[band * LSH_ROWS:(band + 1) * LSH_ROWS] for band in range(LSH_BANDS)]
+
+
+@dataclass(frozen=True)
+class DuplicateMatch:
+    item_id: int
+    cluster_id: int
+    source: Optional[str]
+    similarity: float
+
+
+class NearDuplicateIndex:
+    """MinHash LSH 인덱스 (id → 서명/클러스터/소스)."""
+
+    def __init__(
+        self,
+        threshold: float = JACCARD_THRESHOLD,
+        max_entries: int = NEWS_DEDUP_MAX_ENTRIES,
+    ) -> None:
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[int, Tuple[Signature, int, Optional[str]]]" = OrderedDict()
+        self._buckets: List[Dict[Tuple[int, ...], Set[int]]] = [{} for _ in range(LSH_BANDS)]
+        self.last_id = 0
+        self.loaded_at: Optional[datetime] = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def add(self, item_id: int, signature: Signature, cluster_id: int, source: Optional[str] = None) -> None:
+        if item_id in self._entries:
+            self._remove(item_id)
+        self._entries[item_id] = (signature, cluster_id, source)
+        for band, value in enumerate(_bands(signature)):
+            self._buckets[band].setdefault(value, set()).add(item_id)
+        self.last_id = max(self.last_id, item_id)
+        while len(self._entries) > self.max_entries:
+            self._remove(next(iter(self._entries)))
+
+    def _remove(self, item_id: int) -> None:
+        signature, _, _ = self._entries.pop(item_id)
+        for band, value in enumerate(_bands(signature)):
+            bucket = self._buckets[band].get(value)
+            if bucket is not None:
+                bucket.discard(item_id)
+                if not bucket:
+                    del self._buckets[band][value]
+
+    def find(self, signature: Signature, source: Optional[str] = None) -> Optional[DuplicateMatch]:
+        """가장 유사한 근사 중복 (`source`를 주면 같은 소스 항목만)."""
+        candidates: Set[int] = set()
+        for band, value in enumerate(_bands(signature)):
+            candidates |= self._buckets[band].get(value, set())
+
+        best: Optional[DuplicateMatch] = None
+        for item_id in candidates:
+            other, cluster_id, other_source = self._entries[item_id]
+            if source is not None and other_source != source:
+                continue
+            similarity = estimated_jaccard(signature, other)
+            if similarity < self.threshold:
+                continue
+            if best is None or (-similarity, item_id) < (-best.similarity, best.item_id):
+                best = DuplicateMatch(item_id, cluster_id, other_source, similarity)
+        return best
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._buckets = [{} for _ in range(LSH_BANDS)]
+        self.last_id = 0
+        self.loaded_at = None
+
+
+_news_index = NearDuplicateIndex()
+
+
+def cluster_representative_clause(
+    visible: Callable[[Any], Sequence[Any]] = lambda news: (),
+):
+    """클러스터별 대표와 미분류 기사만 남기는 조건 (목록 중복 접기용).
+
+    `visible(news)`는 목록 필터 조건 목록 — 같은 조건을 통과한 같은 클러스터 기사 중
+    더 이른(id가 작은) 기사가 없으면 대표. 최초 기사가 아카이브되거나 필터로 빠져도
+    나머지 기사가 함께 사라지지 않음.
+    """
+    earlier = aliased(AINews)
+    return or_(
+        AINews.cluster_id.is_(None),
+        ~exists().where(
+            earlier.cluster_id == AINews.cluster_id,
+            earlier.id < AINews.id,
+            *visible(earlier),
+        ),
+    )
+
+
+def invalidate_news_index() -> None:
+    """저장 실패(롤백) 시 메모리 인덱스를 버려 다음 사용 때 DB에서 다시 적재."""
+    _news_index.clear()
+
+
+async def warm_news_index(db: AsyncSession) -> NearDuplicateIndex:
+    """메모리 인덱스 준비 (최초 1회 최근 기사 적재, 이후 id 증분만 조회).
+
+    서명이 없는 최근 기사(마이그레이션 이전 데이터)는 여기서 서명·클러스터를 채움 (커밋은 호출자).
+    """
+    index = _news_index
+    query = select(AINews.id, AINews.minhash, AINews.cluster_id, AINews.source).where(
+        AINews.minhash.isnot(None)
+    )
+    if index.loaded_at is None:
+        since = datetime.now(timezone.utc) - timedelta(days=NEWS_DEDUP_WINDOW_DAYS)
+        query = query.where(AINews.created_at >= since)
+    else:
+        query = query.where(AINews.id > index.last_id)
+
+    for item_id, data, cluster_id, source in (await db.execute(query.order_by(AINews.id))).all():
+        signature = unpack_signature(data)
+        if signature is not None:
+            index.add(item_id, signature, cluster_id or item_id, source)
+
+    if index.loaded_at is None:
+        await _backfill_recent(db, index)
+        index.loaded_at = datetime.now(timezone.utc)
+        logger.info("뉴스 중복 인덱스 적재: %d건", len(index))
+    return index
+
+
+async def _backfill_recent(db: AsyncSession, index: NearDuplicateIndex) -> None:
+    since = datetime.now(timezone.utc) - timedelta(days=NEWS_DEDUP_WINDOW_DAYS)
+    rows = (
+        await db.execute(
+            select(AINews.id, AINews.title, AINews.source)
+            .where(AINews.minhash.is_(None), AINews.created_at >= since)
+            .order_by(AINews.id)
+        )
+    ).all()
+    if not rows:
+        return
+    assignments = assign_clusters(
+        index,
+        ((item_id, news_signature(title), source) for item_id, title, source in rows),
+    )
+    await save_cluster_assignments(db, assignments)
+    logger.info("뉴스 서명 백필: %d건", len(assignments))
+
+
+def assign_clusters(
+    index: NearDuplicateIndex,
+    items: Iterable[Tuple[int, Optional[Signature], Optional[str]]],
+) -> List[Tuple[int, Signature, int]]:
+    """(id, 서명, 소스)를 id 순으로 인덱스에 넣으며 클러스터 지정 → [(id, 서명, cluster_id)]."""
+    assignments = []
+    for item_id, signature, source in sorted(items, key=lambda item: item[0]):
+        if signature is None:
+            continue
+        match = index.find(signature)
+        cluster_id = match.cluster_id if match else item_id
+        index.add(item_id, signature, cluster_id, source)
+        assignments.append((item_id, signature, cluster_id))
+    return assignments
+
+
+async def save_cluster_assignments(
+    db: AsyncSession, assignments: List[Tuple[int, Signature, int]]
+) -> None:
+    """서명·클러스터 id를 executemany UPDATE 1회로 저장 (커밋하지 않음)."""
+    if not assignments:
+        return
+    stmt = (
+        update(AINews.__table__)
+        .where(AINews.__table__.c.id == bindparam("b_id"))
+        .values(minhash=bindparam("b_minhash"), cluster_id=bindparam("b_cluster_id"))
+    )
+    await db.execute(
+        stmt,
+        [
+            {"b_id": item_id, "b_minhash": pack_signature(signature), "b_cluster_id": cluster_id}
+            for item_id, signature, cluster_id in assignments
+        ],
+    )
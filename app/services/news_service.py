@@ -1,22 +1,57 @@
 """AI 뉴스/블로그 RSS 피드 서비스"""
-import httpx
-import feedparser
 from typing import List, Dict, Any, Optional
 from datetime import datetime, timezone
-from difflib import SequenceMatcher
-import re
 import logging
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, desc
 from app.models.news import AINews
 from app.schemas.news import AINewsCreate
+from app.bulk_upsert import bulk_upsert, prefetch_existing
 from app.db_compat import has_archive_column, has_columns
-from app.services.ai_summary_service import AISummaryService
+from app.keyword_matcher import KeywordMatcher
+from app.pagination import apply_keyset
+from app.services.feed_fetch_service import (
+    FEED_STATUS_NOT_MODIFIED,
+    FEED_STATUS_OK,
+    FeedFetchResult,
+    fetch_feeds,
+    stage_feed_validators,
+)
+from app.services.news_dedup_service import (
+    NearDuplicateIndex,
+    assign_clusters,
+    cluster_representative_clause,
+    invalidate_news_index,
+    news_signature,
+    pack_signature,
+    save_cluster_assignments,
+    unpack_signature,
+    warm_news_index,
+)
+from app.services.summary_queue_service import enqueue_missing_summaries
 from app.services.keyword_extraction_service import get_keyword_extractor
 
 logger = logging.getLogger(__name__)
 
 
+def news_list_filters(
+    news: Any,
+    *,
+    include_archived: bool = False,
+    trending_only: bool = False,
+    source: Optional[str] = None,
+) -> List[Any]:
+    """목록·건수·클러스터 대표 선정에 공통으로 쓰는 필터 (`news`는 AINews 또는 그 별칭)."""
+    filters = []
+    if not include_archived:
+        filters.append(news.is_archived == False)
+    if trending_only:
+        filters.append(news.is_trending == True)
+    if source:
+        filters.append(news.source == source)
+    return filters
+
+
 def _log_print(*args, **kwargs):
     sep = kwargs.get("sep", " ")
     message = sep.join(str(arg) for arg in args)
@@ -163,13 +198,14 @@ class NewsService:
         ],
     }
 
+    # 규칙 테이블별 1회 컴파일 (짧은 영문 키워드는 단어 단위: "lg"가 "algorithm"에 걸리지 않음)
+    _AI_KEYWORD_MATCHER = KeywordMatcher(AI_KEYWORDS_FILTER)
+    _TOPIC_MATCHER = KeywordMatcher(NEWS_TOPIC_RULES)
+
     @classmethod
     def classify_news_topic(cls, title: str, content: str = "") -> str:
         """뉴스 제목과 본문에서 토픽 카테고리를 자동분류."""
-        text = f"{title or ''} {content or ''}".lower()
-        scores: Dict[str, int] = {}
-        for topic, keywords in cls.NEWS_TOPIC_RULES.items():
-            scores[topic] = sum(1 for kw in keywords if kw in text)
+        scores = cls._TOPIC_MATCHER.label_counts(f"{title or ''} {content or ''}")
         best = max(scores, key=scores.get)  # type: ignore[arg-type]
         return best if scores[best] > 0 else "AI 일반"
 
@@ -183,42 +219,9 @@ class NewsService:
         "매일경제 과학기술",
     }
 
-    @staticmethod
-    def _normalize_title(title: str) -> str:
-        """중복 제거를 위한 제목 정규화."""
-        if not title:
-            return ""
-        normalized = title.lower().strip()
-        normalized = re.sub(r"\[[^\]]+\]|\([^)]+\)", " ", normalized)
-        normalized = re.sub(r"[^a-z0-9가-힣\s]", " ", normalized)
-        normalized = re.sub(r"\s+", " ", normalized).strip()
-        return normalized
-
-    @staticmethod
-    def _is_similar_title(a: str, b: str, threshold: float = 0.88) -> bool:
-        """정규화된 제목 유사도 비교."""
-        if not a or not b:
-            return False
-        if a == b:
-            return True
-        return SequenceMatcher(None, a, b).ratio() >= threshold
-
     @classmethod
     def _contains_ai_keywords(cls, text: str) -> bool:
-        normalized = (text or "").lower()
-        if not normalized:
-            return False
-        # Short keywords need word boundary check to avoid false matches
-        for keyword in cls.AI_KEYWORDS_FILTER:
-            if len(keyword) <= 3:
-                # Word boundary: check keyword is surrounded by non-alphanumeric
-                import re as _re
-                if _re.search(r'(?<![a-z])' + _re.escape(keyword) + r'(?![a-z])', normalized):
-                    return True
-            else:
-                if keyword in normalized:
-                    return True
-        return False
+        return cls._AI_KEYWORD_MATCHER.contains_any(text)
 
     @classmethod
     def _is_korean_source(cls, source: Optional[str]) -> bool:
@@ -232,9 +235,78 @@ class NewsService:
             for token in ["전자신문", "블로터", "한국경제", "매일경제", "데일리안", "aitimes"]
         )
 
+    def _entries_to_articles(self, feed: Any, source_name: str) -> List[Dict[str, Any]]:
+        """파싱된 피드의 항목을 기사 딕셔너리로 변환 (최대 15개)."""
+        articles = []
+        for entry in feed.entries[:15]:  # 최대 15개씩
+            # 발행일 파싱
+            published_date = None
+            if hasattr(entry, "published_parsed") and entry.published_parsed:
+                try:
+                    published_date = datetime(*entry.published_parsed[:6], tzinfo=timezone.utc)
+                except Exception:
+                    pass
+            elif hasattr(entry, "updated_parsed") and entry.updated_parsed:
+                try:
+                    published_date = datetime(*entry.updated_parsed[:6], tzinfo=timezone.utc)
+                except Exception:
+                    pass
+
+            # 이미지 URL 추출
+            image_url = None
+            if hasattr(entry, "media_content") and entry.media_content:
+                image_url = entry.media_content[0].get("url")
+            elif hasattr(entry, "media_thumbnail") and entry.media_thumbnail:
+                image_url = entry.media_thumbnail[0].get("url")
+
+            # 저자 추출
+            author = None
+            if hasattr(entry, "author"):
+                author = entry.author
+            elif hasattr(entry, "authors") and entry.authors:
+                author = entry.authors[0].get("name")
+
+            # 태그 추출
+            tags = []
+            if hasattr(entry, "tags"):
+                tags = [tag.term for tag in entry.tags if hasattr(tag, "term")]
+
+            article = {
+                "url": entry.link,
+                "title": entry.title if hasattr(entry, "title") else "",
+                "author": author,
+                "source": source_name,
+                "source_url": feed.feed.link if hasattr(feed.feed, "link") else "",
+                "published_date": published_date,
+                "content": entry.description if hasattr(entry, "description") else None,
+                "excerpt": entry.summary if hasattr(entry, "summary") else None,
+                "image_url": image_url,
+                "tags": tags,
+            }
+
+            articles.append(article)
+
+        return articles
+
+    def _articles_from_result(self, result: FeedFetchResult, source_name: str) -> List[Dict[str, Any]]:
+        if result.status == FEED_STATUS_NOT_MODIFIED:
+            print(f"⏭️  {source_name}: 변경 없음 (304)")
+            return []
+        if result.status != FEED_STATUS_OK:
+            print(f"❌ {source_name} 수집 실패: {result.error}")
+            return []
+
+        try:
+            articles = self._entries_to_articles(result.feed, source_name)
+        except Exception as e:
+            print(f"❌ {source_name} 수집 실패: {e}")
+            return []
+        print(f"✅ {source_name}: {len(articles)}개 뉴스 수집")
+        return articles
+
     async def fetch_rss_feed(self, feed_url: str, source_name: str) -> List[Dict[str, Any]]:
         """
-        RSS 피드에서 뉴스 가져오기
+        RSS 피드에서 뉴스 가져오기 (조건부 요청 — 변경 없으면 빈 리스트)
 
         Args:
             feed_url: RSS 피드 URL
@@ -243,85 +315,24 @@ class NewsService:
         Returns:
             뉴스 아이템 리스트
         """
-        try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.get(feed_url)
-                response.raise_for_status()
-
-                # feedparser로 RSS 파싱
-                feed = feedparser.parse(response.text)
-
-                articles = []
-                for entry in feed.entries[:15]:  # 최대 15개씩
-                    # 발행일 파싱
-                    published_date = None
-                    if hasattr(entry, "published_parsed") and entry.published_parsed:
-                        try:
-                            published_date = datetime(*entry.published_parsed[:6], tzinfo=timezone.utc)
-                        except Exception:
-                            pass
-                    elif hasattr(entry, "updated_parsed") and entry.updated_parsed:
-                        try:
-                            published_date = datetime(*entry.updated_parsed[:6], tzinfo=timezone.utc)
-                        except Exception:
-                            pass
-
-                    # 이미지 URL 추출
-                    image_url = None
-                    if hasattr(entry, "media_content") and entry.media_content:
-                        image_url = entry.media_content[0].get("url")
-                    elif hasattr(entry, "media_thumbnail") and entry.media_thumbnail:
-                        image_url = entry.media_thumbnail[0].get("url")
-
-                    # 저자 추출
-                    author = None
-                    if hasattr(entry, "author"):
-                        author = entry.author
-                    elif hasattr(entry, "authors") and entry.authors:
-                        author = entry.authors[0].get("name")
-
-                    # 태그 추출
-                    tags = []
-                    if hasattr(entry, "tags"):
-                        tags = [tag.term for tag in entry.tags if hasattr(tag, "term")]
-
-                    article = {
-                        "url": entry.link,
-                        "title": entry.title if hasattr(entry, "title") else "",
-                        "author": author,
-                        "source": source_name,
-                        "source_url": feed.feed.link if hasattr(feed.feed, "link") else "",
-                        "published_date": published_date,
-                        "content": entry.description if hasattr(entry, "description") else None,
-                        "excerpt": entry.summary if hasattr(entry, "summary") else None,
-                        "image_url": image_url,
-                        "tags": tags,
-                    }
-
-                    articles.append(article)
-
-                print(f"✅ {source_name}: {len(articles)}개 뉴스 수집")
-                return articles
-
-        except httpx.HTTPStatusError as e:
-            print(f"❌ {source_name} RSS 피드 오류: {e.response.status_code}")
-            return []
-        except Exception as e:
-            print(f"❌ {source_name} 수집 실패: {e}")
-            return []
+        results = await fetch_feeds([feed_url], source="news")
+        self.pending_feed_results = list(results.values())
+        return self._articles_from_result(results[feed_url], source_name)
 
     async def fetch_all_feeds(self) -> List[Dict[str, Any]]:
         """
-        모든 RSS 피드에서 뉴스 수집
+        모든 RSS 피드에서 뉴스 수집 (동시 요청 + 조건부 요청, 304 피드는 파싱 생략)
 
         Returns:
             전체 뉴스 아이템 리스트
         """
-        all_articles = []
+        results = await fetch_feeds(self.RSS_FEEDS.values(), source="news")
+        # 피드 검증자는 save_news_to_db가 기사와 같은 트랜잭션에서 저장
+        self.pending_feed_results = list(results.values())
 
+        all_articles = []
         for source_name, feed_url in self.RSS_FEEDS.items():
-            articles = await self.fetch_rss_feed(feed_url, source_name)
-            all_articles.extend(articles)
+            all_articles.extend(self._articles_from_result(results[feed_url], source_name))
 
         return all_articles
 
@@ -338,61 +349,51 @@ class NewsService:
         Returns:
             저장된 뉴스 수
         """
-        saved_count = 0
-        ai_service = AISummaryService()
         keyword_extractor = get_keyword_extractor()
-        can_summarize = await ai_service.can_summarize()
         column_flags = await has_columns(
             db,
             "ai_news",
-            ["is_archived", "archived_at"],
+            ["is_archived", "archived_at", "minhash", "cluster_id"],
         )
         has_archive_columns = (
             column_flags["is_archived"] and column_flags["archived_at"]
         )
+        has_cluster_columns = column_flags["minhash"] and column_flags["cluster_id"]
 
+        candidates = []
+        skipped = 0
         for article_data in articles:
-            try:
-                filter_text = " ".join(
-                    [
-                        article_data.get("title") or "",
-                        article_data.get("content") or "",
-                        article_data.get("excerpt") or "",
-                        " ".join(article_data.get("tags") or []),
-                    ]
-                )
-                if not self._contains_ai_keywords(filter_text):
-                    continue
+            filter_text = " ".join(
+                [
+                    article_data.get("title") or "",
+                    article_data.get("content") or "",
+                    article_data.get("excerpt") or "",
+                    " ".join(article_data.get("tags") or []),
+                ]
+            )
+            if not article_data.get("url") or not self._contains_ai_keywords(filter_text):
+                skipped += 1
+                continue
+            candidates.append(article_data)
+
+        existing_news_map = await prefetch_existing(
+            db, AINews, "url", (article_data["url"] for article_data in candidates)
+        )
 
-                is_korean_news = self._is_korean_source(article_data.get("source"))
+        # 근사 중복 인덱스 (최근 기사 제목 MinHash, 소스 무관) + 이번 배치 내 판정용 인덱스
+        dedup_index = await warm_news_index(db) if has_cluster_columns else None
+        batch_index = NearDuplicateIndex()
 
-                # 이미 존재하는지 확인
-                result = await db.execute(
-                    select(AINews).where(AINews.url == article_data["url"])
-                )
-                existing_news = result.scalar_one_or_none()
+        rows = []
+        for article_data in candidates:
+            try:
+                existing_news = existing_news_map.get(article_data["url"])
 
                 if existing_news:
                     # 업데이트 (트렌딩 플래그)
                     existing_news.is_trending = True
-                    if (
-                        can_summarize
-                        and (not is_korean_news)
-                        and not existing_news.summary
-                    ):
-                        summary_payload = await ai_service.summarize_news(
-                            title=existing_news.title,
-                            content=existing_news.content or existing_news.excerpt,
-                            source=existing_news.source,
-                        )
-                        if summary_payload.get("summary"):
-                            existing_news.summary = summary_payload["summary"]
-                        if summary_payload.get("keywords"):
-                            existing_news.keywords = summary_payload["keywords"]
-                        if summary_payload.get("key_points"):
-                            existing_news.key_points = summary_payload["key_points"]
                     if not (existing_news.keywords or []):
-                        existing_news.keywords = keyword_extractor.extract_keywords(
+                        existing_news.keywords = await keyword_extractor.extract_keywords_async(
                             " ".join(
                                 [
                                     existing_news.title or "",
@@ -405,85 +406,121 @@ class NewsService:
                     if has_archive_columns:
                         existing_news.is_archived = False
                         existing_news.archived_at = None
-                else:
-                    # 제목 유사도 기반 중복 제거 (동일 소스 최근 데이터 기준)
-                    title = article_data.get("title", "")
-                    normalized_title = self._normalize_title(title)
-                    source = article_data.get("source")
-                    if normalized_title and source:
-                        recent = await db.execute(
-                            select(AINews.title)
-                            .where(AINews.source == source)
-                            .order_by(desc(AINews.published_date))
-                            .limit(80)
-                        )
-                        is_duplicate = False
-                        for recent_title in recent.scalars().all():
-                            if self._is_similar_title(
-                                normalized_title,
-                                self._normalize_title(recent_title or ""),
-                            ):
-                                is_duplicate = True
-                                break
-                        if is_duplicate:
-                            continue
-
-                    summary_payload = None
-                    if can_summarize and not is_korean_news:
-                        summary_payload = await ai_service.summarize_news(
-                            title=article_data.get("title", ""),
-                            content=article_data.get("content") or article_data.get("excerpt"),
-                            source=article_data.get("source"),
-                        )
+                    continue
 
-                    extracted_keywords = keyword_extractor.extract_keywords(
-                        " ".join(
-                            [
-                                article_data.get("title", "") or "",
-                                article_data.get("content") or "",
-                                article_data.get("excerpt") or "",
-                                " ".join(article_data.get("tags") or []),
-                            ]
-                        ),
-                        top_k=8,
-                    )
-                    merged_keywords = list(
-                        dict.fromkeys(
-                            ((summary_payload or {}).get("keywords") or []) + extracted_keywords
-                        )
-                    )[:12]
-
-                    # 새로 추가
-                    new_news = AINews(
-                        url=article_data["url"],
-                        title=article_data.get("title", ""),
-                        author=article_data.get("author"),
-                        source=article_data.get("source"),
-                        source_url=article_data.get("source_url"),
-                        published_date=article_data.get("published_date"),
-                        content=article_data.get("content"),
-                        excerpt=article_data.get("excerpt"),
-                        image_url=article_data.get("image_url"),
-                        tags=article_data.get("tags", []),
-                        summary=(summary_payload or {}).get("summary"),
-                        keywords=merged_keywords,
-                        key_points=(summary_payload or {}).get("key_points", []),
-                        category=self.classify_news_topic(
-                            article_data.get("title", ""),
-                            article_data.get("content") or article_data.get("excerpt") or "",
-                        ),
-                        is_trending=True,
-                    )
-                    db.add(new_news)
-                    saved_count += 1
-
-                await db.commit()
+                # 같은 소스의 근사 중복(재게시·제목 수정)은 건너뛰고,
+                # 다른 소스의 같은 이야기는 저장 후 같은 클러스터로 묶음
+                source = article_data.get("source")
+                signature = news_signature(article_data.get("title"))
+                if signature is not None:
+                    if batch_index.find(signature, source=source) or (
+                        dedup_index is not None
+                        and dedup_index.find(signature, source=source)
+                    ):
+                        skipped += 1
+                        continue
+                    batch_index.add(len(batch_index) + 1, signature, 0, source)
+
+                extracted_keywords = await keyword_extractor.extract_keywords_async(
+                    " ".join(
+                        [
+                            article_data.get("title", "") or "",
+                            article_data.get("content") or "",
+                            article_data.get("excerpt") or "",
+                            " ".join(article_data.get("tags") or []),
+                        ]
+                    ),
+                    top_k=8,
+                )
+
+                # 새로 추가
+                row = dict(
+                    url=article_data["url"],
+                    title=article_data.get("title", ""),
+                    author=article_data.get("author"),
+                    source=article_data.get("source"),
+                    source_url=article_data.get("source_url"),
+                    published_date=article_data.get("published_date"),
+                    content=article_data.get("content"),
+                    excerpt=article_data.get("excerpt"),
+                    image_url=article_data.get("image_url"),
+                    tags=article_data.get("tags", []),
+                    keywords=extracted_keywords,
+                    key_points=[],
+                    category=self.classify_news_topic(
+                        article_data.get("title", ""),
+                        article_data.get("content") or article_data.get("excerpt") or "",
+                    ),
+                    is_trending=True,
+                )
+                if has_archive_columns:
+                    row["is_archived"] = False
+                    row["archived_at"] = None
+                if has_cluster_columns:
+                    row["minhash"] = pack_signature(signature) if signature else None
+                rows.append(row)
 
             except Exception as e:
-                await db.rollback()
+                skipped += 1
                 print(f"❌ 뉴스 저장 실패 ({article_data.get('url')}): {e}")
 
-        return saved_count
+        # 동시 수집으로 이미 저장된 URL은 트렌딩/아카이브 상태만 갱신
+        try:
+            stats = await bulk_upsert(
+                db,
+                AINews,
+                rows,
+                key="url",
+                update_columns=["is_trending", "is_archived", "archived_at"],
+                existing=existing_news_map,
+            )
+            if dedup_index is not None:
+                await self._assign_clusters(db, rows, dedup_index)
+            # 요약은 LLM 호출 없이 큐에만 등록 (summary_jobs 워커가 처리)
+            await enqueue_missing_summaries(db, "news")
+            await stage_feed_validators(db, getattr(self, "pending_feed_results", ()))
+            await db.commit()
+            self.pending_feed_results = []
+        except Exception as e:
+            await db.rollback()
+            invalidate_news_index()
+            print(f"❌ 뉴스 저장 실패: {e}")
+            return 0
+
+        stats.updated += len(existing_news_map)
+        stats.skipped += skipped
+        self.last_upsert_stats = stats
+        print(
+            f"💾 뉴스 저장 결과: 신규 {stats.inserted} / 갱신 {stats.updated} / 건너뜀 {stats.skipped}"
+        )
+        return stats.inserted
+
+    @staticmethod
+    async def _assign_clusters(
+        db: AsyncSession, rows: List[Dict[str, Any]], dedup_index: NearDuplicateIndex
+    ) -> None:
+        """새로 저장된 기사에 클러스터 id 지정 (id 1회 조회 + executemany UPDATE 1회)."""
+        signatures = {
+            row["url"]: (unpack_signature(row["minhash"]), row.get("source"))
+            for row in rows
+            if row.get("minhash") is not None
+        }
+        if not signatures:
+            return
+        # 동시 수집으로 이미 클러스터가 지정된 행은 제외
+        inserted = await db.execute(
+            select(AINews.url, AINews.id).where(
+                AINews.url.in_(list(signatures)), AINews.cluster_id.is_(None)
+            )
+        )
+        assignments = assign_clusters(
+            dedup_index,
+            (
+                (item_id, signatures[url][0], signatures[url][1])
+                for url, item_id in inserted.all()
+            ),
+        )
+        await save_cluster_assignments(db, assignments)
 
     async def get_news(
         self,
@@ -493,6 +530,9 @@ class NewsService:
         trending_only: bool = False,
         source: Optional[str] = None,
         include_archived: bool = False,
+        cursor: Optional[str] = None,
+        collapse_duplicates: bool = False,
+        cluster_id: Optional[int] = None,
     ) -> List[AINews]:
         """
         데이터베이스에서 뉴스 목록 가져오기
@@ -503,25 +543,37 @@ class NewsService:
             limit: 가져올 개수
             trending_only: 트렌딩 뉴스만 가져올지 여부
             source: 출처 필터
+            cursor: 키셋 cursor (지정 시 skip 대신 `(정렬키, id)` 기준 조회)
+            collapse_duplicates: 같은 이야기 클러스터는 대표 기사만
+            cluster_id: 지정 시 해당 클러스터 기사만 (중복 접기 무시)
 
         Returns:
             뉴스 목록
         """
-        query = select(AINews)
-
         supports_archive = await has_archive_column(db, "ai_news")
-        if not include_archived and supports_archive:
-            query = query.where(AINews.is_archived == False)
 
-        if trending_only:
-            query = query.where(AINews.is_trending == True)
-
-        if source:
-            query = query.where(AINews.source == source)
-
-        query = (
-            query.order_by(desc(AINews.published_date)).offset(skip).limit(limit)
-        )
+        def visible(news: Any) -> List[Any]:
+            return news_list_filters(
+                news,
+                include_archived=include_archived or not supports_archive,
+                trending_only=trending_only,
+                source=source,
+            )
+
+        query = select(AINews).where(*visible(AINews))
+        if cluster_id is not None:
+            query = query.where(AINews.cluster_id == cluster_id)
+        elif collapse_duplicates:
+            query = query.where(cluster_representative_clause(visible))
+
+        if cursor is not None:
+            query = apply_keyset(
+                query, AINews.published_date, AINews.id, cursor
+            ).limit(limit)
+        else:
+            query = (
+                query.order_by(desc(AINews.published_date)).offset(skip).limit(limit)
+            )
 
         result = await db.execute(query)
         return result.scalars().all()
@@ -2,13 +2,14 @@
 import re
 from typing import List, Dict
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-import feedparser
 from datetime import datetime
 import logging
 
+from app.bulk_upsert import bulk_upsert, prefetch_existing
+from app.keyword_matcher import KeywordMatcher
 from app.models.policy import AIPolicy
 from app.services.ai_summary_service import AISummaryService
+from app.services.feed_fetch_service import fetch_feeds, stage_feed_validators
 
 logger = logging.getLogger(__name__)
 
@@ -100,6 +101,24 @@ class PolicyService:
         },
     ]
 
+    # AI policy 관련 키워드 ("act"/"law"/"bill"은 단어 단위: "impact"·"billion"에 걸리지 않음)
+    POLICY_KEYWORDS = [
+        "regulation", "policy", "law", "act", "bill", "governance",
+        "compliance", "framework", "legislation", "eu ai act",
+    ]
+
+    IMPACT_AREA_KEYWORDS: Dict[str, List[str]] = {
+        "Healthcare": ["health", "medical", "hospital", "patient"],
+        "Finance": ["bank", "finance", "financial", "trading"],
+        "Education": ["education", "school", "university", "learning"],
+        "Transportation": ["autonomous", "vehicle", "transport", "driving"],
+        "Privacy": ["privacy", "data protection", "gdpr", "personal data"],
+        "Security": ["security", "defense", "military", "surveillance"],
+    }
+
+    _POLICY_KEYWORD_MATCHER = KeywordMatcher(POLICY_KEYWORDS, whole_word_max_len=4)
+    _IMPACT_AREA_MATCHER = KeywordMatcher(IMPACT_AREA_KEYWORDS)
+
     def __init__(self):
         self.rss_feeds = {
             # Global
@@ -127,29 +146,28 @@ class PolicyService:
         return normalized in {"south korea", "korea", "kr", "한국", "대한민국"}
 
     async def fetch_policy_news(self, max_results: int = 20) -> List[Dict]:
-        """RSS 피드에서 AI 정책 뉴스 수집"""
+        """RSS 피드에서 AI 정책 뉴스 수집 (동시 조건부 요청 — 변경 없는 피드는 건너뜀)"""
         policies = []
 
         try:
+            results = await fetch_feeds(self.rss_feeds.values(), source="policies")
+            # 피드 검증자는 save_to_db가 정책과 같은 트랜잭션에서 저장
+            self.pending_feed_results = list(results.values())
             for source_name, feed_url in self.rss_feeds.items():
                 try:
-                    feed = feedparser.parse(feed_url)
+                    result = results[feed_url]
+                    if result.feed is None:
+                        if result.error:
+                            print(f"  ⚠️ {source_name} RSS 에러: {result.error}")
+                        continue
+                    feed = result.feed
 
                     for entry in feed.entries[:max_results]:
                         title = entry.get("title", "")
                         description = entry.get("summary", entry.get("description", ""))
 
                         # AI policy 관련 키워드 필터링
-                        policy_keywords = ["regulation", "policy", "law", "act", "bill", "governance",
-                                         "compliance", "framework", "legislation", "eu ai act"]
-
-                        title_lower = title.lower()
-                        desc_lower = description.lower()
-
-                        is_policy_related = any(keyword in title_lower or keyword in desc_lower
-                                               for keyword in policy_keywords)
-
-                        if not is_policy_related:
+                        if not self._POLICY_KEYWORD_MATCHER.contains_any(f"{title} {description}"):
                             continue
 
                         # 영향 영역 추출
@@ -185,22 +203,7 @@ class PolicyService:
 
     def _extract_impact_areas(self, text: str) -> List[str]:
         """텍스트에서 영향 영역 추출"""
-        areas = {
-            "Healthcare": ["health", "medical", "hospital", "patient"],
-            "Finance": ["bank", "finance", "financial", "trading"],
-            "Education": ["education", "school", "university", "learning"],
-            "Transportation": ["autonomous", "vehicle", "transport", "driving"],
-            "Privacy": ["privacy", "data protection", "gdpr", "personal data"],
-            "Security": ["security", "defense", "military", "surveillance"],
-        }
-
-        text_lower = text.lower()
-        found_areas = []
-
-        for area, keywords in areas.items():
-            if any(keyword in text_lower for keyword in keywords):
-                found_areas.append(area)
-
+        found_areas = self._IMPACT_AREA_MATCHER.labels(text)
         return found_areas[:5] if found_areas else ["General"]
 
     async def fetch_sample_policies(self) -> List[Dict]:
@@ -209,10 +212,14 @@ class PolicyService:
         return self.CURATED_POLICIES
 
     async def save_to_db(self, items: List[Dict], db: AsyncSession) -> int:
-        """데이터베이스에 저장"""
-        saved = 0
+        """데이터베이스에 저장 (source_url 기준 벌크 업서트)"""
         ai_service = AISummaryService()
         can_summarize = await ai_service.can_summarize()
+        existing_policies = await prefetch_existing(
+            db, AIPolicy, "source_url", (item.get("source_url") for item in items)
+        )
+
+        rows = []
         for item in items:
             # HTML 태그 제거
             if item.get("description"):
@@ -235,36 +242,41 @@ class PolicyService:
                 if summary_data.get("keywords"):
                     item["keywords"] = summary_data["keywords"]
 
-            if url:
-                result = await db.execute(select(AIPolicy).where(AIPolicy.source_url == url))
-                existing = result.scalar_one_or_none()
-                if not existing:
-                    db.add(AIPolicy(**item))
-                    saved += 1
-                else:
-                    for key, value in item.items():
-                        if hasattr(existing, key) and value is not None:
-                            setattr(existing, key, value)
-
-                    if existing.title:
-                        existing.title = self._strip_html(existing.title)
-                    if existing.description:
-                        existing.description = self._strip_html(existing.description)
-
-                    if (
-                        can_summarize
-                        and (not self._is_korean_policy(existing.country or ""))
-                        and not existing.summary
-                    ):
-                        summary_data = await ai_service.summarize_policy(
-                            title=existing.title,
-                            description=existing.description or "",
-                            policy_type=existing.policy_type,
-                            impact_areas=existing.impact_areas or [],
-                        )
-                        if summary_data.get("summary"):
-                            existing.summary = summary_data["summary"]
-                        if summary_data.get("keywords"):
-                            existing.keywords = summary_data["keywords"]
+            if not url:
+                continue
+
+            existing = existing_policies.get(url)
+            if (
+                existing
+                and can_summarize
+                and not item.get("summary")
+                and not existing.summary
+                and not self._is_korean_policy(item.get("country") or existing.country or "")
+            ):
+                summary_data = await ai_service.summarize_policy(
+                    title=item.get("title") or existing.title,
+                    description=item.get("description") or existing.description or "",
+                    policy_type=item.get("policy_type") or existing.policy_type,
+                    impact_areas=item.get("impact_areas") or existing.impact_areas or [],
+                )
+                if summary_data.get("summary"):
+                    item["summary"] = summary_data["summary"]
+                if summary_data.get("keywords"):
+                    item["keywords"] = summary_data["keywords"]
+            rows.append(item)
+
+        # 기존 항목은 값이 있는 필드만 갱신
+        stats = await bulk_upsert(
+            db,
+            AIPolicy,
+            rows,
+            key="source_url",
+            coalesce_columns=[column for row in rows for column in row if column != "source_url"],
+            existing=existing_policies,
+        )
+        await stage_feed_validators(db, getattr(self, "pending_feed_results", ()))
         await db.commit()
-        return saved
+        self.pending_feed_results = []
+        stats.skipped += len(items) - len(rows)
+        self.last_upsert_stats = stats
+        return stats.inserted
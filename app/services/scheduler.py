@@ -1,11 +1,13 @@
 """스케줄러 서비스 - 정기적 데이터 수집"""
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
+from apscheduler.triggers.interval import IntervalTrigger
 from apscheduler.events import EVENT_JOB_EXECUTED, EVENT_JOB_ERROR
 from datetime import datetime, timedelta, timezone
+from functools import partial
+from typing import Any, Dict, Optional
 import asyncio
 import logging
-from typing import Any, Awaitable, Callable, TypeVar
 
 from app.config import get_settings
 from app.database import AsyncSessionLocal
@@ -18,7 +20,8 @@ from app.services.conference_service import ConferenceService
 from app.services.ai_tool_service import AIToolService
 from app.services.job_trend_service import JobTrendService
 from app.services.policy_service import PolicyService
-from app.services.ai_summary_service import AISummaryService
+from app.services.feed_fetch_service import stage_feed_validators
+from app.services.summary_queue_service import enqueue_missing_summaries, process_summary_jobs
 from app.services.trending_keyword_service import ExternalTrendingKeywordService
 from app.models.huggingface import HuggingFaceModel
 from app.models.youtube import YouTubeVideo
@@ -29,10 +32,20 @@ from app.models.conference import AIConference
 from app.models.ai_tool import AITool
 from app.models.job_trend import AIJobTrend
 from app.models.policy import AIPolicy
-from sqlalchemy import select, desc, update, or_
-from app.cache import cache_delete_pattern
+from sqlalchemy import select, desc, update
+from app.cache import AGGREGATE_CACHE_TAGS, invalidate_cache_tags, list_cache_tag
+from app.services.collection_orchestrator import (
+    Collector,
+    SourceLimit,
+    record_upsert,
+    run_collectors,
+)
+from app.services.collection_run_service import instrumented_run, prune_collection_runs
+from app.run_metrics import CollectorResult
+from app.services.category_stats_service import CATEGORY_META, refresh_category_daily_stats
 from app.services.notification_service import send_error_webhook
 from app.db_compat import has_columns
+from app.metrics import SCHEDULER_JOB_DURATION, SCHEDULER_JOB_RUNS
 
 settings = get_settings()
 logger = logging.getLogger(__name__)
@@ -53,22 +66,72 @@ scheduler = AsyncIOScheduler()
 
 # 작업별 최근 실행 상태 (System API에서 사용)
 JOB_RUNTIME_STATUS = {}
-SummaryRow = TypeVar("SummaryRow")
 
 
-async def _invalidate_cache_after_collection(job_id: str):
-    """수집 완료 후 대시보드/검색 캐시 무효화."""
-    await cache_delete_pattern("dashboard:*")
-    await cache_delete_pattern("search:*")
-    await cache_delete_pattern("system:*")
-    await cache_delete_pattern("list:*")
+# 요약 큐 처리 작업 (수집 직후 즉시 실행되도록 당겨짐, 1회 최대 처리 건수)
+SUMMARY_JOB_ID = "process_summary_jobs"
+SUMMARY_JOBS_PER_RUN = 200
+
+# 수집 작업 → 대시보드 롤업(category_daily_stats) 카테고리
+JOB_CATEGORY_MAP = {
+    "collect_huggingface": "huggingface",
+    "collect_github": "github",
+    "collect_youtube": "youtube",
+    "collect_papers": "papers",
+    "collect_news": "news",
+    "collect_conferences": "conferences",
+    "collect_tools": "tools",
+    "collect_jobs": "jobs",
+    "collect_policies": "policies",
+}
+
+
+async def _refresh_category_rollups(categories):
+    """카테고리별 일자 롤업 증분 갱신 (실패 시 대시보드는 원본 집계로 대체)."""
+    for category in categories:
+        try:
+            async with AsyncSessionLocal() as db:
+                await refresh_category_daily_stats(db, category)
+        except Exception as e:
+            logger.warning("category_daily_stats 갱신 실패 (%s): %s", category, e)
+
+
+async def _invalidate_cache_after_collection(job_id: str, categories=None):
+    """수집 완료 후 대시보드 롤업 갱신 및 바뀐 카테고리의 캐시 무효화.
+
+    `categories`를 주지 않으면 작업 ID로 결정 (카테고리 없는 작업은 전체).
+    """
+    if categories is None:
+        category = JOB_CATEGORY_MAP.get(job_id)
+        if category:
+            categories = [category]
+    if categories:
+        await _refresh_category_rollups(categories)
+    if job_id != "collect_external_trending_keywords":
+        # 외부 키워드는 get_keywords(force_refresh)가 dashboard 세대를 올리고 새 세대에 직접 채움
+        # (여기서 다시 올리면 방금 채운 값이 버려짐)
+        await _clear_collection_caches(categories)
     print(f"🧹 캐시 무효화 완료 ({job_id})")
 
 
+async def _clear_collection_caches(categories=None):
+    """수집 결과에 영향을 받는 캐시 무효화 (태그별 세대 번호 INCR).
+
+    대시보드/검색/시스템 집계와 `categories`(None이면 전체) 목록 캐시만 무효화하고,
+    다른 카테고리 목록 캐시는 유지.
+    """
+    if categories is None:
+        categories = CATEGORY_META.keys()
+    await invalidate_cache_tags(
+        [*AGGREGATE_CACHE_TAGS, *(list_cache_tag(category) for category in categories)]
+    )
+
+
 def _scheduler_event_listener(event):
     """APScheduler 이벤트 리스너: 마지막 실행/성공/실패 상태 기록."""
     job_id = getattr(event, "job_id", "unknown")
     now = datetime.now(timezone.utc).isoformat()
+    SCHEDULER_JOB_RUNS.inc(job_id, "error" if getattr(event, "exception", None) else "success")
     if getattr(event, "exception", None):
         error_message = str(event.exception)
         JOB_RUNTIME_STATUS[job_id] = {
@@ -93,9 +156,17 @@ def _scheduler_event_listener(event):
             "last_status": "success",
             "last_error": None,
         }
+        # 수집·아카이브 작업은 본문 끝에서 직접 무효화하므로 여기서는 요약 큐 처리만 —
+        # 실제로 반영된 요약이 있을 때, 반영된 카테고리만 무효화
+        if job_id != SUMMARY_JOB_ID:
+            return
+        retval = getattr(event, "retval", None) or {}
+        if not retval.get("done"):
+            return
+        categories = list(retval.get("updated") or {}) or None
         try:
             loop = asyncio.get_running_loop()
-            loop.create_task(_invalidate_cache_after_collection(job_id))
+            loop.create_task(_invalidate_cache_after_collection(job_id, categories))
         except RuntimeError:
             pass
 
@@ -107,6 +178,11 @@ def get_scheduler_runtime_status():
 
 async def archive_old_data(days: int = 30):
     """30일 초과 데이터 soft archive."""
+    with SCHEDULER_JOB_DURATION.time("archive_old_data"):
+        await _archive_old_data(days)
+
+
+async def _archive_old_data(days: int):
     cutoff = datetime.now(timezone.utc) - timedelta(days=days)
     archived_at = datetime.now(timezone.utc)
     print(
@@ -169,60 +245,77 @@ async def archive_old_data(days: int = 30):
     total_archived = sum(archived_summary.values())
     details = ", ".join(f"{k}={v}" for k, v in archived_summary.items())
     print(f"✅ 아카이브 완료: total={total_archived} ({details})")
+
+    try:
+        pruned = await prune_collection_runs()
+        if pruned:
+            print(f"🧹 수집 실행 이력 정리: {pruned}개")
+    except Exception as e:
+        logger.warning("collection_runs 정리 실패: %s", e)
     await _invalidate_cache_after_collection("archive_old_data")
 
 
-async def _fill_missing_summaries(
-    *,
-    db,
-    model,
-    label: str,
-    item_name: Callable[[Any], str],
-    build_summary: Callable[[AISummaryService, Any], Awaitable[dict[str, Any]]],
-    apply_summary: Callable[[Any, dict[str, Any]], bool],
-    limit: int = 10,
-) -> int:
-    """카테고리별 공통 요약 백필 루틴."""
-    ai_service = AISummaryService()
-    can_summarize = await ai_service.can_summarize()
-    if not can_summarize:
-        print("⚠️  사용 가능한 요약 provider(Gemini/Ollama)가 없어 요약을 건너뜁니다")
-        return 0
-
-    query = select(model).where(or_(model.summary.is_(None), model.summary == "")).limit(limit)
-    result = await db.execute(query)
-    rows = result.scalars().all()
-    if not rows:
-        return 0
-
-    print(f"\n🧠 AI 요약 생성 시작 ({len(rows)}개 {label})...")
-    delay_seconds = 2.0 if ai_service.model is not None else 0.0
-    updated = 0
-
-    for row in rows:
-        row_title = item_name(row)[:40]
-        try:
-            summary_data = await build_summary(ai_service, row)
-            if apply_summary(row, summary_data):
-                updated += 1
-                print(f"  ✅ {row_title} - 요약 완료")
-            else:
-                print(f"  ⚠️  {row_title} - 요약 실패")
-        except Exception as e:
-            print(f"  ❌ {row_title} - 에러: {e}")
-            continue
+async def _enqueue_summaries(db, category: str) -> int:
+    """요약이 비어있는 항목을 summary_jobs 큐에 등록하고 워커를 즉시 깨움."""
+    queued = await enqueue_missing_summaries(db, category)
+    await db.commit()
+    if queued:
+        print(f"🧠 요약 대기열 등록: {queued}개 ({category})")
+        _wake_summary_worker()
+    return queued
 
-        if delay_seconds > 0:
-            await asyncio.sleep(delay_seconds)
 
-    if updated > 0:
-        await db.commit()
-        print("✅ AI 요약 완료")
+async def _save_feed_validators(db, service) -> None:
+    """저장할 항목이 없어 save_to_db를 건너뛴 수집도 피드 검증자(ETag 등)는 커밋.
 
-    return updated
+    200이지만 필터 후 항목이 없는 피드가 다음 수집에서 조건부 요청(304)을 쓰도록.
+    """
+    await stage_feed_validators(db, getattr(service, "pending_feed_results", ()))
+    await db.commit()
+    service.pending_feed_results = []
 
 
-async def collect_huggingface_data():
+def _wake_summary_worker():
+    """요약 큐 처리 작업의 다음 실행을 지금으로 당김 (스케줄러 미기동 시 무시)."""
+    try:
+        if scheduler.running and scheduler.get_job(SUMMARY_JOB_ID):
+            scheduler.modify_job(SUMMARY_JOB_ID, next_run_time=datetime.now(timezone.utc))
+    except Exception as e:
+        logger.warning("요약 큐 워커 깨우기 실패: %s", e)
+
+
+async def process_summary_queue():
+    """summary_jobs 큐 처리 (동시 LLM 호출 + 토큰 버킷 레이트 리밋)."""
+    with SCHEDULER_JOB_DURATION.time(SUMMARY_JOB_ID):
+        return await process_summary_jobs(max_jobs=SUMMARY_JOBS_PER_RUN)
+
+
+def _instrumented(job_id: str):
+    """수집 작업을 계측해 collection_runs에 기록하는 데코레이터.
+
+    APScheduler는 인자 없이 호출 (`trigger="scheduled"`), 전체 수집은 결과 객체를 넘겨 호출.
+    """
+
+    def decorator(func):
+        async def wrapper(
+            result: Optional[CollectorResult] = None,
+            invalidate: bool = True,
+            trigger: str = "scheduled",
+        ):
+            async with instrumented_run(job_id, result, trigger=trigger) as run:
+                await func(run, invalidate=invalidate)
+
+        # functools.wraps는 __wrapped__를 남겨 APScheduler가 원본 시그니처(필수 인자)를 검사하므로 이름만 복사
+        wrapper.__name__ = func.__name__
+        wrapper.__qualname__ = func.__qualname__
+        wrapper.__doc__ = func.__doc__
+        return wrapper
+
+    return decorator
+
+
+@_instrumented("collect_huggingface")
+async def collect_huggingface_data(result: CollectorResult, invalidate: bool = True):
     """Hugging Face 데이터 수집 작업"""
     print(f"\n{'='*60}")
     print(f"🤖 자동 수집 시작: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
@@ -232,50 +325,41 @@ async def collect_huggingface_data():
         try:
             # 1. 트렌딩 모델 수집
             hf_service = HuggingFaceService()
-            result = await hf_service.collect_trending_models(db, limit=50)
-
-            if result["success"]:
-                print(f"✅ Hugging Face: {result['count']}개 신규 모델 저장")
+            with result.phase("fetch"):
+                models_data = await hf_service.fetch_trending_models(limit=50)
+            result.fetched += len(models_data)
+
+            if models_data:
+                with result.phase("save"):
+                    saved = await hf_service.save_models_to_db(
+                        models_data, db, is_trending=True
+                    )
+                record_upsert(result, hf_service)
+                print(f"✅ Hugging Face: {saved}개 신규 모델 저장")
             else:
                 print("⚠️  Hugging Face 수집 실패")
 
-            # 2. AI 요약 생성 (요약이 없는 모델들에 대해)
-            def _apply_hf_summary(row: HuggingFaceModel, payload: dict[str, Any]) -> bool:
-                if not payload.get("summary"):
-                    return False
-                row.summary = payload.get("summary")
-                row.key_features = payload.get("key_features", [])
-                row.use_cases = payload.get("use_cases")
-                return True
-
-            await _fill_missing_summaries(
-                db=db,
-                model=HuggingFaceModel,
-                label="모델",
-                item_name=lambda row: row.model_name or row.model_id or "unknown",
-                build_summary=lambda ai, row: ai.summarize_huggingface_model(
-                    model_name=row.model_name,
-                    description=row.description,
-                    task=row.task,
-                    tags=row.tags or [],
-                ),
-                apply_summary=_apply_hf_summary,
-                limit=10,
-            )
+            # 2. 요약이 없는 모델들은 요약 큐에 등록 (워커가 비동기 처리)
+            with result.phase("save"):
+                await _enqueue_summaries(db, "huggingface")
 
         except Exception as e:
             print(f"❌ 수집 중 에러 발생: {e}")
+            result.errors.append(str(e))
         finally:
             await db.close()
 
-    await _invalidate_cache_after_collection("collect_huggingface")
+    if invalidate:
+        with result.phase("invalidate"):
+            await _invalidate_cache_after_collection("collect_huggingface")
 
     print(f"\n{'='*60}")
     print(f"✨ 자동 수집 완료: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     print(f"{'='*60}\n")
 
 
-async def collect_youtube_data():
+@_instrumented("collect_youtube")
+async def collect_youtube_data(result: CollectorResult, invalidate: bool = True):
     """YouTube 데이터 수집 작업 (큐레이션 채널 + 키워드 검색)"""
     print(f"\n{'='*60}")
     print(f"📺 YouTube 수집 시작: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
@@ -290,13 +374,13 @@ async def collect_youtube_data():
 
             # 1. 큐레이션된 채널의 최신 영상 수집 (우선순위 높은 순)
             print("📌 큐레이션된 AI 유튜버 채널에서 최신 영상 수집 중...")
-            result = await db.execute(
+            channel_rows = await db.execute(
                 select(YouTubeChannel)
                 .where(YouTubeChannel.is_active == True)
                 .order_by(desc(YouTubeChannel.priority))
                 .limit(30)  # 최대 30개 채널
             )
-            channels = result.scalars().all()
+            channels = channel_rows.scalars().all()
 
             channel_videos_count = 0
             for channel in channels:
@@ -311,16 +395,20 @@ async def collect_youtube_data():
                         continue
 
                     channel_lang = "ko"
-                    videos = await yt_service.get_channel_videos(
-                        channel_id=channel.channel_id,
-                        max_results=15,  # 채널당 최신 15개
-                        order="date",
-                        relevance_language=channel_lang,
-                        default_language=channel_lang,
-                    )
+                    with result.phase("fetch"):
+                        videos = await yt_service.get_channel_videos(
+                            channel_id=channel.channel_id,
+                            max_results=15,  # 채널당 최신 15개
+                            order="date",
+                            relevance_language=channel_lang,
+                            default_language=channel_lang,
+                        )
 
                     if videos:
-                        saved = await yt_service.save_videos_to_db(videos, db)
+                        result.fetched += len(videos)
+                        with result.phase("save"):
+                            saved = await yt_service.save_videos_to_db(videos, db)
+                        record_upsert(result, yt_service)
                         channel_videos_count += saved
                         if saved > 0:
                             print(
@@ -335,6 +423,7 @@ async def collect_youtube_data():
 
                 except Exception as e:
                     print(f"  ❌ {channel.channel_name}: {e}")
+                    result.errors.append(f"{channel.channel_name}: {e}")
                     continue
 
             print(
@@ -354,15 +443,19 @@ async def collect_youtube_data():
 
             keyword_videos_count = 0
             for query, lang in queries:
-                videos = await yt_service.search_ai_videos(
-                    query=query,
-                    max_results=15,
-                    order="viewCount",
-                    relevance_language=lang,
-                )
+                with result.phase("fetch"):
+                    videos = await yt_service.search_ai_videos(
+                        query=query,
+                        max_results=15,
+                        order="viewCount",
+                        relevance_language=lang,
+                    )
 
                 if videos:
-                    saved = await yt_service.save_videos_to_db(videos, db)
+                    result.fetched += len(videos)
+                    with result.phase("save"):
+                        saved = await yt_service.save_videos_to_db(videos, db)
+                    record_upsert(result, yt_service)
                     keyword_videos_count += saved
                     if saved > 0:
                         print(f"  ✅ '{query}': {saved}개 신규 비디오")
@@ -374,42 +467,27 @@ async def collect_youtube_data():
             total_saved = channel_videos_count + keyword_videos_count
             print(f"\n✅ YouTube 전체: 총 {total_saved}개 신규 비디오 저장")
 
-            # 2. AI 요약 생성 (요약이 없는 비디오들에 대해)
-            def _apply_youtube_summary(row: YouTubeVideo, payload: dict[str, Any]) -> bool:
-                if not payload.get("summary"):
-                    return False
-                row.summary = payload.get("summary")
-                row.keywords = payload.get("keywords", [])
-                row.key_points = payload.get("key_points", [])
-                return True
-
-            await _fill_missing_summaries(
-                db=db,
-                model=YouTubeVideo,
-                label="비디오",
-                item_name=lambda row: row.title or row.video_id or "unknown",
-                build_summary=lambda ai, row: ai.summarize_youtube_video(
-                    title=row.title,
-                    description=row.description,
-                    tags=row.tags or [],
-                ),
-                apply_summary=_apply_youtube_summary,
-                limit=10,
-            )
+            # 2. 요약이 없는 비디오들은 요약 큐에 등록 (워커가 비동기 처리)
+            with result.phase("save"):
+                await _enqueue_summaries(db, "youtube")
 
         except Exception as e:
             print(f"❌ YouTube 수집 중 에러 발생: {e}")
+            result.errors.append(str(e))
         finally:
             await db.close()
 
-    await _invalidate_cache_after_collection("collect_youtube")
+    if invalidate:
+        with result.phase("invalidate"):
+            await _invalidate_cache_after_collection("collect_youtube")
 
     print(f"\n{'='*60}")
     print(f"✨ YouTube 수집 완료: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     print(f"{'='*60}\n")
 
 
-async def collect_papers_data():
+@_instrumented("collect_papers")
+async def collect_papers_data(result: CollectorResult, invalidate: bool = True):
     """AI Papers 데이터 수집 작업"""
     print(f"\n{'='*60}")
     print(f"📄 AI Papers 수집 시작: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
@@ -421,53 +499,41 @@ async def collect_papers_data():
             arxiv_service = ArxivService()
 
             # 최근 7일간의 AI 논문 수집
-            papers = await arxiv_service.search_recent_papers(
-                days=7, max_results=100
-            )
+            with result.phase("fetch"):
+                papers = await arxiv_service.search_recent_papers(
+                    days=7, max_results=100
+                )
 
             if papers:
-                saved = await arxiv_service.save_papers_to_db(papers, db)
+                result.fetched += len(papers)
+                with result.phase("save"):
+                    saved = await arxiv_service.save_papers_to_db(papers, db)
+                record_upsert(result, arxiv_service)
                 print(f"✅ arXiv: {saved}개 신규 논문 저장")
             else:
                 print("⚠️  arXiv에서 논문을 찾을 수 없습니다")
 
-            # 2. AI 요약 생성 (요약이 없는 논문들에 대해)
-            def _apply_paper_summary(row: AIPaper, payload: dict[str, Any]) -> bool:
-                if not payload.get("summary"):
-                    return False
-                row.summary = payload.get("summary")
-                row.keywords = payload.get("keywords", [])
-                row.key_contributions = payload.get("key_contributions", [])
-                return True
-
-            await _fill_missing_summaries(
-                db=db,
-                model=AIPaper,
-                label="논문",
-                item_name=lambda row: row.title or row.arxiv_id or "unknown",
-                build_summary=lambda ai, row: ai.summarize_paper(
-                    title=row.title,
-                    abstract=row.abstract,
-                    authors=row.authors or [],
-                    categories=row.categories or [],
-                ),
-                apply_summary=_apply_paper_summary,
-                limit=10,
-            )
+            # 2. 요약이 없는 논문들은 요약 큐에 등록 (워커가 비동기 처리)
+            with result.phase("save"):
+                await _enqueue_summaries(db, "papers")
 
         except Exception as e:
             print(f"❌ Papers 수집 중 에러 발생: {e}")
+            result.errors.append(str(e))
         finally:
             await db.close()
 
-    await _invalidate_cache_after_collection("collect_papers")
+    if invalidate:
+        with result.phase("invalidate"):
+            await _invalidate_cache_after_collection("collect_papers")
 
     print(f"\n{'='*60}")
     print(f"✨ Papers 수집 완료: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     print(f"{'='*60}\n")
 
 
-async def collect_news_data():
+@_instrumented("collect_news")
+async def collect_news_data(result: CollectorResult, invalidate: bool = True):
     """AI News 데이터 수집 작업"""
     print(f"\n{'='*60}")
     print(f"📰 AI News 수집 시작: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
@@ -478,50 +544,41 @@ async def collect_news_data():
             # 1. RSS 피드에서 뉴스 수집
             news_service = NewsService()
 
-            articles = await news_service.fetch_all_feeds()
+            with result.phase("fetch"):
+                articles = await news_service.fetch_all_feeds()
 
             if articles:
-                saved = await news_service.save_news_to_db(articles, db)
+                result.fetched += len(articles)
+                with result.phase("save"):
+                    saved = await news_service.save_news_to_db(articles, db)
+                record_upsert(result, news_service)
                 print(f"\n✅ AI News: 총 {saved}개 신규 뉴스 저장")
             else:
                 print("⚠️  RSS 피드에서 뉴스를 찾을 수 없습니다")
+                with result.phase("save"):
+                    await _save_feed_validators(db, news_service)
 
-            # 2. AI 요약 생성 (요약이 없는 뉴스들에 대해)
-            def _apply_news_summary(row: AINews, payload: dict[str, Any]) -> bool:
-                if not payload.get("summary"):
-                    return False
-                row.summary = payload.get("summary")
-                row.keywords = payload.get("keywords", [])
-                row.key_points = payload.get("key_points", [])
-                return True
-
-            await _fill_missing_summaries(
-                db=db,
-                model=AINews,
-                label="뉴스",
-                item_name=lambda row: row.title or row.url or "unknown",
-                build_summary=lambda ai, row: ai.summarize_news(
-                    title=row.title,
-                    content=row.content or row.excerpt,
-                    source=row.source,
-                ),
-                apply_summary=_apply_news_summary,
-                limit=10,
-            )
+            # 2. 요약이 없는 뉴스들은 요약 큐에 등록 (워커가 비동기 처리)
+            with result.phase("save"):
+                await _enqueue_summaries(db, "news")
 
         except Exception as e:
             print(f"❌ News 수집 중 에러 발생: {e}")
+            result.errors.append(str(e))
         finally:
             await db.close()
 
-    await _invalidate_cache_after_collection("collect_news")
+    if invalidate:
+        with result.phase("invalidate"):
+            await _invalidate_cache_after_collection("collect_news")
 
     print(f"\n{'='*60}")
     print(f"✨ News 수집 완료: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     print(f"{'='*60}\n")
 
 
-async def collect_github_data():
+@_instrumented("collect_github")
+async def collect_github_data(result: CollectorResult, invalidate: bool = True):
     """GitHub 트렌딩 프로젝트 수집 작업"""
     print(f"\n{'='*60}")
     print(f"⭐ GitHub 트렌딩 수집 시작: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
@@ -532,53 +589,41 @@ async def collect_github_data():
             # 1. GitHub에서 트렌딩 AI/ML 프로젝트 검색
             github_service = GitHubService()
 
-            projects = await github_service.fetch_trending_repos(
-                language="", max_results=50
-            )
+            with result.phase("fetch"):
+                projects = await github_service.fetch_trending_repos(
+                    language="", max_results=50
+                )
 
             if projects:
-                saved = await github_service.save_projects_to_db(projects, db)
+                result.fetched += len(projects)
+                with result.phase("save"):
+                    saved = await github_service.save_projects_to_db(projects, db)
+                record_upsert(result, github_service)
                 print(f"✅ GitHub: {saved}개 신규 프로젝트 저장")
             else:
                 print("⚠️  GitHub에서 프로젝트를 찾을 수 없습니다")
 
-            # 2. AI 요약 생성 (요약이 없는 프로젝트들에 대해)
-            def _apply_github_summary(row: GitHubProject, payload: dict[str, Any]) -> bool:
-                if not payload.get("summary"):
-                    return False
-                row.summary = payload.get("summary")
-                row.keywords = payload.get("keywords", [])
-                row.use_cases = payload.get("use_cases", [])
-                return True
-
-            await _fill_missing_summaries(
-                db=db,
-                model=GitHubProject,
-                label="프로젝트",
-                item_name=lambda row: row.repo_name or row.name or "unknown",
-                build_summary=lambda ai, row: ai.summarize_github_project(
-                    repo_name=row.repo_name,
-                    description=row.description,
-                    language=row.language,
-                    topics=row.topics or [],
-                ),
-                apply_summary=_apply_github_summary,
-                limit=10,
-            )
+            # 2. 요약이 없는 프로젝트들은 요약 큐에 등록 (워커가 비동기 처리)
+            with result.phase("save"):
+                await _enqueue_summaries(db, "github")
 
         except Exception as e:
             print(f"❌ GitHub 수집 중 에러 발생: {e}")
+            result.errors.append(str(e))
         finally:
             await db.close()
 
-    await _invalidate_cache_after_collection("collect_github")
+    if invalidate:
+        with result.phase("invalidate"):
+            await _invalidate_cache_after_collection("collect_github")
 
     print(f"\n{'='*60}")
     print(f"✨ GitHub 수집 완료: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     print(f"{'='*60}\n")
 
 
-async def collect_conference_data():
+@_instrumented("collect_conferences")
+async def collect_conference_data(result: CollectorResult, invalidate: bool = True):
     """AI Conference 데이터 수집 작업"""
     print(f"\n{'='*60}")
     print(f"📅 AI Conference 수집 시작: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
@@ -589,49 +634,41 @@ async def collect_conference_data():
             # 1. WikiCFP에서 AI 컨퍼런스 수집
             conference_service = ConferenceService()
 
-            conferences = await conference_service.fetch_wikicfp_conferences(max_results=50)
+            with result.phase("fetch"):
+                conferences = await conference_service.fetch_wikicfp_conferences(max_results=50)
 
             if conferences:
-                saved = await conference_service.save_to_db(conferences, db)
+                result.fetched += len(conferences)
+                with result.phase("save"):
+                    saved = await conference_service.save_to_db(conferences, db)
+                record_upsert(result, conference_service)
                 print(f"✅ AI Conference: {saved}개 신규 컨퍼런스 저장")
             else:
                 print("⚠️  WikiCFP에서 컨퍼런스를 찾을 수 없습니다")
+                with result.phase("save"):
+                    await _save_feed_validators(db, conference_service)
 
-            # 2. AI 요약 생성 (요약이 없는 컨퍼런스들에 대해)
-            def _apply_conference_summary(row: AIConference, payload: dict[str, Any]) -> bool:
-                if not payload.get("summary"):
-                    return False
-                row.summary = payload.get("summary")
-                row.keywords = payload.get("keywords", [])
-                return True
-
-            await _fill_missing_summaries(
-                db=db,
-                model=AIConference,
-                label="컨퍼런스",
-                item_name=lambda row: row.conference_name or "unknown",
-                build_summary=lambda ai, row: ai.summarize_conference(
-                    name=row.conference_name,
-                    description=row.summary or "",
-                    topics=row.topics or [],
-                ),
-                apply_summary=_apply_conference_summary,
-                limit=10,
-            )
+            # 2. 요약이 없는 컨퍼런스들은 요약 큐에 등록 (워커가 비동기 처리)
+            with result.phase("save"):
+                await _enqueue_summaries(db, "conferences")
 
         except Exception as e:
             print(f"❌ Conference 수집 중 에러 발생: {e}")
+            result.errors.append(str(e))
         finally:
             await db.close()
 
-    await _invalidate_cache_after_collection("collect_conferences")
+    if invalidate:
+        with result.phase("invalidate"):
+            await _invalidate_cache_after_collection("collect_conferences")
 
     print(f"\n{'='*60}")
     print(f"✨ Conference 수집 완료: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     print(f"{'='*60}\n")
 
 
-async def collect_tool_data():
+@_instrumented("collect_tools")
+async def collect_tool_data(result: CollectorResult, invalidate: bool = True):
     """AI Tool 데이터 수집 작업"""
     print(f"\n{'='*60}")
     print(f"🛠️ AI Tool 수집 시작: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
@@ -642,50 +679,39 @@ async def collect_tool_data():
             # 1. 트렌딩 AI 도구 수집
             tool_service = AIToolService()
 
-            tools = await tool_service.fetch_trending_tools(max_results=30)
+            with result.phase("fetch"):
+                tools = await tool_service.fetch_trending_tools(max_results=30)
 
             if tools:
-                saved = await tool_service.save_to_db(tools, db)
+                result.fetched += len(tools)
+                with result.phase("save"):
+                    saved = await tool_service.save_to_db(tools, db)
+                record_upsert(result, tool_service)
                 print(f"✅ AI Tool: {saved}개 신규 도구 저장")
             else:
                 print("⚠️  AI 도구를 찾을 수 없습니다")
 
-            # 2. AI 요약 생성 (요약이 없는 도구들에 대해)
-            def _apply_tool_summary(row: AITool, payload: dict[str, Any]) -> bool:
-                if not payload.get("summary"):
-                    return False
-                row.summary = payload.get("summary")
-                row.keywords = payload.get("keywords", [])
-                return True
-
-            await _fill_missing_summaries(
-                db=db,
-                model=AITool,
-                label="도구",
-                item_name=lambda row: row.tool_name or "unknown",
-                build_summary=lambda ai, row: ai.summarize_ai_tool(
-                    name=row.tool_name,
-                    description=row.description or "",
-                    category=row.category,
-                    use_cases=row.use_cases or [],
-                ),
-                apply_summary=_apply_tool_summary,
-                limit=10,
-            )
+            # 2. 요약이 없는 도구들은 요약 큐에 등록 (워커가 비동기 처리)
+            with result.phase("save"):
+                await _enqueue_summaries(db, "tools")
 
         except Exception as e:
             print(f"❌ Tool 수집 중 에러 발생: {e}")
+            result.errors.append(str(e))
         finally:
             await db.close()
 
-    await _invalidate_cache_after_collection("collect_tools")
+    if invalidate:
+        with result.phase("invalidate"):
+            await _invalidate_cache_after_collection("collect_tools")
 
     print(f"\n{'='*60}")
     print(f"✨ Tool 수집 완료: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     print(f"{'='*60}\n")
 
 
-async def collect_job_data():
+@_instrumented("collect_jobs")
+async def collect_job_data(result: CollectorResult, invalidate: bool = True):
     """AI Job Trend 데이터 수집 작업"""
     print(f"\n{'='*60}")
     print(f"💼 AI Job Trend 수집 시작: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
@@ -696,54 +722,43 @@ async def collect_job_data():
             # 1. RemoteOK에서 AI/ML 채용 공고 수집
             job_service = JobTrendService()
 
-            jobs = await job_service.fetch_remoteok_jobs(max_results=100)
-            if len(jobs) < 100:
-                fallback_jobs = await job_service.fetch_sample_jobs()
-                jobs.extend(fallback_jobs)
-                jobs = jobs[:100]
+            with result.phase("fetch"):
+                jobs = await job_service.fetch_remoteok_jobs(max_results=100)
+                if len(jobs) < 100:
+                    fallback_jobs = await job_service.fetch_sample_jobs()
+                    jobs.extend(fallback_jobs)
+                    jobs = jobs[:100]
 
             if jobs:
-                saved = await job_service.save_to_db(jobs, db)
+                result.fetched += len(jobs)
+                with result.phase("save"):
+                    saved = await job_service.save_to_db(jobs, db)
+                record_upsert(result, job_service)
                 print(f"✅ AI Job Trend: {saved}개 신규 채용 공고 저장")
             else:
                 print("⚠️  채용 공고를 찾을 수 없습니다")
 
-            # 2. AI 요약 생성 (요약이 없는 채용 공고들에 대해)
-            def _apply_job_summary(row: AIJobTrend, payload: dict[str, Any]) -> bool:
-                if not payload.get("summary"):
-                    return False
-                row.summary = payload.get("summary")
-                row.keywords = payload.get("keywords", [])
-                return True
-
-            await _fill_missing_summaries(
-                db=db,
-                model=AIJobTrend,
-                label="채용 공고",
-                item_name=lambda row: row.job_title or row.job_url or "unknown",
-                build_summary=lambda ai, row: ai.summarize_job(
-                    title=row.job_title,
-                    company=row.company_name,
-                    description=row.description or "",
-                    skills=row.required_skills or [],
-                ),
-                apply_summary=_apply_job_summary,
-                limit=10,
-            )
+            # 2. 요약이 없는 채용 공고들은 요약 큐에 등록 (워커가 비동기 처리)
+            with result.phase("save"):
+                await _enqueue_summaries(db, "jobs")
 
         except Exception as e:
             print(f"❌ Job 수집 중 에러 발생: {e}")
+            result.errors.append(str(e))
         finally:
             await db.close()
 
-    await _invalidate_cache_after_collection("collect_jobs")
+    if invalidate:
+        with result.phase("invalidate"):
+            await _invalidate_cache_after_collection("collect_jobs")
 
     print(f"\n{'='*60}")
     print(f"✨ Job 수집 완료: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     print(f"{'='*60}\n")
 
 
-async def collect_policy_data():
+@_instrumented("collect_policies")
+async def collect_policy_data(result: CollectorResult, invalidate: bool = True):
     """AI Policy 데이터 수집 작업"""
     print(f"\n{'='*60}")
     print(f"⚖️ AI Policy 수집 시작: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
@@ -754,50 +769,41 @@ async def collect_policy_data():
             # 1. RSS 피드에서 AI 정책 뉴스 수집
             policy_service = PolicyService()
 
-            policies = await policy_service.fetch_policy_news(max_results=20)
+            with result.phase("fetch"):
+                policies = await policy_service.fetch_policy_news(max_results=20)
 
             if policies:
-                saved = await policy_service.save_to_db(policies, db)
+                result.fetched += len(policies)
+                with result.phase("save"):
+                    saved = await policy_service.save_to_db(policies, db)
+                record_upsert(result, policy_service)
                 print(f"✅ AI Policy: {saved}개 신규 정책 저장")
             else:
                 print("⚠️  정책 정보를 찾을 수 없습니다")
+                with result.phase("save"):
+                    await _save_feed_validators(db, policy_service)
 
-            # 2. AI 요약 생성 (요약이 없는 정책들에 대해)
-            def _apply_policy_summary(row: AIPolicy, payload: dict[str, Any]) -> bool:
-                if not payload.get("summary"):
-                    return False
-                row.summary = payload.get("summary")
-                row.keywords = payload.get("keywords", [])
-                return True
-
-            await _fill_missing_summaries(
-                db=db,
-                model=AIPolicy,
-                label="정책",
-                item_name=lambda row: row.title or row.source_url or "unknown",
-                build_summary=lambda ai, row: ai.summarize_policy(
-                    title=row.title,
-                    description=row.description or "",
-                    policy_type=row.policy_type,
-                    impact_areas=row.impact_areas or [],
-                ),
-                apply_summary=_apply_policy_summary,
-                limit=10,
-            )
+            # 2. 요약이 없는 정책들은 요약 큐에 등록 (워커가 비동기 처리)
+            with result.phase("save"):
+                await _enqueue_summaries(db, "policies")
 
         except Exception as e:
             print(f"❌ Policy 수집 중 에러 발생: {e}")
+            result.errors.append(str(e))
         finally:
             await db.close()
 
-    await _invalidate_cache_after_collection("collect_policies")
+    if invalidate:
+        with result.phase("invalidate"):
+            await _invalidate_cache_after_collection("collect_policies")
 
     print(f"\n{'='*60}")
     print(f"✨ Policy 수집 완료: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     print(f"{'='*60}\n")
 
 
-async def collect_external_trending_keywords():
+@_instrumented("collect_external_trending_keywords")
+async def collect_external_trending_keywords(result: CollectorResult, invalidate: bool = True):
     """외부 트렌딩 키워드 캐시 갱신."""
     print(f"\n{'='*60}")
     print(f"📈 외부 키워드 수집 시작: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
@@ -805,55 +811,106 @@ async def collect_external_trending_keywords():
 
     try:
         service = ExternalTrendingKeywordService()
-        payload = await service.get_keywords(limit=50, force_refresh=True)
+        with result.phase("fetch"):
+            payload = await service.get_keywords(limit=50, force_refresh=True)
+        result.fetched += len(payload.get("keywords", []))
         print(
             "✅ 외부 트렌딩 키워드 갱신 완료 "
             f"(count={len(payload.get('keywords', []))})"
         )
     except Exception as e:
         print(f"❌ 외부 트렌딩 키워드 수집 실패: {e}")
-
-    await _invalidate_cache_after_collection("collect_external_trending_keywords")
-
-
-async def collect_all_data():
-    """모든 데이터 수집 작업"""
+        result.errors.append(str(e))
+
+    if invalidate:
+        with result.phase("invalidate"):
+            await _invalidate_cache_after_collection("collect_external_trending_keywords")
+
+
+# 전체 수집 계획: (작업 ID, 수집 함수, 사용하는 소스, 선행 작업)
+# 소스가 겹치는 수집기만 COLLECTION_SOURCE_LIMITS에 따라 순서/간격을 둠
+COLLECTION_PLAN = [
+    ("collect_huggingface", collect_huggingface_data, ("huggingface",), ()),
+    ("collect_youtube", collect_youtube_data, ("youtube",), ()),
+    ("collect_papers", collect_papers_data, ("arxiv", "llm"), ()),
+    ("collect_news", collect_news_data, ("news",), ()),
+    ("collect_github", collect_github_data, ("github",), ()),
+    ("collect_conferences", collect_conference_data, ("conferences",), ()),
+    ("collect_tools", collect_tool_data, ("tools",), ()),
+    ("collect_jobs", collect_job_data, ("jobs",), ()),
+    ("collect_policies", collect_policy_data, ("policies", "llm"), ()),
+    (
+        "collect_external_trending_keywords",
+        collect_external_trending_keywords,
+        ("trending", "huggingface"),
+        (),
+    ),
+]
+
+# 전체 수집 시 소스별 제한 (명시하지 않은 소스는 동시에 1개)
+COLLECTION_SOURCE_LIMITS = {
+    # 논문·정책은 저장 시점에 LLM 요약을 직접 호출 → 한 번에 하나만
+    "llm": SourceLimit(max_concurrent=1),
+    # HF 모델 수집과 외부 키워드(HF trending API)가 같은 API를 씀
+    "huggingface": SourceLimit(max_concurrent=1, min_interval=3.0),
+}
+
+
+async def collect_all_data() -> Dict[str, Any]:
+    """모든 데이터 수집 작업 (동시 실행, 캐시 무효화는 마지막에 1회)
+
+    Returns:
+        `{"status", "duration_ms", "collectors": {작업 ID: 결과}}`
+    """
     print(f"\n{'='*80}")
     print(f"🚀 전체 데이터 수집 시작: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     print(f"{'='*80}\n")
 
-    await collect_huggingface_data()
-    await asyncio.sleep(3)  # 잠깐 대기
-
-    await collect_youtube_data()
-    await asyncio.sleep(3)  # 잠깐 대기
-
-    await collect_papers_data()
-    await asyncio.sleep(3)  # 잠깐 대기
-
-    await collect_news_data()
-    await asyncio.sleep(3)  # 잠깐 대기
-
-    await collect_github_data()
-    await asyncio.sleep(3)  # 잠깐 대기
-
-    await collect_conference_data()
-    await asyncio.sleep(3)  # 잠깐 대기
-
-    await collect_tool_data()
-    await asyncio.sleep(3)  # 잠깐 대기
-
-    await collect_job_data()
-    await asyncio.sleep(3)  # 잠깐 대기
-
-    await collect_policy_data()
-
-    # 외부 트렌딩 키워드 캐시 갱신
-    await collect_external_trending_keywords()
-
+    async with instrumented_run("collect_all_data", trigger="manual") as run:
+        results = await run_collectors(
+            [
+                Collector(
+                    name=job_id,
+                    run=partial(func, invalidate=False, trigger="collect_all"),
+                    sources=sources,
+                    depends_on=depends_on,
+                )
+                for job_id, func, sources, depends_on in COLLECTION_PLAN
+            ],
+            concurrency=settings.collection_concurrency,
+            source_limits=COLLECTION_SOURCE_LIMITS,
+        )
+        for job_id, result in results.items():
+            JOB_RUNTIME_STATUS[job_id] = {
+                "last_run": (result.finished_at or run.started_at).isoformat(),
+                "last_status": result.status,
+                "last_error": result.errors[0] if result.errors else None,
+            }
+            # 전체 실행 기록에는 수집기 합계 (단계 시간은 수집기별 이력 참고)
+            run.fetched += result.fetched
+            run.inserted += result.inserted
+            run.updated += result.updated
+            run.http_calls += result.http_calls
+            run.llm_calls += result.llm_calls
+            run.errors.extend(f"{job_id}: {error}" for error in result.errors)
+
+        # 대시보드 롤업 갱신 + 캐시 무효화 (전체 1회)
+        with run.phase("invalidate"):
+            await _refresh_category_rollups(CATEGORY_META.keys())
+            await _clear_collection_caches()
+
+    failed = [job_id for job_id, result in results.items() if result.errors]
     print(f"\n{'='*80}")
-    print(f"🎉 전체 수집 완료: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    print(
+        f"🎉 전체 수집 완료: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} "
+        f"({run.duration_ms}ms, 실패 {len(failed)}개)"
+    )
     print(f"{'='*80}\n")
+    return {
+        "status": "partial" if failed else "completed",
+        "duration_ms": run.duration_ms,
+        "collectors": {job_id: result.as_dict() for job_id, result in results.items()},
+    }
 
 
 def start_scheduler():
@@ -930,6 +987,13 @@ def start_scheduler():
             "id": "collect_tools",
             "name": "AI 플랫폼 수집 (매주)",
         },
+        # ── 상시: AI 요약 큐 처리 (매 10분, 수집 직후에는 즉시) ──
+        {
+            "func": process_summary_queue,
+            "trigger": IntervalTrigger(minutes=10),
+            "id": SUMMARY_JOB_ID,
+            "name": "AI 요약 큐 처리 (매 10분)",
+        },
         # ── 일간: 30일 초과 데이터 아카이브 (매일 03:30) ──
         {
             "func": archive_old_data,
@@ -955,7 +1019,7 @@ def start_scheduler():
         "  - 뉴스: 매 1시간 | YouTube: 매 4시간\n"
         "  - HuggingFace/GitHub/채용/외부키워드: 매 6시간\n"
         "  - 논문: 매 12시간 | 컨퍼런스/정책: 매일\n"
-        "  - 플랫폼: 매주 월요일"
+        "  - 플랫폼: 매주 월요일 | AI 요약 큐: 매 10분"
     )
     logger.info(schedule_info)
     print(schedule_info)
@@ -970,4 +1034,4 @@ def stop_scheduler():
 
 async def run_collection_now():
     """즉시 수집 실행 (테스트용)"""
-    await collect_all_data()
+    return await collect_all_data()
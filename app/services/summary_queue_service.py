@@ -0,0 +1,493 @@
+"""AI 요약 작업 큐 (summary_jobs) + 워커 풀
+
+- 수집기/백필은 요약이 비어있는 항목을 `summary_jobs`에 등록만 하고 즉시 종료
+- 워커 풀은 `SELECT ... FOR UPDATE SKIP LOCKED`로 작업을 나눠 가져감 (다중 프로세스 안전)
+- 같은 카테고리 항목은 배치 프롬프트(`summarize_many`)로 묶어 호출 수를 줄임
+- LLM 호출은 동시 N개 + 토큰 버킷(분당 요청 수)으로 제한, 실패 시 지수 백오프 재시도
+- 결과 반영은 배치 단위로 세션 1개·커밋 1회 (LLM 호출 중에는 DB 트랜잭션을 잡지 않음)
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from sqlalchemy import and_, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.bulk_upsert import dialect_insert
+from app.config import get_settings
+from app.database import AsyncSessionLocal
+from app.models.ai_tool import AITool
+from app.models.conference import AIConference
+from app.models.github import GitHubProject
+from app.models.huggingface import HuggingFaceModel
+from app.models.job_trend import AIJobTrend
+from app.models.news import AINews
+from app.models.paper import AIPaper
+from app.models.policy import AIPolicy
+from app.models.summary_job import SummaryJob
+from app.models.youtube import YouTubeVideo
+from app.services.ai_summary_service import AISummaryService
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+SUMMARY_JOB_LEASE_SECONDS = 600  # running 상태로 이 시간을 넘기면 워커 중단으로 보고 재할당
+SUMMARY_RETRY_BASE_SECONDS = 60
+SUMMARY_RETRY_MAX_SECONDS = 3600
+
+
+@dataclass(frozen=True)
+class SummaryHandler:
+    """카테고리별 요약 생성/반영 규칙."""
+
+    model: Any
+    item_name: Callable[[Any], str]
+    summary_args: Callable[[Any], Dict[str, Any]]  # 행 → summarize_* 인자
+    list_fields: Tuple[str, ...]
+
+
+def apply_summary(row: Any, payload: Dict[str, Any], list_fields: Sequence[str]) -> bool:
+    """요약 결과를 ORM 행에 반영 (비어있는 목록 필드는 기존 값 유지)."""
+    if not payload.get("summary"):
+        return False
+    row.summary = payload["summary"]
+    for field in list_fields:
+        if payload.get(field):
+            setattr(row, field, payload[field])
+    return True
+
+
+SUMMARY_HANDLERS: Dict[str, SummaryHandler] = {
+    "huggingface": SummaryHandler(
+        model=HuggingFaceModel,
+        item_name=lambda row: row.model_name or row.model_id or "unknown",
+        summary_args=lambda row: dict(
+            model_name=row.model_name,
+            description=row.description,
+            task=row.task,
+            tags=row.tags or [],
+        ),
+        list_fields=("key_features", "use_cases"),
+    ),
+    "youtube": SummaryHandler(
+        model=YouTubeVideo,
+        item_name=lambda row: row.title or row.video_id or "unknown",
+        summary_args=lambda row: dict(
+            title=row.title,
+            description=row.description,
+            tags=row.tags or [],
+        ),
+        list_fields=("keywords", "key_points"),
+    ),
+    "papers": SummaryHandler(
+        model=AIPaper,
+        item_name=lambda row: row.title or row.arxiv_id or "unknown",
+        summary_args=lambda row: dict(
+            title=row.title,
+            abstract=row.abstract,
+            authors=row.authors or [],
+            categories=row.categories or [],
+        ),
+        list_fields=("keywords", "key_contributions"),
+    ),
+    "news": SummaryHandler(
+        model=AINews,
+        item_name=lambda row: row.title or row.url or "unknown",
+        summary_args=lambda row: dict(
+            title=row.title,
+            content=row.content or row.excerpt,
+            source=row.source,
+        ),
+        list_fields=("keywords", "key_points"),
+    ),
+    "github": SummaryHandler(
+        model=GitHubProject,
+        item_name=lambda row: row.repo_name or row.name or "unknown",
+        summary_args=lambda row: dict(
+            repo_name=row.repo_name,
+            description=row.description,
+            language=row.language,
+            topics=row.topics or [],
+        ),
+        list_fields=("keywords", "use_cases"),
+    ),
+    "conferences": SummaryHandler(
+        model=AIConference,
+        item_name=lambda row: row.conference_name or "unknown",
+        summary_args=lambda row: dict(
+            name=row.conference_name,
+            description=row.summary or "",
+            topics=row.topics or [],
+        ),
+        list_fields=("keywords",),
+    ),
+    "tools": SummaryHandler(
+        model=AITool,
+        item_name=lambda row: row.tool_name or "unknown",
+        summary_args=lambda row: dict(
+            name=row.tool_name,
+            description=row.description or "",
+            category=row.category,
+            use_cases=row.use_cases or [],
+        ),
+        list_fields=("keywords", "best_for"),
+    ),
+    "jobs": SummaryHandler(
+        model=AIJobTrend,
+        item_name=lambda row: row.job_title or row.job_url or "unknown",
+        summary_args=lambda row: dict(
+            title=row.job_title,
+            company=row.company_name,
+            description=row.description or "",
+            skills=row.required_skills or [],
+        ),
+        list_fields=("keywords",),
+    ),
+    "policies": SummaryHandler(
+        model=AIPolicy,
+        item_name=lambda row: row.title or row.source_url or "unknown",
+        summary_args=lambda row: dict(
+            title=row.title,
+            description=row.description or "",
+            policy_type=row.policy_type,
+            impact_areas=row.impact_areas or [],
+        ),
+        list_fields=("keywords",),
+    ),
+}
+
+
+class TokenBucket:
+    """비동기 토큰 버킷 (초당 `rate`개 보충, 최대 `capacity`개 누적)."""
+
+    def __init__(self, rate: float, capacity: float = 1.0):
+        self.rate = rate
+        self.capacity = max(capacity, 1.0)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        if self.rate <= 0:
+            return
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity, self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def _missing_summary(model):
+    return or_(model.summary.is_(None), model.summary == "")
+
+
+async def enqueue_summary_jobs(
+    db: AsyncSession,
+    category: str,
+    item_ids: Iterable[int],
+    retry_failed: bool = False,
+) -> int:
+    """요약 작업 등록 (커밋하지 않음).
+
+    이미 대기/처리 중인 항목은 무시하고, 완료(done)된 항목은 다시 대기 상태로 되돌림.
+    `retry_failed=True`면 재시도 한도를 넘긴 failed 항목도 되살림.
+
+    Returns:
+        새로 대기 상태가 된 작업 수
+    """
+    unique_ids = list(dict.fromkeys(item_ids))
+    if not unique_ids:
+        return 0
+
+    table = SummaryJob.__table__
+    resettable = ["done", "failed"] if retry_failed else ["done"]
+    stmt = dialect_insert(db, table)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[table.c.category, table.c.item_id],
+        set_={
+            "status": "pending",
+            "attempts": 0,
+            "next_run_at": stmt.excluded.next_run_at,
+            "locked_at": None,
+            "last_error": None,
+        },
+        # executemany에서는 IN 확장 파라미터를 쓸 수 없어 OR로 전개
+        where=or_(*(table.c.status == status for status in resettable)),
+    )
+    now = _utcnow()
+    result = await db.execute(
+        stmt.returning(table.c.id),
+        [
+            {
+                "category": category,
+                "item_id": item_id,
+                "status": "pending",
+                "attempts": 0,
+                "next_run_at": now,
+            }
+            for item_id in unique_ids
+        ],
+    )
+    return len(result.scalars().all())
+
+
+async def enqueue_missing_summaries(
+    db: AsyncSession,
+    category: str,
+    limit: Optional[int] = None,
+    retry_failed: bool = False,
+) -> int:
+    """summary가 비어있는 항목을 최신순으로 큐에 등록 (커밋하지 않음)."""
+    model = SUMMARY_HANDLERS[category].model
+    skip_statuses = ["pending", "running"] if retry_failed else ["pending", "running", "failed"]
+    queued = select(SummaryJob.item_id).where(
+        SummaryJob.category == category,
+        SummaryJob.status.in_(skip_statuses),
+    )
+    query = (
+        select(model.id)
+        .where(_missing_summary(model), model.id.not_in(queued))
+        .order_by(model.id.desc())
+    )
+    if limit is not None:
+        query = query.limit(limit)
+    item_ids = (await db.execute(query)).scalars().all()
+    return await enqueue_summary_jobs(db, category, item_ids, retry_failed=retry_failed)
+
+
+async def claim_summary_jobs(db: AsyncSession, limit: int) -> List[SummaryJob]:
+    """실행 가능한 작업을 running으로 전환하며 가져감 (커밋 포함).
+
+    PostgreSQL에서는 `FOR UPDATE SKIP LOCKED`로 다른 워커가 잡은 행을 건너뜀.
+    """
+    now = _utcnow()
+    stale_before = now - timedelta(seconds=SUMMARY_JOB_LEASE_SECONDS)
+    result = await db.execute(
+        select(SummaryJob)
+        .where(
+            or_(
+                and_(
+                    SummaryJob.status == "pending",
+                    or_(SummaryJob.next_run_at.is_(None), SummaryJob.next_run_at <= now),
+                ),
+                and_(SummaryJob.status == "running", SummaryJob.locked_at < stale_before),
+            )
+        )
+        .order_by(SummaryJob.next_run_at.asc(), SummaryJob.id.asc())
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+    )
+    jobs = result.scalars().all()
+    for job in jobs:
+        job.status = "running"
+        job.locked_at = now
+        job.attempts = (job.attempts or 0) + 1
+    await db.commit()
+    return list(jobs)
+
+
+async def _load_targets(db: AsyncSession, jobs: Sequence[SummaryJob]) -> Dict[Tuple[str, int], Any]:
+    """작업 대상 행을 카테고리별 IN 조회 1회로 로드."""
+    ids_by_category: Dict[str, List[int]] = defaultdict(list)
+    for job in jobs:
+        if job.category in SUMMARY_HANDLERS:
+            ids_by_category[job.category].append(job.item_id)
+
+    targets: Dict[Tuple[str, int], Any] = {}
+    for category, item_ids in ids_by_category.items():
+        model = SUMMARY_HANDLERS[category].model
+        rows = (await db.execute(select(model).where(model.id.in_(item_ids)))).scalars()
+        for row in rows:
+            targets[(category, row.id)] = row
+    return targets
+
+
+def _retry_delay(attempts: int) -> timedelta:
+    seconds = SUMMARY_RETRY_BASE_SECONDS * (2 ** max(attempts - 1, 0))
+    return timedelta(seconds=min(seconds, SUMMARY_RETRY_MAX_SECONDS))
+
+
+async def _process_batch(
+    jobs: Sequence[SummaryJob],
+    ai_service: AISummaryService,
+    semaphore: asyncio.Semaphore,
+    bucket: TokenBucket,
+    session_factory,
+    max_attempts: int,
+    items_per_prompt: int,
+) -> Dict[str, int]:
+    counts: Dict[str, Any] = {"done": 0, "retried": 0, "failed": 0, "updated": defaultdict(int)}
+
+    async with session_factory() as db:
+        targets = await _load_targets(db, jobs)
+
+    outcomes: Dict[int, Tuple[Optional[Dict[str, Any]], Optional[str]]] = {}
+    chunks: List[Tuple[str, List[SummaryJob]]] = []
+    by_category: Dict[str, List[SummaryJob]] = defaultdict(list)
+    for job in jobs:
+        row = targets.get((job.category, job.item_id))
+        if row is None:
+            outcomes[job.id] = (None, "item not found")
+        elif row.summary:
+            outcomes[job.id] = ({}, None)  # 다른 경로에서 이미 요약됨
+        else:
+            by_category[job.category].append(job)
+    for category, category_jobs in by_category.items():
+        for start in range(0, len(category_jobs), items_per_prompt):
+            chunks.append((category, category_jobs[start:start + items_per_prompt]))
+
+    async def run(category: str, chunk: List[SummaryJob]) -> None:
+        handler = SUMMARY_HANDLERS[category]
+        items = [
+            (job.id, handler.summary_args(targets[(category, job.item_id)]))
+            for job in chunk
+        ]
+        async with semaphore:
+            try:
+                payloads = await ai_service.summarize_many(
+                    category,
+                    items,
+                    batch_size=items_per_prompt,
+                    acquire=bucket.acquire,
+                )
+            except Exception as e:
+                for job in chunk:
+                    outcomes[job.id] = (None, str(e))
+                return
+        for job in chunk:
+            payload = payloads.get(job.id) or {}
+            if payload.get("summary"):
+                outcomes[job.id] = (payload, None)
+            else:
+                outcomes[job.id] = (None, "empty summary")
+
+    # 배치 프롬프트 단위로 동시 실행 (LLM 호출마다 토큰 버킷 대기)
+    await asyncio.gather(*(run(category, chunk) for category, chunk in chunks))
+
+    # 결과 반영: 세션 1개, 커밋 1회
+    now = _utcnow()
+    async with session_factory() as db:
+        fresh_jobs = {
+            job.id: job
+            for job in (
+                await db.execute(
+                    select(SummaryJob).where(SummaryJob.id.in_([job.id for job in jobs]))
+                )
+            ).scalars()
+        }
+        rows = await _load_targets(db, [job for job in jobs if outcomes[job.id][0]])
+
+        for job in jobs:
+            payload, error = outcomes[job.id]
+            record = fresh_jobs.get(job.id)
+            if record is None:
+                continue
+            record.locked_at = None
+            if payload is not None:
+                row = rows.get((job.category, job.item_id))
+                handler = SUMMARY_HANDLERS[job.category]
+                if payload and row is not None and not row.summary:
+                    apply_summary(row, payload, handler.list_fields)
+                    counts["updated"][job.category] += 1
+                    logger.info("summary done: %s", handler.item_name(row)[:40])
+                record.status = "done"
+                record.last_error = None
+                counts["done"] += 1
+            elif error == "item not found" or (record.attempts or 0) >= max_attempts:
+                record.status = "failed"
+                record.last_error = error
+                counts["failed"] += 1
+            else:
+                record.status = "pending"
+                record.next_run_at = now + _retry_delay(record.attempts or 1)
+                record.last_error = error
+                counts["retried"] += 1
+        await db.commit()
+
+    logger.info(
+        "summary batch: done=%d retried=%d failed=%d",
+        counts["done"],
+        counts["retried"],
+        counts["failed"],
+    )
+    return counts
+
+
+async def process_summary_jobs(
+    max_jobs: Optional[int] = None,
+    concurrency: Optional[int] = None,
+    batch_size: Optional[int] = None,
+    ai_service: Optional[AISummaryService] = None,
+    session_factory=AsyncSessionLocal,
+) -> Dict[str, Any]:
+    """큐가 빌 때까지(또는 max_jobs까지) 요약 작업 처리.
+
+    Returns:
+        {"provider", "claimed", "done", "retried", "failed", "updated": {카테고리: 요약 반영 수}}
+    """
+    ai_service = ai_service or AISummaryService()
+    result: Dict[str, Any] = {
+        "provider": "none",
+        "claimed": 0,
+        "done": 0,
+        "retried": 0,
+        "failed": 0,
+        "updated": {},
+    }
+    if not await ai_service.can_summarize():
+        logger.warning("사용 가능한 요약 provider(Gemini/Ollama)가 없어 요약 큐 처리를 건너뜁니다")
+        return result
+    result["provider"] = "gemini" if ai_service.model is not None else "ollama"
+
+    concurrency = max(concurrency or settings.summary_worker_concurrency, 1)
+    batch_size = max(batch_size or settings.summary_batch_size, 1)
+    semaphore = asyncio.Semaphore(concurrency)
+    # 외부 API(Gemini) 쿼터만 제한, 로컬 Ollama는 동시 실행 수로만 제한
+    rate = settings.summary_rate_per_minute / 60 if ai_service.model is not None else 0
+    bucket = TokenBucket(rate, capacity=concurrency)
+
+    while max_jobs is None or result["claimed"] < max_jobs:
+        take = batch_size if max_jobs is None else min(batch_size, max_jobs - result["claimed"])
+        async with session_factory() as db:
+            jobs = await claim_summary_jobs(db, take)
+        if not jobs:
+            break
+        result["claimed"] += len(jobs)
+        counts = await _process_batch(
+            jobs,
+            ai_service,
+            semaphore,
+            bucket,
+            session_factory,
+            settings.summary_max_attempts,
+            max(settings.summary_items_per_prompt, 1),
+        )
+        for key in ("done", "retried", "failed"):
+            result[key] += counts[key]
+        for category, value in counts["updated"].items():
+            result["updated"][category] = result["updated"].get(category, 0) + value
+
+    if result["claimed"]:
+        logger.info(
+            "요약 큐 처리: 완료 %d / 재시도 대기 %d / 실패 %d",
+            result["done"],
+            result["retried"],
+            result["failed"],
+        )
+    return result
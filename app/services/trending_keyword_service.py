@@ -10,7 +10,9 @@ import logging
 
 import httpx
 
-from app.cache import cache_get, cache_set
+from app.cache import cached, invalidate_cache_tags
+from app.http_client import http_client
+from app.keyword_matcher import BOUNDARY_WORD, KeywordMatcher
 
 logger = logging.getLogger(__name__)
 
@@ -27,7 +29,9 @@ print = _log_print  # type: ignore[assignment]
 class ExternalTrendingKeywordService:
     """Aggregate AI trend keywords from external public sources."""
 
+    CACHE_KEY = "dashboard:external_trending_keywords"
     CACHE_TTL_SECONDS = 6 * 60 * 60
+    MAX_KEYWORDS = 100  # API limit 상한
     HF_URL = "https://huggingface.co/api/models"
     HN_URL = "https://hn.algolia.com/api/v1/search"
     PWC_URL = "https://paperswithcode.com/api/v1/papers/"
@@ -115,6 +119,9 @@ class ExternalTrendingKeywordService:
         "Edge AI",
     ]
 
+    # 키워드 전체를 1회 컴파일 (단어 단위 일치, 복수형 허용)
+    _TERM_MATCHER = KeywordMatcher(AI_KEYWORDS, boundary=BOUNDARY_WORD)
+
     def __init__(self) -> None:
         self._keyword_map = {kw.lower(): kw for kw in self.AI_KEYWORDS}
         self._normalized_terms = sorted(
@@ -122,13 +129,26 @@ class ExternalTrendingKeywordService:
         )
 
     async def get_keywords(self, limit: int = 50, force_refresh: bool = False) -> Dict[str, Any]:
-        """Return merged keywords with weights and source metadata."""
-        cache_key = f"dashboard:external_trending_keywords:{limit}"
-        if not force_refresh:
-            cached = await cache_get(cache_key)
-            if cached is not None:
-                return cached
+        """Return merged keywords with weights and source metadata.
 
+        상위 MAX_KEYWORDS개 순위 하나를 dashboard 태그 세대 아래에 캐시하고 limit만큼 잘라 반환하므로
+        limit(대시보드 50, 라이브 펄스 3 등)이 달라도 같은 시점의 순위를 공유함.
+        `force_refresh`면 dashboard 태그 세대를 올린 뒤 새 세대에 다시 채움.
+        """
+        if force_refresh:
+            await invalidate_cache_tags(["dashboard"])
+        payload = await cached(
+            self.CACHE_KEY,
+            self._build_ranking,
+            ttl=self.CACHE_TTL_SECONDS,
+            tag="dashboard",
+        )
+        return {
+            "keywords": payload["keywords"][:limit],
+            "updated_at": payload["updated_at"],
+        }
+
+    async def _build_ranking(self) -> Dict[str, Any]:
         source_payloads = await self._collect_sources()
         counter: Counter[str] = Counter()
         sources_map: Dict[str, Set[str]] = defaultdict(set)
@@ -142,16 +162,14 @@ class ExternalTrendingKeywordService:
                 sources_map[canonical].add(source_name)
 
         if not counter:
-            payload = {
+            return {
                 "keywords": [],
                 "updated_at": datetime.now(timezone.utc).isoformat(),
             }
-            await cache_set(cache_key, payload, ttl=self.CACHE_TTL_SECONDS)
-            return payload
 
         max_count = max(counter.values())
         keywords = []
-        for keyword, count in counter.most_common(limit):
+        for keyword, count in counter.most_common(self.MAX_KEYWORDS):
             keyword_sources = sorted(list(sources_map[keyword]))
             keywords.append(
                 {
@@ -163,15 +181,13 @@ class ExternalTrendingKeywordService:
                 }
             )
 
-        payload = {
+        return {
             "keywords": keywords,
             "updated_at": datetime.now(timezone.utc).isoformat(),
         }
-        await cache_set(cache_key, payload, ttl=self.CACHE_TTL_SECONDS)
-        return payload
 
     async def _collect_sources(self) -> Dict[str, List[str]]:
-        async with httpx.AsyncClient(timeout=25.0) as client:
+        async with http_client("trending") as client:
             hf_task = self._fetch_huggingface(client)
             hn_task = self._fetch_hackernews(client)
             pwc_task = self._fetch_paperswithcode(client)
@@ -263,18 +279,7 @@ class ExternalTrendingKeywordService:
         return keywords
 
     def _extract_keywords_from_text(self, text: str) -> List[str]:
-        if not text:
-            return []
-        lowered = text.lower()
-        found: List[str] = []
-        for term in self._normalized_terms:
-            if " " in term or "-" in term:
-                if term in lowered:
-                    found.append(self._keyword_map[term])
-                continue
-            if re.search(rf"\b{re.escape(term)}\b", lowered):
-                found.append(self._keyword_map[term])
-        return found
+        return self._TERM_MATCHER.labels(text)
 
     def _canonicalize_keyword(self, keyword: str) -> Optional[str]:
         if not keyword:
@@ -291,8 +296,11 @@ class ExternalTrendingKeywordService:
         if compact in self._keyword_map:
             return self._keyword_map[compact]
 
-        # 약한 매칭: 후보 키워드가 문자열에 포함되면 canonical 사용
+        # 약한 매칭: 입력을 포함하는 가장 긴 키워드, 없으면 입력에 (단어 단위로) 포함된 가장 긴 키워드
         for key in self._normalized_terms:
-            if key in normalized or normalized in key:
+            if normalized in key:
                 return self._keyword_map[key]
+        contained = self._TERM_MATCHER.find_all(normalized)
+        if contained:
+            return self._keyword_map[max(contained, key=len)]
         return None
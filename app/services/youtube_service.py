@@ -9,7 +9,10 @@ from sqlalchemy import select, desc
 from app.models.youtube import YouTubeVideo
 from app.schemas.youtube import YouTubeVideoCreate
 from app.config import get_settings
+from app.bulk_upsert import bulk_upsert, prefetch_existing
+from app.http_client import http_client
 from app.db_compat import has_archive_column, has_columns
+from app.pagination import apply_keyset
 
 settings = get_settings()
 logger = logging.getLogger(__name__)
@@ -175,7 +178,7 @@ class YouTubeService:
             return []
 
         try:
-            async with httpx.AsyncClient() as client:
+            async with http_client("youtube") as client:
                 # 1. 비디오 검색
                 search_params = {
                     "part": "snippet",
@@ -232,7 +235,7 @@ class YouTubeService:
             상세 정보 리스트
         """
         try:
-            async with httpx.AsyncClient() as client:
+            async with http_client("youtube") as client:
                 params = {
                     "part": "snippet,statistics,contentDetails",
                     "id": ",".join(video_ids),
@@ -303,7 +306,6 @@ class YouTubeService:
         Returns:
             저장된 비디오 수
         """
-        saved_count = 0
         column_flags = await has_columns(
             db,
             "youtube_videos",
@@ -314,12 +316,15 @@ class YouTubeService:
         )
         has_channel_language = column_flags["channel_language"]
 
+        prepared = []
+        skipped = 0
         for video_data in videos:
             try:
                 normalized_video_id = self._extract_video_id(video_data.get("video_id"))
                 if not normalized_video_id:
                     normalized_video_id = self._extract_video_id(video_data.get("url"))
                 if not normalized_video_id:
+                    skipped += 1
                     continue
 
                 channel_id = video_data.get("channel_id")
@@ -338,14 +343,6 @@ class YouTubeService:
                     or ""
                 )
 
-                # 이미 존재하는지 확인
-                result = await db.execute(
-                    select(YouTubeVideo).where(
-                        YouTubeVideo.video_id == normalized_video_id
-                    )
-                )
-                existing_video = result.scalar_one_or_none()
-
                 # published_at 파싱
                 published_at = None
                 if video_data.get("published_at"):
@@ -356,64 +353,113 @@ class YouTubeService:
                     except Exception:
                         pass
 
-                if existing_video:
-                    # 업데이트 (조회수, 좋아요 수 등)
-                    existing_video.view_count = video_data.get("view_count", 0)
-                    existing_video.like_count = video_data.get("like_count", 0)
-                    existing_video.comment_count = video_data.get("comment_count", 0)
-                    if resolved_channel_title:
-                        existing_video.channel_title = resolved_channel_title
-                    if has_channel_language:
-                        existing_video.channel_language = resolved_channel_language
-                    existing_video.is_trending = True
-                    if has_archive_columns:
-                        existing_video.is_archived = False
-                        existing_video.archived_at = None
-                else:
-                    # 동일 채널 + 동일 제목 + 동일 게시일 중복 방어
-                    duplicate_query = select(YouTubeVideo).where(
-                        YouTubeVideo.channel_id == channel_id,
-                        YouTubeVideo.title == video_data.get("title", ""),
-                        YouTubeVideo.published_at == published_at,
-                    )
-                    duplicate_row = (await db.execute(duplicate_query)).scalar_one_or_none()
-                    if duplicate_row:
-                        duplicate_row.is_trending = True
-                        if has_archive_columns:
-                            duplicate_row.is_archived = False
-                            duplicate_row.archived_at = None
-                        await db.commit()
-                        continue
-
-                    # 새로 추가
-                    payload = dict(
-                        video_id=normalized_video_id,
-                        title=video_data.get("title", ""),
-                        channel_title=resolved_channel_title,
-                        channel_id=channel_id,
-                        description=video_data.get("description"),
-                        published_at=published_at,
-                        thumbnail_url=video_data.get("thumbnail_url"),
-                        view_count=video_data.get("view_count", 0),
-                        like_count=video_data.get("like_count", 0),
-                        comment_count=video_data.get("comment_count", 0),
-                        duration=video_data.get("duration"),
-                        tags=video_data.get("tags", []),
-                        is_trending=True,
-                    )
-                    if has_channel_language:
-                        payload["channel_language"] = resolved_channel_language
-                    new_video = YouTubeVideo(**payload)
-                    db.add(new_video)
-                    saved_count += 1
-
-                await db.commit()
-
+                payload = dict(
+                    video_id=normalized_video_id,
+                    title=video_data.get("title", ""),
+                    channel_title=resolved_channel_title,
+                    channel_id=channel_id,
+                    description=video_data.get("description"),
+                    published_at=published_at,
+                    thumbnail_url=video_data.get("thumbnail_url"),
+                    view_count=video_data.get("view_count", 0),
+                    like_count=video_data.get("like_count", 0),
+                    comment_count=video_data.get("comment_count", 0),
+                    duration=video_data.get("duration"),
+                    tags=video_data.get("tags", []),
+                    is_trending=True,
+                )
+                if has_channel_language:
+                    payload["channel_language"] = resolved_channel_language
+                if has_archive_columns:
+                    payload["is_archived"] = False
+                    payload["archived_at"] = None
+                prepared.append(payload)
             except Exception as e:
-                await db.rollback()
+                skipped += 1
                 print(f"❌ 비디오 저장 실패 ({video_data.get('video_id')}): {e}")
 
-        return saved_count
+        existing_videos = await prefetch_existing(
+            db, YouTubeVideo, "video_id", (row["video_id"] for row in prepared)
+        )
+
+        # 동일 채널 + 동일 제목 + 동일 게시일 중복 방어 (신규 후보만, 1회 조회)
+        candidates = [row for row in prepared if row["video_id"] not in existing_videos]
+        duplicates: Dict[tuple, YouTubeVideo] = {}
+        if candidates:
+            duplicate_rows = await db.execute(
+                select(YouTubeVideo).where(
+                    YouTubeVideo.channel_id.in_({row["channel_id"] for row in candidates}),
+                    YouTubeVideo.title.in_({row["title"] for row in candidates}),
+                )
+            )
+            for video in duplicate_rows.scalars():
+                duplicates[self._duplicate_key(video.channel_id, video.title, video.published_at)] = video
+
+        rows = []
+        new_keys = set()
+        for payload in prepared:
+            existing_video = existing_videos.get(payload["video_id"])
+            if existing_video:
+                if not payload["channel_title"]:
+                    payload["channel_title"] = existing_video.channel_title
+                rows.append(payload)
+                continue
+
+            duplicate_key = self._duplicate_key(
+                payload["channel_id"], payload["title"], payload["published_at"]
+            )
+            if duplicate_key in new_keys:
+                skipped += 1
+                continue
+            duplicate_row = duplicates.get(duplicate_key)
+            if duplicate_row:
+                duplicate_row.is_trending = True
+                if has_archive_columns:
+                    duplicate_row.is_archived = False
+                    duplicate_row.archived_at = None
+                skipped += 1
+                continue
+            new_keys.add(duplicate_key)
+            rows.append(payload)
+
+        # 기존 항목은 조회수/좋아요 등 지표와 채널 정보, 트렌딩/아카이브 상태만 갱신
+        try:
+            stats = await bulk_upsert(
+                db,
+                YouTubeVideo,
+                rows,
+                key="video_id",
+                update_columns=[
+                    "view_count",
+                    "like_count",
+                    "comment_count",
+                    "channel_title",
+                    "channel_language",
+                    "is_trending",
+                    "is_archived",
+                    "archived_at",
+                ],
+                existing=existing_videos,
+            )
+            await db.commit()
+        except Exception as e:
+            await db.rollback()
+            print(f"❌ 비디오 저장 실패: {e}")
+            return 0
+
+        stats.skipped += skipped
+        self.last_upsert_stats = stats
+        print(
+            f"💾 YouTube 저장 결과: 신규 {stats.inserted} / 갱신 {stats.updated} / 건너뜀 {stats.skipped}"
+        )
+        return stats.inserted
+
+    @staticmethod
+    def _duplicate_key(channel_id: Optional[str], title: Optional[str], published_at) -> tuple:
+        """중복 판정 키 (게시일은 UTC naive로 정규화해 비교)."""
+        if isinstance(published_at, datetime) and published_at.tzinfo is not None:
+            published_at = published_at.astimezone(timezone.utc).replace(tzinfo=None)
+        return (channel_id, title or "", published_at)
 
     async def get_videos(
         self,
@@ -423,6 +469,7 @@ class YouTubeService:
         trending_only: bool = False,
         include_archived: bool = False,
         language: Optional[str] = None,
+        cursor: Optional[str] = None,
     ) -> List[YouTubeVideo]:
         """
         데이터베이스에서 비디오 목록 가져오기
@@ -432,6 +479,7 @@ class YouTubeService:
             skip: 건너뛸 개수
             limit: 가져올 개수
             trending_only: 트렌딩 비디오만 가져올지 여부
+            cursor: 키셋 cursor (지정 시 skip 대신 `(정렬키, id)` 기준 조회)
 
         Returns:
             비디오 목록
@@ -448,7 +496,12 @@ class YouTubeService:
         if language:
             query = query.where(YouTubeVideo.channel_language == language.lower())
 
-        query = query.order_by(desc(YouTubeVideo.view_count)).offset(skip).limit(limit)
+        if cursor is not None:
+            query = apply_keyset(
+                query, YouTubeVideo.view_count, YouTubeVideo.id, cursor
+            ).limit(limit)
+        else:
+            query = query.order_by(desc(YouTubeVideo.view_count)).offset(skip).limit(limit)
 
         result = await db.execute(query)
         videos = result.scalars().all()
@@ -519,7 +572,7 @@ class YouTubeService:
             return []
 
         try:
-            async with httpx.AsyncClient() as client:
+            async with http_client("youtube") as client:
                 # 1. 채널의 비디오 검색
                 search_params = {
                     "part": "snippet",
@@ -572,7 +625,7 @@ class YouTubeService:
             return None
 
         try:
-            async with httpx.AsyncClient() as client:
+            async with http_client("youtube") as client:
                 params = {
                     "part": "snippet,statistics",
                     "id": channel_id,
@@ -642,7 +695,7 @@ class YouTubeService:
 
         try:
             expected_language = self._language_from_handle(handle) or "en"
-            async with httpx.AsyncClient() as client:
+            async with http_client("youtube") as client:
                 # 1. 핸들로 채널 검색하여 채널 ID 확인
                 search_params = {
                     "part": "snippet",
@@ -1,9 +1,78 @@
 """공통 테스트 픽스처."""
+import asyncio
 import os
 
+import pytest
+from sqlalchemy import MetaData, Table, UniqueConstraint, event
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
 # 테스트 환경변수 설정 (Settings 로드 전에 반드시 필요)
 os.environ.setdefault("DATABASE_URL", "sqlite+aiosqlite:///test.db")
 os.environ.setdefault("REDIS_URL", "redis://localhost:6379/15")
 os.environ.setdefault("APP_PASSWORD", "test-pw-for-ci")
 os.environ.setdefault("ADMIN_PASSWORD", "admin-pw-for-ci")
 os.environ.setdefault("JWT_SECRET_KEY", "test-jwt-secret-key-for-ci")
+
+
+@pytest.fixture
+def run():
+    """테스트 하나의 코루틴들을 같은 이벤트 루프에서 실행 (준비·검증 단계가 엔진을 공유)."""
+    with asyncio.Runner() as runner:
+        yield runner.run
+
+
+def _sqlite_table(table: Table) -> Table:
+    """PostgreSQL 전용 generated 컬럼(search_vector, GIN 인덱스)을 뺀 테이블 사본."""
+    if "search_vector" not in table.c:
+        return table
+    return Table(
+        table.name,
+        MetaData(),
+        *(column._copy() for column in table.columns if column.name != "search_vector"),
+        *(
+            constraint._copy()
+            for constraint in table.constraints
+            if isinstance(constraint, UniqueConstraint)
+        ),
+    )
+
+
+@pytest.fixture
+def sqlite_db(run):
+    """필요한 테이블만 만든 SQLite DB의 세션 팩토리 생성기.
+
+    `sqlite_db(AITool, KeywordOccurrence)` → 메모리 DB,
+    `path=`를 주면 WAL 모드 파일 DB (동시 쓰기 세션이 필요한 테스트용).
+    """
+    engines = []
+
+    def _create(*models, path=None):
+        engine = create_async_engine(f"sqlite+aiosqlite:///{path}" if path else "sqlite+aiosqlite://")
+
+        if path:
+            @event.listens_for(engine.sync_engine, "connect")
+            def _wal(dbapi_connection, _):
+                dbapi_connection.execute("PRAGMA journal_mode=WAL")
+        else:
+            # pysqlite는 BEGIN을 늦게 보내 SAVEPOINT가 바깥 트랜잭션 밖에서 커밋됨 → 직접 BEGIN
+            # (메모리 DB는 연결 1개라 동시 쓰기 잠금 문제 없음)
+            @event.listens_for(engine.sync_engine, "connect")
+            def _autocommit(dbapi_connection, _):
+                dbapi_connection.isolation_level = None
+
+            @event.listens_for(engine.sync_engine, "begin")
+            def _begin(conn):
+                conn.exec_driver_sql("BEGIN")
+
+        async def _create_tables():
+            async with engine.begin() as conn:
+                for model in models:
+                    await conn.run_sync(_sqlite_table(model.__table__).create)
+
+        run(_create_tables())
+        engines.append(engine)
+        return async_sessionmaker(engine, expire_on_commit=False)
+
+    yield _create
+    for engine in engines:
+        run(engine.dispose())
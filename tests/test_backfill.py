@@ -0,0 +1,149 @@
+"""청크 단위 재개형 백필 엔진 테스트.
+
+청크마다 커밋되어 실패한 청크 앞까지의 결과와 체크포인트가 남고,
+재실행하면 체크포인트 다음부터 이어서 처리하는지 확인 (SQLite WAL 파일 DB).
+"""
+import pytest
+from sqlalchemy import select
+
+from app.backfill import (
+    BACKFILL_STATUS_DONE,
+    BACKFILL_STATUS_FAILED,
+    BACKFILL_STATUS_PENDING,
+    BackfillTask,
+    claim_backfill,
+    get_backfill_progress,
+    is_backfill_running,
+    release_backfill,
+    run_backfill,
+)
+from app.models.ai_tool import AITool
+from app.models.backfill_checkpoint import BackfillCheckpoint
+
+
+class _TaglineBackfill:
+    """처리한 id를 기록하고 `fail_on` id에서 실패하는 tagline 백필."""
+
+    def __init__(self, fail_on=None):
+        self.fail_on = fail_on
+        self.seen = []
+
+    def apply(self, row):
+        self.seen.append(row.id)
+        if row.id == self.fail_on:
+            raise ValueError("boom")
+        tagline = row.tool_name.upper()
+        if row.tagline == tagline:
+            return False
+        row.tagline = tagline
+        return True
+
+    def run(self, session_factory, concurrency=1, **options):
+        task = BackfillTask("tagline", AITool, self.apply)
+        return run_backfill(
+            "test",
+            [task],
+            chunk_size=10,
+            concurrency=concurrency,
+            session_factory=session_factory,
+            **options,
+        )
+
+
+@pytest.fixture
+def session_factory(sqlite_db, run, tmp_path):
+    # 청크를 동시에 커밋하므로 WAL 파일 DB 사용
+    session_factory = sqlite_db(AITool, BackfillCheckpoint, path=tmp_path / "backfill.db")
+
+    async def _seed():
+        async with session_factory() as db:
+            db.add_all([AITool(tool_name=f"tool-{n}") for n in range(1, 26)])
+            await db.commit()
+
+    run(_seed())
+    return session_factory
+
+
+async def _taglines(session_factory):
+    async with session_factory() as db:
+        return (await db.execute(select(AITool.tagline).order_by(AITool.id))).scalars().all()
+
+
+def test_failed_chunk_keeps_earlier_chunks(session_factory, run):
+    backfill = _TaglineBackfill(fail_on=17)
+    result = run(backfill.run(session_factory))
+
+    # 두 번째 청크(11~20)에서 실패 → 첫 청크만 반영, 이후 청크는 시작하지 않음
+    assert result["tagline"]["status"] == BACKFILL_STATUS_FAILED
+    assert (result["tagline"]["last_id"], result["tagline"]["processed"]) == (10, 10)
+    assert backfill.seen == list(range(1, 18))
+    taglines = run(_taglines(session_factory))
+    assert taglines[:10] == [f"TOOL-{n}" for n in range(1, 11)]
+    assert set(taglines[10:]) == {None}
+
+
+def test_rerun_resumes_after_checkpoint(session_factory, run):
+    run(_TaglineBackfill(fail_on=17).run(session_factory))
+
+    backfill = _TaglineBackfill()
+    result = run(backfill.run(session_factory, concurrency=2))
+
+    # 재실행은 체크포인트 다음(11)부터
+    assert sorted(backfill.seen) == list(range(11, 26))
+    assert result["tagline"] == {
+        "status": BACKFILL_STATUS_DONE,
+        "processed": 25,
+        "updated": 25,
+        "total": 25,
+        "last_id": 25,
+    }
+    assert run(_taglines(session_factory)) == [f"TOOL-{n}" for n in range(1, 26)]
+
+
+def test_limited_runs_resume_after_last_id(session_factory, run):
+    first = _TaglineBackfill()
+    result = run(first.run(session_factory, limit=10))
+
+    # limit으로 끊긴 실행은 done이 아니라 재개 가능한 pending, 진행률은 전체 25행 기준
+    assert first.seen == list(range(1, 11))
+    assert result["tagline"]["status"] == BACKFILL_STATUS_PENDING
+    assert (result["tagline"]["last_id"], result["tagline"]["total"]) == (10, 25)
+    [checkpoint] = run(get_backfill_progress("test", session_factory=session_factory))
+    assert checkpoint["progress"] == 0.4
+
+    second = _TaglineBackfill()
+    run(second.run(session_factory, limit=10))
+    last = _TaglineBackfill()
+    result = run(last.run(session_factory, limit=10))
+
+    assert second.seen == list(range(11, 21))
+    assert last.seen == list(range(21, 26))
+    assert result["tagline"]["status"] == BACKFILL_STATUS_DONE
+    assert (result["tagline"]["processed"], result["tagline"]["total"]) == (25, 25)
+
+
+def test_progress_reports_finished_checkpoint(session_factory, run):
+    run(_TaglineBackfill().run(session_factory, concurrency=2))
+
+    [checkpoint] = run(get_backfill_progress("test", session_factory=session_factory))
+    assert checkpoint["status"] == BACKFILL_STATUS_DONE
+    assert checkpoint["progress"] == 1.0
+    assert checkpoint["running"] is False
+    assert checkpoint["last_error"] is None
+
+
+def test_claimed_job_rejects_second_start_until_released(session_factory, run):
+    assert claim_backfill("test")
+    try:
+        assert not claim_backfill("test")
+        with pytest.raises(RuntimeError):
+            run(_TaglineBackfill().run(session_factory))
+
+        # 선점한 쪽은 claimed=True로 실행하고, 실행이 끝나도 해제 전까지 자리를 유지
+        result = run(_TaglineBackfill().run(session_factory, claimed=True))
+        assert result["tagline"]["status"] == BACKFILL_STATUS_DONE
+        assert is_backfill_running("test")
+    finally:
+        release_backfill("test")
+    assert claim_backfill("test")
+    release_backfill("test")
@@ -0,0 +1,146 @@
+"""벌크 업서트 헬퍼 테스트.
+
+ON CONFLICT 갱신 범위(update/coalesce), 배치 내 중복 처리, 집계 카운트,
+키워드 인덱스 동기화를 SQLite에서 확인.
+"""
+import pytest
+from sqlalchemy import select
+
+from app.bulk_upsert import bulk_upsert, prefetch_existing
+from app.models.ai_tool import AITool
+from app.models.job_trend import AIJobTrend
+from app.models.keyword_occurrence import KeywordOccurrence
+from app.services.job_trend_service import JobTrendService
+
+UPSERT_OPTIONS = {
+    "key": "website",
+    "update_columns": ["rating"],
+    "coalesce_columns": ["description", "key_features"],
+}
+
+
+async def _upsert_first_batch(session_factory):
+    async with session_factory() as db:
+        stats = await bulk_upsert(
+            db,
+            AITool,
+            [
+                {"tool_name": "A", "website": "https://a", "description": "old", "key_features": ["LLM"]},
+                {"tool_name": "B", "website": "https://b", "rating": 4.0},
+                {"tool_name": "B-dup", "website": "https://b"},
+                {"tool_name": "no-key"},
+            ],
+            **UPSERT_OPTIONS,
+        )
+        await db.commit()
+    return stats
+
+
+async def _upsert_second_batch(session_factory):
+    async with session_factory() as db:
+        existing = await prefetch_existing(db, AITool, "website", ["https://a", "https://b", "https://c"])
+        stats = await bulk_upsert(
+            db,
+            AITool,
+            [
+                {"tool_name": "A", "website": "https://a", "description": None, "key_features": ["Agent"]},
+                {"tool_name": "B", "website": "https://b", "rating": 2.5},
+                {"tool_name": "C", "website": "https://c"},
+            ],
+            existing=existing,
+            **UPSERT_OPTIONS,
+        )
+        await db.commit()
+    return existing, stats
+
+
+async def _select_all(session_factory, *columns):
+    async with session_factory() as db:
+        return (await db.execute(select(*columns))).all()
+
+
+@pytest.fixture
+def session_factory(sqlite_db):
+    return sqlite_db(AITool, KeywordOccurrence)
+
+
+def test_batch_duplicates_and_missing_keys_are_skipped(session_factory, run):
+    stats = run(_upsert_first_batch(session_factory))
+
+    assert stats.as_dict() == {"inserted": 2, "updated": 0, "skipped": 2}
+
+
+def test_prefetch_existing_splits_inserts_and_updates(session_factory, run):
+    run(_upsert_first_batch(session_factory))
+    existing, stats = run(_upsert_second_batch(session_factory))
+
+    assert sorted(existing) == ["https://a", "https://b"]
+    assert stats.as_dict() == {"inserted": 1, "updated": 2, "skipped": 0}
+
+
+def test_conflict_updates_and_coalesces_columns(session_factory, run):
+    run(_upsert_first_batch(session_factory))
+    run(_upsert_second_batch(session_factory))
+
+    tools = run(
+        _select_all(session_factory, AITool.tool_name, AITool.description, AITool.key_features, AITool.rating)
+    )
+    # rating은 덮어쓰고, description은 새 값이 NULL이면 기존 값 유지
+    assert sorted(tools) == [
+        ("A", "old", ["Agent"], None),
+        ("B", None, [], 2.5),
+        ("C", None, [], None),
+    ]
+
+
+def test_keyword_index_follows_upserted_values(session_factory, run):
+    run(_upsert_first_batch(session_factory))
+    assert run(_select_all(session_factory, KeywordOccurrence.keyword)) == [("LLM",)]
+
+    run(_upsert_second_batch(session_factory))
+
+    assert run(_select_all(session_factory, KeywordOccurrence.keyword)) == [("Agent",)]
+
+
+def test_conflict_update_moves_updated_at(session_factory, run):
+    run(_upsert_first_batch(session_factory))
+    assert run(_select_all(session_factory, AITool.updated_at)) == [(None,), (None,)]
+
+    run(_upsert_second_batch(session_factory))
+
+    # ON CONFLICT로 갱신된 A/B만 updated_at이 채워지고, 새로 들어간 C는 그대로
+    updated = dict(run(_select_all(session_factory, AITool.tool_name, AITool.updated_at)))
+    assert updated["A"] is not None and updated["B"] is not None
+    assert updated["C"] is None
+
+
+class _FixedExtractor:
+    def __init__(self, keywords):
+        self.keywords = keywords
+
+    async def extract_keywords_batch_async(self, texts, top_k):
+        return [list(self.keywords) for _ in texts]
+
+
+async def _save_job(session_factory, extracted, **fields):
+    service = JobTrendService()
+    service.keyword_extractor = _FixedExtractor(extracted)
+    job = {
+        "job_title": "ML Engineer",
+        "job_url": "https://jobs/1",
+        "role_category": "llm",
+        **fields,
+    }
+    async with session_factory() as db:
+        await service.save_to_db([job], db)
+        return (await db.execute(select(AIJobTrend.keywords))).scalar_one()
+
+
+def test_job_upsert_keeps_stored_keywords(sqlite_db, run):
+    session_factory = sqlite_db(AIJobTrend, KeywordOccurrence)
+    run(_save_job(session_factory, ["PyTorch"]))
+
+    # 새 공고 데이터에 keywords가 있어도 저장된 키워드를 버리지 않고 뒤에 덧붙임
+    keywords = run(_save_job(session_factory, ["RAG"], keywords=["Kubernetes"]))
+
+    assert keywords == ["LLM 모델 전문가", "PyTorch", "Kubernetes", "RAG"]
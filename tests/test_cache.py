@@ -0,0 +1,315 @@
+"""캐시 계층 테스트.
+
+L1의 바이트 상한 LRU·TTL, Redis 적중 값의 L1 적재, 다른 워커의 무효화 메시지 반영,
+`cached()`의 단일 계산·stale-while-revalidate를 확인 (Redis는 딕셔너리 기반 가짜 클라이언트로 대체).
+"""
+import asyncio
+import fnmatch
+import json
+
+import pytest
+
+from app import cache
+from app.cache import LocalCache
+
+
+class _FakePipeline:
+    def __init__(self, client):
+        self._client = client
+        self._ops = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: self._ops.append((name, args, kwargs))
+
+    async def execute(self):
+        return [await getattr(self._client, name)(*args, **kwargs) for name, args, kwargs in self._ops]
+
+
+class _FakeRedis:
+    def __init__(self):
+        self.store = {}
+        self.hll = {}
+        self.gets = 0
+        self.published = []
+
+    def pipeline(self, transaction=True):
+        return _FakePipeline(self)
+
+    async def get(self, key):
+        self.gets += 1
+        return self.store.get(key)
+
+    async def pttl(self, key):
+        return 60_000 if key in self.store else -2
+
+    async def set(self, key, value, ex=None, nx=False):
+        if nx and key in self.store:
+            return None
+        self.store[key] = str(value)
+        return True
+
+    async def incr(self, key):
+        self.store[key] = str(int(self.store.get(key, 0)) + 1)
+        return int(self.store[key])
+
+    async def expire(self, key, seconds):
+        return True
+
+    async def incrby(self, key, amount):
+        self.store[key] = str(int(self.store.get(key, 0)) + amount)
+
+    async def pfadd(self, key, *members):
+        self.hll.setdefault(key, set()).update(members)
+
+    async def delete(self, key):
+        self.store.pop(key, None)
+
+    async def scan_iter(self, match, count=None):
+        for key in [key for key in self.store if fnmatch.fnmatchcase(key, match)]:
+            yield key
+
+    async def publish(self, channel, message):
+        self.published.append((channel, json.loads(message)))
+
+    async def eval(self, script, numkeys, key, token):
+        if self.store.get(key) == token:
+            del self.store[key]
+
+
+@pytest.fixture
+def fake_redis(monkeypatch):
+    client = _FakeRedis()
+
+    async def _get_redis(force_reconnect=False):
+        return client
+
+    monkeypatch.setattr(cache, "get_redis", _get_redis)
+    monkeypatch.setattr(cache.local_cache, "enabled", True)
+    cache.local_cache.clear()
+    yield client
+    cache.local_cache.clear()
+
+
+def test_local_cache_evicts_by_bytes_and_expires(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(cache.time, "monotonic", lambda: now[0])
+    local = LocalCache(max_bytes=100, max_ttl=30)
+    local.enabled = True
+
+    local.set("a", "A", 40, ttl=60)
+    local.set("b", "B", 40, ttl=5)
+    assert local.get("a") == (True, "A")  # a가 최근 사용으로 이동
+    local.set("c", "C", 40, ttl=60)
+    assert local.get("b") == (False, None)  # 가장 오래 안 쓴 b가 축출
+    assert local.size == 80
+
+    local.set("huge", "H", 101, ttl=60)
+    assert local.get("huge") == (False, None)
+
+    now[0] += 31  # TTL 상한(30초) 경과
+    assert local.get("a") == (False, None)
+    assert local.delete_pattern("*") == 1 and local.size == 0
+
+
+def test_hot_key_served_from_l1_and_invalidated_across_workers(fake_redis):
+    async def _scenario():
+        await cache.cache_set("dashboard:live_pulse", {"total": 1}, ttl=60)
+        fake_redis.store["system:status"] = json.dumps({"ok": True})
+        first = await cache.cache_get("system:status")
+        second = await cache.cache_get("system:status")
+        pulse = await cache.cache_get("dashboard:live_pulse")
+        return first, second, pulse
+
+    first, second, pulse = asyncio.run(_scenario())
+    assert first == second == {"ok": True}
+    assert pulse == {"total": 1}
+    assert fake_redis.gets == 1  # 두 번째 조회와 cache_set 직후 조회는 L1에서 처리
+    assert fake_redis.published[0] == (
+        cache.CACHE_INVALIDATION_CHANNEL,
+        {"origin": cache.WORKER_ID, "keys": ["dashboard:live_pulse"]},
+    )
+
+    # 자기 자신이 보낸 메시지는 무시, 다른 워커의 패턴 무효화는 반영
+    own = json.dumps({"origin": cache.WORKER_ID, "patterns": ["*"]})
+    assert cache.apply_invalidation(own) == 0
+    other = json.dumps({"origin": "other-worker", "patterns": ["dashboard:*"]})
+    assert cache.apply_invalidation(other) == 1
+    assert cache.local_cache.get("dashboard:live_pulse") == (False, None)
+    assert cache.local_cache.get("system:status") == (True, {"ok": True})
+
+    assert asyncio.run(cache.cache_delete_pattern("system:*")) == 1
+    assert cache.local_cache.get("system:status") == (False, None)
+    assert fake_redis.published[-1][1] == {"origin": cache.WORKER_ID, "patterns": ["system:*"]}
+
+
+def test_cached_coalesces_concurrent_misses(fake_redis):
+    calls = []
+
+    async def _compute():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return {"total": 42}
+
+    async def _scenario():
+        results = await asyncio.gather(
+            *(cache.cached("dashboard:summary", _compute, ttl=60) for _ in range(10))
+        )
+        return results, await cache.cached("dashboard:summary", _compute, ttl=60)
+
+    results, again = asyncio.run(_scenario())
+    assert len(calls) == 1
+    assert results == [{"total": 42}] * 10 and again == {"total": 42}
+    assert "dashboard:v0:summary" in fake_redis.store  # 세대 번호가 들어간 실제 키
+    assert "lock:dashboard:v0:summary" not in fake_redis.store  # 계산 후 락 해제
+
+
+def test_cached_waits_for_other_worker_fill(fake_redis, monkeypatch):
+    monkeypatch.setattr(cache, "CACHE_LOCK_POLL", 0.01)
+    fake_redis.store["lock:system:v0:status"] = "other-worker"
+
+    async def _compute():
+        raise AssertionError("락을 가진 워커만 계산해야 함")
+
+    async def _other_worker_fills():
+        await asyncio.sleep(0.05)
+        fake_redis.store["system:v0:status"] = json.dumps(cache._envelope({"ok": True}, 60))
+
+    async def _scenario():
+        filler = asyncio.create_task(_other_worker_fills())
+        value = await cache.cached("system:status", _compute, ttl=60)
+        await filler
+        return value
+
+    assert asyncio.run(_scenario()) == {"ok": True}
+
+
+def test_cached_rechecks_after_lock_before_computing(fake_redis, monkeypatch):
+    acquire_lock = cache._acquire_lock
+
+    async def _acquire_after_other_worker_filled(key, token):
+        # 첫 조회(미스) 뒤, 락을 잡기 직전에 다른 워커가 채우고 락을 풂
+        fake_redis.store[key] = json.dumps(cache._envelope({"ok": True}, 60))
+        return await acquire_lock(key, token)
+
+    async def _compute():
+        raise AssertionError("이미 채워진 값은 다시 계산하지 않아야 함")
+
+    monkeypatch.setattr(cache, "_acquire_lock", _acquire_after_other_worker_filled)
+
+    assert asyncio.run(cache.cached("system:status", _compute, ttl=60)) == {"ok": True}
+    assert "lock:system:v0:status" not in fake_redis.store
+
+
+def test_cached_serves_stale_and_refreshes_once(fake_redis):
+    stale = cache._envelope({"version": 1}, ttl=-1)  # soft TTL 경과
+    fake_redis.store["list:news:v0:page=1"] = json.dumps(stale)
+    calls = []
+
+    async def _compute():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return {"version": 2, "partial": len(calls) > 1}
+
+    async def _scenario():
+        served = await asyncio.gather(
+            *(cache.cached("list:news:page=1", _compute, ttl=60, tag="list:news") for _ in range(5))
+        )
+        await asyncio.gather(*list(cache._refresh_tasks))
+        fresh = await cache.cached("list:news:page=1", _compute, ttl=60, tag="list:news")
+        skipped = await cache.cached(
+            "search:llm:1:20", _compute, ttl=60, cache_if=lambda payload: not payload["partial"]
+        )
+        return served, fresh, skipped
+
+    served, fresh, skipped = asyncio.run(_scenario())
+    assert served == [{"version": 1}] * 5
+    assert len(calls) == 2  # 백그라운드 갱신 1회 + 검색 계산 1회
+    assert fresh == {"version": 2, "partial": False}
+    assert skipped["partial"] is True
+    assert "search:v0:llm:1:20" not in fake_redis.store
+
+
+def test_tag_invalidation_bumps_generation_only_for_touched_tags(fake_redis):
+    calls = []
+
+    async def _compute():
+        calls.append(1)
+        return len(calls)
+
+    async def _scenario():
+        news = cache.list_cache_tag("news")
+        papers = cache.list_cache_tag("papers")
+        await cache.cached("list:news:page=1", _compute, ttl=60, tag=news)
+        await cache.cached("list:papers:page=1", _compute, ttl=60, tag=papers)
+        await cache.invalidate_cache_tags([news, "dashboard"])
+        return (
+            await cache.cached("list:news:page=1", _compute, ttl=60, tag=news),
+            await cache.cached("list:papers:page=1", _compute, ttl=60, tag=papers),
+        )
+
+    news_value, papers_value = asyncio.run(_scenario())
+    assert (news_value, papers_value) == (3, 2)  # 뉴스만 재계산, 논문 캐시는 유지
+    assert fake_redis.store["cache:gen:list:news"] == "1"
+    assert "list:news:v1:page=1" in fake_redis.store
+    assert {"origin": cache.WORKER_ID, "keys": ["cache:gen:dashboard", "cache:gen:list:news"]} in [
+        message for _, message in fake_redis.published
+    ]
+    with pytest.raises(ValueError):
+        asyncio.run(cache.namespaced_key("search:x", "list:news"))
+
+
+def test_external_keywords_share_one_ranking_across_limits(fake_redis, monkeypatch):
+    from app.services.trending_keyword_service import ExternalTrendingKeywordService
+
+    sources = {"huggingface": ["LLM", "RAG"], "hackernews": ["LLM"], "paperswithcode": []}
+    calls = []
+
+    async def _collect_sources(self):
+        calls.append(1)
+        return {name: list(keywords) for name, keywords in sources.items()}
+
+    monkeypatch.setattr(ExternalTrendingKeywordService, "_collect_sources", _collect_sources)
+    service = ExternalTrendingKeywordService()
+
+    async def _scenario():
+        before = await service.get_keywords(limit=50), await service.get_keywords(limit=1)
+        sources["hackernews"] = ["RAG", "RAG"]
+        refreshed = await service.get_keywords(limit=50, force_refresh=True)
+        return before, refreshed, await service.get_keywords(limit=1)
+
+    (full, top), refreshed, top_after = asyncio.run(_scenario())
+    assert len(calls) == 2  # limit별 계산 없이 순위 1개를 공유, 강제 갱신 때만 재계산
+    assert [k["keyword"] for k in full["keywords"]] == ["LLM", "RAG"]
+    assert top["keywords"] == full["keywords"][:1]
+    assert [k["keyword"] for k in refreshed["keywords"]] == ["RAG", "LLM"]
+    assert top_after["keywords"] == refreshed["keywords"][:1]
+    assert fake_redis.store["cache:gen:dashboard"] == "1"
+
+
+def test_request_stats_are_buffered_and_flushed_in_one_pipeline(fake_redis, monkeypatch):
+    buffer = cache.RequestStatsBuffer(max_pending=4)
+    monkeypatch.setattr(cache, "request_stats", buffer)
+    for visitor in ("1.1.1.1", "2.2.2.2", "1.1.1.1"):
+        cache.record_api_request(visitor)
+    assert fake_redis.store == {} and buffer.pending_visitors == 6
+    assert buffer.wakeup.is_set()  # 상한 도달 → 주기 전에 flush
+
+    async def _failing_redis(force_reconnect=False):
+        raise ConnectionError("redis down")
+
+    with monkeypatch.context() as patched:
+        patched.setattr(cache, "get_redis", _failing_redis)
+        assert asyncio.run(cache.flush_request_stats()) is False
+    assert sum(buffer.requests.values()) == 3  # 실패분은 버퍼로 복구
+
+    assert asyncio.run(cache.flush_request_stats()) is True
+    [request_key] = [key for key in fake_redis.store if key.startswith("api_requests:")]
+    assert fake_redis.store[request_key] == "3"
+    assert fake_redis.hll["visitors:total"] == {"1.1.1.1", "2.2.2.2"}
+    assert buffer.requests == {} and buffer.pending_visitors == 0
@@ -0,0 +1,117 @@
+"""대시보드 카테고리 통계 스냅샷 테스트.
+
+롤업에 있는 카테고리는 롤업 값을, 없는 카테고리는 원본 집계를 사용하고
+원본 집계 실패는 카테고리 단위로 격리되는지, 롤업 스냅샷이 행 삭제·날짜 변경 뒤에도
+원본 집계와 같은지 확인 (SQLite).
+"""
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import delete, update
+
+from app.models.category_stats import CategoryDailyStat
+from app.models.huggingface import HuggingFaceModel
+from app.models.keyword_occurrence import KeywordOccurrence
+from app.models.news import AINews
+from app.services import category_stats_service as stats_service
+
+
+def test_snapshot_merges_rollup_and_live(monkeypatch):
+    live_calls = []
+
+    async def fake_rollup(now, session_factory=None):
+        return {"news": {**stats_service._empty_stats(), "total": 10, "today": 2}}
+
+    async def fake_live(key, now, session_factory=None):
+        live_calls.append(key)
+        if key == "jobs":
+            raise RuntimeError("boom")
+        return {**stats_service._empty_stats(), "total": 1}
+
+    monkeypatch.setattr(stats_service, "_rollup_category_stats", fake_rollup)
+    monkeypatch.setattr(stats_service, "_live_category_stats", fake_live)
+
+    snapshot = asyncio.run(stats_service.get_category_stats_snapshot())
+
+    assert list(snapshot) == list(stats_service.CATEGORY_META)
+    assert "news" not in live_calls
+    assert snapshot["news"]["total"] == 10
+    assert snapshot["news"]["today"] == 2
+    assert snapshot["github"]["total"] == 1
+    assert snapshot["jobs"]["total"] == 0
+    assert "boom" in snapshot["jobs"]["error"]
+
+
+def test_snapshot_falls_back_when_rollup_missing(monkeypatch):
+    async def broken_rollup(now, session_factory=None):
+        raise RuntimeError("no such table: category_daily_stats")
+
+    async def fake_live(key, now, session_factory=None):
+        return {**stats_service._empty_stats(), "recent_7d": 3}
+
+    monkeypatch.setattr(stats_service, "_rollup_category_stats", broken_rollup)
+    monkeypatch.setattr(stats_service, "_live_category_stats", fake_live)
+
+    snapshot = asyncio.run(stats_service.get_category_stats_snapshot())
+
+    assert all(stat["recent_7d"] == 3 for stat in snapshot.values())
+
+
+def test_rollup_snapshot_matches_live_after_changes(sqlite_db, run):
+    session_factory = sqlite_db(
+        *(meta["model"] for meta in stats_service.CATEGORY_META.values()),
+        CategoryDailyStat,
+        KeywordOccurrence,
+    )
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    month_ago = now - timedelta(days=30)
+
+    async def _refresh():
+        async with session_factory() as db:
+            for category in ("huggingface", "news"):
+                await stats_service.refresh_category_daily_stats(db, category)
+
+    async def _seed():
+        async with session_factory() as db:
+            db.add(HuggingFaceModel(model_id="org/m", model_name="m", created_at=month_ago, collected_at=month_ago))
+            db.add_all(
+                [
+                    AINews(title="moved", url="https://n/1", source="s", created_at=now - timedelta(days=3)),
+                    AINews(title="deleted", url="https://n/2", source="s", created_at=now - timedelta(days=2)),
+                    AINews(title="old", url="https://n/3", source="s", created_at=month_ago),
+                    AINews(title="no date", url="https://n/4", source="s"),
+                ]
+            )
+            await db.flush()
+            await db.execute(update(AINews).where(AINews.title == "no date").values(created_at=None))
+            await db.commit()
+
+    async def _change():
+        async with session_factory() as db:
+            # HF 재수집은 collected_at만 갱신, 뉴스 1건은 날짜가 오늘로 바뀌고 1건은 삭제
+            await db.execute(update(HuggingFaceModel).values(collected_at=now))
+            await db.execute(update(AINews).where(AINews.title == "moved").values(created_at=now))
+            await db.execute(delete(AINews).where(AINews.title == "deleted"))
+            await db.commit()
+
+    async def _compare():
+        snapshot = await stats_service.get_category_stats_snapshot(now, session_factory)
+        live = {
+            key: await stats_service._live_category_stats(key, now, session_factory)
+            for key in ("huggingface", "news")
+        }
+        return snapshot, live
+
+    run(_seed())
+    run(_refresh())
+    run(_change())
+    run(_refresh())
+    snapshot, live = run(_compare())
+
+    assert snapshot["huggingface"]["total"] == live["huggingface"]["total"] == 1
+    assert snapshot["huggingface"]["recent_7d"] == 0
+    # 날짜 없는 행도 전체 수에 포함
+    assert snapshot["news"]["total"] == live["news"]["total"] == 3
+    for field in ("recent_7d", "prev_7d", "today"):
+        assert snapshot["news"][field] == live["news"][field]
+    assert (snapshot["news"]["today"], snapshot["news"]["recent_7d"]) == (1, 1)
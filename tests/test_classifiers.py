@@ -103,3 +103,18 @@ class TestPaperTopicClassifier:
             ["cs.CV"],
         )
         assert result == "CV"
+
+
+class TestKeywordBoundaries:
+    """짧은 영문 키워드의 부분 문자열 오탐 방지."""
+
+    def test_short_keywords_need_word_boundaries(self):
+        from app.services.arxiv_service import ArxivService
+        from app.services.job_trend_service import JobTrendService
+        from app.services.policy_service import PolicyService
+
+        assert ArxivService.classify_topic("Scaling LLMs with Mixture of Experts", ["cs.LG"]) == "LLM"
+        assert JobTrendService()._extract_skills("Design storage arrays in PostgreSQL", []) == []
+        assert PolicyService()._extract_impact_areas("The impact of a billion-dollar bank merger") == [
+            "Finance"
+        ]
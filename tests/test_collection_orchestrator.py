@@ -0,0 +1,118 @@
+"""수집기 오케스트레이터 테스트.
+
+독립 수집기는 동시에 실행되고, 같은 소스를 쓰는 수집기는 겹치지 않으며,
+선행 수집기 실패 시 후속 수집기는 건너뛰는지 확인 (외부 호출 없는 가짜 수집기).
+"""
+import asyncio
+
+import pytest
+
+from app.bulk_upsert import UpsertStats
+from app.services.collection_orchestrator import (
+    COLLECTOR_STATUS_ERROR,
+    COLLECTOR_STATUS_SKIPPED,
+    COLLECTOR_STATUS_SUCCESS,
+    Collector,
+    SourceLimit,
+    record_upsert,
+    run_collectors,
+)
+
+
+class _FakeService:
+    def __init__(self, inserted, updated):
+        self.last_upsert_stats = UpsertStats(inserted=inserted, updated=updated)
+
+
+class _Recorder:
+    """가짜 수집기 실행 순서와 시작 시점에 함께 실행 중이던 수집기를 기록."""
+
+    def __init__(self):
+        self.running = set()
+        self.overlaps = {}
+        self.order = []
+
+    def collector(self, name, sources=(), depends_on=(), fail=False):
+        async def _run(result):
+            self.overlaps[name] = set(self.running)
+            self.running.add(name)
+            self.order.append(name)
+            await asyncio.sleep(0.05)
+            self.running.discard(name)
+            if fail:
+                raise RuntimeError("upstream down")
+            result.fetched += 10
+            service = _FakeService(inserted=3, updated=2)
+            record_upsert(result, service)
+            record_upsert(result, service)  # 같은 통계는 한 번만 집계
+
+        return Collector(name, _run, sources=sources, depends_on=depends_on)
+
+
+@pytest.fixture
+def collection(run):
+    """수집기 5개를 전역 3개 + llm 소스 1개 제한으로 실행한 결과."""
+    recorder = _Recorder()
+
+    async def _run_all():
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        results = await run_collectors(
+            [
+                recorder.collector("papers", sources=("arxiv", "llm")),
+                recorder.collector("news", sources=("news",)),
+                recorder.collector("policies", sources=("policies", "llm")),
+                recorder.collector("github", sources=("github",), fail=True),
+                recorder.collector("trending", depends_on=("github",)),
+            ],
+            concurrency=3,
+            source_limits={"llm": SourceLimit(max_concurrent=1)},
+        )
+        return results, loop.time() - started
+
+    results, elapsed = run(_run_all())
+    return results, recorder, elapsed
+
+
+def test_collectors_run_concurrently_within_limits(collection):
+    results, recorder, elapsed = collection
+
+    # 4개 수집기, 전역 3개 + llm 1개 제한 → 순차(0.2초)보다 빠르게 두 단계에 끝남
+    assert elapsed < 0.15
+    assert max(len(active) for active in recorder.overlaps.values()) <= 2
+    for name in ("papers", "policies"):
+        assert not ({"papers", "policies"} & recorder.overlaps[name])
+
+
+def test_collector_results_are_recorded(collection):
+    results, _, _ = collection
+
+    assert list(results) == ["papers", "news", "policies", "github", "trending"]
+    assert results["news"].as_dict()["status"] == COLLECTOR_STATUS_SUCCESS
+    assert (results["news"].fetched, results["news"].inserted, results["news"].updated) == (10, 3, 2)
+    assert results["news"].duration_ms >= 40
+    assert results["github"].status == COLLECTOR_STATUS_ERROR
+    assert results["github"].errors == ["upstream down"]
+
+
+def test_dependents_of_failed_collector_are_skipped(collection):
+    results, recorder, _ = collection
+
+    assert results["trending"].status == COLLECTOR_STATUS_SKIPPED
+    assert "trending" not in recorder.order
+
+
+def test_dependency_cycle_is_rejected():
+    async def _noop(result):
+        return None
+
+    with pytest.raises(ValueError):
+        asyncio.run(
+            run_collectors(
+                [
+                    Collector("a", _noop, depends_on=("b",)),
+                    Collector("b", _noop, depends_on=("a",)),
+                ],
+                concurrency=2,
+            )
+        )
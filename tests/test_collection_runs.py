@@ -0,0 +1,107 @@
+"""수집 실행 계측·이력 테스트.
+
+수집 작업 안에서 띄운 동시 작업의 HTTP/LLM 호출과 단계 시간이 해당 실행에만 집계되고,
+collection_runs 이력·분위수로 조회되는지 확인 (SQLite 메모리 DB).
+"""
+import asyncio
+
+import pytest
+
+from app.models.collection_run import CollectionRun
+from app.run_metrics import count_http_call, count_llm_call, current_run, track_phase
+from app.services import collection_run_service
+from app.services.collection_run_service import (
+    get_collection_run_history,
+    get_collection_run_percentiles,
+    instrumented_run,
+    percentile,
+)
+
+
+async def _fetch_feed():
+    count_http_call()
+    with track_phase("parse"):
+        await asyncio.sleep(0.01)
+
+
+@pytest.fixture
+def session_factory(sqlite_db, run):
+    """뉴스 수집 3회(fetched 10/20/30) + 실패한 논문 수집 1회가 기록된 DB."""
+    session_factory = sqlite_db(CollectionRun)
+
+    async def _record_runs():
+        for fetched in (10, 20, 30):
+            async with instrumented_run("collect_news", session_factory=session_factory) as result:
+                with result.phase("fetch"):
+                    await asyncio.gather(*(_fetch_feed() for _ in range(3)))
+                with result.phase("save"):
+                    count_llm_call()
+                    result.fetched += fetched
+                    result.inserted += 1
+
+        with pytest.raises(RuntimeError):
+            async with instrumented_run(
+                "collect_papers", trigger="manual", session_factory=session_factory
+            ):
+                raise RuntimeError("arxiv timeout")
+
+    run(_record_runs())
+    return session_factory
+
+
+def test_calls_are_attributed_to_the_enclosing_run(session_factory, run):
+    history = run(get_collection_run_history(session_factory=session_factory))
+
+    assert [entry["job_id"] for entry in history] == [
+        "collect_papers",
+        "collect_news",
+        "collect_news",
+        "collect_news",
+    ]
+    news = history[1]
+    assert news["status"] == "success"
+    assert (news["http_calls"], news["llm_calls"], news["fetched"]) == (3, 1, 30)
+    # parse는 동시 호출 3건의 누적 (fetch 구간 안에서 측정)
+    assert news["phases_ms"]["parse"] >= 25
+    assert news["phases_ms"]["fetch"] >= 8
+    assert news["duration_ms"] >= news["phases_ms"]["fetch"]
+
+
+def test_calls_outside_a_run_are_not_counted():
+    count_http_call()
+    assert current_run() is None
+
+
+def test_failed_run_is_recorded_with_error(session_factory, run):
+    [failed] = run(get_collection_run_history(status="error", session_factory=session_factory))
+
+    assert failed["job_id"] == "collect_papers"
+    assert failed["trigger"] == "manual"
+    assert failed["errors"] == ["arxiv timeout"]
+
+
+def test_percentiles_per_job(session_factory, run):
+    stats = run(get_collection_run_percentiles(session_factory=session_factory))
+
+    assert stats["collect_news"]["runs"] == 3
+    assert stats["collect_news"]["error_rate"] == 0
+    assert stats["collect_news"]["metrics"]["fetched"]["p50"] == 20
+    assert stats["collect_news"]["metrics"]["fetched"]["max"] == 30
+    assert stats["collect_papers"]["error_rate"] == 1
+
+
+def test_percentiles_use_only_recent_runs_per_job(session_factory, run, monkeypatch):
+    monkeypatch.setattr(collection_run_service, "PERCENTILE_MAX_RUNS", 2)
+    stats = run(get_collection_run_percentiles(session_factory=session_factory))
+
+    # 뉴스는 최근 2회(fetched 20/30)만, 1회뿐인 논문은 그대로
+    assert stats["collect_news"]["runs"] == 2
+    assert stats["collect_news"]["metrics"]["fetched"]["p50"] == 25
+    assert stats["collect_papers"]["runs"] == 1
+
+
+def test_percentile_interpolates():
+    assert percentile([], 50) == 0.0
+    assert percentile([5], 99) == 5.0
+    assert percentile([10, 20, 30, 40], 50) == 25.0
+    assert percentile([10, 20, 30, 40], 100) == 40.0
@@ -0,0 +1,118 @@
+"""수집기 본문 테스트.
+
+외부 API 서비스를 가짜로 바꿔 스케줄러 수집기를 실제로 실행하고,
+본문이 `_instrumented`가 넘긴 CollectorResult에 단계/건수/오류를 기록하고,
+저장할 항목이 없는 수집도 피드 검증자를 남기는지 확인 (SQLite 메모리 DB).
+"""
+import asyncio
+from functools import partial
+
+import pytest
+from sqlalchemy import select
+
+from app.bulk_upsert import UpsertStats
+from app.models.collection_run import CollectionRun
+from app.models.feed_state import FeedState
+from app.models.youtube_channel import YouTubeChannel
+from app.run_metrics import COLLECTOR_STATUS_SUCCESS, CollectorResult
+from app.services import scheduler
+from app.services.collection_run_service import instrumented_run
+from app.services.feed_fetch_service import FEED_STATUS_OK, FeedFetchResult
+
+
+class _FakePolicyService:
+    """피드는 200으로 받았지만 AI 정책 항목이 모두 걸러진 수집."""
+
+    async def fetch_policy_news(self, max_results):
+        self.pending_feed_results = [
+            FeedFetchResult("https://policy/rss", FEED_STATUS_OK, http_status=200, etag='"v2"')
+        ]
+        return []
+
+    async def save_to_db(self, items, db):
+        raise AssertionError("저장할 항목이 없으면 호출되지 않음")
+
+
+class _FakeYouTubeService:
+    """채널당 영상 2개, 키워드 검색당 영상 1개를 돌려주고 모두 신규로 저장."""
+
+    last_upsert_stats = None
+
+    async def get_channel_videos(self, channel_id, **kwargs):
+        return [{"video_id": f"{channel_id}-{n}"} for n in range(2)]
+
+    async def search_ai_videos(self, query, **kwargs):
+        return [{"video_id": query}]
+
+    async def save_videos_to_db(self, videos, db):
+        self.last_upsert_stats = UpsertStats(inserted=len(videos))
+        return len(videos)
+
+
+@pytest.fixture
+def session_factory(sqlite_db, run, monkeypatch):
+    session_factory = sqlite_db(YouTubeChannel, CollectionRun, FeedState)
+
+    async def _seed():
+        async with session_factory() as db:
+            db.add_all(
+                [
+                    YouTubeChannel(channel_id="ko", channel_name="국내 채널", category="국내"),
+                    YouTubeChannel(channel_id="en", channel_name="해외 채널", category="해외"),
+                ]
+            )
+            await db.commit()
+
+    async def _no_sleep(_delay):
+        return None
+
+    async def _enqueue_summaries(db, category):
+        return 0
+
+    run(_seed())
+    monkeypatch.setattr(scheduler, "AsyncSessionLocal", session_factory)
+    monkeypatch.setattr(
+        scheduler, "instrumented_run", partial(instrumented_run, session_factory=session_factory)
+    )
+    monkeypatch.setattr(scheduler, "YouTubeService", _FakeYouTubeService)
+    monkeypatch.setattr(scheduler, "PolicyService", _FakePolicyService)
+    monkeypatch.setattr(scheduler, "_enqueue_summaries", _enqueue_summaries)
+    monkeypatch.setattr(asyncio, "sleep", _no_sleep)  # 수집기의 API 호출 간격 대기 생략
+    return session_factory
+
+
+async def _saved_runs(session_factory):
+    async with session_factory() as db:
+        return (await db.execute(select(CollectionRun))).scalars().all()
+
+
+def test_youtube_collector_records_into_collector_result(session_factory, run):
+    result = CollectorResult("collect_youtube")
+    run(scheduler.collect_youtube_data(result, invalidate=False))
+
+    # 국내 채널 1개(영상 2) + 키워드 검색 6건(각 1)
+    assert result.errors == []
+    assert result.status == COLLECTOR_STATUS_SUCCESS
+    assert (result.fetched, result.inserted) == (8, 8)
+    assert "fetch" in result.phases and "save" in result.phases
+
+    [saved] = run(_saved_runs(session_factory))
+    assert (saved.job_id, saved.status, saved.inserted) == (
+        "collect_youtube",
+        COLLECTOR_STATUS_SUCCESS,
+        8,
+    )
+
+
+async def _feed_states(session_factory):
+    async with session_factory() as db:
+        return (await db.execute(select(FeedState.feed_url, FeedState.etag))).all()
+
+
+def test_policy_collector_saves_validators_without_items(session_factory, run):
+    result = CollectorResult("collect_policies")
+    run(scheduler.collect_policy_data(result, invalidate=False))
+
+    # 항목이 없어도 ETag를 저장해 다음 수집은 조건부 요청으로 본문을 건너뜀
+    assert result.errors == []
+    assert run(_feed_states(session_factory)) == [("https://policy/rss", '"v2"')]
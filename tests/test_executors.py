@@ -0,0 +1,77 @@
+"""CPU 작업 실행기 테스트.
+
+parse 스레드 풀 집계(대기열 깊이 포함)와 nlp 프로세스 풀에서의 키워드 추출이
+동기 호출과 같은 결과를 내는지 확인.
+"""
+import asyncio
+import threading
+
+from app import executors
+from app.executors import get_executor_stats, run_parse, shutdown_executors
+from app.services import keyword_extraction_service
+from app.services.keyword_extraction_service import KeywordExtractionService
+
+
+def test_run_parse_offloads_and_tracks_queue_depth(monkeypatch):
+    monkeypatch.setattr(executors.settings, "parse_thread_workers", 1)
+    shutdown_executors()
+    executors.reset_executor_stats()
+    release = threading.Event()
+
+    def _blocking(value):
+        release.wait(timeout=5)
+        return value, threading.current_thread().name
+
+    async def _scenario():
+        tasks = [asyncio.create_task(run_parse(_blocking, n)) for n in range(3)]
+        await asyncio.sleep(0.05)
+        during = get_executor_stats()["parse"]
+        release.set()
+        return await asyncio.gather(*tasks), during
+
+    try:
+        results, during = asyncio.run(_scenario())
+    finally:
+        shutdown_executors()
+
+    assert [value for value, _ in results] == [0, 1, 2]
+    assert all(name.startswith("parse-worker") for _, name in results)
+    assert during["in_flight"] == 3
+    assert during["queue_depth"] == 2
+    after = get_executor_stats()["parse"]
+    assert (after["in_flight"], after["completed"], after["max_in_flight"]) == (0, 3, 3)
+
+
+def test_extract_keywords_async_in_process_pool(monkeypatch):
+    monkeypatch.setattr(executors.settings, "nlp_process_workers", 1)
+
+    async def _no_redis_get(keys, touch_ttl=None):
+        return [None] * len(keys)
+
+    async def _no_redis_set(items, ttl=None):
+        return False
+
+    monkeypatch.setattr(keyword_extraction_service, "cache_get_many", _no_redis_get)
+    monkeypatch.setattr(keyword_extraction_service, "cache_set_many", _no_redis_set)
+    shutdown_executors()
+    text = "OpenAI GPT 모델 출시 — 멀티모달 모델 성능 향상, GPT 에이전트 지원"
+    extractor = KeywordExtractionService()
+
+    async def _scenario():
+        return await asyncio.gather(
+            extractor.extract_keywords_async(text, top_k=5),
+            extractor.extract_trending_keywords_async([text, "GPT 에이전트"], top_k=3),
+            extractor.extract_keywords_async("", top_k=5),
+        )
+
+    try:
+        keywords, trending, empty = asyncio.run(_scenario())
+        stats = get_executor_stats()["nlp"]
+    finally:
+        shutdown_executors()
+
+    assert keywords == extractor.extract_keywords(text, top_k=5)
+    assert trending == extractor.extract_trending_keywords([text, "GPT 에이전트"], top_k=3)
+    assert empty == []
+    assert stats["mode"] == "process"
+    assert stats["started"]
@@ -0,0 +1,124 @@
+"""RSS 피드 동시·조건부 수집 테스트.
+
+저장된 ETag/Last-Modified로 다음 수집에서
+If-None-Match/If-Modified-Since를 보내 304면 파싱을 건너뛰는지 확인
+(네트워크 대신 httpx.MockTransport, DB는 SQLite). 검증자는 항목 저장 트랜잭션이 커밋될 때만 남음.
+"""
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+
+import httpx
+import pytest
+from sqlalchemy import select
+
+from app.models.feed_state import FeedState
+from app.services import feed_fetch_service
+from app.services.feed_fetch_service import (
+    FEED_STATUS_ERROR,
+    FEED_STATUS_NOT_MODIFIED,
+    FEED_STATUS_OK,
+    fetch_feeds,
+    stage_feed_validators,
+)
+
+RSS = b"""<?xml version="1.0" encoding="utf-8"?>
+<rss version="2.0"><channel><title>T</title><link>https://a.example</link>
+<item><title>\xec\x83\x88 \xeb\xaa\xa8\xeb\x8d\xb8</title><link>https://a.example/1</link></item>
+</channel></rss>"""
+
+FEED_A = "https://a.example/rss"
+FEED_B = "https://b.example/rss"
+
+
+@pytest.fixture
+def feeds(monkeypatch, sqlite_db):
+    """MockTransport 피드 (a: ETag "v1" 응답·일치 시 304, b: 500) + 요청·파싱 기록."""
+    requests = []
+    parsed = []
+
+    def _handler(request):
+        requests.append((str(request.url), request.headers.get("if-none-match")))
+        if request.url.host == "b.example":
+            return httpx.Response(500)
+        if request.headers.get("if-none-match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(
+            200,
+            content=RSS,
+            headers={"etag": '"v1"', "last-modified": "Sat, 17 Oct 2026 00:00:00 GMT"},
+        )
+
+    @asynccontextmanager
+    async def _client(source):
+        async with httpx.AsyncClient(transport=httpx.MockTransport(_handler)) as client:
+            yield client
+
+    original_parse = feed_fetch_service.parse_feed
+
+    async def _counting_parse(content, content_type=None):
+        parsed.append(content)
+        return await original_parse(content, content_type)
+
+    monkeypatch.setattr(feed_fetch_service, "http_client", _client)
+    monkeypatch.setattr(feed_fetch_service, "parse_feed", _counting_parse)
+    return SimpleNamespace(
+        session_factory=sqlite_db(FeedState), requests=requests, parsed=parsed
+    )
+
+
+async def _fetch_and_save(session_factory, urls, commit=True):
+    """수집기처럼 수집 → (항목 저장과 같은 트랜잭션에서) 검증자 반영 → 커밋/롤백."""
+    results = await fetch_feeds(urls, session_factory=session_factory)
+    async with session_factory() as db:
+        await stage_feed_validators(db, results.values())
+        if commit:
+            await db.commit()
+        else:
+            await db.rollback()
+    return results
+
+
+async def _states(session_factory):
+    async with session_factory() as db:
+        return {
+            state.feed_url: state
+            for state in (await db.execute(select(FeedState))).scalars()
+        }
+
+
+def test_first_fetch_parses_and_dedupes_urls(feeds, run):
+    results = run(fetch_feeds([FEED_A, FEED_B, FEED_A], session_factory=feeds.session_factory))
+
+    assert results[FEED_A].status == FEED_STATUS_OK
+    assert results[FEED_A].feed.entries[0].title == "새 모델"
+    assert results[FEED_B].status == FEED_STATUS_ERROR
+    assert results[FEED_B].error == "HTTP 500"
+    assert feeds.requests.count((FEED_A, None)) == 1
+    # 수집만으로는 검증자를 저장하지 않음
+    assert run(_states(feeds.session_factory)) == {}
+
+
+def test_saved_validators_make_next_fetch_conditional(feeds, run):
+    run(_fetch_and_save(feeds.session_factory, [FEED_A, FEED_B]))
+    second = run(fetch_feeds([FEED_A, FEED_B], session_factory=feeds.session_factory))
+
+    assert second[FEED_A].status == FEED_STATUS_NOT_MODIFIED
+    assert second[FEED_A].feed is None
+    assert len(feeds.parsed) == 1  # 304는 파싱하지 않음
+    assert (FEED_A, '"v1"') in feeds.requests
+
+    states = run(_states(feeds.session_factory))
+    assert states[FEED_A].etag == '"v1"'
+    assert states[FEED_A].last_modified == "Sat, 17 Oct 2026 00:00:00 GMT"
+    assert states[FEED_A].last_status == 200
+    assert states[FEED_B].etag is None
+    assert states[FEED_B].last_status == 500
+
+
+def test_rolled_back_save_keeps_feed_unconditional(feeds, run):
+    run(_fetch_and_save(feeds.session_factory, [FEED_A], commit=False))
+    retry = run(fetch_feeds([FEED_A], session_factory=feeds.session_factory))
+
+    # 항목 저장이 롤백되면 검증자도 없으므로 다음 수집은 전체 본문을 다시 받음
+    assert retry[FEED_A].status == FEED_STATUS_OK
+    assert feeds.requests == [(FEED_A, None), (FEED_A, None)]
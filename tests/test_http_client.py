@@ -0,0 +1,70 @@
+"""공용 HTTP 클라이언트 레지스트리 테스트.
+
+소스별 클라이언트 재사용/이벤트 루프 변경 시 재생성, 호스트별 동시 요청 상한을 확인
+(네트워크 대신 httpx.MockTransport 사용).
+"""
+import asyncio
+
+import httpx
+
+from app import http_client as http_client_module
+from app.http_client import (
+    _HostLimitedTransport,
+    close_http_clients,
+    get_http_client,
+    http_client,
+)
+
+
+def test_registry_reuses_client_per_source():
+    async def _scenario():
+        async with http_client("news") as first:
+            pass
+        async with http_client("news") as second:
+            pass
+        other = get_http_client("arxiv")
+        unknown = get_http_client("unknown-source")
+        state = (first is second, first.is_closed, other is first, unknown.timeout.read)
+        await close_http_clients()
+        return first, state
+
+    first, (same, closed_inside, shared_across_sources, default_timeout) = asyncio.run(_scenario())
+    assert same
+    assert not closed_inside
+    assert not shared_across_sources
+    assert default_timeout == http_client_module.HTTP_SOURCE_CONFIGS["default"].timeout
+    assert first.is_closed
+
+    # 새 이벤트 루프에서는 이전 루프의 클라이언트를 쓰지 않음
+    async def _next_run():
+        client = get_http_client("news")
+        await close_http_clients()
+        return client
+
+    assert asyncio.run(_next_run()) is not first
+
+
+def test_per_host_limit_caps_concurrency():
+    active = {}
+    peak = {}
+
+    async def _handler(request):
+        host = request.url.host
+        active[host] = active.get(host, 0) + 1
+        peak[host] = max(peak.get(host, 0), active[host])
+        await asyncio.sleep(0.01)
+        active[host] -= 1
+        return httpx.Response(200, text="ok")
+
+    async def _scenario():
+        transport = _HostLimitedTransport(httpx.MockTransport(_handler), per_host_limit=2)
+        async with httpx.AsyncClient(transport=transport) as client:
+            responses = await asyncio.gather(
+                *(client.get("https://a.example/feed") for _ in range(6)),
+                *(client.get("https://b.example/feed") for _ in range(3)),
+            )
+        return [response.text for response in responses]
+
+    texts = asyncio.run(_scenario())
+    assert texts == ["ok"] * 9
+    assert peak == {"a.example": 2, "b.example": 2}
@@ -33,3 +33,115 @@ def test_extract_trending_keywords_counts():
     assert isinstance(count, int)
     assert count >= 1
 
+
+
+def test_extract_keywords_batch_matches_single_calls_in_order():
+    service = KeywordExtractionService()
+    texts = [
+        "RAG 기반 LLM 에이전트 구축 with LangChain",
+        "",
+        None,
+        "Diffusion 모델 이미지 생성 with Stable Diffusion",
+    ]
+
+    batch = service.extract_keywords_batch(texts, top_k=5)
+
+    assert len(batch) == 4
+    assert batch[1] == [] and batch[2] == []
+    assert batch[0] == service.extract_keywords(texts[0], top_k=5)
+    assert batch[3] == service.extract_keywords(texts[3], top_k=5)
+
+
+class _FakeKeyBERT:
+    def __init__(self):
+        self.calls = []
+
+    def extract_keywords(self, docs, **kwargs):
+        self.calls.append(list(docs))
+        results = [[(doc.split()[0], 0.9)] for doc in docs]
+        return results[0] if len(docs) == 1 else results
+
+
+class _FakeSpacy:
+    def __init__(self):
+        self.pipe_calls = []
+
+    def pipe(self, docs, batch_size):
+        self.pipe_calls.append((list(docs), batch_size))
+        for doc in docs:
+            yield type("Doc", (), {"ents": [type("Ent", (), {"text": doc.split()[-1]})()]})()
+
+
+def test_extract_keywords_batch_uses_batched_backends(monkeypatch):
+    monkeypatch.setenv("KEYWORD_BATCH_SIZE", "2")
+    service = KeywordExtractionService()
+    service._initialized = True
+    service._keybert = _FakeKeyBERT()
+    service._spacy_nlp = _FakeSpacy()
+
+    texts = ["Alpha one Omega", "Beta two Sigma", "", "Gamma three Delta"]
+    batch = service.extract_keywords_batch(texts, top_k=3)
+
+    # 빈 텍스트를 제외한 3개 문서를 batch_size=2 청크로 KeyBERT 2회, spaCy pipe 1회
+    assert service._keybert.calls == [
+        ["Alpha one Omega", "Beta two Sigma"],
+        ["Gamma three Delta"],
+    ]
+    assert service._spacy_nlp.pipe_calls == [
+        (["Alpha one Omega", "Beta two Sigma", "Gamma three Delta"], 2)
+    ]
+    assert batch[0][:2] == ["Alpha", "Omega"]
+    assert batch[1][:2] == ["Beta", "Sigma"]
+    assert batch[2] == []
+    assert batch[3][:2] == ["Gamma", "Delta"]
+
+
+def test_extract_keywords_batch_async_memoizes(monkeypatch):
+    import asyncio
+
+    from app.services import keyword_extraction_service
+
+    store = {}
+    nlp_batches = []
+
+    async def _get_many(keys, touch_ttl=None):
+        return [store.get(key) for key in keys]
+
+    async def _set_many(items, ttl=None):
+        store.update(items)
+        return True
+
+    async def _run_nlp(fn, docs, top_k):
+        nlp_batches.append(list(docs))
+        return fn(docs, top_k)
+
+    monkeypatch.setattr(keyword_extraction_service, "cache_get_many", _get_many)
+    monkeypatch.setattr(keyword_extraction_service, "cache_set_many", _set_many)
+    monkeypatch.setattr(keyword_extraction_service, "run_nlp", _run_nlp)
+
+    texts = ["LLM 에이전트  RAG", "Vector DB 검색", "LLM 에이전트 RAG"]
+
+    async def _scenario():
+        first_process = KeywordExtractionService()
+        first = await first_process.extract_keywords_batch_async(texts, top_k=5)
+        again = await first_process.extract_keywords_batch_async(texts[:2], top_k=5)
+        # 새 프로세스(LRU 비어 있음)는 Redis에서 적중
+        second_process = KeywordExtractionService()
+        restored = await second_process.extract_keywords_batch_async(texts, top_k=5)
+        other_top_k = await second_process.extract_keywords_async(texts[1], top_k=3)
+        return first, again, restored, other_top_k, first_process, second_process
+
+    first, again, restored, other_top_k, first_process, second_process = asyncio.run(_scenario())
+
+    # 공백만 다른 텍스트는 같은 키 → NLP에는 2건만 전달
+    assert nlp_batches[:1] == [["LLM 에이전트  RAG", "Vector DB 검색"]]
+    assert first[0] == first[2]
+    assert again == first[:2]
+    assert restored == first
+    assert len(nlp_batches) == 2 and nlp_batches[1] == ["Vector DB 검색"]
+    assert len(other_top_k) <= 3
+
+    assert first_process.memo.stats()["l1_hits"] == 2
+    assert first_process.memo.stats()["misses"] == 2
+    stats = second_process.memo.stats()
+    assert (stats["l1_hits"], stats["l2_hits"], stats["misses"]) == (0, 2, 1)
@@ -0,0 +1,75 @@
+"""keyword_occurrences 동기화/집계 테스트.
+
+ORM flush 시 출현 행이 신규/수정/삭제를 따라가고, 상위 키워드 집계가
+빈도 → 키워드 순으로 결정적인지 확인.
+"""
+import pytest
+from sqlalchemy import select
+
+from app.models.ai_tool import AITool
+from app.models.keyword_occurrence import KeywordOccurrence
+from app.services.keyword_index_service import get_top_keywords
+
+
+@pytest.fixture
+def session_factory(sqlite_db, run):
+    session_factory = sqlite_db(AITool, KeywordOccurrence)
+
+    async def _seed():
+        async with session_factory() as db:
+            db.add_all(
+                [
+                    AITool(tool_name="A", key_features=["LLM", "Agent", "LLM", " "]),
+                    AITool(tool_name="B", key_features=["Agent", "RAG"]),
+                    AITool(tool_name="C", key_features=["RAG"]),
+                ]
+            )
+            await db.commit()
+
+    run(_seed())
+    return session_factory
+
+
+async def _top_keywords(session_factory):
+    async with session_factory() as db:
+        return await get_top_keywords(db, limit=10)
+
+
+async def _update_b_and_delete_c(session_factory):
+    async with session_factory() as db:
+        tools = {
+            tool.tool_name: tool for tool in (await db.execute(select(AITool))).scalars()
+        }
+        tools["B"].key_features = ["LLM"]
+        await db.delete(tools["C"])
+        await db.commit()
+        stored = (
+            await db.execute(select(KeywordOccurrence.item_id, KeywordOccurrence.keyword))
+        ).all()
+    return tools["B"].id, stored
+
+
+def test_top_keywords_order_by_count_then_keyword(session_factory, run):
+    top = run(_top_keywords(session_factory))
+
+    # 항목 안 중복·공백 키워드는 한 번만/제외
+    assert [(k["keyword"], k["count"]) for k in top["top_keywords"]] == [
+        ("Agent", 2),
+        ("RAG", 2),
+        ("LLM", 1),
+    ]
+    assert top["top_keywords"][0]["sources"] == ["platforms"]
+    assert top["total_keywords"] == 5
+    assert top["unique_keywords"] == 3
+
+
+def test_occurrences_follow_update_and_delete(session_factory, run):
+    b_id, stored = run(_update_b_and_delete_c(session_factory))
+    top = run(_top_keywords(session_factory))
+
+    assert [(k["keyword"], k["count"]) for k in top["top_keywords"]] == [
+        ("LLM", 2),
+        ("Agent", 1),
+    ]
+    assert (b_id, "LLM") in stored
+    assert all(keyword != "RAG" for _, keyword in stored)
@@ -0,0 +1,38 @@
+"""공용 다중 키워드 매처 테스트.
+
+겹치는 키워드를 한 번에 모두 찾고, 영문 키워드에만 단어 경계를 적용하는지 확인.
+"""
+from app.keyword_matcher import BOUNDARY_NONE, BOUNDARY_WORD, KeywordMatcher
+
+
+def test_overlapping_matches_and_labels():
+    matcher = KeywordMatcher(
+        {
+            "제품": ["출시", "ai 모델", "gpt-"],
+            "기술": ["모델", "transformer"],
+            "기업": ["openai", "모델"],
+        }
+    )
+    text = "OpenAI가 새 AI 모델과 GPT-5를 출시, Transformers 기반"
+
+    assert matcher.find_all(text) == ["openai", "ai 모델", "모델", "gpt-", "출시", "transformer"]
+    assert matcher.label_counts(text) == {"제품": 3, "기술": 2, "기업": 2}
+    assert matcher.labels("모델 공개") == ["기술", "기업"]
+    assert matcher.first_label("모델 공개", order=["기업", "기술"]) == "기업"
+    assert matcher.first_label("무관한 문장") is None
+
+
+def test_word_boundaries():
+    matcher = KeywordMatcher(["lg", "rag", "llm", "sora", "ai 반도체"])
+
+    # 짧은 영문 키워드는 단어 단위 (복수형 s 허용), 긴 키워드는 단어 시작 기준
+    assert matcher.find_all("An algorithm for storage") == []
+    assert matcher.find_all("LG전자, RAG 파이프라인과 LLMs 발표") == ["lg", "rag", "llm"]
+    assert matcher.find_all("diaspora Soras") == ["sora"]
+    assert matcher.contains_any("삼성 AI 반도체 공개")
+
+    assert KeywordMatcher(["transformer"], boundary=BOUNDARY_WORD).find_all("Transformers") == [
+        "transformer"
+    ]
+    assert not KeywordMatcher(["transformer"], boundary=BOUNDARY_WORD).contains_any("transformerxl")
+    assert KeywordMatcher(["rag"], boundary=BOUNDARY_NONE).contains_any("storage")
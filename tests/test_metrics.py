@@ -0,0 +1,82 @@
+"""프로세스 내 메트릭 레지스트리 테스트.
+
+Prometheus 텍스트 포맷, 라우트 템플릿 라벨, SQL/업스트림 HTTP 계측을 확인
+(앱은 ASGI 전송으로 직접 호출, DB는 SQLite 메모리, 네트워크는 MockTransport).
+"""
+import asyncio
+
+import httpx
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.http_client import _HostLimitedTransport
+from app.metrics import (
+    CACHE_REQUESTS,
+    DB_QUERY_DURATION,
+    Counter,
+    Histogram,
+    UPSTREAM_REQUESTS,
+    instrument_engine,
+    record_cache_lookup,
+    render_metrics,
+    reset_metrics,
+)
+
+
+def test_text_format_histogram_and_labels():
+    histogram = Histogram("demo_seconds", "Demo.", ("route",), buckets=(0.1, 1.0))
+    for value in (0.05, 0.5, 3.0):
+        histogram.observe(value, '/a"b')
+    counter = Counter("demo_total", "Demo.", ("status",))
+    counter.inc("200", amount=2)
+
+    lines = histogram.samples() + counter.samples()
+    assert lines == [
+        'demo_seconds_bucket{route="/a\\"b",le="0.1"} 1',
+        'demo_seconds_bucket{route="/a\\"b",le="1"} 2',
+        'demo_seconds_bucket{route="/a\\"b",le="+Inf"} 3',
+        'demo_seconds_sum{route="/a\\"b"} 3.55',
+        'demo_seconds_count{route="/a\\"b"} 3',
+        'demo_total{status="200"} 2',
+    ]
+
+
+def test_request_db_cache_and_upstream_metrics():
+    reset_metrics()
+
+    async def _scenario():
+        from app.main import app
+
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            await client.get("/")
+            await client.get("/no-such-page")
+            body = (await client.get("/metrics")).text
+
+        engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+        instrument_engine(engine.sync_engine)
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+        await engine.dispose()
+
+        transport = _HostLimitedTransport(
+            httpx.MockTransport(lambda request: httpx.Response(304)), per_host_limit=2, source="news"
+        )
+        async with httpx.AsyncClient(transport=transport) as client:
+            await client.get("https://feeds.example/rss")
+        return body
+
+    body = asyncio.run(_scenario())
+    assert 'http_requests_total{method="GET",route="/",status="200"} 1' in body
+    assert 'http_requests_total{method="GET",route="unmatched",status="404"} 1' in body
+    assert 'http_request_duration_seconds_count{method="GET",route="/"} 1' in body
+    assert "# TYPE db_query_duration_seconds histogram" in body
+
+    assert DB_QUERY_DURATION.count("SELECT") >= 1
+    assert UPSTREAM_REQUESTS.value("news", "feeds.example", "304") == 1
+
+    for hit in (True, True, False):
+        record_cache_lookup("list:news:page=1", hit)
+    assert CACHE_REQUESTS.value("list", "hit") == 2
+    assert 'cache_hit_ratio{prefix="list"} 0.6667' in render_metrics()
@@ -0,0 +1,113 @@
+"""뉴스 근사 중복 인덱스 테스트.
+
+매체별로 조금씩 다른 같은 기사 제목은 같은 클러스터로 묶이고,
+주제만 겹치는 다른 기사는 묶이지 않는지 확인 (순수 인덱스), 목록 중복 접기의 대표가
+필터를 통과한 기사 중에서 정해지는지 확인 (SQLite).
+"""
+import pytest
+
+from app.models.keyword_occurrence import KeywordOccurrence
+from app.models.news import AINews
+from app.services import news_service
+from app.services.news_dedup_service import (
+    NearDuplicateIndex,
+    assign_clusters,
+    news_signature,
+    pack_signature,
+    unpack_signature,
+)
+
+SYNDICATED = [
+    ("OpenAI launches GPT-5 with improved reasoning", "OpenAI launches GPT-5 with improved reasoning - The Verge"),
+    ("Meta releases Llama 4 open weights model", "Meta releases Llama 4, its open-weights model family"),
+    ("삼성전자, 차세대 AI 반도체 공개", "[속보] 삼성전자 차세대 AI 반도체 공개 예정"),
+]
+
+UNRELATED = [
+    "OpenAI launches GPT-5 with improved reasoning",
+    "Google launches Gemini 2 with improved reasoning",
+    "Google releases Gemini 3 with better coding",
+    "OpenAI launches Sora 2 video model",
+    "네이버 하이퍼클로바X 업데이트 발표",
+    "삼성전자, 차세대 AI 반도체 공개",
+]
+
+
+def test_syndicated_titles_match_and_unrelated_do_not():
+    for original, variant in SYNDICATED:
+        index = NearDuplicateIndex()
+        index.add(1, news_signature(original), 1, "Source A")
+        match = index.find(news_signature(variant))
+        assert match is not None and match.cluster_id == 1, (original, variant)
+
+    index = NearDuplicateIndex()
+    for item_id, title in enumerate(UNRELATED, start=1):
+        signature = news_signature(title)
+        assert index.find(signature) is None, title
+        index.add(item_id, signature, item_id)
+
+
+def test_assign_clusters_and_same_source_filter():
+    index = NearDuplicateIndex()
+    items = [
+        (12, news_signature(SYNDICATED[0][1]), "The Verge"),
+        (10, news_signature(SYNDICATED[0][0]), "TechCrunch"),
+        (11, news_signature(UNRELATED[4]), "ZDNet"),
+        (13, news_signature(""), "ZDNet"),
+    ]
+    assignments = assign_clusters(index, items)
+
+    # id 순으로 처리: 최초 기사가 클러스터 대표, 제목 없는 기사는 제외
+    assert [(item_id, cluster_id) for item_id, _, cluster_id in assignments] == [
+        (10, 10),
+        (11, 11),
+        (12, 10),
+    ]
+    signature = news_signature("OpenAI launches GPT-5 with improved reasoning!")
+    assert index.find(signature, source="TechCrunch").item_id == 10
+    assert index.find(signature, source="ZDNet") is None
+    assert unpack_signature(pack_signature(signature)) == signature
+
+
+@pytest.fixture
+def news_db(sqlite_db, run, monkeypatch):
+    """클러스터 1(아카이브된 최초 기사 1 + 2 + 3)과 미분류 기사 4."""
+    async def _supports_archive(db, table_name):
+        return True
+
+    monkeypatch.setattr(news_service, "has_archive_column", _supports_archive)
+    session_factory = sqlite_db(AINews, KeywordOccurrence)
+
+    async def _seed():
+        async with session_factory() as db:
+            db.add_all(
+                [
+                    AINews(id=1, title="t1", url="https://n/1", source="A", cluster_id=1, is_archived=True),
+                    AINews(id=2, title="t2", url="https://n/2", source="B", cluster_id=1, is_archived=False),
+                    AINews(id=3, title="t3", url="https://n/3", source="A", cluster_id=1, is_archived=False),
+                    AINews(id=4, title="t4", url="https://n/4", source="A", is_archived=False),
+                ]
+            )
+            await db.commit()
+
+    run(_seed())
+    return session_factory
+
+
+def _collapsed_ids(session_factory, run, **filters):
+    async def _list():
+        async with session_factory() as db:
+            rows = await news_service.NewsService().get_news(db, collapse_duplicates=True, **filters)
+        return sorted(row.id for row in rows)
+
+    return run(_list())
+
+
+def test_archived_representative_does_not_hide_cluster(news_db, run):
+    assert _collapsed_ids(news_db, run) == [2, 4]
+    assert _collapsed_ids(news_db, run, include_archived=True) == [1, 4]
+
+
+def test_representative_is_chosen_within_source_filter(news_db, run):
+    assert _collapsed_ids(news_db, run, source="A") == [3, 4]
+    assert _collapsed_ids(news_db, run, source="B") == [2]
@@ -0,0 +1,53 @@
+"""키셋 페이지네이션 회귀 테스트.
+
+정렬 키 중복/NULL이 있어도 cursor 순회가 모든 행을 정확히 한 번씩 반환하는지 확인.
+"""
+from datetime import datetime, timedelta
+
+from sqlalchemy import Column, DateTime, Integer, MetaData, Table, create_engine, select
+
+from app.pagination import apply_keyset, decode_cursor, encode_cursor, split_keyset_page
+
+
+def _walk(engine, table, descending):
+    seen = []
+    cursor = ""
+    while cursor is not None:
+        query = apply_keyset(
+            select(table), table.c.published, table.c.id, cursor, descending=descending
+        ).limit(3 + 1)
+        with engine.connect() as conn:
+            rows = conn.execute(query).all()
+        page, cursor = split_keyset_page(rows, 3, "published")
+        seen.extend(row.id for row in page)
+    return seen
+
+
+def test_cursor_roundtrip_datetime():
+    value = datetime(2026, 2, 8, 9, 15)
+    assert decode_cursor(encode_cursor(value, 42)) == (value, 42)
+    assert decode_cursor(encode_cursor(None, 7)) == (None, 7)
+
+
+def test_keyset_walk_visits_every_row_once():
+    engine = create_engine("sqlite://")
+    table = Table(
+        "items",
+        MetaData(),
+        Column("id", Integer, primary_key=True),
+        Column("published", DateTime),
+    )
+    table.metadata.create_all(engine)
+    base = datetime(2026, 1, 1)
+    values = [base, base, base + timedelta(days=1), None, base + timedelta(days=2), None, base]
+    with engine.begin() as conn:
+        conn.execute(
+            table.insert(),
+            [{"id": i + 1, "published": v} for i, v in enumerate(values)],
+        )
+
+    desc_ids = _walk(engine, table, descending=True)
+    assert desc_ids == [5, 3, 7, 2, 1, 6, 4]
+
+    asc_ids = _walk(engine, table, descending=False)
+    assert asc_ids == [1, 2, 7, 3, 5, 4, 6]
@@ -0,0 +1,106 @@
+"""rate limiter 테스트 (가짜 시계 사용, Redis 스크립트 결과는 대체 함수로 주입)."""
+import asyncio
+
+import httpx
+
+from app import rate_limit
+from app.rate_limit import DistributedRateLimiter, RateLimitRule, SlidingWindowLimiter, route_class
+
+
+def test_sliding_window_limits_and_decays():
+    now = [600.0]  # 윈도 경계
+    limiter = SlidingWindowLimiter(limit=4, window=60.0, clock=lambda: now[0])
+
+    decisions = [limiter.hit("1.1.1.1") for _ in range(5)]
+    assert [d.allowed for d in decisions] == [True, True, True, True, False]
+    assert [d.remaining for d in decisions[:4]] == [3, 2, 1, 0]
+    assert decisions[-1].retry_after == 60
+    assert limiter.hit("2.2.2.2").allowed  # 키별 독립
+
+    # 다음 윈도 15초 시점: 직전 4건 × 0.75 = 3 → 1건만 추가 허용
+    now[0] = 675.0
+    assert limiter.hit("1.1.1.1").allowed
+    assert not limiter.hit("1.1.1.1").allowed
+
+    # 다음 윈도 45초 시점: 직전 1건 × 0.25 → 3건 허용
+    now[0] = 765.0
+    assert [limiter.hit("1.1.1.1").allowed for _ in range(4)] == [True, True, True, False]
+
+
+def test_idle_keys_are_evicted():
+    now = [0.0]
+    limiter = SlidingWindowLimiter(limit=10, window=60.0, clock=lambda: now[0])
+    for i in range(100):
+        limiter.hit(f"10.0.0.{i}")
+    now[0] = 70.0
+    limiter.hit("10.0.0.1")  # 직전 윈도 키는 아직 유지
+    assert len(limiter) == 100
+
+    now[0] = 130.0
+    limiter.hit("10.0.0.200")
+    assert len(limiter) == 2  # 직전 윈도(60~120)에 쓰인 10.0.0.1과 새 키만 남음
+
+
+def test_route_class():
+    assert route_class("GET", "/api/v1/search") == "search"
+    assert route_class("GET", "/api/v1/papers/search/") == "search"
+    assert route_class("POST", "/api/v1/admin/login") == "write"
+    assert route_class("GET", "/api/v1/news") == "default"
+
+
+def test_distributed_limiter_uses_redis_and_falls_back(monkeypatch):
+    results = [[1, 4, 1000], [0, 0, 2500], None]
+    calls = []
+
+    async def _run_script(action, script, keys, args):
+        calls.append((keys, args))
+        return results.pop(0) if results else None
+
+    monkeypatch.setattr(rate_limit, "run_script", _run_script)
+    rule = RateLimitRule("search", limit=5, window=10.0)
+    limiter = DistributedRateLimiter([rule], clock=lambda: 0.0)
+
+    async def _scenario():
+        return [await limiter.hit(rule, "1.1.1.1") for _ in range(3)]
+
+    allowed, limited, fallback = asyncio.run(_scenario())
+    assert calls[0] == (["ratelimit:search:1.1.1.1"], ["2000.0", "10000.0"])
+    assert (allowed.allowed, allowed.remaining, allowed.reset_after) == (True, 4, 1.0)
+    assert not limited.allowed and limited.retry_after == 3
+    assert rule.headers(limited) == {
+        "RateLimit-Limit": "5",
+        "RateLimit-Remaining": "0",
+        "RateLimit-Reset": "3",
+        "RateLimit-Policy": "5;w=10",
+    }
+    # Redis 장애: 워커 내 슬라이딩 윈도 판정 (앞선 2건 포함 3번째 요청)
+    assert fallback.allowed and fallback.remaining == 2
+
+    # 워커 안에서 이미 초과하면 Redis를 호출하지 않음
+    assert [d.allowed for d in asyncio.run(_scenario())] == [True, True, False]
+    assert len(calls) == 5
+
+
+def test_middleware_sets_rate_limit_headers(monkeypatch):
+    from app import main
+
+    async def _redis_down(action, script, keys, args):
+        return None
+
+    monkeypatch.setattr(rate_limit, "run_script", _redis_down)
+    monkeypatch.setattr(main, "api_rate_limiter", DistributedRateLimiter([
+        RateLimitRule("default", 100), RateLimitRule("search", 1), RateLimitRule("write", 1),
+    ]))
+
+    async def _scenario():
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=main.app), base_url="http://test"
+        ) as client:
+            return [await client.get("/api/v1/unknown/search") for _ in range(2)]
+
+    first, second = asyncio.run(_scenario())
+    assert first.headers["RateLimit-Policy"] == "1;w=60"
+    assert first.headers["RateLimit-Remaining"] == "0"
+    assert second.status_code == 429
+    assert second.json()["rule"] == "search"
+    assert second.headers["Retry-After"] == second.headers["RateLimit-Reset"]
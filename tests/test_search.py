@@ -0,0 +1,104 @@
+"""전역 검색 회귀 테스트.
+
+카테고리 쿼리 동시 실행 시 데드라인 초과 카테고리가 부분 결과로 보고되고,
+동시 검색이 몰려도 쿼리 슬롯 대기는 데드라인에 포함되지 않는지,
+FTS 문서 표현식(모델 generated 컬럼·인라인 fallback·마이그레이션)이 같은 컬럼을 쓰는지 확인.
+"""
+import asyncio
+import importlib.util
+from pathlib import Path
+
+from app.database import Base
+from app.models.search_document import (
+    SEARCH_DOCUMENT_COLUMNS,
+    SEARCH_TRIGRAM_COLUMNS,
+    search_document_sql,
+)
+
+SEARCH_MIGRATION = (
+    Path(__file__).parent.parent
+    / "alembic"
+    / "versions"
+    / "e4f5a6b7c8d9_add_search_vector_and_trgm_indexes.py"
+)
+
+
+def _load_search_migration():
+    spec = importlib.util.spec_from_file_location("search_migration", SEARCH_MIGRATION)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_slow_category_reported_as_degraded(monkeypatch):
+    from app.api.v1 import search
+
+    async def fake_query(category, sql, params):
+        if category == "news":
+            await asyncio.sleep(1)
+        if category == "jobs":
+            raise RuntimeError("relation does not exist")
+        return [{"category": category, "id": "1", "score": 0.5, "published_at": None}]
+
+    monkeypatch.setattr(search, "_run_category_query", fake_query)
+    monkeypatch.setattr(search, "_query_slots", asyncio.Semaphore(len(search.SEARCH_QUERIES)))
+    rows, degraded = asyncio.run(search._search_categories({}, timeout=0.05))
+
+    assert sorted(degraded) == ["jobs", "news"]
+    returned = {row["category"] for row in rows}
+    assert "news" not in returned
+    assert len(returned) == len(search.SEARCH_QUERIES) - 2
+
+
+def test_concurrent_searches_share_bounded_query_slots(monkeypatch):
+    from app.api.v1 import search
+
+    running = []
+    peak = []
+
+    async def fake_query(category, sql, params):
+        running.append(category)
+        peak.append(len(running))
+        await asyncio.sleep(0.02)
+        running.remove(category)
+        return [{"category": category, "id": "1", "score": 0.5, "published_at": None}]
+
+    async def _two_searches():
+        return await asyncio.gather(
+            search._search_categories({}, timeout=0.05),
+            search._search_categories({}, timeout=0.05),
+        )
+
+    monkeypatch.setattr(search, "_run_category_query", fake_query)
+    monkeypatch.setattr(search, "_query_slots", asyncio.Semaphore(2))
+    outcomes = asyncio.run(_two_searches())
+
+    # 16개 쿼리가 2개씩 실행되어 전체(0.16초)는 데드라인을 넘지만, 슬롯 대기는 데드라인에서 제외
+    assert max(peak) == 2
+    for rows, degraded in outcomes:
+        assert degraded == []
+        assert len(rows) == len(search.SEARCH_QUERIES)
+
+
+def test_search_document_covers_every_search_table():
+    from app.api.v1.search import SEARCH_TABLES
+
+    tables = set(SEARCH_TABLES.values())
+    assert set(SEARCH_DOCUMENT_COLUMNS) == tables
+    assert set(SEARCH_TRIGRAM_COLUMNS) == tables
+    for table_name in tables:
+        assert search_document_sql(table_name).startswith("to_tsvector('simple', ")
+
+
+def test_inline_document_matches_model_and_migration():
+    import app.models  # noqa: F401 — 모든 모델을 메타데이터에 등록
+
+    migration = _load_search_migration()
+    assert migration.SEARCH_DOCUMENT_COLUMNS == SEARCH_DOCUMENT_COLUMNS
+    assert migration.SEARCH_TRIGRAM_COLUMNS == SEARCH_TRIGRAM_COLUMNS
+    for table_name, columns in SEARCH_DOCUMENT_COLUMNS.items():
+        # 인라인 fallback == 마이그레이션 generated 식 == 모델 Computed 식
+        assert migration._document_sql(table_name) == search_document_sql(table_name)
+        table = Base.metadata.tables[table_name]
+        assert str(table.c.search_vector.computed.sqltext) == search_document_sql(table_name)
+        assert set(columns) | set(SEARCH_TRIGRAM_COLUMNS[table_name]) <= set(table.c.keys())
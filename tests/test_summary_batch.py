@@ -0,0 +1,95 @@
+"""배치 요약(summarize_many) 테스트.
+
+여러 항목을 프롬프트 1개로 묶고, 응답에서 누락되거나 검증에 실패한 항목만
+다시 묶어 재요청하는지 확인 (LLM 응답과 Redis 캐시는 가짜로 대체).
+"""
+import asyncio
+import json
+
+from app.services import ai_summary_service
+from app.services.ai_summary_service import AISummaryService
+
+
+def test_summary_request_sections_keep_item_blank_lines():
+    service = AISummaryService(api_key="")
+    request = service._news_request(title="제목", content="첫 문단\n\n둘째 문단", source="src")
+
+    intro, body, outro = request.sections()
+
+    assert intro.startswith("다음은 AI 관련 뉴스")
+    assert body.startswith("**제목**: 제목")
+    assert "둘째 문단" in body
+    assert outro.startswith("아래 형식으로 JSON 응답을 작성해주세요")
+
+
+def test_summarize_many_retries_only_failed_items(monkeypatch):
+    stored = {}
+
+    async def _lookup(keys):
+        return None
+
+    async def _record(kind, hit):
+        return None
+
+    async def _set(key, value, ttl):
+        stored[key] = value
+        return True
+
+    monkeypatch.setattr(ai_summary_service, "summary_cache_lookup", _lookup)
+    monkeypatch.setattr(ai_summary_service, "summary_cache_record", _record)
+    monkeypatch.setattr(ai_summary_service, "cache_set", _set)
+
+    service = AISummaryService(api_key="")
+    service._ollama_checked = True
+    service._ollama_available = True
+
+    prompts = []
+    responses = [
+        # 1차: 1번만 정상, 2번은 summary 누락, 3번은 응답에서 빠짐
+        json.dumps(
+            [
+                {"id": "1", "summary": "요약1", "keywords": ["A"], "key_points": "x"},
+                {"id": "2", "summary": "", "keywords": [], "key_points": []},
+            ]
+        ),
+        # 2차: 실패 항목(2, 3)만 재요청
+        "```json\n"
+        + json.dumps(
+            [
+                {"id": "3", "summary": "요약3", "keywords": [], "key_points": []},
+                {"id": "2", "summary": "요약2", "keywords": ["B"], "key_points": ["p"]},
+            ]
+        )
+        + "\n```",
+    ]
+
+    async def _fake_generate(prompt):
+        prompts.append(prompt)
+        return responses[len(prompts) - 1], "fake-model"
+
+    monkeypatch.setattr(service, "_generate_text", _fake_generate)
+
+    acquired = []
+
+    async def _acquire():
+        acquired.append(1)
+
+    items = [
+        (item_id, {"title": f"뉴스{item_id}", "content": "본문", "source": "src"})
+        for item_id in (1, 2, 3)
+    ]
+    results = asyncio.run(
+        service.summarize_many("news", items, batch_size=5, acquire=_acquire)
+    )
+
+    assert len(prompts) == 2
+    assert all(f"### 항목 id={item_id}" in prompts[0] for item_id in (1, 2, 3))
+    assert "### 항목 id=1" not in prompts[1]
+    assert "### 항목 id=2" in prompts[1] and "### 항목 id=3" in prompts[1]
+    assert len(acquired) == 2
+
+    assert results[1] == {"summary": "요약1", "keywords": ["A"], "key_points": []}
+    assert results[2] == {"summary": "요약2", "keywords": ["B"], "key_points": ["p"]}
+    assert results[3]["summary"] == "요약3"
+    assert len(stored) == 3
+    assert all(":news:v1:fake-model:" in key for key in stored)
@@ -0,0 +1,74 @@
+"""AI 요약 캐시 테스트.
+
+캐시 키가 공백 정규화·템플릿 버전·모델명을 반영하는지, 동일 입력 재요약 시
+provider를 다시 호출하지 않는지 확인 (Redis는 딕셔너리로 대체).
+"""
+import asyncio
+import json
+
+from app.services import ai_summary_service
+from app.services.ai_summary_service import AISummaryService
+
+
+def _ollama_only_service(monkeypatch, responses):
+    service = AISummaryService(api_key="")
+    service.model = None
+    service._ollama_checked = True
+    service._ollama_available = True
+
+    async def _fake_call(prompt):
+        responses.append(prompt)
+        return json.dumps({"summary": "요약", "keywords": "not-a-list", "key_points": ["a"]})
+
+    monkeypatch.setattr(service, "_call_ollama", _fake_call)
+    return service
+
+
+def test_summary_cache_key_normalizes_and_versions(monkeypatch):
+    key = AISummaryService.summary_cache_key("news", "solar", "제목:  A\n\n본문 B ")
+    assert key == AISummaryService.summary_cache_key("news", "solar", "제목: A 본문 B")
+    assert key.startswith("ai_summary:news:v1:solar:")
+    assert key != AISummaryService.summary_cache_key("news", "gemini", "제목: A 본문 B")
+
+    monkeypatch.setitem(ai_summary_service.PROMPT_TEMPLATE_VERSIONS, "news", "v2")
+    assert AISummaryService.summary_cache_key("news", "solar", "제목: A 본문 B").startswith(
+        "ai_summary:news:v2:solar:"
+    )
+
+
+def test_generate_json_summary_uses_cache(monkeypatch):
+    store = {}
+    counters = []
+
+    async def _lookup(keys):
+        return next((store[key] for key in keys if key in store), None)
+
+    async def _record(kind, hit):
+        counters.append((kind, hit))
+
+    async def _set(key, value, ttl):
+        store[key] = value
+        return True
+
+    monkeypatch.setattr(ai_summary_service, "summary_cache_lookup", _lookup)
+    monkeypatch.setattr(ai_summary_service, "summary_cache_record", _record)
+    monkeypatch.setattr(ai_summary_service, "cache_set", _set)
+
+    calls = []
+    service = _ollama_only_service(monkeypatch, calls)
+
+    async def _scenario():
+        first = await service.summarize_news(title="A", content="본문", source="src")
+        second = await service.summarize_news(title="A", content="본문", source="src")
+        other = await service.summarize_news(title="B", content="본문", source="src")
+        return first, second, other
+
+    first, second, other = asyncio.run(_scenario())
+
+    assert first == {"summary": "요약", "keywords": [], "key_points": ["a"]}
+    assert second == first
+    assert other == first
+    assert len(calls) == 2
+    assert counters == [("news", False), ("news", True), ("news", False)]
+    assert len(store) == 2
+    assert all(key.startswith(f"ai_summary:news:v1:{service.ollama_model}:") for key in store)
@@ -0,0 +1,132 @@
+"""요약 작업 큐 테스트.
+
+요약 누락 항목 등록(중복 무시), 동시 처리 상한, 실패 시 백오프 재시도,
+결과 일괄 반영을 SQLite에서 확인.
+"""
+import asyncio
+
+import pytest
+from sqlalchemy import select
+
+from app.models.ai_tool import AITool
+from app.models.keyword_occurrence import KeywordOccurrence
+from app.models.summary_job import SummaryJob
+from app.services import summary_queue_service
+from app.services.summary_queue_service import (
+    enqueue_missing_summaries,
+    process_summary_jobs,
+)
+
+
+class _FakeSummaryService:
+    """동시 호출 수를 기록하는 가짜 요약 provider."""
+
+    model = None
+
+    def __init__(self):
+        self.active = 0
+        self.max_active = 0
+        self.calls = []
+
+    async def can_summarize(self):
+        return True
+
+    async def summarize_many(self, kind, items, batch_size=None, acquire=None):
+        names = [kwargs["name"] for _, kwargs in items]
+        self.calls.extend(names)
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        await asyncio.sleep(0.01)
+        self.active -= 1
+        if "B" in names:
+            raise RuntimeError("quota exceeded")
+        return {
+            item_id: {"summary": f"{kwargs['name']} 요약", "keywords": ["LLM"], "best_for": []}
+            for item_id, kwargs in items
+        }
+
+
+@pytest.fixture
+def session_factory(sqlite_db, run, monkeypatch):
+    # 항목당 프롬프트 1개로 나눠 동시 실행 상한을 확인
+    monkeypatch.setattr(summary_queue_service.settings, "summary_items_per_prompt", 1)
+    session_factory = sqlite_db(AITool, KeywordOccurrence, SummaryJob)
+
+    async def _seed():
+        async with session_factory() as db:
+            db.add_all(
+                [
+                    AITool(tool_name="A"),
+                    AITool(tool_name="B"),
+                    AITool(tool_name="C"),
+                    AITool(tool_name="D", summary="기존 요약"),
+                ]
+            )
+            await db.commit()
+
+    run(_seed())
+    return session_factory
+
+
+async def _enqueue(session_factory):
+    async with session_factory() as db:
+        count = await enqueue_missing_summaries(db, "tools")
+        await db.commit()
+    return count
+
+
+async def _tool_states(session_factory):
+    async with session_factory() as db:
+        tools = dict(
+            (await db.execute(select(AITool.tool_name, AITool.summary))).all()
+        )
+        jobs = {
+            tool_name: job
+            for tool_name, job in (
+                await db.execute(
+                    select(AITool.tool_name, SummaryJob).join(SummaryJob, SummaryJob.item_id == AITool.id)
+                )
+            ).all()
+        }
+    return tools, jobs
+
+
+def test_enqueue_skips_summarized_and_already_queued(session_factory, run):
+    assert run(_enqueue(session_factory)) == 3
+    assert run(_enqueue(session_factory)) == 0
+
+
+def test_processing_respects_concurrency_and_applies_results(session_factory, run):
+    run(_enqueue(session_factory))
+    ai_service = _FakeSummaryService()
+
+    result = run(
+        process_summary_jobs(concurrency=2, ai_service=ai_service, session_factory=session_factory)
+    )
+    tools, jobs = run(_tool_states(session_factory))
+
+    assert result["claimed"] == 3
+    assert (result["done"], result["retried"], result["failed"]) == (2, 1, 0)
+    assert result["updated"] == {"tools": 2}
+    assert ai_service.max_active <= 2
+    assert sorted(ai_service.calls) == ["A", "B", "C"]
+
+    assert tools == {"A": "A 요약", "B": None, "C": "C 요약", "D": "기존 요약"}
+    assert jobs["A"].status == "done"
+
+
+def test_failed_job_backs_off_before_retry(session_factory, run):
+    run(_enqueue(session_factory))
+    ai_service = _FakeSummaryService()
+    run(process_summary_jobs(concurrency=2, ai_service=ai_service, session_factory=session_factory))
+
+    # 실패 항목은 백오프 시각 전이라 바로 다시 가져가지 않음
+    rerun = run(process_summary_jobs(ai_service=ai_service, session_factory=session_factory))
+    _, jobs = run(_tool_states(session_factory))
+
+    assert rerun["claimed"] == 0
+    assert ai_service.calls.count("B") == 1
+    failed_job = jobs["B"]
+    assert failed_job.status == "pending"
+    assert failed_job.attempts == 1
+    assert failed_job.last_error == "quota exceeded"